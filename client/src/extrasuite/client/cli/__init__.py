@@ -634,26 +634,51 @@ def build_parser() -> Any:
     )
     doc_sub = doc_parser.add_subparsers(dest="subcommand")
 
+    # Per-phase timing for pull/diff/push (see extradoc.tracing)
+    trace_parent = argparse.ArgumentParser(add_help=False)
+    trace_parent.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write per-phase timing spans and counters as JSON to FILE",
+    )
+
     sp = doc_sub.add_parser(
         "pull",
         help="Download document as markdown",
-        parents=[auth_parent],
+        parents=[auth_parent, trace_parent],
         description=_load_help("docs", "pull"),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     sp.add_argument("url", help="Document URL or ID")
     sp.add_argument("output_dir", nargs="?", help="Output directory (default: .)")
+    sp.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Download even if the folder is already up to date",
+    )
+    sp.add_argument(
+        "--tab",
+        metavar="TAB",
+        help="Download only this tab (tab ID or title)",
+    )
 
     sp = doc_sub.add_parser(
         "push",
         help="Push local changes to Google Docs",
-        parents=[auth_parent],
+        parents=[auth_parent, trace_parent],
         description=_load_help("docs", "push"),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     sp.add_argument("folder", help="Document folder path")
     sp.add_argument("-f", "--force", action="store_true", help="Push despite warnings")
     sp.add_argument("--verify", action="store_true", help="Pull after push to verify")
+    sp.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Update the folder to the pushed state, so it can be edited again "
+        "without re-pulling",
+    )
     sp.add_argument(
         "--debug",
         action="store_true",
@@ -702,23 +727,40 @@ def build_parser() -> Any:
     sp = doc_sub.add_parser(
         "pull-xml",
         help=argparse.SUPPRESS,
-        parents=[auth_parent],
+        parents=[auth_parent, trace_parent],
         description=_load_help("docs", "pull-xml"),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     sp.add_argument("url", help="Document URL or ID")
     sp.add_argument("output_dir", nargs="?", help="Output directory (default: .)")
+    sp.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Download even if the folder is already up to date",
+    )
+    sp.add_argument(
+        "--tab",
+        metavar="TAB",
+        help="Download only this tab (tab ID or title)",
+    )
 
     sp = doc_sub.add_parser(
         "push-xml",
         help=argparse.SUPPRESS,
-        parents=[auth_parent],
+        parents=[auth_parent, trace_parent],
         description=_load_help("docs", "push"),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     sp.add_argument("folder", help="Document folder path")
     sp.add_argument("-f", "--force", action="store_true", help="Push despite warnings")
     sp.add_argument("--verify", action="store_true", help="Pull after push to verify")
+    sp.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Update the folder to the pushed state, so it can be edited again "
+        "without re-pulling",
+    )
     sp.add_argument(
         "--debug",
         action="store_true",
@@ -731,6 +773,7 @@ def build_parser() -> Any:
         sp = doc_sub.add_parser(
             "diff",
             help="[debug] Show pending batchUpdate requests",
+            parents=[trace_parent],
             description=_load_help("docs", "diff"),
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import shutil
 import sys
 import tempfile
@@ -63,9 +64,44 @@ def _assert_safe_to_replace(dest_dir: Path) -> None:
     )
 
 
+def _make_tracer(args: Any) -> Any:
+    """Return a RecordingTracer when ``--trace FILE`` was given, else None."""
+    if not getattr(args, "trace", None):
+        return None
+    from extradoc import RecordingTracer
+
+    return RecordingTracer()
+
+
+def _docs_transport(token: str) -> Any:
+    """Return a GoogleDocsTransport, honouring API base-URL overrides.
+
+    ``EXTRASUITE_DOCS_API_BASE`` / ``EXTRASUITE_DRIVE_API_BASE`` point the
+    Docs and Drive calls elsewhere, e.g. at a local
+    ``extradoc.mock.server.MockDocsServer`` for load tests.  Requests go
+    through the process-wide pooled client.
+    """
+    from extradoc.transport import API_BASE, DRIVE_API_BASE, GoogleDocsTransport
+
+    from extrasuite.client.http import shared_async_client
+
+    return GoogleDocsTransport(
+        token,
+        api_base=os.environ.get("EXTRASUITE_DOCS_API_BASE") or API_BASE,
+        drive_api_base=os.environ.get("EXTRASUITE_DRIVE_API_BASE") or DRIVE_API_BASE,
+        http_client=shared_async_client(),
+    )
+
+
+def _write_trace(args: Any, tracer: Any) -> None:
+    if tracer is not None:
+        tracer.write_json(args.trace)
+        print(f"Wrote trace to {args.trace}", file=sys.stderr)
+
+
 def cmd_doc_pull(args: Any) -> None:
     """Pull a Google Doc in markdown format (default)."""
-    from extradoc import DocsClient, GoogleDocsTransport
+    from extradoc import DocsClient
 
     document_id = _parse_document_id(args.url)
     output_dir_arg = args.output_dir
@@ -84,16 +120,33 @@ def cmd_doc_pull(args: Any) -> None:
     else:
         dest_dir = Path() / document_id
 
-    async def _run() -> None:
-        transport = GoogleDocsTransport(cred.token)
-        client = DocsClient(transport)
+    tracer = _make_tracer(args)
+
+    force = bool(getattr(args, "force", False))
+    tab = getattr(args, "tab", None)
+
+    async def _run() -> bool:
+        transport = _docs_transport(cred.token)
+        client = DocsClient(transport, tracer=tracer)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
-            await client.pull(
+            # pull() checks <parent>/<document_id>; an explicit output_dir
+            # is pulled via a temp dir, so check it here
+            if (
+                tmp_parent is not None
+                and not force
+                and await client.is_up_to_date(
+                    document_id, dest_dir, format="markdown", save_raw=True, tab=tab
+                )
+            ):
+                return False
+            pulled = await client.pull(
                 document_id,
                 pull_parent,
                 save_raw=True,
                 format="markdown",
+                force=force,
+                tab=tab,
             )
             if tmp_parent is not None:
                 dest_dir.parent.mkdir(parents=True, exist_ok=True)
@@ -101,21 +154,24 @@ def cmd_doc_pull(args: Any) -> None:
                     _assert_safe_to_replace(dest_dir)
                     shutil.rmtree(dest_dir)
                 shutil.move(str(tmp_parent / document_id), str(dest_dir))
+            return pulled
         finally:
             await transport.close()
 
     try:
-        asyncio.run(_run())
+        pulled = asyncio.run(_run())
     finally:
         if tmp_parent is not None:
             shutil.rmtree(tmp_parent, ignore_errors=True)
+        # a failed pull still leaves the spans recorded so far
+        _write_trace(args, tracer)
 
-    print(f"Pulled to {dest_dir}/")
+    print(f"Pulled to {dest_dir}/" if pulled else f"{dest_dir}/ is already up to date")
 
 
 def cmd_doc_pull_xml(args: Any) -> None:
     """Pull a Google Doc in XML format."""
-    from extradoc import DocsClient, GoogleDocsTransport
+    from extradoc import DocsClient
 
     document_id = _parse_document_id(args.url)
     output_dir_arg = args.output_dir
@@ -134,29 +190,47 @@ def cmd_doc_pull_xml(args: Any) -> None:
     else:
         dest_dir = Path() / document_id
 
-    async def _run() -> None:
-        transport = GoogleDocsTransport(cred.token)
-        client = DocsClient(transport)
+    tracer = _make_tracer(args)
+
+    force = bool(getattr(args, "force", False))
+    tab = getattr(args, "tab", None)
+
+    async def _run() -> bool:
+        transport = _docs_transport(cred.token)
+        client = DocsClient(transport, tracer=tracer)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
-            await client.pull(
+            if (
+                tmp_parent is not None
+                and not force
+                and await client.is_up_to_date(
+                    document_id, dest_dir, save_raw=True, tab=tab
+                )
+            ):
+                return False
+            pulled = await client.pull(
                 document_id,
                 pull_parent,
                 save_raw=True,
+                force=force,
+                tab=tab,
             )
             if tmp_parent is not None:
                 dest_dir.parent.mkdir(parents=True, exist_ok=True)
                 shutil.move(str(tmp_parent / document_id), str(dest_dir))
+            return pulled
         finally:
             await transport.close()
 
     try:
-        asyncio.run(_run())
+        pulled = asyncio.run(_run())
     finally:
         if tmp_parent is not None:
             shutil.rmtree(tmp_parent, ignore_errors=True)
+        # a failed pull still leaves the spans recorded so far
+        _write_trace(args, tracer)
 
-    print(f"Pulled to {dest_dir}/")
+    print(f"Pulled to {dest_dir}/" if pulled else f"{dest_dir}/ is already up to date")
 
 
 def cmd_doc_diff(args: Any) -> None:
@@ -164,7 +238,13 @@ def cmd_doc_diff(args: Any) -> None:
     from extradoc import DocsClient
 
     client = DocsClient.__new__(DocsClient)
-    result = client.diff(args.folder)
+    tracer = _make_tracer(args)
+    if tracer is not None:
+        client.tracer = tracer
+    try:
+        result = client.diff(args.folder)
+    finally:
+        _write_trace(args, tracer)
     has_changes = bool(result.batches) or result.comment_ops.has_operations
     if not has_changes:
         print("No changes detected.")
@@ -189,7 +269,7 @@ def cmd_doc_diff(args: Any) -> None:
 
 def cmd_doc_push(args: Any) -> None:
     """Push changes to a Google Doc."""
-    from extradoc import DocsClient, GoogleDocsTransport
+    from extradoc import DocsClient
 
     debug = bool(getattr(args, "debug", False))
     if debug:
@@ -208,11 +288,17 @@ def cmd_doc_push(args: Any) -> None:
         reason=reason,
     )
 
+    tracer = _make_tracer(args)
+
     async def _run() -> None:
-        transport = GoogleDocsTransport(cred.token)
-        client = DocsClient(transport)
+        transport = _docs_transport(cred.token)
+        client = DocsClient(transport, tracer=tracer)
         try:
-            result = await client.push(args.folder, force=args.force)
+            result = await client.push(
+                args.folder,
+                force=args.force,
+                refresh=bool(getattr(args, "refresh", False)),
+            )
             print(result.message)
             if not result.success:
                 if debug:
@@ -227,7 +313,10 @@ def cmd_doc_push(args: Any) -> None:
         finally:
             await transport.close()
 
-    asyncio.run(_run())
+    try:
+        asyncio.run(_run())
+    finally:
+        _write_trace(args, tracer)
 
 
 # Legacy aliases for backward compatibility
@@ -237,7 +326,7 @@ cmd_doc_push_md = cmd_doc_push
 
 def cmd_doc_create(args: Any) -> None:
     """Create a new Google Doc and pull it locally."""
-    from extradoc import DocsClient, GoogleDocsTransport
+    from extradoc import DocsClient
 
     file_id, url = _cmd_create("doc", args)
 
@@ -257,7 +346,7 @@ def cmd_doc_create(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleDocsTransport(cred.token)
+        transport = _docs_transport(cred.token)
         client = DocsClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
@@ -284,8 +373,6 @@ def cmd_doc_create_empty(args: Any) -> None:
 
 def cmd_doc_download_raw(args: Any) -> None:
     """Download raw Google Docs transport JSON for a document."""
-    from extradoc import GoogleDocsTransport
-
     document_id = _parse_document_id(args.url)
     reason = _get_reason(args, default="Downloading raw Google Doc JSON")
     cred = _get_credential(
@@ -295,7 +382,7 @@ def cmd_doc_download_raw(args: Any) -> None:
     )
 
     async def _run() -> tuple[dict[str, Any], list[dict[str, Any]]]:
-        transport = GoogleDocsTransport(cred.token)
+        transport = _docs_transport(cred.token)
         try:
             document = await transport.get_document(document_id)
             comments = (
@@ -363,7 +450,6 @@ def _write_json(path: Path, payload: dict[str, Any]) -> None:
 
 def cmd_doc_verify_table_indices(args: Any) -> None:
     """Verify deterministic table index prediction against the live API."""
-    from extradoc import GoogleDocsTransport
 
     document_id = _parse_document_id(args.url)
     reason = _get_reason(args, default="Verifying table index prediction")
@@ -374,7 +460,7 @@ def cmd_doc_verify_table_indices(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleDocsTransport(cred.token)
+        transport = _docs_transport(cred.token)
         try:
             results = await _verify_table_indices(transport, document_id)
         finally:
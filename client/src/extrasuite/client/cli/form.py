@@ -23,6 +23,8 @@ def cmd_form_pull(args: Any) -> None:
     """Pull a Google Form."""
     from extraform import FormsClient, GoogleFormsTransport
 
+    from extrasuite.client.http import shared_async_client
+
     form_id = _parse_form_id(args.url)
     output_dir_arg = args.output_dir
     reason = _get_reason(args, default="Pulling Google Form")
@@ -40,7 +42,7 @@ def cmd_form_pull(args: Any) -> None:
         dest_dir = Path() / form_id
 
     async def _run() -> None:
-        transport = GoogleFormsTransport(cred.token)
+        transport = GoogleFormsTransport(cred.token, http_client=shared_async_client())
         client = FormsClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
@@ -82,6 +84,8 @@ def cmd_form_push(args: Any) -> None:
     """Push changes to a Google Form."""
     from extraform import FormsClient, GoogleFormsTransport
 
+    from extrasuite.client.http import shared_async_client
+
     reason = _get_reason(args, default="Pushing changes to Google Form")
     cred = _get_credential(
         args,
@@ -90,7 +94,7 @@ def cmd_form_push(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleFormsTransport(cred.token)
+        transport = GoogleFormsTransport(cred.token, http_client=shared_async_client())
         client = FormsClient(transport)
         try:
             result = await client.push(Path(args.folder), force=args.force)
@@ -107,6 +111,8 @@ def cmd_form_create(args: Any) -> None:
     """Create a new Google Form and pull it locally."""
     from extraform import FormsClient, GoogleFormsTransport
 
+    from extrasuite.client.http import shared_async_client
+
     file_id, url = _cmd_create("form", args)
 
     output_dir_arg = getattr(args, "output_dir", None)
@@ -125,7 +131,7 @@ def cmd_form_create(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleFormsTransport(cred.token)
+        transport = GoogleFormsTransport(cred.token, http_client=shared_async_client())
         client = FormsClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
@@ -17,6 +17,8 @@ def cmd_script_pull(args: Any) -> None:
     from extrascript import GoogleAppsScriptTransport, ScriptClient
     from extrascript.client import parse_script_id
 
+    from extrasuite.client.http import shared_async_client
+
     script_id = parse_script_id(args.url)
     output_dir_arg = args.output_dir
     reason = _get_reason(args, default="Pull Apps Script project")
@@ -34,7 +36,9 @@ def cmd_script_pull(args: Any) -> None:
         dest_dir = Path() / script_id
 
     async def _run() -> None:
-        transport = GoogleAppsScriptTransport(cred.token)
+        transport = GoogleAppsScriptTransport(
+            cred.token, http_client=shared_async_client()
+        )
         client = ScriptClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
@@ -79,6 +83,8 @@ def cmd_script_push(args: Any) -> None:
     """Push changes to a Google Apps Script project."""
     from extrascript import GoogleAppsScriptTransport, ScriptClient
 
+    from extrasuite.client.http import shared_async_client
+
     reason = _get_reason(args, default="Push Apps Script project")
     cred = _get_credential(
         args,
@@ -87,7 +93,9 @@ def cmd_script_push(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleAppsScriptTransport(cred.token)
+        transport = GoogleAppsScriptTransport(
+            cred.token, http_client=shared_async_client()
+        )
         client = ScriptClient(transport)
         try:
             if not args.skip_lint:
@@ -117,6 +125,8 @@ def cmd_script_create(args: Any) -> None:
     from extrascript import GoogleAppsScriptTransport, ScriptClient
     from extrascript.client import parse_file_id
 
+    from extrasuite.client.http import shared_async_client
+
     reason = _get_reason(args, default="Create Apps Script project")
     bind_to = args.bind_to or ""
     cred = _get_credential(
@@ -128,7 +138,9 @@ def cmd_script_create(args: Any) -> None:
     output_dir = Path(args.output_dir) if args.output_dir else Path()
 
     async def _run() -> None:
-        transport = GoogleAppsScriptTransport(cred.token)
+        transport = GoogleAppsScriptTransport(
+            cred.token, http_client=shared_async_client()
+        )
         client = ScriptClient(transport)
         try:
             files = await client.create(
@@ -24,6 +24,8 @@ def cmd_sheet_pull(args: Any) -> None:
 
     from extrasheet import GoogleSheetsTransport, SheetsClient
 
+    from extrasuite.client.http import shared_async_client
+
     spreadsheet_id = _parse_spreadsheet_id(args.url)
     output_dir_arg = args.output_dir
     reason = _get_reason(args, default="Pulling Google Sheet")
@@ -44,7 +46,7 @@ def cmd_sheet_pull(args: Any) -> None:
     sheet_count_holder: list[int] = []
 
     async def _run() -> None:
-        transport = GoogleSheetsTransport(cred.token)
+        transport = GoogleSheetsTransport(cred.token, http_client=shared_async_client())
         client = SheetsClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
@@ -115,6 +117,8 @@ def cmd_sheet_push(args: Any) -> None:
 
     from extrasheet import GoogleSheetsTransport, SheetsClient
 
+    from extrasuite.client.http import shared_async_client
+
     reason = _get_reason(args, default="Pushing changes to Google Sheet")
     cred = _get_credential(
         args,
@@ -123,7 +127,7 @@ def cmd_sheet_push(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleSheetsTransport(cred.token)
+        transport = GoogleSheetsTransport(cred.token, http_client=shared_async_client())
         client = SheetsClient(transport)
         try:
             result = client.push(args.folder, force=args.force)
@@ -144,6 +148,8 @@ def cmd_sheet_batchupdate(args: Any) -> None:
 
     from extrasheet import GoogleSheetsTransport
 
+    from extrasuite.client.http import shared_async_client
+
     spreadsheet_id = _parse_spreadsheet_id(args.url)
     requests_path = Path(args.requests_file)
     if not requests_path.exists():
@@ -174,7 +180,7 @@ def cmd_sheet_batchupdate(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleSheetsTransport(cred.token)
+        transport = GoogleSheetsTransport(cred.token, http_client=shared_async_client())
         try:
             response = await transport.batch_update(spreadsheet_id, requests_list)
             print(f"Applied {len(requests_list)} requests.")
@@ -192,6 +198,8 @@ def cmd_sheet_create(args: Any) -> None:
 
     from extrasheet import GoogleSheetsTransport, SheetsClient
 
+    from extrasuite.client.http import shared_async_client
+
     file_id, url = _cmd_create("sheet", args)
 
     output_dir_arg = getattr(args, "output_dir", None)
@@ -212,7 +220,7 @@ def cmd_sheet_create(args: Any) -> None:
     sheet_count_holder: list[int] = []
 
     async def _run() -> None:
-        transport = GoogleSheetsTransport(cred.token)
+        transport = GoogleSheetsTransport(cred.token, http_client=shared_async_client())
         client = SheetsClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
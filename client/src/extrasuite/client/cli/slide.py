@@ -22,6 +22,8 @@ def cmd_slide_pull(args: Any) -> None:
     """Pull a Google Slides presentation."""
     from extraslide import GoogleSlidesTransport, SlidesClient
 
+    from extrasuite.client.http import shared_async_client
+
     presentation_id = _parse_presentation_id(args.url)
     output_dir_arg = args.output_dir
     reason = _get_reason(args, default="Pulling Google Slides")
@@ -41,7 +43,7 @@ def cmd_slide_pull(args: Any) -> None:
     slide_count_holder: list[int] = []
 
     async def _run() -> None:
-        transport = GoogleSlidesTransport(cred.token)
+        transport = GoogleSlidesTransport(cred.token, http_client=shared_async_client())
         client = SlidesClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
@@ -86,6 +88,8 @@ def cmd_slide_push(args: Any) -> None:
     """Push changes to a Google Slides presentation."""
     from extraslide import GoogleSlidesTransport, SlidesClient
 
+    from extrasuite.client.http import shared_async_client
+
     reason = _get_reason(args, default="Pushing changes to Google Slides")
     cred = _get_credential(
         args,
@@ -94,7 +98,7 @@ def cmd_slide_push(args: Any) -> None:
     )
 
     async def _run() -> None:
-        transport = GoogleSlidesTransport(cred.token)
+        transport = GoogleSlidesTransport(cred.token, http_client=shared_async_client())
         client = SlidesClient(transport)
         try:
             response = await client.push(args.folder)
@@ -110,6 +114,8 @@ def cmd_slide_create(args: Any) -> None:
     """Create a new Google Slides presentation and pull it locally."""
     from extraslide import GoogleSlidesTransport, SlidesClient
 
+    from extrasuite.client.http import shared_async_client
+
     file_id, url = _cmd_create("slide", args)
 
     output_dir_arg = getattr(args, "output_dir", None)
@@ -132,7 +138,7 @@ def cmd_slide_create(args: Any) -> None:
     slide_count_holder: list[int] = []
 
     async def _run() -> None:
-        transport = GoogleSlidesTransport(cred.token)
+        transport = GoogleSlidesTransport(cred.token, http_client=shared_async_client())
         client = SlidesClient(transport)
         pull_parent = tmp_parent if tmp_parent else Path()
         try:
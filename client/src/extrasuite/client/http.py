@@ -0,0 +1,144 @@
+"""Shared, pooled HTTP client for the Google API transports.
+
+Every ``*Transport`` (Docs, Sheets, Slides, Forms, Apps Script) accepts an
+``http_client`` argument.  The CLI passes ``shared_async_client()`` so that
+all transports created on one event loop reuse one connection pool:
+
+- HTTP/2 multiplexing when the optional ``h2`` package is installed
+  (``pip install httpx[http2]``); HTTP/1.1 keep-alive otherwise
+- pool limits and keep-alive expiry from ``[http]`` in settings.toml
+- ``Accept-Encoding: gzip`` plus a User-Agent containing "gzip", which
+  Google APIs require before they compress responses
+- optional gzip compression of large request bodies (big batchUpdate
+  payloads), enabled with ``gzip_request_min_bytes``
+- retries, backoff and per-API rate limiting (``extrasuite.client.retry``),
+  counted in ``SHARED_STATS``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import importlib.util
+import ssl
+import weakref
+
+import httpx
+
+from extrasuite.client import __version__
+from extrasuite.client.retry import HttpStats, RetryTransport
+from extrasuite.client.settings import HttpSettings, load_http_settings
+
+try:
+    import certifi
+
+    _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+except ImportError:
+    _SSL_CONTEXT = ssl.create_default_context()
+
+USER_AGENT = f"extrasuite/{__version__} (gzip)"
+
+_COMPRESSIBLE_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Retry / throttling counters for every shared client in the process
+SHARED_STATS = HttpStats()
+
+
+def http2_available() -> bool:
+    """Return True if the h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class GzipRequestTransport(httpx.AsyncBaseTransport):
+    """Wrap a transport, gzip-compressing request bodies of *min_bytes* or more."""
+
+    def __init__(self, wrapped: httpx.AsyncBaseTransport, min_bytes: int) -> None:
+        self._wrapped = wrapped
+        self._min_bytes = min_bytes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if (
+            request.method in _COMPRESSIBLE_METHODS
+            and "Content-Encoding" not in request.headers
+        ):
+            body = await request.aread()
+            if len(body) >= self._min_bytes:
+                headers = request.headers.copy()
+                headers["Content-Encoding"] = "gzip"
+                del headers["Content-Length"]
+                request = httpx.Request(
+                    request.method,
+                    request.url,
+                    headers=headers,
+                    content=gzip.compress(body, compresslevel=6),
+                    extensions=request.extensions,
+                )
+        return await self._wrapped.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
+
+
+def create_async_client(
+    settings: HttpSettings | None = None,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+    stats: HttpStats | None = None,
+) -> httpx.AsyncClient:
+    """Build an ``httpx.AsyncClient`` tuned by *settings*.
+
+    Args:
+        settings: Pool / protocol settings; loaded from settings.toml if None
+        transport: Optional inner transport (e.g. an ``httpx.MockTransport``)
+            in place of the pooled network transport
+        stats: Where to count retries and throttling; a fresh
+            ``HttpStats`` if None
+    """
+    if settings is None:
+        settings = load_http_settings()
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            verify=_SSL_CONTEXT,
+            http2=settings.http2 and http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+    if settings.gzip_request_min_bytes is not None:
+        transport = GzipRequestTransport(transport, settings.gzip_request_min_bytes)
+    transport = RetryTransport(transport, settings, stats)
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=settings.timeout,
+        headers={"Accept-Encoding": "gzip", "User-Agent": USER_AGENT},
+    )
+
+
+_shared_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, asyncio.Task[None]]
+] = weakref.WeakKeyDictionary()
+
+
+def shared_async_client() -> httpx.AsyncClient:
+    """Return the process-wide client for the running event loop.
+
+    The client is created on first use and closed when the loop shuts down
+    (``asyncio.run`` cancels the watcher task on exit), so callers never
+    close it themselves.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _shared_clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = create_async_client(stats=SHARED_STATS)
+        entry = (client, loop.create_task(_close_on_shutdown(client)))
+        _shared_clients[loop] = entry
+    return entry[0]
+
+
+async def _close_on_shutdown(client: httpx.AsyncClient) -> None:
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
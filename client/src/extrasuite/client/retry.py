@@ -0,0 +1,226 @@
+"""Retry, backoff and client-side rate limiting for Google API requests.
+
+``RetryTransport`` wraps the transport of the shared HTTP client (see
+``extrasuite.client.http``), so every Docs / Sheets / Slides / Forms /
+Apps Script / Drive call gets the same rules:
+
+- 429 responses are always retried: Google rejects over-quota requests
+  before executing them.  The API's token bucket is drained so concurrent
+  requests back off too.
+- 5xx responses and network errors are retried only for idempotent
+  requests: GET / HEAD / PUT / DELETE, and requests the caller marks with
+  the ``IDEMPOTENT_EXTENSION`` request extension (e.g. a ``:batchUpdate``
+  whose ``writeControl.requiredRevisionId`` makes a replay fail instead of
+  applying twice).  Request bodies are never decoded to decide this.
+  Connection failures (nothing sent) are always retried.
+- Delays honour ``Retry-After`` and otherwise use exponential backoff with
+  full jitter.
+- Each API gets read and write token buckets sized to its per-minute quota
+  (``HttpSettings.quotas``), so long pushes pace themselves instead of
+  hitting 429s.
+
+Counters land in an ``HttpStats``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from extrasuite.client.settings import HttpSettings
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Set to True in ``httpx.Request.extensions`` to mark a POST / PATCH as safe
+# to replay after a 5xx or a network error.
+IDEMPOTENT_EXTENSION = "extrasuite.idempotent"
+
+
+@dataclass
+class HttpStats:
+    """Counters for requests sent through a ``RetryTransport``."""
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0  # 429 responses received
+    backoff_seconds: float = 0.0  # time slept between attempts
+    rate_limit_wait_seconds: float = 0.0  # time spent waiting on token buckets
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at *per_minute* / 60 per second."""
+
+    def __init__(
+        self,
+        per_minute: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if needed; return seconds waited."""
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                await self._sleep(waited)
+                self._refill()
+                self._tokens = max(self._tokens, 1.0)
+            self._tokens -= 1
+            return waited
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reports quota exhaustion."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Wrap a transport with retries, backoff and per-API rate limits."""
+
+    def __init__(
+        self,
+        wrapped: httpx.AsyncBaseTransport,
+        settings: HttpSettings,
+        stats: HttpStats | None = None,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._wrapped = wrapped
+        self._settings = settings
+        self.stats = stats if stats is not None else HttpStats()
+        self._sleep = sleep
+        self._random = rng or random.Random()
+        self._buckets: dict[tuple[str, bool], TokenBucket] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self._bucket(request)
+        idempotent = _is_idempotent(request)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                self.stats.rate_limit_wait_seconds += await bucket.acquire()
+            self.stats.requests += 1
+            try:
+                response = await self._wrapped.handle_async_request(request)
+            except httpx.TransportError as e:
+                if attempt >= self._settings.max_retries or not (
+                    idempotent or isinstance(e, httpx.ConnectError)
+                ):
+                    raise
+                delay = self._backoff(attempt)
+                reason = type(e).__name__
+            else:
+                status = response.status_code
+                if (
+                    status not in RETRY_STATUSES
+                    or attempt >= self._settings.max_retries
+                    or not (idempotent or status == 429)
+                ):
+                    return response
+                if status == 429:
+                    self.stats.throttled += 1
+                    if bucket is not None:
+                        bucket.drain()
+                retry_after = _retry_after(response)
+                delay = self._backoff(attempt) if retry_after is None else retry_after
+                reason = str(status)
+                await response.aclose()
+
+            attempt += 1
+            self.stats.retries += 1
+            self.stats.backoff_seconds += delay
+            logger.debug(
+                "Retrying %s %s after %s (attempt %d, %.2fs)",
+                request.method,
+                request.url,
+                reason,
+                attempt,
+                delay,
+            )
+            await self._sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._wrapped.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        cap = min(self._settings.backoff_max, self._settings.backoff_base * 2**attempt)
+        return self._random.uniform(0, cap)
+
+    def _bucket(self, request: httpx.Request) -> TokenBucket | None:
+        if not self._settings.rate_limit:
+            return None
+        api = _api_name(request.url)
+        quota = self._settings.quotas.get(api)
+        if quota is None:
+            return None
+        is_read = request.method in _READ_METHODS
+        bucket = self._buckets.get((api, is_read))
+        if bucket is None:
+            bucket = TokenBucket(quota[0] if is_read else quota[1], sleep=self._sleep)
+            self._buckets[api, is_read] = bucket
+        return bucket
+
+
+def _api_name(url: httpx.URL) -> str:
+    """Return the quota key for *url*: ``docs``, ``sheets``, ``drive``, ..."""
+    if url.host == "www.googleapis.com":
+        # www.googleapis.com/drive/v3/... and friends
+        return url.path.lstrip("/").split("/", 1)[0]
+    return url.host.split(".", 1)[0]
+
+
+def _is_idempotent(request: httpx.Request) -> bool:
+    return request.method in _IDEMPOTENT_METHODS or bool(
+        request.extensions.get(IDEMPOTENT_EXTENSION)
+    )
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse ``Retry-After`` (seconds or an HTTP date) into seconds."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
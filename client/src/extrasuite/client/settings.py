@@ -4,6 +4,15 @@ Example settings.toml:
   [trusted_contacts]
   domains = ["yourcompany.com"]
   emails  = ["alice@other.com"]
+
+  [http]
+  http2 = true
+  max_connections = 20
+  gzip_request_min_bytes = 65536
+  max_retries = 5
+
+  [http.quotas]
+  sheets = [60, 60]   # read, write requests per minute
 """
 
 from __future__ import annotations
@@ -93,3 +102,86 @@ def load_trusted_contacts(path: Path = _SETTINGS_PATH) -> TrustedContacts:
         )
     except Exception:
         return TrustedContacts()
+
+
+# Requests per minute per user, (read, write), by API: Google's default
+# per-user quotas.  Override in settings.toml under [http.quotas].
+DEFAULT_QUOTAS: dict[str, tuple[int, int]] = {
+    "docs": (300, 60),
+    "sheets": (60, 60),
+    "slides": (600, 60),
+    "forms": (300, 60),
+    "script": (60, 60),
+    "drive": (12000, 12000),
+}
+
+
+@dataclass
+class HttpSettings:
+    """Tuning for the HTTP client shared by the Google API transports.
+
+    Persisted in settings.toml under [http]; every key is optional.
+    """
+
+    # Use HTTP/2 when the optional h2 package is installed (httpx[http2])
+    http2: bool = True
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    timeout: float = 60.0
+    # Gzip request bodies of at least this many bytes; None disables it
+    gzip_request_min_bytes: int | None = None
+    # Retries after the first attempt; 0 disables retrying
+    max_retries: int = 5
+    # Exponential backoff: a random delay up to base * 2**attempt, capped
+    backoff_base: float = 1.0
+    backoff_max: float = 32.0
+    # Client-side token buckets sized to the per-minute quotas below
+    rate_limit: bool = True
+    quotas: dict[str, tuple[int, int]] = field(
+        default_factory=lambda: dict(DEFAULT_QUOTAS)
+    )
+
+
+def load_http_settings(path: Path = _SETTINGS_PATH) -> HttpSettings:
+    """Load HTTP client settings from settings.toml.
+
+    Returns the defaults if the file is missing, the [http] section is
+    absent, or the file is corrupt.
+    """
+    if not path.exists() or tomllib is None:
+        return HttpSettings()
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+        section = data.get("http", {})
+        defaults = HttpSettings()
+        gzip_min = section.get("gzip_request_min_bytes")
+        return HttpSettings(
+            http2=bool(section.get("http2", defaults.http2)),
+            max_connections=int(
+                section.get("max_connections", defaults.max_connections)
+            ),
+            max_keepalive_connections=int(
+                section.get(
+                    "max_keepalive_connections", defaults.max_keepalive_connections
+                )
+            ),
+            keepalive_expiry=float(
+                section.get("keepalive_expiry", defaults.keepalive_expiry)
+            ),
+            timeout=float(section.get("timeout", defaults.timeout)),
+            gzip_request_min_bytes=None if gzip_min is None else int(gzip_min),
+            max_retries=int(section.get("max_retries", defaults.max_retries)),
+            backoff_base=float(section.get("backoff_base", defaults.backoff_base)),
+            backoff_max=float(section.get("backoff_max", defaults.backoff_max)),
+            rate_limit=bool(section.get("rate_limit", defaults.rate_limit)),
+            quotas={
+                **defaults.quotas,
+                **{
+                    str(api): (int(read), int(write))
+                    for api, (read, write) in section.get("quotas", {}).items()
+                },
+            },
+        )
+    except Exception:
+        return HttpSettings()
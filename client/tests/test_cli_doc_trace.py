@@ -0,0 +1,66 @@
+"""Tests for ``--trace`` output from the doc CLI commands."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+from extradoc import GoogleDocsTransport
+from extradoc.transport import APIError
+
+from extrasuite.client.cli import doc
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def failing_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route doc commands to a Docs API that answers every call with a 500."""
+
+    def _error(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, text="backend error")
+
+    def _credential(*_args: Any, **_kwargs: Any) -> Any:
+        return SimpleNamespace(token="t")
+
+    def _transport(token: str) -> Any:
+        return GoogleDocsTransport(token, http_transport=httpx.MockTransport(_error))
+
+    monkeypatch.setattr(doc, "_get_credential", _credential)
+    monkeypatch.setattr(doc, "_docs_transport", _transport)
+
+
+def _span_names(path: Path) -> list[str]:
+    return [s["name"] for s in json.loads(path.read_text())["spans"]]
+
+
+@pytest.mark.usefixtures("failing_api")
+def test_failed_pull_still_writes_trace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    trace = tmp_path / "trace.json"
+    args = argparse.Namespace(url="doc", output_dir=None, trace=str(trace))
+
+    with pytest.raises(APIError):
+        doc.cmd_doc_pull(args)
+
+    assert "pull.get_document" in _span_names(trace)
+
+
+@pytest.mark.usefixtures("failing_api")
+def test_failed_push_still_writes_trace(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.json"
+    args = argparse.Namespace(
+        folder=str(tmp_path / "missing"), force=False, trace=str(trace)
+    )
+
+    with pytest.raises(FileNotFoundError):
+        doc.cmd_doc_push(args)
+
+    assert "push.diff" in _span_names(trace)
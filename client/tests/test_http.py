@@ -0,0 +1,118 @@
+"""Tests for the shared HTTP client used by the Google API transports."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+from typing import TYPE_CHECKING
+
+import httpx
+from extradoc import GoogleDocsTransport
+
+from extrasuite.client.http import create_async_client, shared_async_client
+from extrasuite.client.settings import HttpSettings, load_http_settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _recording_client(
+    seen: list[httpx.Request], settings: HttpSettings
+) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    return create_async_client(settings, transport=httpx.MockTransport(handler))
+
+
+def test_large_bodies_are_gzipped() -> None:
+    seen: list[httpx.Request] = []
+    big = {"requests": ["x" * 200]}
+
+    async def _run() -> None:
+        async with _recording_client(
+            seen, HttpSettings(gzip_request_min_bytes=100)
+        ) as client:
+            await client.post("https://example.com/big", json=big)
+            await client.post("https://example.com/small", json={"a": 1})
+            await client.get("https://example.com/get")
+
+    asyncio.run(_run())
+
+    large, small, get = seen
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert int(large.headers["Content-Length"]) == len(large.content)
+    assert (
+        gzip.decompress(large.content)
+        == httpx.Request("POST", "https://example.com", json=big).read()
+    )
+    assert "Content-Encoding" not in small.headers
+    assert "Content-Encoding" not in get.headers
+    # Google only compresses responses for user agents mentioning gzip
+    assert "gzip" in get.headers["Accept-Encoding"]
+    assert "gzip" in get.headers["User-Agent"]
+
+
+def test_gzip_is_off_by_default() -> None:
+    seen: list[httpx.Request] = []
+
+    async def _run() -> None:
+        async with _recording_client(seen, HttpSettings()) as client:
+            await client.post("https://example.com", content=b"x" * 10**6)
+
+    asyncio.run(_run())
+    assert "Content-Encoding" not in seen[0].headers
+
+
+def test_shared_client_is_per_loop_and_closed_on_exit() -> None:
+    async def _run() -> httpx.AsyncClient:
+        client = shared_async_client()
+        assert shared_async_client() is client
+        # Transports send their own auth headers and leave the client open
+        transport = GoogleDocsTransport("token", http_client=client)
+        await transport.close()
+        assert not client.is_closed
+        return client
+
+    first = asyncio.run(_run())
+    second = asyncio.run(_run())
+    assert first is not second
+    assert first.is_closed
+    assert second.is_closed
+
+
+def test_transports_authenticate_each_request() -> None:
+    seen: list[httpx.Request] = []
+
+    async def _run() -> None:
+        async with _recording_client(seen, HttpSettings()) as client:
+            for token in ("a", "b"):
+                transport = GoogleDocsTransport(
+                    token, api_base="https://mock/v1/documents", http_client=client
+                )
+                await transport.get_document("doc")
+
+    asyncio.run(_run())
+    assert [r.headers["Authorization"] for r in seen] == ["Bearer a", "Bearer b"]
+
+
+def test_load_http_settings(tmp_path: Path) -> None:
+    path = tmp_path / "settings.toml"
+    assert load_http_settings(path) == HttpSettings()
+
+    path.write_text(
+        "[http]\nhttp2 = false\nmax_connections = 5\ngzip_request_min_bytes = 1024\n"
+        "[http.quotas]\nsheets = [30, 10]\n",
+        encoding="utf-8",
+    )
+    settings = load_http_settings(path)
+    assert settings.http2 is False
+    assert settings.max_connections == 5
+    assert settings.gzip_request_min_bytes == 1024
+    assert settings.timeout == HttpSettings().timeout
+    assert settings.quotas["sheets"] == (30, 10)
+    assert settings.quotas["docs"] == HttpSettings().quotas["docs"]
+
+    path.write_text("not toml [", encoding="utf-8")
+    assert load_http_settings(path) == HttpSettings()
@@ -0,0 +1,265 @@
+"""Tests for retry, backoff and rate limiting in the shared HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from extradoc import GoogleDocsTransport
+from extradoc.api_types._generated import BatchUpdateDocumentRequest, WriteControl
+from extradoc.mock.server import MockDocsServer
+
+from extrasuite.client.http import create_async_client
+from extrasuite.client.retry import (
+    IDEMPOTENT_EXTENSION,
+    HttpStats,
+    RetryTransport,
+    TokenBucket,
+    _is_idempotent,
+    _retry_after,
+)
+from extrasuite.client.settings import HttpSettings
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+DOCS_URL = "https://docs.googleapis.com/v1/documents/doc"
+SHEETS_URL = "https://sheets.googleapis.com/v4/spreadsheets/s"
+
+
+class _Sleeps(list[float]):
+    async def __call__(self, seconds: float) -> None:
+        self.append(seconds)
+
+
+def _client(
+    responses: list[httpx.Response | Exception],
+    sleeps: _Sleeps,
+    stats: HttpStats,
+    settings: HttpSettings | None = None,
+) -> tuple[httpx.AsyncClient, list[httpx.Request]]:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    transport = RetryTransport(
+        httpx.MockTransport(handler),
+        settings or HttpSettings(rate_limit=False),
+        stats,
+        sleep=sleeps,
+        rng=random.Random(0),
+    )
+    return httpx.AsyncClient(transport=transport), seen
+
+
+def _send(
+    responses: list[httpx.Response | Exception],
+    call: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+    settings: HttpSettings | None = None,
+) -> tuple[httpx.Response, list[httpx.Request], _Sleeps, HttpStats]:
+    sleeps, stats = _Sleeps(), HttpStats()
+    client, seen = _client(responses, sleeps, stats, settings)
+
+    async def _run() -> httpx.Response:
+        async with client:
+            return await call(client)
+
+    return asyncio.run(_run()), seen, sleeps, stats
+
+
+def test_reads_retry_server_errors_with_backoff() -> None:
+    response, seen, sleeps, stats = _send(
+        [httpx.Response(503), httpx.Response(500), httpx.Response(200)],
+        lambda c: c.get(DOCS_URL),
+    )
+    assert response.status_code == 200
+    assert len(seen) == 3
+    assert stats.retries == 2
+    assert stats.requests == 3
+    # Full jitter: each delay is within its exponential cap
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 2.0
+    assert stats.backoff_seconds == pytest.approx(sum(sleeps))
+
+
+def test_batch_update_retried_only_when_marked_idempotent() -> None:
+    url = f"{DOCS_URL}:batchUpdate"
+    body = {"requests": [], "writeControl": {"requiredRevisionId": "rev"}}
+    # The body alone does not make a POST retryable.
+    unsafe, seen, _, _ = _send(
+        [httpx.Response(503), httpx.Response(200)],
+        lambda c: c.post(url, json=body),
+    )
+    assert unsafe.status_code == 503
+    assert len(seen) == 1
+
+    safe, seen, _, stats = _send(
+        [httpx.Response(503), httpx.Response(200)],
+        lambda c: c.post(url, json=body, extensions={IDEMPOTENT_EXTENSION: True}),
+    )
+    assert safe.status_code == 200
+    assert len(seen) == 2
+    assert stats.retries == 1
+
+
+class _UnreadableStream(httpx.AsyncByteStream):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        raise AssertionError("request body was read")
+        yield b""  # pragma: no cover
+
+
+def test_idempotency_does_not_read_the_body() -> None:
+    request = httpx.Request(
+        "POST",
+        f"{DOCS_URL}:batchUpdate",
+        stream=_UnreadableStream(),
+        extensions={IDEMPOTENT_EXTENSION: True},
+    )
+    assert _is_idempotent(request)
+    assert not _is_idempotent(
+        httpx.Request("POST", request.url, stream=_UnreadableStream())
+    )
+
+
+@pytest.mark.parametrize("pinned", [False, True])
+def test_docs_batch_update_marks_pinned_batches_idempotent(pinned: bool) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"replies": []})
+
+    batch = BatchUpdateDocumentRequest(
+        requests=[],
+        write_control=WriteControl(required_revision_id="rev") if pinned else None,
+    )
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            transport = GoogleDocsTransport("token", http_client=client)
+            await transport.batch_update("doc", batch)
+
+    asyncio.run(_run())
+    assert _is_idempotent(seen[0]) is pinned
+
+
+def test_throttling_always_retried_and_honours_retry_after() -> None:
+    response, seen, sleeps, stats = _send(
+        [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)],
+        lambda c: c.post(f"{SHEETS_URL}:batchUpdate", json={"requests": []}),
+    )
+    assert response.status_code == 200
+    assert len(seen) == 2
+    assert sleeps == [7.0]
+    assert stats.throttled == 1
+
+
+def test_gives_up_after_max_retries() -> None:
+    response, seen, _, stats = _send(
+        [httpx.Response(503)] * 3,
+        lambda c: c.get(DOCS_URL),
+        HttpSettings(max_retries=2, rate_limit=False),
+    )
+    assert response.status_code == 503
+    assert len(seen) == 3
+    assert stats.retries == 2
+
+
+def test_network_errors() -> None:
+    request = httpx.Request("GET", DOCS_URL)
+    response, seen, _, _ = _send(
+        [httpx.ReadTimeout("slow", request=request), httpx.Response(200)],
+        lambda c: c.get(DOCS_URL),
+    )
+    assert response.status_code == 200
+    assert len(seen) == 2
+
+    # A POST that may have reached the server is not replayed...
+    with pytest.raises(httpx.ReadTimeout):
+        _send(
+            [httpx.ReadTimeout("slow", request=request)],
+            lambda c: c.post(f"{SHEETS_URL}:batchUpdate", json={}),
+        )
+    # ...but one that never connected is
+    response, _, _, _ = _send(
+        [httpx.ConnectError("refused", request=request), httpx.Response(200)],
+        lambda c: c.post(f"{SHEETS_URL}:batchUpdate", json={}),
+    )
+    assert response.status_code == 200
+
+
+def test_requests_are_paced_by_api_quota() -> None:
+    async def _two_writes(client: httpx.AsyncClient) -> httpx.Response:
+        await client.post(SHEETS_URL)
+        return await client.post(SHEETS_URL)
+
+    _, _, sleeps, stats = _send(
+        [httpx.Response(200)] * 2,
+        _two_writes,
+        HttpSettings(quotas={"sheets": (60, 1)}),
+    )
+    # One write per minute: the second waits for the bucket to refill
+    assert sleeps == [pytest.approx(60.0, abs=0.1)]
+    assert stats.rate_limit_wait_seconds == pytest.approx(60.0, abs=0.1)
+
+
+def test_token_bucket_refill_and_drain() -> None:
+    sleeps = _Sleeps()
+    now = [0.0]
+    bucket = TokenBucket(30, clock=lambda: now[0], sleep=sleeps)
+
+    async def _run() -> None:
+        for _ in range(30):
+            assert await bucket.acquire() == 0
+        # Bucket empty: the next token arrives after 60 / 30 seconds
+        assert await bucket.acquire() == pytest.approx(2.0)
+        now[0] += 10
+        assert await bucket.acquire() == 0
+        bucket.drain()
+        assert await bucket.acquire() == pytest.approx(2.0)
+
+    asyncio.run(_run())
+    assert sleeps == pytest.approx([2.0, 2.0])
+
+
+def test_retry_after_formats() -> None:
+    assert _retry_after(httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    assert _retry_after(httpx.Response(429)) is None
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert _retry_after(httpx.Response(429, headers={"Retry-After": past})) == 0.0
+    assert _retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+
+
+def test_docs_requests_survive_injected_throttling() -> None:
+    server = MockDocsServer(throttle_rate=0.5, retry_after=0, seed=1)
+    server.add_document(
+        "doc",
+        {"documentId": "doc", "tabs": [{"tabProperties": {"tabId": "t.0"}}]},
+    )
+    stats = HttpStats()
+
+    async def _run() -> None:
+        async with create_async_client(
+            HttpSettings(), transport=server.transport(), stats=stats
+        ) as client:
+            transport = GoogleDocsTransport(
+                "token",
+                api_base="https://docs.googleapis.com/v1/documents",
+                drive_api_base="https://www.googleapis.com/drive/v3/files",
+                http_client=client,
+            )
+            document = await transport.get_document("doc")
+            assert document.document_id == "doc"
+            assert await transport.list_comments("doc") == []
+
+    asyncio.run(_run())
+    assert stats.throttled > 0
+    assert stats.retries == stats.throttled
@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+"""Benchmark the markdown pull → edit → diff → push pipeline offline.
+
+Runs each phase of ``DocsClient.diff`` / ``push`` on its own, against the
+golden corpus in ``extradoc/tests/golden`` and against generated documents
+(thousands of paragraphs, 100-row tables, many tabs), and reports wall time,
+peak memory and request counts per phase as JSON.
+
+Phases
+------
+For every case the base document is serialized to a markdown folder and a
+deterministic set of edits is applied to the tab files (some paragraphs
+rewritten, one inserted per tab).  Then:
+
+  deserialize   MarkdownSerde.deserialize(folder)
+  normalize     model_dump → reindex_and_normalize_all_tabs → model_validate
+  diff          diffmerge.diff(base, desired)
+  lower         reconcile_v3.lower.lower_batches(ops, ...)
+  encode        transport.encode_batch for every batch (JSON bytes on the wire)
+  batch_update  MockGoogleDocsAPI.batch_update for every batch, resolving
+                deferred placeholders between batches
+
+A separate ``synthetic:batch-N-requests`` case (``--batch-requests``, 5,000 by
+default) compares the transport's serialization paths on one large batch:
+
+  encode_dict   json.dumps(batch.model_dump(...)), the old batchUpdate body
+  encode_json   transport.encode_batch(batch)
+  decode_dict   json.loads + Document.model_validate of a documents.get body
+  decode_json   DocumentData.to_document() straight from the response bytes
+
+A ``startup`` case (``--no-startup`` skips it) runs each measurement in a
+fresh interpreter, where the API models have not been built yet:
+
+  import_extradoc   ``import extradoc``
+  import_api_types  self time of ``extradoc.api_types._generated``
+                    (``python -X importtime``)
+  validate_first    first load_document() of a documents.get body, including
+                    building the models it needs
+  validate_warm     a second load_document() of the same body
+
+Wall time is the best of ``--repeat`` runs; peak memory comes from one extra
+run under ``tracemalloc`` (skip it with ``--no-memory``).  The 20k-paragraph
+case takes several minutes; pass ``--sizes`` to pick smaller ones.
+
+Usage
+-----
+    uv run python extradoc/scripts/bench_reconcile.py --output bench.json
+    uv run python extradoc/scripts/bench_reconcile.py --sizes 1000 --no-golden
+    uv run python extradoc/scripts/bench_reconcile.py --compare before.json
+
+``--compare`` prints the wall-time ratio of each case/phase against an
+earlier results file, so two commits can be compared directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    Document,
+    InsertTextRequest,
+    Location,
+    Range,
+    Request,
+    TextStyle,
+    UpdateTextStyleRequest,
+)
+from extradoc.comments._from_raw import from_raw as comments_from_raw
+from extradoc.comments._types import DocumentWithComments
+from extradoc.diffmerge import diff as diff_documents
+from extradoc.mock.api import MockGoogleDocsAPI
+from extradoc.mock.reindex import reindex_and_normalize_all_tabs
+from extradoc.reconcile_v3.api import _extract_lists_by_tab
+from extradoc.reconcile_v3.executor import resolve_deferred_placeholders
+from extradoc.reconcile_v3.lower import lower_batches
+from extradoc.serde.markdown import MarkdownSerde
+from extradoc.transport import DocumentData, encode_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+EXTRADOC_ROOT = Path(__file__).resolve().parents[1]
+GOLDEN_DIR = EXTRADOC_ROOT / "tests" / "golden"
+
+DEFAULT_SIZES = (1_000, 5_000, 20_000)
+STARTUP_PARAGRAPHS = 5_000
+STARTUP_PHASES = (
+    "import_extradoc",
+    "import_api_types",
+    "validate_first",
+    "validate_warm",
+)
+TABLE_ROWS = 100
+MANY_TABS = 20
+MANY_TABS_PARAGRAPHS = 250
+
+# Every N-th plain paragraph line in a tab file is rewritten by the edit step.
+EDIT_EVERY = 40
+
+_WORDS = (
+    "agreement",
+    "supplier",
+    "customer",
+    "delivery",
+    "schedule",
+    "payment",
+    "invoice",
+    "clause",
+    "liability",
+    "warranty",
+    "notice",
+    "term",
+    "renewal",
+    "scope",
+    "service",
+    "level",
+    "report",
+    "quarter",
+    "review",
+    "budget",
+    "forecast",
+    "milestone",
+    "owner",
+    "status",
+    "risk",
+    "action",
+)
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Case:
+    name: str
+    source: str
+    raw: dict[str, Any]
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(text: str, style: str = "NORMAL_TEXT") -> dict[str, Any]:
+    return {
+        "paragraph": {
+            "elements": [{"textRun": {"content": text + "\n", "textStyle": {}}}],
+            "paragraphStyle": {"namedStyleType": style},
+        }
+    }
+
+
+def _table(rng: random.Random, rows: int, columns: int) -> dict[str, Any]:
+    return {
+        "table": {
+            "rows": rows,
+            "columns": columns,
+            "tableRows": [
+                {
+                    "tableCells": [
+                        {"content": [_paragraph(" ".join(rng.sample(_WORDS, 3)))]}
+                        for _ in range(columns)
+                    ]
+                }
+                for _ in range(rows)
+            ],
+        }
+    }
+
+
+def _body(rng: random.Random, paragraphs: int, tables: int = 0) -> dict[str, Any]:
+    content: list[dict[str, Any]] = [
+        {"sectionBreak": {"sectionStyle": {"sectionType": "CONTINUOUS"}}}
+    ]
+    table_every = paragraphs // (tables + 1) if tables else 0
+    for i in range(paragraphs):
+        if i % 25 == 0:
+            content.append(_paragraph(f"Section {i // 25 + 1}", "HEADING_2"))
+        content.append(_paragraph(_sentence(rng)))
+        if table_every and i and i % table_every == 0 and tables:
+            content.append(_table(rng, TABLE_ROWS, 3))
+            content.append(_paragraph(_sentence(rng)))
+            tables -= 1
+    content.append(_paragraph(""))
+    return {"content": content}
+
+
+def _synthetic_document(
+    name: str, *, tabs: int, paragraphs: int, tables: int = 0, seed: int = 0
+) -> dict[str, Any]:
+    rng = random.Random(seed)
+    raw: dict[str, Any] = {
+        "documentId": name,
+        "title": name,
+        "revisionId": "bench_revision_1",
+        "tabs": [
+            {
+                "tabProperties": {
+                    "tabId": f"t.{i}",
+                    "title": f"Tab {i + 1}",
+                    "index": i,
+                },
+                "documentTab": {"body": _body(rng, paragraphs, tables)},
+            }
+            for i in range(tabs)
+        ],
+    }
+    reindex_and_normalize_all_tabs(raw)
+    return raw
+
+
+def _count_paragraphs(raw: dict[str, Any]) -> int:
+    total = 0
+    stack = list(raw.get("tabs", []))
+    while stack:
+        tab = stack.pop()
+        stack.extend(tab.get("childTabs", []))
+        body = tab.get("documentTab", {}).get("body", {})
+        total += sum(1 for el in body.get("content", []) if "paragraph" in el)
+    return total
+
+
+def _golden_cases() -> list[Case]:
+    cases: list[Case] = []
+    for path in sorted(GOLDEN_DIR.glob("*.json")):
+        if path.stem.endswith("_desired"):
+            continue
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        cases.append(Case(name=f"golden:{path.stem}", source="golden", raw=raw))
+    return cases
+
+
+def _synthetic_cases(sizes: list[int]) -> list[Case]:
+    cases = [
+        Case(
+            name=f"synthetic:paragraphs-{size}",
+            source="synthetic",
+            raw=_synthetic_document(f"paragraphs-{size}", tabs=1, paragraphs=size),
+        )
+        for size in sizes
+    ]
+    cases.append(
+        Case(
+            name=f"synthetic:tables-{TABLE_ROWS}-rows",
+            source="synthetic",
+            raw=_synthetic_document("tables", tabs=1, paragraphs=500, tables=3),
+        )
+    )
+    cases.append(
+        Case(
+            name=f"synthetic:tabs-{MANY_TABS}",
+            source="synthetic",
+            raw=_synthetic_document(
+                "tabs", tabs=MANY_TABS, paragraphs=MANY_TABS_PARAGRAPHS
+            ),
+        )
+    )
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Folder preparation
+# ---------------------------------------------------------------------------
+
+_PLAIN_LINE_RE = re.compile(r"^[A-Za-z]")
+
+
+def _edit_markdown(text: str) -> str:
+    """Rewrite every EDIT_EVERY-th plain paragraph and insert one new one."""
+    lines = text.split("\n")
+    plain = 0
+    inserted = False
+    for i, line in enumerate(lines):
+        if not _PLAIN_LINE_RE.match(line):
+            continue
+        plain += 1
+        if plain % EDIT_EVERY == 0:
+            lines[i] = line.rstrip(".") + " (revised by benchmark)."
+        if not inserted and plain == 3:
+            lines[i] = line + "\n\nA paragraph inserted by the benchmark."
+            inserted = True
+    return "\n".join(lines)
+
+
+def _prepare_folder(case: Case, root: Path) -> Path:
+    document = Document.model_validate(case.raw)
+    bundle = DocumentWithComments(
+        document=document,
+        comments=comments_from_raw(document.document_id or case.name, []),
+    )
+    folder = root / re.sub(r"[^A-Za-z0-9_.-]", "_", case.name)
+    MarkdownSerde().serialize(bundle, folder)
+    for md_path in sorted(folder.rglob("*.md")):
+        if md_path.name == "index.md":
+            continue
+        md_path.write_text(
+            _edit_markdown(md_path.read_text(encoding="utf-8")), encoding="utf-8"
+        )
+    return folder
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _measure(
+    fn: Callable[[], Any], *, repeat: int, memory: bool
+) -> tuple[Any, dict[str, Any]]:
+    """Run *fn* ``repeat`` times (plus once under tracemalloc if *memory*)."""
+    timings: list[float] = []
+    result: Any = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    report: dict[str, Any] = {
+        "wall_s": round(min(timings), 6),
+        "wall_s_all": [round(t, 6) for t in timings],
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            report["peak_mem_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, report
+
+
+def _apply_batches(base: Document, batches: list[list[Any]]) -> dict[str, Any]:
+    mock = MockGoogleDocsAPI(base)
+    responses: list[dict[str, Any]] = []
+    for requests in batches:
+        batch = resolve_deferred_placeholders(
+            responses, BatchUpdateDocumentRequest(requests=requests)
+        )
+        response = mock.batch_update(batch)
+        responses.append(response.model_dump(by_alias=True, exclude_none=True))
+    return {"revision_id": mock.get().revision_id}
+
+
+def _run_case(case: Case, root: Path, *, repeat: int, memory: bool) -> dict[str, Any]:
+    folder = _prepare_folder(case, root)
+    serde = MarkdownSerde()
+    report: dict[str, Any] = {
+        "name": case.name,
+        "source": case.source,
+        "tabs": len(case.raw.get("tabs", [])) or 1,
+        "paragraphs": _count_paragraphs(case.raw),
+        "phases": {},
+    }
+    phases: dict[str, Any] = report["phases"]
+
+    def phase(name: str, fn: Callable[[], Any]) -> Any:
+        try:
+            result, timing = _measure(fn, repeat=repeat, memory=memory)
+        except Exception as exc:
+            phases[name] = {"error": f"{type(exc).__name__}: {exc}"}
+            raise
+        phases[name] = timing
+        return result
+
+    try:
+        result = phase("deserialize", lambda: serde.deserialize(folder))
+        base = result.base.document
+
+        def _normalize() -> Document:
+            # Mirrors DocsClient.diff: the serdes' merge already reindexes
+            if result.desired_reindexed:
+                return result.desired.document
+            desired_dict = result.desired.document.model_dump(
+                by_alias=True, exclude_none=True
+            )
+            reindex_and_normalize_all_tabs(desired_dict)
+            return Document.model_validate(desired_dict)
+
+        desired = phase("normalize", _normalize)
+
+        ops = phase("diff", lambda: diff_documents(base, desired))
+        phases["diff"]["ops"] = len(ops)
+
+        base_lists = _extract_lists_by_tab(base)
+        desired_lists = _extract_lists_by_tab(desired)
+        batches = phase(
+            "lower",
+            lambda: lower_batches(
+                ops,
+                desired_lists_by_tab=desired_lists,
+                base_lists_by_tab=base_lists,
+            ),
+        )
+        phases["lower"]["batches"] = len(batches)
+        phases["lower"]["requests_per_batch"] = [len(b) for b in batches]
+        phases["lower"]["requests"] = sum(len(b) for b in batches)
+
+        encoded = phase(
+            "encode",
+            lambda: sum(
+                len(encode_batch(BatchUpdateDocumentRequest(requests=b)))
+                for b in batches
+            ),
+        )
+        phases["encode"]["bytes"] = encoded
+
+        applied = phase("batch_update", lambda: _apply_batches(base, batches))
+        phases["batch_update"]["requests"] = phases["lower"]["requests"]
+        phases["batch_update"]["final_revision_id"] = applied["revision_id"]
+    except Exception:
+        report["error"] = next(
+            (p["error"] for p in phases.values() if "error" in p), "unknown error"
+        )
+    return report
+
+
+def _large_batch(requests: int) -> BatchUpdateDocumentRequest:
+    """Alternate insertText / updateTextStyle requests, *requests* in total."""
+    rng = random.Random(0)
+    out: list[Request] = []
+    for i in range(requests):
+        index = 1 + 40 * (requests - i)
+        if i % 2:
+            out.append(
+                Request(
+                    update_text_style=UpdateTextStyleRequest(
+                        range=Range(start_index=index, end_index=index + 10),
+                        text_style=TextStyle(bold=True),
+                        fields="bold",
+                    )
+                )
+            )
+        else:
+            out.append(
+                Request(
+                    insert_text=InsertTextRequest(
+                        text=_sentence(rng), location=Location(index=index)
+                    )
+                )
+            )
+    return BatchUpdateDocumentRequest(requests=out)
+
+
+def _run_serialization_case(
+    requests: int, *, repeat: int, memory: bool
+) -> dict[str, Any]:
+    batch = _large_batch(requests)
+    raw = _synthetic_document("serialization", tabs=1, paragraphs=requests)
+    content = json.dumps(raw).encode("utf-8")
+    data = DocumentData(document_id="serialization", title="", raw=raw, content=content)
+    report: dict[str, Any] = {
+        "name": f"synthetic:batch-{requests}-requests",
+        "source": "synthetic",
+        "requests": requests,
+        "phases": {},
+    }
+    phases: dict[str, Any] = report["phases"]
+    for name, fn in (
+        (
+            "encode_dict",
+            lambda: json.dumps(
+                batch.model_dump(by_alias=True, exclude_none=True)
+            ).encode("utf-8"),
+        ),
+        ("encode_json", lambda: encode_batch(batch)),
+        ("decode_dict", lambda: Document.model_validate(json.loads(content))),
+        ("decode_json", data.to_document),
+    ):
+        result, phases[name] = _measure(fn, repeat=repeat, memory=memory)
+        if name.startswith("encode"):
+            phases[name]["bytes"] = len(result)
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+_STARTUP_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import extradoc
+imported = time.perf_counter()
+from extradoc.api_types import load_document
+
+with open(sys.argv[1], "rb") as f:
+    content = f.read()
+first = time.perf_counter()
+load_document(content)
+warm = time.perf_counter()
+load_document(content)
+end = time.perf_counter()
+print(json.dumps({
+    "import_extradoc": imported - start,
+    "validate_first": warm - first,
+    "validate_warm": end - warm,
+}))
+"""
+
+
+def _import_self_time(stderr: str, module: str) -> float | None:
+    """Return *module*'s self import time in seconds from ``-X importtime``."""
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[0].split(":")[1]) / 1e6
+    return None
+
+
+def _run_startup_case(paragraphs: int, root: Path, *, repeat: int) -> dict[str, Any]:
+    raw = _synthetic_document("startup", tabs=1, paragraphs=paragraphs)
+    path = root / "startup.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    report: dict[str, Any] = {
+        "name": f"startup:{paragraphs}-paragraphs",
+        "source": "synthetic",
+        "paragraphs": paragraphs,
+        "phases": {},
+    }
+    runs: dict[str, list[float]] = {}
+    try:
+        for _ in range(repeat):
+            out = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", _STARTUP_SCRIPT, str(path)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            timings = json.loads(out.stdout)
+            self_time = _import_self_time(out.stderr, "extradoc.api_types._generated")
+            if self_time is not None:
+                timings["import_api_types"] = self_time
+            for name, seconds in timings.items():
+                runs.setdefault(name, []).append(seconds)
+    except (OSError, subprocess.CalledProcessError, ValueError) as exc:
+        report["error"] = f"{type(exc).__name__}: {exc}"
+        return report
+    for name in STARTUP_PHASES:
+        if name in runs:
+            report["phases"][name] = {
+                "wall_s": round(min(runs[name]), 6),
+                "wall_s_all": [round(t, 6) for t in runs[name]],
+            }
+    return report
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=EXTRADOC_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _print_comparison(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    before = {c["name"]: c for c in baseline.get("cases", [])}
+    print(f"{'case':48} {'phase':13} {'before':>10} {'after':>10} {'ratio':>7}")
+    for case in current["cases"]:
+        old = before.get(case["name"])
+        if old is None:
+            continue
+        for name, timing in case["phases"].items():
+            old_timing = old["phases"].get(name, {})
+            if "wall_s" not in timing or "wall_s" not in old_timing:
+                continue
+            ratio = (
+                timing["wall_s"] / old_timing["wall_s"] if old_timing["wall_s"] else 0
+            )
+            print(
+                f"{case['name'][:48]:48} {name:13} "
+                f"{old_timing['wall_s']:10.4f} {timing['wall_s']:10.4f} {ratio:7.2f}"
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",") if x],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated paragraph counts for synthetic single-tab docs",
+    )
+    parser.add_argument("--no-golden", action="store_true", help="Skip golden docs")
+    parser.add_argument(
+        "--no-synthetic", action="store_true", help="Skip generated documents"
+    )
+    parser.add_argument(
+        "--batch-requests",
+        type=int,
+        default=5_000,
+        help="Requests in the serialization case's batch (0 to skip it)",
+    )
+    parser.add_argument(
+        "--no-startup", action="store_true", help="Skip the fresh-interpreter case"
+    )
+    parser.add_argument("--case", help="Only run cases whose name matches this regex")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per phase")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the tracemalloc run"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON here (default stdout)")
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier results file to compare wall time with"
+    )
+    args = parser.parse_args(argv)
+
+    cases: list[Case] = []
+    if not args.no_golden:
+        cases.extend(_golden_cases())
+    if not args.no_synthetic:
+        cases.extend(_synthetic_cases(args.sizes))
+    if args.case:
+        pattern = re.compile(args.case)
+        cases = [c for c in cases if pattern.search(c.name)]
+
+    results: dict[str, Any] = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "memory": not args.no_memory,
+        },
+        "cases": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="extradoc-bench-") as tmp:
+        for case in cases:
+            print(f"running {case.name}", file=sys.stderr)
+            results["cases"].append(
+                _run_case(
+                    case, Path(tmp), repeat=args.repeat, memory=not args.no_memory
+                )
+            )
+    serialization_name = f"synthetic:batch-{args.batch_requests}-requests"
+    if (
+        args.batch_requests
+        and not args.no_synthetic
+        and (not args.case or re.search(args.case, serialization_name))
+    ):
+        print(f"running {serialization_name}", file=sys.stderr)
+        results["cases"].append(
+            _run_serialization_case(
+                args.batch_requests, repeat=args.repeat, memory=not args.no_memory
+            )
+        )
+    startup_name = f"startup:{STARTUP_PARAGRAPHS}-paragraphs"
+    if not args.no_startup and (not args.case or re.search(args.case, startup_name)):
+        print(f"running {startup_name}", file=sys.stderr)
+        with tempfile.TemporaryDirectory(prefix="extradoc-bench-") as tmp:
+            results["cases"].append(
+                _run_startup_case(STARTUP_PARAGRAPHS, Path(tmp), repeat=args.repeat)
+            )
+
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+    if args.compare:
+        _print_comparison(results, json.loads(args.compare.read_text()))
+
+    return 1 if any("error" in c for c in results["cases"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
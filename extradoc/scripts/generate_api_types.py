@@ -184,32 +184,10 @@ def generate_field_type(
     return "Any"
 
 
-def _needs_any_import(schemas: dict[str, dict]) -> bool:
-    """Check if Any is used in any generated type annotation."""
-    for schema in schemas.values():
-        for prop in schema.get("properties", {}).values():
-            ptype = prop.get("type", "")
-            if ptype == "array":
-                items = prop.get("items", {})
-                if not items.get("$ref") and items.get("type") not in (
-                    "string",
-                    "integer",
-                ):
-                    return True
-            if ptype == "object" and "additionalProperties" in prop:
-                addl = prop["additionalProperties"]
-                if not addl.get("$ref"):
-                    return True
-            if not prop.get("$ref") and not ptype and "enum" not in prop:
-                return True
-    return False
-
-
 def generate_code(schemas: dict[str, dict]) -> str:
     """Generate the full Python module source."""
     enums, prop_to_enum = collect_enums(schemas)
     sorted_names = topological_sort(schemas)
-    needs_any = _needs_any_import(schemas)
 
     lines: list[str] = []
 
@@ -235,13 +213,15 @@ def generate_code(schemas: dict[str, dict]) -> str:
     lines.append("")
     lines.append("        pass")
     lines.append("")
-    if needs_any:
-        lines.append("from typing import Any")
     lines.append("")
     lines.append("from dataclasses import dataclass")
+    lines.append("from typing import TYPE_CHECKING, Any, ForwardRef, get_args")
     lines.append("")
     lines.append("from pydantic import BaseModel, ConfigDict, Field")
     lines.append("")
+    lines.append("if TYPE_CHECKING:")
+    lines.append("    from collections.abc import Mapping")
+    lines.append("")
     lines.append("")
 
     # Add DeferredID dataclass before enums
@@ -290,6 +270,93 @@ def generate_code(schemas: dict[str, dict]) -> str:
     lines.append("")
     lines.append("")
 
+    # Add the ApiModel base class: deferred, dependency-first model building
+    lines.append("class ApiModel(BaseModel):")
+    lines.append('    """Base class of the generated models.')
+    lines.append("")
+    lines.append(
+        "    Models are built on first use instead of at import (``defer_build``)."
+    )
+    lines.append(
+        "    Building a model first builds the unbuilt models it refers to, leaves"
+    )
+    lines.append(
+        "    first, so each schema is generated once and reused instead of being"
+    )
+    lines.append("    inlined into every model that refers to it.")
+    lines.append('    """')
+    lines.append("")
+    lines.append(
+        '    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)'
+    )
+    lines.append("")
+    lines.append("    @classmethod")
+    lines.append("    def model_rebuild(")
+    lines.append("        cls,")
+    lines.append("        *,")
+    lines.append("        force: bool = False,")
+    lines.append("        raise_errors: bool = True,")
+    lines.append("        _parent_namespace_depth: int = 2,")
+    lines.append("        _types_namespace: Mapping[str, Any] | None = None,")
+    lines.append("    ) -> bool | None:")
+    lines.append("        if not cls.__pydantic_complete__:")
+    lines.append("            for model in _build_order(cls):")
+    lines.append(
+        "                super(ApiModel, model).model_rebuild(_parent_namespace_depth=0)"
+    )
+    lines.append("        if _parent_namespace_depth > 0:")
+    lines.append(
+        "            # Skip this frame when pydantic looks up the caller's namespace"
+    )
+    lines.append("            _parent_namespace_depth += 1")
+    lines.append("        return super().model_rebuild(")
+    lines.append("            force=force,")
+    lines.append("            raise_errors=raise_errors,")
+    lines.append("            _parent_namespace_depth=_parent_namespace_depth,")
+    lines.append("            _types_namespace=_types_namespace,")
+    lines.append("        )")
+    lines.append("")
+    lines.append("")
+    lines.append("def _build_order(cls: type[BaseModel]) -> list[type[ApiModel]]:")
+    lines.append(
+        '    """Return the unbuilt models *cls* refers to, dependencies first."""'
+    )
+    lines.append("    order: list[type[ApiModel]] = []")
+    lines.append("    seen: set[type[BaseModel]] = {cls}")
+    lines.append("")
+    lines.append("    def visit(model: type[BaseModel]) -> None:")
+    lines.append("        for field in model.model_fields.values():")
+    lines.append("            for dependency in _models_in(field.annotation):")
+    lines.append(
+        "                if dependency not in seen and not dependency.__pydantic_complete__:"
+    )
+    lines.append("                    seen.add(dependency)")
+    lines.append("                    visit(dependency)")
+    lines.append("                    order.append(dependency)")
+    lines.append("")
+    lines.append("    visit(cls)")
+    lines.append("    return order")
+    lines.append("")
+    lines.append("")
+    lines.append("def _models_in(annotation: Any) -> list[type[ApiModel]]:")
+    lines.append('    """Return the generated models named in a field annotation."""')
+    lines.append("    if isinstance(annotation, ForwardRef):")
+    lines.append("        try:")
+    lines.append("            annotation = eval(annotation.__forward_arg__, globals())")
+    lines.append("        except NameError:")
+    lines.append("            # Declared outside this module; pydantic resolves it")
+    lines.append("            return []")
+    lines.append("    args = get_args(annotation)")
+    lines.append("    if args:")
+    lines.append("        return [model for arg in args for model in _models_in(arg)]")
+    lines.append(
+        "    if isinstance(annotation, type) and issubclass(annotation, ApiModel):"
+    )
+    lines.append("        return [annotation]")
+    lines.append("    return []")
+    lines.append("")
+    lines.append("")
+
     # Generate enums (sorted by name for stability)
     for enum_name in sorted(enums.keys()):
         desc, values = enums[enum_name]
@@ -311,14 +378,10 @@ def generate_code(schemas: dict[str, dict]) -> str:
         props = schema.get("properties", {})
         desc = schema.get("description", "")
 
-        lines.append(f"class {schema_name}(BaseModel):")
+        lines.append(f"class {schema_name}(ApiModel):")
         if desc:
             lines.append(f'    """{desc}"""')
-        lines.append("")
-        lines.append(
-            '    model_config = ConfigDict(populate_by_name=True, extra="allow")'
-        )
-        lines.append("")
+            lines.append("")
 
         if not props:
             lines.append("    pass")
@@ -3,6 +3,7 @@
 __version__ = "0.1.0"
 
 from extradoc.client import DocsClient, PushResult
+from extradoc.tracing import RecordingTracer, Tracer
 from extradoc.transport import (
     APIError,
     AuthenticationError,
@@ -23,6 +24,8 @@ __all__ = [
     "LocalFileTransport",
     "NotFoundError",
     "PushResult",
+    "RecordingTracer",
+    "Tracer",
     "Transport",
     "TransportError",
 ]
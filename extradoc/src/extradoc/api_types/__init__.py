@@ -6,7 +6,9 @@ import directly from ``extradoc.api_types._generated``.
 
 from typing import TypeAlias
 
+from extradoc.api_types._adapters import load_document, type_adapter
 from extradoc.api_types._generated import (
+    ApiModel,
     BatchUpdateDocumentRequest,
     BatchUpdateDocumentResponse,
     DeferredID,
@@ -20,6 +22,7 @@ SegmentID: TypeAlias = str | DeferredID | None
 TabID: TypeAlias = str | DeferredID | None
 
 __all__ = [
+    "ApiModel",
     "BatchUpdateDocumentRequest",
     "BatchUpdateDocumentResponse",
     "DeferredID",
@@ -28,4 +31,6 @@ __all__ = [
     "Response",
     "SegmentID",
     "TabID",
+    "load_document",
+    "type_adapter",
 ]
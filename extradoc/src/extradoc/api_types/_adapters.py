@@ -0,0 +1,38 @@
+"""Shared ``TypeAdapter``s and the trusted load path for API payloads.
+
+The generated models are built on first use (see ``ApiModel``).
+``type_adapter`` returns one cached ``TypeAdapter`` per top-level type; it
+builds the model first, so the adapter shares the model's validator instead
+of compiling a second copy of the whole schema.
+
+``load_document`` is the load path for JSON the Docs API produced — a
+``documents.get`` body or ``.extrasuite/document.json``.  The bytes go
+through pydantic-core in one pass instead of being decoded into a ``dict``
+that is then walked again for validation.
+"""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+from extradoc.api_types._generated import ApiModel, Document
+
+M = TypeVar("M", bound=ApiModel)
+
+_ADAPTERS: dict[type[ApiModel], TypeAdapter[Any]] = {}
+
+
+def type_adapter(model: type[M]) -> TypeAdapter[M]:
+    """Return the shared ``TypeAdapter`` for the generated *model*."""
+    adapter = _ADAPTERS.get(model)
+    if adapter is None:
+        model.model_rebuild()
+        adapter = _ADAPTERS[model] = TypeAdapter(model)
+    return adapter
+
+
+def load_document(data: bytes | str) -> Document:
+    """Validate a Docs API document from its JSON text."""
+    return type_adapter(Document).validate_json(data)
@@ -21,9 +21,13 @@ else:
 
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ForwardRef, get_args
 
 from pydantic import BaseModel, ConfigDict, Field
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 @dataclass(frozen=True)
 class DeferredID:
@@ -57,6 +61,73 @@ class DeferredID:
         )
 
 
+class ApiModel(BaseModel):
+    """Base class of the generated models.
+
+    Models are built on first use instead of at import (``defer_build``).
+    Building a model first builds the unbuilt models it refers to, leaves
+    first, so each schema is generated once and reused instead of being
+    inlined into every model that refers to it.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)
+
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Mapping[str, Any] | None = None,
+    ) -> bool | None:
+        if not cls.__pydantic_complete__:
+            for model in _build_order(cls):
+                super(ApiModel, model).model_rebuild(_parent_namespace_depth=0)
+        if _parent_namespace_depth > 0:
+            # Skip this frame when pydantic looks up the caller's namespace
+            _parent_namespace_depth += 1
+        return super().model_rebuild(
+            force=force,
+            raise_errors=raise_errors,
+            _parent_namespace_depth=_parent_namespace_depth,
+            _types_namespace=_types_namespace,
+        )
+
+
+def _build_order(cls: type[BaseModel]) -> list[type[ApiModel]]:
+    """Return the unbuilt models *cls* refers to, dependencies first."""
+    order: list[type[ApiModel]] = []
+    seen: set[type[BaseModel]] = {cls}
+
+    def visit(model: type[BaseModel]) -> None:
+        for field in model.model_fields.values():
+            for dependency in _models_in(field.annotation):
+                if dependency not in seen and not dependency.__pydantic_complete__:
+                    seen.add(dependency)
+                    visit(dependency)
+                    order.append(dependency)
+
+    visit(cls)
+    return order
+
+
+def _models_in(annotation: Any) -> list[type[ApiModel]]:
+    """Return the generated models named in a field annotation."""
+    if isinstance(annotation, ForwardRef):
+        try:
+            annotation = eval(annotation.__forward_arg__, globals())
+        except NameError:
+            # Declared outside this module; pydantic resolves it
+            return []
+    args = get_args(annotation)
+    if args:
+        return [model for arg in args for model in _models_in(arg)]
+    if isinstance(annotation, type) and issubclass(annotation, ApiModel):
+        return [annotation]
+    return []
+
+
 class AutoTextType(StrEnum):
     """The type of this auto text."""
 
@@ -287,62 +358,48 @@ class TextStyleBaselineOffset(StrEnum):
     SUBSCRIPT = "SUBSCRIPT"
 
 
-class BackgroundSuggestionState(BaseModel):
+class BackgroundSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base Background have been changed in this suggestion. For any field set to true, the Backgound has a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color_suggested: bool | None = Field(
         None, alias="backgroundColorSuggested"
     )
 
 
-class BookmarkLink(BaseModel):
+class BookmarkLink(ApiModel):
     """A reference to a bookmark in this document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     id: str | None = Field(None)
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class CreateFooterResponse(BaseModel):
+class CreateFooterResponse(ApiModel):
     """The result of creating a footer."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     footer_id: str | None = Field(None, alias="footerId")
 
 
-class CreateFootnoteResponse(BaseModel):
+class CreateFootnoteResponse(ApiModel):
     """The result of creating a footnote."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     footnote_id: str | None = Field(None, alias="footnoteId")
 
 
-class CreateHeaderResponse(BaseModel):
+class CreateHeaderResponse(ApiModel):
     """The result of creating a header."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     header_id: str | None = Field(None, alias="headerId")
 
 
-class CreateNamedRangeResponse(BaseModel):
+class CreateNamedRangeResponse(ApiModel):
     """The result of creating a named range."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     named_range_id: str | None = Field(None, alias="namedRangeId")
 
 
-class CropProperties(BaseModel):
+class CropProperties(ApiModel):
     """The crop properties of an image. The crop rectangle is represented using fractional offsets from the original content's 4 edges. - If the offset is in the interval (0, 1), the corresponding edge of crop rectangle is positioned inside of the image's original bounding rectangle. - If the offset is negative or greater than 1, the corresponding edge of crop rectangle is positioned outside of the image's original bounding rectangle. - If all offsets and rotation angles are 0, the image is not cropped."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     angle: float | None = Field(None)
     offset_bottom: float | None = Field(None, alias="offsetBottom")
     offset_left: float | None = Field(None, alias="offsetLeft")
@@ -350,11 +407,9 @@ class CropProperties(BaseModel):
     offset_top: float | None = Field(None, alias="offsetTop")
 
 
-class CropPropertiesSuggestionState(BaseModel):
+class CropPropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base CropProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     angle_suggested: bool | None = Field(None, alias="angleSuggested")
     offset_bottom_suggested: bool | None = Field(None, alias="offsetBottomSuggested")
     offset_left_suggested: bool | None = Field(None, alias="offsetLeftSuggested")
@@ -362,11 +417,9 @@ class CropPropertiesSuggestionState(BaseModel):
     offset_top_suggested: bool | None = Field(None, alias="offsetTopSuggested")
 
 
-class DateElementProperties(BaseModel):
+class DateElementProperties(ApiModel):
     """Properties of a DateElement."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     date_format: DateElementPropertiesDateFormat | None = Field(
         None, alias="dateFormat"
     )
@@ -379,11 +432,9 @@ class DateElementProperties(BaseModel):
     timestamp: str | None = Field(None)
 
 
-class DateElementPropertiesSuggestionState(BaseModel):
+class DateElementPropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base DateElementProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     date_format_suggested: bool | None = Field(None, alias="dateFormatSuggested")
     locale_suggested: bool | None = Field(None, alias="localeSuggested")
     time_format_suggested: bool | None = Field(None, alias="timeFormatSuggested")
@@ -391,191 +442,149 @@ class DateElementPropertiesSuggestionState(BaseModel):
     timestamp_suggested: bool | None = Field(None, alias="timestampSuggested")
 
 
-class DeleteFooterRequest(BaseModel):
+class DeleteFooterRequest(ApiModel):
     """Deletes a Footer from the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     footer_id: str | None = Field(None, alias="footerId")
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class DeleteHeaderRequest(BaseModel):
+class DeleteHeaderRequest(ApiModel):
     """Deletes a Header from the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     header_id: str | None = Field(None, alias="headerId")
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class DeletePositionedObjectRequest(BaseModel):
+class DeletePositionedObjectRequest(ApiModel):
     """Deletes a PositionedObject from the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     object_id: str | None = Field(None, alias="objectId")
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class DeleteTabRequest(BaseModel):
+class DeleteTabRequest(ApiModel):
     """Deletes a tab. If the tab has child tabs, they are deleted as well."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class Dimension(BaseModel):
+class Dimension(ApiModel):
     """A magnitude in a single direction in the specified units."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     magnitude: float | None = Field(None)
     unit: DimensionUnit | None = Field(None)
 
 
-class DocumentFormat(BaseModel):
+class DocumentFormat(ApiModel):
     """Represents document-level format settings."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     document_mode: DocumentFormatDocumentMode | None = Field(None, alias="documentMode")
 
 
-class EmbeddedDrawingProperties(BaseModel):
+class EmbeddedDrawingProperties(ApiModel):
     """The properties of an embedded drawing and used to differentiate the object type. An embedded drawing is one that's created and edited within a document. Note that extensive details are not supported."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     pass
 
 
-class EmbeddedDrawingPropertiesSuggestionState(BaseModel):
+class EmbeddedDrawingPropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base EmbeddedDrawingProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     pass
 
 
-class EmbeddedObjectBorderSuggestionState(BaseModel):
+class EmbeddedObjectBorderSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base EmbeddedObjectBorder have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     color_suggested: bool | None = Field(None, alias="colorSuggested")
     dash_style_suggested: bool | None = Field(None, alias="dashStyleSuggested")
     property_state_suggested: bool | None = Field(None, alias="propertyStateSuggested")
     width_suggested: bool | None = Field(None, alias="widthSuggested")
 
 
-class EndOfSegmentLocation(BaseModel):
+class EndOfSegmentLocation(ApiModel):
     """Location at the end of a body, header, footer or footnote. The location is immediately before the last newline in the document segment."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     segment_id: str | DeferredID | None = Field(None, alias="segmentId")
     tab_id: str | DeferredID | None = Field(None, alias="tabId")
 
 
-class Equation(BaseModel):
+class Equation(ApiModel):
     """A ParagraphElement representing an equation."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
         None, alias="suggestedInsertionIds"
     )
 
 
-class HeadingLink(BaseModel):
+class HeadingLink(ApiModel):
     """A reference to a heading in this document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     id: str | None = Field(None)
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class InsertInlineImageResponse(BaseModel):
+class InsertInlineImageResponse(ApiModel):
     """The result of inserting an inline image."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     object_id: str | None = Field(None, alias="objectId")
 
 
-class InsertInlineSheetsChartResponse(BaseModel):
+class InsertInlineSheetsChartResponse(ApiModel):
     """The result of inserting an embedded Google Sheets chart."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     object_id: str | None = Field(None, alias="objectId")
 
 
-class Location(BaseModel):
+class Location(ApiModel):
     """A particular location in the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     index: int | None = Field(None)
     segment_id: str | DeferredID | None = Field(None, alias="segmentId")
     tab_id: str | DeferredID | None = Field(None, alias="tabId")
 
 
-class ObjectReferences(BaseModel):
+class ObjectReferences(ApiModel):
     """A collection of object IDs."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     object_ids: list[str] | None = Field(None, alias="objectIds")
 
 
-class PersonProperties(BaseModel):
+class PersonProperties(ApiModel):
     """Properties specific to a linked Person."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     email: str | None = Field(None)
     name: str | None = Field(None)
 
 
-class PositionedObjectPositioningSuggestionState(BaseModel):
+class PositionedObjectPositioningSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base PositionedObjectPositioning have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     layout_suggested: bool | None = Field(None, alias="layoutSuggested")
     left_offset_suggested: bool | None = Field(None, alias="leftOffsetSuggested")
     top_offset_suggested: bool | None = Field(None, alias="topOffsetSuggested")
 
 
-class Range(BaseModel):
+class Range(ApiModel):
     """Specifies a contiguous range of text."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_index: int | None = Field(None, alias="endIndex")
     segment_id: str | DeferredID | None = Field(None, alias="segmentId")
     start_index: int | None = Field(None, alias="startIndex")
     tab_id: str | DeferredID | None = Field(None, alias="tabId")
 
 
-class ReplaceAllTextResponse(BaseModel):
+class ReplaceAllTextResponse(ApiModel):
     """The result of replacing text."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     occurrences_changed: int | None = Field(None, alias="occurrencesChanged")
 
 
-class ReplaceImageRequest(BaseModel):
+class ReplaceImageRequest(ApiModel):
     """Replaces an existing image with a new image. Replacing an image removes some image effects from the existing image in order to mirror the behavior of the Docs editor."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     image_object_id: str | None = Field(None, alias="imageObjectId")
     image_replace_method: ReplaceImageRequestImageReplaceMethod | None = Field(
         None, alias="imageReplaceMethod"
@@ -584,78 +593,62 @@ class ReplaceImageRequest(BaseModel):
     uri: str | None = Field(None)
 
 
-class RgbColor(BaseModel):
+class RgbColor(ApiModel):
     """An RGB color."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     blue: float | None = Field(None)
     green: float | None = Field(None)
     red: float | None = Field(None)
 
 
-class RichLinkProperties(BaseModel):
+class RichLinkProperties(ApiModel):
     """Properties specific to a RichLink."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     mime_type: str | None = Field(None, alias="mimeType")
     title: str | None = Field(None)
     uri: str | None = Field(None)
 
 
-class ShadingSuggestionState(BaseModel):
+class ShadingSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base Shading have been changed in this suggested change. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color_suggested: bool | None = Field(
         None, alias="backgroundColorSuggested"
     )
 
 
-class SheetsChartReference(BaseModel):
+class SheetsChartReference(ApiModel):
     """A reference to a linked chart embedded from Google Sheets."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     chart_id: int | None = Field(None, alias="chartId")
     spreadsheet_id: str | None = Field(None, alias="spreadsheetId")
 
 
-class SheetsChartReferenceSuggestionState(BaseModel):
+class SheetsChartReferenceSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base SheetsChartReference have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     chart_id_suggested: bool | None = Field(None, alias="chartIdSuggested")
     spreadsheet_id_suggested: bool | None = Field(None, alias="spreadsheetIdSuggested")
 
 
-class SizeSuggestionState(BaseModel):
+class SizeSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base Size have been changed in this suggestion. For any field set to true, the Size has a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     height_suggested: bool | None = Field(None, alias="heightSuggested")
     width_suggested: bool | None = Field(None, alias="widthSuggested")
 
 
-class SubstringMatchCriteria(BaseModel):
+class SubstringMatchCriteria(ApiModel):
     """A criteria that matches a specific string of text in the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     match_case: bool | None = Field(None, alias="matchCase")
     search_by_regex: bool | None = Field(None, alias="searchByRegex")
     text: str | None = Field(None)
 
 
-class TabProperties(BaseModel):
+class TabProperties(ApiModel):
     """Properties of a tab."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     icon_emoji: str | None = Field(None, alias="iconEmoji")
     index: int | None = Field(None)
     nesting_level: int | None = Field(None, alias="nestingLevel")
@@ -664,11 +657,9 @@ class TabProperties(BaseModel):
     title: str | None = Field(None)
 
 
-class TableCellStyleSuggestionState(BaseModel):
+class TableCellStyleSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base TableCellStyle have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color_suggested: bool | None = Field(
         None, alias="backgroundColorSuggested"
     )
@@ -687,27 +678,21 @@ class TableCellStyleSuggestionState(BaseModel):
     row_span_suggested: bool | None = Field(None, alias="rowSpanSuggested")
 
 
-class TableRowStyleSuggestionState(BaseModel):
+class TableRowStyleSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base TableRowStyle have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     min_row_height_suggested: bool | None = Field(None, alias="minRowHeightSuggested")
 
 
-class TabsCriteria(BaseModel):
+class TabsCriteria(ApiModel):
     """A criteria that specifies in which tabs a request executes."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     tab_ids: list[str] | None = Field(None, alias="tabIds")
 
 
-class TextStyleSuggestionState(BaseModel):
+class TextStyleSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base TextStyle have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color_suggested: bool | None = Field(
         None, alias="backgroundColorSuggested"
     )
@@ -729,29 +714,23 @@ class TextStyleSuggestionState(BaseModel):
     )
 
 
-class WeightedFontFamily(BaseModel):
+class WeightedFontFamily(ApiModel):
     """Represents a font family and weight of text."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     font_family: str | None = Field(None, alias="fontFamily")
     weight: int | None = Field(None)
 
 
-class WriteControl(BaseModel):
+class WriteControl(ApiModel):
     """Provides control over how write requests are executed."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     required_revision_id: str | None = Field(None, alias="requiredRevisionId")
     target_revision_id: str | None = Field(None, alias="targetRevisionId")
 
 
-class ImageProperties(BaseModel):
+class ImageProperties(ApiModel):
     """The properties of an image."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     angle: float | None = Field(None)
     brightness: float | None = Field(None)
     content_uri: str | None = Field(None, alias="contentUri")
@@ -761,11 +740,9 @@ class ImageProperties(BaseModel):
     transparency: float | None = Field(None)
 
 
-class ImagePropertiesSuggestionState(BaseModel):
+class ImagePropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base ImageProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     angle_suggested: bool | None = Field(None, alias="angleSuggested")
     brightness_suggested: bool | None = Field(None, alias="brightnessSuggested")
     content_uri_suggested: bool | None = Field(None, alias="contentUriSuggested")
@@ -777,11 +754,9 @@ class ImagePropertiesSuggestionState(BaseModel):
     transparency_suggested: bool | None = Field(None, alias="transparencySuggested")
 
 
-class SuggestedDateElementProperties(BaseModel):
+class SuggestedDateElementProperties(ApiModel):
     """A suggested change to a DateElementProperties."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     date_element_properties: DateElementProperties | None = Field(
         None, alias="dateElementProperties"
     )
@@ -790,67 +765,53 @@ class SuggestedDateElementProperties(BaseModel):
     ) = Field(None, alias="dateElementPropertiesSuggestionState")
 
 
-class PositionedObjectPositioning(BaseModel):
+class PositionedObjectPositioning(ApiModel):
     """The positioning of a PositionedObject. The positioned object is positioned relative to the beginning of the Paragraph it's tethered to."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     layout: PositionedObjectPositioningLayout | None = Field(None)
     left_offset: Dimension | None = Field(None, alias="leftOffset")
     top_offset: Dimension | None = Field(None, alias="topOffset")
 
 
-class SectionColumnProperties(BaseModel):
+class SectionColumnProperties(ApiModel):
     """Properties that apply to a section's column."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     padding_end: Dimension | None = Field(None, alias="paddingEnd")
     width: Dimension | None = Field(None)
 
 
-class Size(BaseModel):
+class Size(ApiModel):
     """A width and height."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     height: Dimension | None = Field(None)
     width: Dimension | None = Field(None)
 
 
-class TabStop(BaseModel):
+class TabStop(ApiModel):
     """A tab stop within a paragraph."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     alignment: TabStopAlignment | None = Field(None)
     offset: Dimension | None = Field(None)
 
 
-class TableColumnProperties(BaseModel):
+class TableColumnProperties(ApiModel):
     """The properties of a column in a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     width: Dimension | None = Field(None)
     width_type: TableColumnPropertiesWidthType | None = Field(None, alias="widthType")
 
 
-class TableRowStyle(BaseModel):
+class TableRowStyle(ApiModel):
     """Styles that apply to a table row."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     min_row_height: Dimension | None = Field(None, alias="minRowHeight")
     prevent_overflow: bool | None = Field(None, alias="preventOverflow")
     table_header: bool | None = Field(None, alias="tableHeader")
 
 
-class Link(BaseModel):
+class Link(ApiModel):
     """A reference to another portion of a document or an external URL resource."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     bookmark: BookmarkLink | None = Field(None)
     bookmark_id: str | None = Field(None, alias="bookmarkId")
     heading: HeadingLink | None = Field(None)
@@ -859,40 +820,32 @@ class Link(BaseModel):
     url: str | None = Field(None)
 
 
-class CreateFooterRequest(BaseModel):
+class CreateFooterRequest(ApiModel):
     """Creates a Footer. The new footer is applied to the SectionStyle at the location of the SectionBreak if specified, otherwise it is applied to the DocumentStyle. If a footer of the specified type already exists, a 400 bad request error is returned."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     section_break_location: Location | None = Field(None, alias="sectionBreakLocation")
     type: CreateFooterRequestType | None = Field(None)
 
 
-class CreateFootnoteRequest(BaseModel):
+class CreateFootnoteRequest(ApiModel):
     """Creates a Footnote segment and inserts a new FootnoteReference to it at the given location. The new Footnote segment will contain a space followed by a newline character."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
     )
     location: Location | None = Field(None)
 
 
-class CreateHeaderRequest(BaseModel):
+class CreateHeaderRequest(ApiModel):
     """Creates a Header. The new header is applied to the SectionStyle at the location of the SectionBreak if specified, otherwise it is applied to the DocumentStyle. If a header of the specified type already exists, a 400 bad request error is returned."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     section_break_location: Location | None = Field(None, alias="sectionBreakLocation")
     type: CreateFooterRequestType | None = Field(None)
 
 
-class InsertDateRequest(BaseModel):
+class InsertDateRequest(ApiModel):
     """Inserts a date at the specified location."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     date_element_properties: DateElementProperties | None = Field(
         None, alias="dateElementProperties"
     )
@@ -902,22 +855,18 @@ class InsertDateRequest(BaseModel):
     location: Location | None = Field(None)
 
 
-class InsertPageBreakRequest(BaseModel):
+class InsertPageBreakRequest(ApiModel):
     """Inserts a page break followed by a newline at the specified location."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
     )
     location: Location | None = Field(None)
 
 
-class InsertSectionBreakRequest(BaseModel):
+class InsertSectionBreakRequest(ApiModel):
     """Inserts a section break at the given location. A newline character will be inserted before the section break."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
     )
@@ -927,11 +876,9 @@ class InsertSectionBreakRequest(BaseModel):
     )
 
 
-class InsertTableRequest(BaseModel):
+class InsertTableRequest(ApiModel):
     """Inserts a table at the specified location. A newline character will be inserted before the inserted table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     columns: int | None = Field(None)
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
@@ -940,11 +887,9 @@ class InsertTableRequest(BaseModel):
     rows: int | None = Field(None)
 
 
-class InsertTextRequest(BaseModel):
+class InsertTextRequest(ApiModel):
     """Inserts text at the specified location."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
     )
@@ -952,30 +897,24 @@ class InsertTextRequest(BaseModel):
     text: str | None = Field(None)
 
 
-class PinTableHeaderRowsRequest(BaseModel):
+class PinTableHeaderRowsRequest(ApiModel):
     """Updates the number of pinned table header rows in a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     pinned_header_rows_count: int | None = Field(None, alias="pinnedHeaderRowsCount")
     table_start_location: Location | None = Field(None, alias="tableStartLocation")
 
 
-class TableCellLocation(BaseModel):
+class TableCellLocation(ApiModel):
     """Location of a single cell within a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     column_index: int | None = Field(None, alias="columnIndex")
     row_index: int | None = Field(None, alias="rowIndex")
     table_start_location: Location | None = Field(None, alias="tableStartLocation")
 
 
-class InsertPersonRequest(BaseModel):
+class InsertPersonRequest(ApiModel):
     """Inserts a person mention."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
     )
@@ -983,65 +922,51 @@ class InsertPersonRequest(BaseModel):
     person_properties: PersonProperties | None = Field(None, alias="personProperties")
 
 
-class CreateNamedRangeRequest(BaseModel):
+class CreateNamedRangeRequest(ApiModel):
     """Creates a NamedRange referencing the given range."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     name: str | None = Field(None)
     range: Range | None = Field(None)
 
 
-class CreateParagraphBulletsRequest(BaseModel):
+class CreateParagraphBulletsRequest(ApiModel):
     """Creates bullets for all of the paragraphs that overlap with the given range. The nesting level of each paragraph will be determined by counting leading tabs in front of each paragraph. To avoid excess space between the bullet and the corresponding paragraph, these leading tabs are removed by this request. This may change the indices of parts of the text. If the paragraph immediately before paragraphs being updated is in a list with a matching preset, the paragraphs being updated are added to that preceding list."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     bullet_preset: CreateParagraphBulletsRequestBulletPreset | None = Field(
         None, alias="bulletPreset"
     )
     range: Range | None = Field(None)
 
 
-class DeleteContentRangeRequest(BaseModel):
+class DeleteContentRangeRequest(ApiModel):
     """Deletes content from the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     range: Range | None = Field(None)
 
 
-class DeleteParagraphBulletsRequest(BaseModel):
+class DeleteParagraphBulletsRequest(ApiModel):
     """Deletes bullets from all of the paragraphs that overlap with the given range. The nesting level of each paragraph will be visually preserved by adding indent to the start of the corresponding paragraph."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     range: Range | None = Field(None)
 
 
-class NamedRange(BaseModel):
+class NamedRange(ApiModel):
     """A collection of Ranges with the same named range ID. Named ranges allow developers to associate parts of a document with an arbitrary user-defined label so their contents can be programmatically read or edited later. A document can contain multiple named ranges with the same name, but every named range has a unique ID. A named range is created with a single Range, and content inserted inside a named range generally expands that range. However, certain document changes can cause the range to be split into multiple ranges. Named ranges are not private. All applications and collaborators that have access to the document can see its named ranges."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     name: str | None = Field(None)
     named_range_id: str | None = Field(None, alias="namedRangeId")
     ranges: list[Range] | None = Field(None)
 
 
-class Color(BaseModel):
+class Color(ApiModel):
     """A solid color."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     rgb_color: RgbColor | None = Field(None, alias="rgbColor")
 
 
-class ParagraphStyleSuggestionState(BaseModel):
+class ParagraphStyleSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base ParagraphStyle have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     alignment_suggested: bool | None = Field(None, alias="alignmentSuggested")
     avoid_widow_and_orphan_suggested: bool | None = Field(
         None, alias="avoidWidowAndOrphanSuggested"
@@ -1077,31 +1002,25 @@ class ParagraphStyleSuggestionState(BaseModel):
     spacing_mode_suggested: bool | None = Field(None, alias="spacingModeSuggested")
 
 
-class LinkedContentReference(BaseModel):
+class LinkedContentReference(ApiModel):
     """A reference to the external linked source content."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     sheets_chart_reference: SheetsChartReference | None = Field(
         None, alias="sheetsChartReference"
     )
 
 
-class LinkedContentReferenceSuggestionState(BaseModel):
+class LinkedContentReferenceSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base LinkedContentReference have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     sheets_chart_reference_suggestion_state: (
         SheetsChartReferenceSuggestionState | None
     ) = Field(None, alias="sheetsChartReferenceSuggestionState")
 
 
-class DocumentStyleSuggestionState(BaseModel):
+class DocumentStyleSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base DocumentStyle have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_suggestion_state: BackgroundSuggestionState | None = Field(
         None, alias="backgroundSuggestionState"
     )
@@ -1149,67 +1068,53 @@ class DocumentStyleSuggestionState(BaseModel):
     )
 
 
-class AddDocumentTabRequest(BaseModel):
+class AddDocumentTabRequest(ApiModel):
     """Adds a document tab. When a tab is added at a given index, all subsequent tabs' indexes are incremented."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     tab_properties: TabProperties | None = Field(None, alias="tabProperties")
 
 
-class AddDocumentTabResponse(BaseModel):
+class AddDocumentTabResponse(ApiModel):
     """The result of adding a document tab."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     tab_properties: TabProperties | None = Field(None, alias="tabProperties")
 
 
-class UpdateDocumentTabPropertiesRequest(BaseModel):
+class UpdateDocumentTabPropertiesRequest(ApiModel):
     """Update the properties of a document tab."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     fields: str | None = Field(None)
     tab_properties: TabProperties | None = Field(None, alias="tabProperties")
 
 
-class DeleteNamedRangeRequest(BaseModel):
+class DeleteNamedRangeRequest(ApiModel):
     """Deletes a NamedRange."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     name: str | None = Field(None)
     named_range_id: str | None = Field(None, alias="namedRangeId")
     tabs_criteria: TabsCriteria | None = Field(None, alias="tabsCriteria")
 
 
-class ReplaceAllTextRequest(BaseModel):
+class ReplaceAllTextRequest(ApiModel):
     """Replaces all instances of text matching a criteria with replace text."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     contains_text: SubstringMatchCriteria | None = Field(None, alias="containsText")
     replace_text: str | None = Field(None, alias="replaceText")
     tabs_criteria: TabsCriteria | None = Field(None, alias="tabsCriteria")
 
 
-class ReplaceNamedRangeContentRequest(BaseModel):
+class ReplaceNamedRangeContentRequest(ApiModel):
     """Replaces the contents of the specified NamedRange or NamedRanges with the given replacement content. Note that an individual NamedRange may consist of multiple discontinuous ranges. In this case, only the content in the first range will be replaced. The other ranges and their content will be deleted. In cases where replacing or deleting any ranges would result in an invalid document structure, a 400 bad request error is returned."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     named_range_id: str | None = Field(None, alias="namedRangeId")
     named_range_name: str | None = Field(None, alias="namedRangeName")
     tabs_criteria: TabsCriteria | None = Field(None, alias="tabsCriteria")
     text: str | None = Field(None)
 
 
-class BulletSuggestionState(BaseModel):
+class BulletSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base Bullet have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     list_id_suggested: bool | None = Field(None, alias="listIdSuggested")
     nesting_level_suggested: bool | None = Field(None, alias="nestingLevelSuggested")
     text_style_suggestion_state: TextStyleSuggestionState | None = Field(
@@ -1217,11 +1122,9 @@ class BulletSuggestionState(BaseModel):
     )
 
 
-class NestingLevelSuggestionState(BaseModel):
+class NestingLevelSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base NestingLevel have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     bullet_alignment_suggested: bool | None = Field(
         None, alias="bulletAlignmentSuggested"
     )
@@ -1238,11 +1141,9 @@ class NestingLevelSuggestionState(BaseModel):
     )
 
 
-class SectionStyle(BaseModel):
+class SectionStyle(ApiModel):
     """The styling that applies to a section."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     column_properties: list[SectionColumnProperties] | None = Field(
         None, alias="columnProperties"
     )
@@ -1274,11 +1175,9 @@ class SectionStyle(BaseModel):
     )
 
 
-class InsertInlineImageRequest(BaseModel):
+class InsertInlineImageRequest(ApiModel):
     """Inserts an InlineObject containing an image at the given location."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_of_segment_location: EndOfSegmentLocation | None = Field(
         None, alias="endOfSegmentLocation"
     )
@@ -1287,21 +1186,17 @@ class InsertInlineImageRequest(BaseModel):
     uri: str | None = Field(None)
 
 
-class TableStyle(BaseModel):
+class TableStyle(ApiModel):
     """Styles that apply to a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_column_properties: list[TableColumnProperties] | None = Field(
         None, alias="tableColumnProperties"
     )
 
 
-class UpdateTableColumnPropertiesRequest(BaseModel):
+class UpdateTableColumnPropertiesRequest(ApiModel):
     """Updates the TableColumnProperties of columns in a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     column_indices: list[int] | None = Field(None, alias="columnIndices")
     fields: str | None = Field(None)
     table_column_properties: TableColumnProperties | None = Field(
@@ -1310,75 +1205,61 @@ class UpdateTableColumnPropertiesRequest(BaseModel):
     table_start_location: Location | None = Field(None, alias="tableStartLocation")
 
 
-class SuggestedTableRowStyle(BaseModel):
+class SuggestedTableRowStyle(ApiModel):
     """A suggested change to a TableRowStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_row_style: TableRowStyle | None = Field(None, alias="tableRowStyle")
     table_row_style_suggestion_state: TableRowStyleSuggestionState | None = Field(
         None, alias="tableRowStyleSuggestionState"
     )
 
 
-class UpdateTableRowStyleRequest(BaseModel):
+class UpdateTableRowStyleRequest(ApiModel):
     """Updates the TableRowStyle of rows in a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     fields: str | None = Field(None)
     row_indices: list[int] | None = Field(None, alias="rowIndices")
     table_row_style: TableRowStyle | None = Field(None, alias="tableRowStyle")
     table_start_location: Location | None = Field(None, alias="tableStartLocation")
 
 
-class DeleteTableColumnRequest(BaseModel):
+class DeleteTableColumnRequest(ApiModel):
     """Deletes a column from a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_cell_location: TableCellLocation | None = Field(
         None, alias="tableCellLocation"
     )
 
 
-class DeleteTableRowRequest(BaseModel):
+class DeleteTableRowRequest(ApiModel):
     """Deletes a row from a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_cell_location: TableCellLocation | None = Field(
         None, alias="tableCellLocation"
     )
 
 
-class InsertTableColumnRequest(BaseModel):
+class InsertTableColumnRequest(ApiModel):
     """Inserts an empty column into a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     insert_right: bool | None = Field(None, alias="insertRight")
     table_cell_location: TableCellLocation | None = Field(
         None, alias="tableCellLocation"
     )
 
 
-class InsertTableRowRequest(BaseModel):
+class InsertTableRowRequest(ApiModel):
     """Inserts an empty row into a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     insert_below: bool | None = Field(None, alias="insertBelow")
     table_cell_location: TableCellLocation | None = Field(
         None, alias="tableCellLocation"
     )
 
 
-class TableRange(BaseModel):
+class TableRange(ApiModel):
     """A table range represents a reference to a subset of a table. It's important to note that the cells specified by a table range do not necessarily form a rectangle. For example, let's say we have a 3 x 3 table where all the cells of the last row are merged together. The table looks like this: [ ] A table range with table cell location = (table_start_location, row = 0, column = 0), row span = 3 and column span = 2 specifies the following cells: x x [ x x x ]"""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     column_span: int | None = Field(None, alias="columnSpan")
     row_span: int | None = Field(None, alias="rowSpan")
     table_cell_location: TableCellLocation | None = Field(
@@ -1386,28 +1267,22 @@ class TableRange(BaseModel):
     )
 
 
-class NamedRanges(BaseModel):
+class NamedRanges(ApiModel):
     """A collection of all the NamedRanges in the document that share a given name."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     name: str | None = Field(None)
     named_ranges: list[NamedRange] | None = Field(None, alias="namedRanges")
 
 
-class OptionalColor(BaseModel):
+class OptionalColor(ApiModel):
     """A color that can either be fully opaque or fully transparent."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     color: Color | None = Field(None)
 
 
-class NamedStyleSuggestionState(BaseModel):
+class NamedStyleSuggestionState(ApiModel):
     """A suggestion state of a NamedStyle message."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     named_style_type: ParagraphStyleNamedStyleType | None = Field(
         None, alias="namedStyleType"
     )
@@ -1419,11 +1294,9 @@ class NamedStyleSuggestionState(BaseModel):
     )
 
 
-class EmbeddedObjectSuggestionState(BaseModel):
+class EmbeddedObjectSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base EmbeddedObject have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     description_suggested: bool | None = Field(None, alias="descriptionSuggested")
     embedded_drawing_properties_suggestion_state: (
         EmbeddedDrawingPropertiesSuggestionState | None
@@ -1447,11 +1320,9 @@ class EmbeddedObjectSuggestionState(BaseModel):
     title_suggested: bool | None = Field(None, alias="titleSuggested")
 
 
-class Response(BaseModel):
+class Response(ApiModel):
     """A single response from an update."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     add_document_tab: AddDocumentTabResponse | None = Field(
         None, alias="addDocumentTab"
     )
@@ -1472,21 +1343,17 @@ class Response(BaseModel):
     )
 
 
-class ListPropertiesSuggestionState(BaseModel):
+class ListPropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base ListProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     nesting_levels_suggestion_states: list[NestingLevelSuggestionState] | None = Field(
         None, alias="nestingLevelsSuggestionStates"
     )
 
 
-class SectionBreak(BaseModel):
+class SectionBreak(ApiModel):
     """A StructuralElement representing a section break. A section is a range of content that has the same SectionStyle. A section break represents the start of a new section, and the section style applies to the section after the section break. The document body always begins with a section break."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     section_style: SectionStyle | None = Field(None, alias="sectionStyle")
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
@@ -1494,45 +1361,35 @@ class SectionBreak(BaseModel):
     )
 
 
-class UpdateSectionStyleRequest(BaseModel):
+class UpdateSectionStyleRequest(ApiModel):
     """Updates the SectionStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     fields: str | None = Field(None)
     range: Range | None = Field(None)
     section_style: SectionStyle | None = Field(None, alias="sectionStyle")
 
 
-class MergeTableCellsRequest(BaseModel):
+class MergeTableCellsRequest(ApiModel):
     """Merges cells in a Table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_range: TableRange | None = Field(None, alias="tableRange")
 
 
-class UnmergeTableCellsRequest(BaseModel):
+class UnmergeTableCellsRequest(ApiModel):
     """Unmerges cells in a Table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_range: TableRange | None = Field(None, alias="tableRange")
 
 
-class Background(BaseModel):
+class Background(ApiModel):
     """Represents the background of a document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     color: OptionalColor | None = Field(None)
 
 
-class EmbeddedObjectBorder(BaseModel):
+class EmbeddedObjectBorder(ApiModel):
     """A border around an EmbeddedObject."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     color: OptionalColor | None = Field(None)
     dash_style: EmbeddedObjectBorderDashStyle | None = Field(None, alias="dashStyle")
     property_state: EmbeddedObjectBorderPropertyState | None = Field(
@@ -1541,40 +1398,32 @@ class EmbeddedObjectBorder(BaseModel):
     width: Dimension | None = Field(None)
 
 
-class ParagraphBorder(BaseModel):
+class ParagraphBorder(ApiModel):
     """A border around a paragraph."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     color: OptionalColor | None = Field(None)
     dash_style: EmbeddedObjectBorderDashStyle | None = Field(None, alias="dashStyle")
     padding: Dimension | None = Field(None)
     width: Dimension | None = Field(None)
 
 
-class Shading(BaseModel):
+class Shading(ApiModel):
     """The shading of a paragraph."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color: OptionalColor | None = Field(None, alias="backgroundColor")
 
 
-class TableCellBorder(BaseModel):
+class TableCellBorder(ApiModel):
     """A border around a table cell. Table cell borders cannot be transparent. To hide a table cell border, make its width 0."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     color: OptionalColor | None = Field(None)
     dash_style: EmbeddedObjectBorderDashStyle | None = Field(None, alias="dashStyle")
     width: Dimension | None = Field(None)
 
 
-class TextStyle(BaseModel):
+class TextStyle(ApiModel):
     """Represents the styling that can be applied to text. Inherited text styles are represented as unset fields in this message. A text style's parent depends on where the text style is defined: * The TextStyle of text in a Paragraph inherits from the paragraph's corresponding named style type. * The TextStyle on a named style inherits from the normal text named style. * The TextStyle of the normal text named style inherits from the default text style in the Docs editor. * The TextStyle on a Paragraph element that's contained in a table may inherit its text style from the table style. If the text style does not inherit from a parent, unsetting fields will revert the style to a value matching the defaults in the Docs editor."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color: OptionalColor | None = Field(None, alias="backgroundColor")
     baseline_offset: TextStyleBaselineOffset | None = Field(
         None, alias="baselineOffset"
@@ -1592,31 +1441,25 @@ class TextStyle(BaseModel):
     )
 
 
-class NamedStylesSuggestionState(BaseModel):
+class NamedStylesSuggestionState(ApiModel):
     """The suggestion state of a NamedStyles message."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     styles_suggestion_states: list[NamedStyleSuggestionState] | None = Field(
         None, alias="stylesSuggestionStates"
     )
 
 
-class InlineObjectPropertiesSuggestionState(BaseModel):
+class InlineObjectPropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base InlineObjectProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     embedded_object_suggestion_state: EmbeddedObjectSuggestionState | None = Field(
         None, alias="embeddedObjectSuggestionState"
     )
 
 
-class PositionedObjectPropertiesSuggestionState(BaseModel):
+class PositionedObjectPropertiesSuggestionState(ApiModel):
     """A mask that indicates which of the fields on the base PositionedObjectProperties have been changed in this suggestion. For any field set to true, there's a new suggested value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     embedded_object_suggestion_state: EmbeddedObjectSuggestionState | None = Field(
         None, alias="embeddedObjectSuggestionState"
     )
@@ -1625,21 +1468,17 @@ class PositionedObjectPropertiesSuggestionState(BaseModel):
     )
 
 
-class BatchUpdateDocumentResponse(BaseModel):
+class BatchUpdateDocumentResponse(ApiModel):
     """Response message from a BatchUpdateDocument request."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     document_id: str | None = Field(None, alias="documentId")
     replies: list[Response] | None = Field(None)
     write_control: WriteControl | None = Field(None, alias="writeControl")
 
 
-class DocumentStyle(BaseModel):
+class DocumentStyle(ApiModel):
     """The style of the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background: Background | None = Field(None)
     default_footer_id: str | None = Field(None, alias="defaultFooterId")
     default_header_id: str | None = Field(None, alias="defaultHeaderId")
@@ -1668,11 +1507,9 @@ class DocumentStyle(BaseModel):
     )
 
 
-class EmbeddedObject(BaseModel):
+class EmbeddedObject(ApiModel):
     """An embedded object in the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     description: str | None = Field(None)
     embedded_drawing_properties: EmbeddedDrawingProperties | None = Field(
         None, alias="embeddedDrawingProperties"
@@ -1692,11 +1529,9 @@ class EmbeddedObject(BaseModel):
     title: str | None = Field(None)
 
 
-class ParagraphStyle(BaseModel):
+class ParagraphStyle(ApiModel):
     """Styles that apply to a whole paragraph. Inherited paragraph styles are represented as unset fields in this message. A paragraph style's parent depends on where the paragraph style is defined: * The ParagraphStyle on a Paragraph inherits from the paragraph's corresponding named style type. * The ParagraphStyle on a named style inherits from the normal text named style. * The ParagraphStyle of the normal text named style inherits from the default paragraph style in the Docs editor. * The ParagraphStyle on a Paragraph element that's contained in a table may inherit its paragraph style from the table style. If the paragraph style does not inherit from a parent, unsetting fields will revert the style to a value matching the defaults in the Docs editor."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     alignment: ParagraphStyleAlignment | None = Field(None)
     avoid_widow_and_orphan: bool | None = Field(None, alias="avoidWidowAndOrphan")
     border_between: ParagraphBorder | None = Field(None, alias="borderBetween")
@@ -1723,11 +1558,9 @@ class ParagraphStyle(BaseModel):
     tab_stops: list[TabStop] | None = Field(None, alias="tabStops")
 
 
-class TableCellStyle(BaseModel):
+class TableCellStyle(ApiModel):
     """The style of a TableCell. Inherited table cell styles are represented as unset fields in this message. A table cell style can inherit from the table's style."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     background_color: OptionalColor | None = Field(None, alias="backgroundColor")
     border_bottom: TableCellBorder | None = Field(None, alias="borderBottom")
     border_left: TableCellBorder | None = Field(None, alias="borderLeft")
@@ -1744,21 +1577,17 @@ class TableCellStyle(BaseModel):
     row_span: int | None = Field(None, alias="rowSpan")
 
 
-class Bullet(BaseModel):
+class Bullet(ApiModel):
     """Describes the bullet of a paragraph."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     list_id: str | None = Field(None, alias="listId")
     nesting_level: int | None = Field(None, alias="nestingLevel")
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class NestingLevel(BaseModel):
+class NestingLevel(ApiModel):
     """Contains properties describing the look and feel of a list bullet at a given level of nesting."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     bullet_alignment: NestingLevelBulletAlignment | None = Field(
         None, alias="bulletAlignment"
     )
@@ -1771,70 +1600,56 @@ class NestingLevel(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class SuggestedTextStyle(BaseModel):
+class SuggestedTextStyle(ApiModel):
     """A suggested change to a TextStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     text_style: TextStyle | None = Field(None, alias="textStyle")
     text_style_suggestion_state: TextStyleSuggestionState | None = Field(
         None, alias="textStyleSuggestionState"
     )
 
 
-class UpdateTextStyleRequest(BaseModel):
+class UpdateTextStyleRequest(ApiModel):
     """Update the styling of text."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     fields: str | None = Field(None)
     range: Range | None = Field(None)
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class SuggestedDocumentStyle(BaseModel):
+class SuggestedDocumentStyle(ApiModel):
     """A suggested change to the DocumentStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     document_style: DocumentStyle | None = Field(None, alias="documentStyle")
     document_style_suggestion_state: DocumentStyleSuggestionState | None = Field(
         None, alias="documentStyleSuggestionState"
     )
 
 
-class UpdateDocumentStyleRequest(BaseModel):
+class UpdateDocumentStyleRequest(ApiModel):
     """Updates the DocumentStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     document_style: DocumentStyle | None = Field(None, alias="documentStyle")
     fields: str | None = Field(None)
     tab_id: str | None = Field(None, alias="tabId")
 
 
-class InlineObjectProperties(BaseModel):
+class InlineObjectProperties(ApiModel):
     """Properties of an InlineObject."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     embedded_object: EmbeddedObject | None = Field(None, alias="embeddedObject")
 
 
-class PositionedObjectProperties(BaseModel):
+class PositionedObjectProperties(ApiModel):
     """Properties of a PositionedObject."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     embedded_object: EmbeddedObject | None = Field(None, alias="embeddedObject")
     positioning: PositionedObjectPositioning | None = Field(None)
 
 
-class NamedStyle(BaseModel):
+class NamedStyle(ApiModel):
     """A named style. Paragraphs in the document can inherit their TextStyle and ParagraphStyle from this named style when they have the same named style type."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     named_style_type: ParagraphStyleNamedStyleType | None = Field(
         None, alias="namedStyleType"
     )
@@ -1842,73 +1657,59 @@ class NamedStyle(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class SuggestedParagraphStyle(BaseModel):
+class SuggestedParagraphStyle(ApiModel):
     """A suggested change to a ParagraphStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     paragraph_style: ParagraphStyle | None = Field(None, alias="paragraphStyle")
     paragraph_style_suggestion_state: ParagraphStyleSuggestionState | None = Field(
         None, alias="paragraphStyleSuggestionState"
     )
 
 
-class UpdateParagraphStyleRequest(BaseModel):
+class UpdateParagraphStyleRequest(ApiModel):
     """Update the styling of all paragraphs that overlap with the given range."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     fields: str | None = Field(None)
     paragraph_style: ParagraphStyle | None = Field(None, alias="paragraphStyle")
     range: Range | None = Field(None)
 
 
-class SuggestedTableCellStyle(BaseModel):
+class SuggestedTableCellStyle(ApiModel):
     """A suggested change to a TableCellStyle."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     table_cell_style: TableCellStyle | None = Field(None, alias="tableCellStyle")
     table_cell_style_suggestion_state: TableCellStyleSuggestionState | None = Field(
         None, alias="tableCellStyleSuggestionState"
     )
 
 
-class UpdateTableCellStyleRequest(BaseModel):
+class UpdateTableCellStyleRequest(ApiModel):
     """Updates the style of a range of table cells."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     fields: str | None = Field(None)
     table_cell_style: TableCellStyle | None = Field(None, alias="tableCellStyle")
     table_range: TableRange | None = Field(None, alias="tableRange")
     table_start_location: Location | None = Field(None, alias="tableStartLocation")
 
 
-class SuggestedBullet(BaseModel):
+class SuggestedBullet(ApiModel):
     """A suggested change to a Bullet."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     bullet: Bullet | None = Field(None)
     bullet_suggestion_state: BulletSuggestionState | None = Field(
         None, alias="bulletSuggestionState"
     )
 
 
-class ListProperties(BaseModel):
+class ListProperties(ApiModel):
     """The properties of a list that describe the look and feel of bullets belonging to paragraphs associated with a list."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     nesting_levels: list[NestingLevel] | None = Field(None, alias="nestingLevels")
 
 
-class AutoText(BaseModel):
+class AutoText(ApiModel):
     """A ParagraphElement representing a spot in the text that's dynamically replaced with content that can change over time, like a page number."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
         None, alias="suggestedInsertionIds"
@@ -1920,11 +1721,9 @@ class AutoText(BaseModel):
     type: AutoTextType | None = Field(None)
 
 
-class ColumnBreak(BaseModel):
+class ColumnBreak(ApiModel):
     """A ParagraphElement representing a column break. A column break makes the subsequent text start at the top of the next column."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
         None, alias="suggestedInsertionIds"
@@ -1935,11 +1734,9 @@ class ColumnBreak(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class DateElement(BaseModel):
+class DateElement(ApiModel):
     """A date instance mentioned in a document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     date_element_properties: DateElementProperties | None = Field(
         None, alias="dateElementProperties"
     )
@@ -1957,11 +1754,9 @@ class DateElement(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class FootnoteReference(BaseModel):
+class FootnoteReference(ApiModel):
     """A ParagraphElement representing a footnote reference. A footnote reference is the inline content rendered with a number and is used to identify the footnote."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     footnote_id: str | None = Field(None, alias="footnoteId")
     footnote_number: str | None = Field(None, alias="footnoteNumber")
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
@@ -1974,11 +1769,9 @@ class FootnoteReference(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class HorizontalRule(BaseModel):
+class HorizontalRule(ApiModel):
     """A ParagraphElement representing a horizontal line."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
         None, alias="suggestedInsertionIds"
@@ -1989,11 +1782,9 @@ class HorizontalRule(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class InlineObjectElement(BaseModel):
+class InlineObjectElement(ApiModel):
     """A ParagraphElement that contains an InlineObject."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     inline_object_id: str | None = Field(None, alias="inlineObjectId")
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
@@ -2005,11 +1796,9 @@ class InlineObjectElement(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class PageBreak(BaseModel):
+class PageBreak(ApiModel):
     """A ParagraphElement representing a page break. A page break makes the subsequent text start at the top of the next page."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
         None, alias="suggestedInsertionIds"
@@ -2020,11 +1809,9 @@ class PageBreak(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class Person(BaseModel):
+class Person(ApiModel):
     """A person or email address mentioned in a document. These mentions behave as a single, immutable element containing the person's name or email address."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     person_id: str | None = Field(None, alias="personId")
     person_properties: PersonProperties | None = Field(None, alias="personProperties")
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
@@ -2037,11 +1824,9 @@ class Person(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class RichLink(BaseModel):
+class RichLink(ApiModel):
     """A link to a Google resource (such as a file in Drive, a YouTube video, or a Calendar event)."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     rich_link_id: str | None = Field(None, alias="richLinkId")
     rich_link_properties: RichLinkProperties | None = Field(
         None, alias="richLinkProperties"
@@ -2056,11 +1841,9 @@ class RichLink(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class TextRun(BaseModel):
+class TextRun(ApiModel):
     """A ParagraphElement that represents a run of text that all has the same styling."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: str | None = Field(None)
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
@@ -2072,11 +1855,9 @@ class TextRun(BaseModel):
     text_style: TextStyle | None = Field(None, alias="textStyle")
 
 
-class SuggestedInlineObjectProperties(BaseModel):
+class SuggestedInlineObjectProperties(ApiModel):
     """A suggested change to InlineObjectProperties."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     inline_object_properties: InlineObjectProperties | None = Field(
         None, alias="inlineObjectProperties"
     )
@@ -2085,11 +1866,9 @@ class SuggestedInlineObjectProperties(BaseModel):
     ) = Field(None, alias="inlineObjectPropertiesSuggestionState")
 
 
-class SuggestedPositionedObjectProperties(BaseModel):
+class SuggestedPositionedObjectProperties(ApiModel):
     """A suggested change to PositionedObjectProperties."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     positioned_object_properties: PositionedObjectProperties | None = Field(
         None, alias="positionedObjectProperties"
     )
@@ -2098,19 +1877,15 @@ class SuggestedPositionedObjectProperties(BaseModel):
     ) = Field(None, alias="positionedObjectPropertiesSuggestionState")
 
 
-class NamedStyles(BaseModel):
+class NamedStyles(ApiModel):
     """The named styles. Paragraphs in the document can inherit their TextStyle and ParagraphStyle from these named styles."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     styles: list[NamedStyle] | None = Field(None)
 
 
-class Request(BaseModel):
+class Request(ApiModel):
     """A single update to apply to a document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     add_document_tab: AddDocumentTabRequest | None = Field(None, alias="addDocumentTab")
     create_footer: CreateFooterRequest | None = Field(None, alias="createFooter")
     create_footnote: CreateFootnoteRequest | None = Field(None, alias="createFootnote")
@@ -2197,22 +1972,18 @@ class Request(BaseModel):
     )
 
 
-class SuggestedListProperties(BaseModel):
+class SuggestedListProperties(ApiModel):
     """A suggested change to ListProperties."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     list_properties: ListProperties | None = Field(None, alias="listProperties")
     list_properties_suggestion_state: ListPropertiesSuggestionState | None = Field(
         None, alias="listPropertiesSuggestionState"
     )
 
 
-class ParagraphElement(BaseModel):
+class ParagraphElement(ApiModel):
     """A ParagraphElement describes content within a Paragraph."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     auto_text: AutoText | None = Field(None, alias="autoText")
     column_break: ColumnBreak | None = Field(None, alias="columnBreak")
     date_element: DateElement | None = Field(None, alias="dateElement")
@@ -2232,11 +2003,9 @@ class ParagraphElement(BaseModel):
     text_run: TextRun | None = Field(None, alias="textRun")
 
 
-class InlineObject(BaseModel):
+class InlineObject(ApiModel):
     """An object that appears inline with text. An InlineObject contains an EmbeddedObject such as an image."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     inline_object_properties: InlineObjectProperties | None = Field(
         None, alias="inlineObjectProperties"
     )
@@ -2248,11 +2017,9 @@ class InlineObject(BaseModel):
     suggested_insertion_id: str | None = Field(None, alias="suggestedInsertionId")
 
 
-class PositionedObject(BaseModel):
+class PositionedObject(ApiModel):
     """An object that's tethered to a Paragraph and positioned relative to the beginning of the paragraph. A PositionedObject contains an EmbeddedObject such as an image."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     object_id: str | None = Field(None, alias="objectId")
     positioned_object_properties: PositionedObjectProperties | None = Field(
         None, alias="positionedObjectProperties"
@@ -2264,31 +2031,25 @@ class PositionedObject(BaseModel):
     ) = Field(None, alias="suggestedPositionedObjectPropertiesChanges")
 
 
-class SuggestedNamedStyles(BaseModel):
+class SuggestedNamedStyles(ApiModel):
     """A suggested change to the NamedStyles."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     named_styles: NamedStyles | None = Field(None, alias="namedStyles")
     named_styles_suggestion_state: NamedStylesSuggestionState | None = Field(
         None, alias="namedStylesSuggestionState"
     )
 
 
-class BatchUpdateDocumentRequest(BaseModel):
+class BatchUpdateDocumentRequest(ApiModel):
     """Request message for BatchUpdateDocument."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     requests: list[Request] | None = Field(None)
     write_control: WriteControl | None = Field(None, alias="writeControl")
 
 
-class List(BaseModel):
+class List(ApiModel):
     """A List represents the list attributes for a group of paragraphs that all belong to the same list. A paragraph that's part of a list has a reference to the list's ID in its bullet."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     list_properties: ListProperties | None = Field(None, alias="listProperties")
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_id: str | None = Field(None, alias="suggestedInsertionId")
@@ -2297,11 +2058,9 @@ class List(BaseModel):
     )
 
 
-class Paragraph(BaseModel):
+class Paragraph(ApiModel):
     """A StructuralElement representing a paragraph. A paragraph is a range of content that's terminated with a newline character."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     bullet: Bullet | None = Field(None)
     elements: list[ParagraphElement] | None = Field(None)
     paragraph_style: ParagraphStyle | None = Field(None, alias="paragraphStyle")
@@ -2317,19 +2076,15 @@ class Paragraph(BaseModel):
     )
 
 
-class Body(BaseModel):
+class Body(ApiModel):
     """The document body. The body typically contains the full document contents except for headers, footers, and footnotes."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: list[StructuralElement] | None = Field(None)
 
 
-class Document(BaseModel):
+class Document(ApiModel):
     """A Google Docs document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     body: Body | None = Field(None)
     document_id: str | None = Field(None, alias="documentId")
     document_style: DocumentStyle | None = Field(None, alias="documentStyle")
@@ -2357,11 +2112,9 @@ class Document(BaseModel):
     title: str | None = Field(None)
 
 
-class DocumentTab(BaseModel):
+class DocumentTab(ApiModel):
     """A tab with document contents."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     body: Body | None = Field(None)
     document_style: DocumentStyle | None = Field(None, alias="documentStyle")
     footers: dict[str, Footer] | None = Field(None)
@@ -2382,38 +2135,30 @@ class DocumentTab(BaseModel):
     )
 
 
-class Footer(BaseModel):
+class Footer(ApiModel):
     """A document footer."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: list[StructuralElement] | None = Field(None)
     footer_id: str | None = Field(None, alias="footerId")
 
 
-class Footnote(BaseModel):
+class Footnote(ApiModel):
     """A document footnote."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: list[StructuralElement] | None = Field(None)
     footnote_id: str | None = Field(None, alias="footnoteId")
 
 
-class Header(BaseModel):
+class Header(ApiModel):
     """A document header."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: list[StructuralElement] | None = Field(None)
     header_id: str | None = Field(None, alias="headerId")
 
 
-class StructuralElement(BaseModel):
+class StructuralElement(ApiModel):
     """A StructuralElement describes content that provides structure to the document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_index: int | None = Field(None, alias="endIndex")
     paragraph: Paragraph | None = Field(None)
     section_break: SectionBreak | None = Field(None, alias="sectionBreak")
@@ -2422,21 +2167,17 @@ class StructuralElement(BaseModel):
     table_of_contents: TableOfContents | None = Field(None, alias="tableOfContents")
 
 
-class Tab(BaseModel):
+class Tab(ApiModel):
     """A tab in a document."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     child_tabs: list[Tab] | None = Field(None, alias="childTabs")
     document_tab: DocumentTab | None = Field(None, alias="documentTab")
     tab_properties: TabProperties | None = Field(None, alias="tabProperties")
 
 
-class Table(BaseModel):
+class Table(ApiModel):
     """A StructuralElement representing a table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     columns: int | None = Field(None)
     rows: int | None = Field(None)
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
@@ -2447,11 +2188,9 @@ class Table(BaseModel):
     table_style: TableStyle | None = Field(None, alias="tableStyle")
 
 
-class TableCell(BaseModel):
+class TableCell(ApiModel):
     """The contents and style of a cell in a Table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: list[StructuralElement] | None = Field(None)
     end_index: int | None = Field(None, alias="endIndex")
     start_index: int | None = Field(None, alias="startIndex")
@@ -2465,11 +2204,9 @@ class TableCell(BaseModel):
     table_cell_style: TableCellStyle | None = Field(None, alias="tableCellStyle")
 
 
-class TableOfContents(BaseModel):
+class TableOfContents(ApiModel):
     """A StructuralElement representing a table of contents."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     content: list[StructuralElement] | None = Field(None)
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
     suggested_insertion_ids: list[str] | None = Field(
@@ -2477,11 +2214,9 @@ class TableOfContents(BaseModel):
     )
 
 
-class TableRow(BaseModel):
+class TableRow(ApiModel):
     """The contents and style of a row in a Table."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
     end_index: int | None = Field(None, alias="endIndex")
     start_index: int | None = Field(None, alias="startIndex")
     suggested_deletion_ids: list[str] | None = Field(None, alias="suggestedDeletionIds")
@@ -5,11 +5,12 @@ Orchestrates pull/diff/push using serde + reconcile + comments packages.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from extradoc.api_types._generated import (
     BatchUpdateDocumentRequest,
@@ -22,13 +23,20 @@ from extradoc.comments._types import (
     DocumentWithComments,
 )
 from extradoc.mock.reindex import reindex_and_normalize_all_tabs
+from extradoc.mock.replay import ReplayDivergedError, replay_batches
 from extradoc.reconcile_v3.api import reconcile_batches as reconcile_v3_batches
-from extradoc.reconcile_v3.executor import execute_request_batches
+from extradoc.reconcile_v3.executor import (
+    BatchExecutionResult,
+    execute_request_batches,
+)
 from extradoc.serde._models import IndexXml
 from extradoc.serde.markdown import MarkdownSerde
 from extradoc.serde.xml import XmlSerde
+from extradoc.tracing import NULL_TRACER, Tracer
+from extradoc.transport import NotFoundError
 
 if TYPE_CHECKING:
+    from extradoc.diffmerge import TabExecutorMode
     from extradoc.serde import Serde
     from extradoc.transport import Transport
 
@@ -47,6 +55,8 @@ class PushResult:
     message: str = ""
     replies_created: int = 0
     comments_resolved: int = 0
+    # How the local folder was refreshed: "replayed", "fetched" or None
+    refreshed: str | None = None
 
 
 @dataclass
@@ -57,16 +67,27 @@ class DiffResult:
     batches: list[BatchUpdateDocumentRequest]
     comment_ops: CommentOperations
     base_revision_id: str | None = None
+    base: DocumentWithComments | None = None
+    format: str = "xml"
+    # Tab ID of a single-tab folder; None when it holds every tab
+    tab: str | None = None
 
 
 class DocsClient:
-    """Main client for Google Docs pull/diff/push operations."""
+    """Main client for Google Docs pull/diff/push operations.
+
+    Pass a ``tracer`` (see ``extradoc.tracing``) to record per-phase timing
+    spans and counters; the default records nothing.
+    """
 
     _xml_serde: Serde = XmlSerde()
     _md_serde: Serde = MarkdownSerde()
+    tracer: Tracer = NULL_TRACER
 
-    def __init__(self, transport: Transport) -> None:
+    def __init__(self, transport: Transport, *, tracer: Tracer | None = None) -> None:
         self._transport = transport
+        if tracer is not None:
+            self.tracer = tracer
 
     def _get_serde(self, format: str) -> Serde:
         """Return the appropriate serde for the given format."""
@@ -79,96 +100,225 @@ class DocsClient:
         *,
         save_raw: bool = True,
         format: str = "xml",
-    ) -> None:
+        force: bool = False,
+        tab: str | None = None,
+    ) -> bool:
         """Pull a document from Google Docs to local files.
 
+        An existing folder that is already up to date (see
+        ``is_up_to_date``) is left alone.
+
+        With ``tab``, only that tab is fetched (see
+        ``Transport.get_document_tab``) and written.  Diff and push on such
+        a folder leave the document's other tabs alone.
+
         Args:
             document_id: The document identifier
             output_path: Parent directory for the output folder
             save_raw: Whether to save optional raw sidecars such as comments.json
             format: Output format — "xml" (default) or "markdown"
+            force: Fetch and rewrite the folder even if it is up to date
+            tab: ID or title of the one tab to pull (default: every tab)
+
+        Returns:
+            True if the folder was written, False if it was up to date
         """
-        output_path = Path(output_path)
+        document_dir = Path(output_path) / document_id
+        if not force and await self.is_up_to_date(
+            document_id, document_dir, format=format, save_raw=save_raw, tab=tab
+        ):
+            self.tracer.count("pull.skipped")
+            return False
+        await self._pull_into(
+            document_id, document_dir, save_raw=save_raw, format=format, tab=tab
+        )
+        return True
+
+    async def is_up_to_date(
+        self,
+        document_id: str,
+        folder: str | Path,
+        *,
+        format: str = "xml",
+        save_raw: bool = False,
+        tab: str | None = None,
+    ) -> bool:
+        """Return True if *folder* still holds the live document and comments.
+
+        Local checks come first: the folder must be a *format* pull of
+        *document_id* (of the same *tab*, or of every tab) whose files are
+        untouched since that pull.  Then two
+        small requests run concurrently — the ``revisionId`` alone, and the
+        comments modified after the high-water mark recorded in index.xml —
+        instead of the full document and comment list.
+
+        Args:
+            document_id: The document identifier
+            folder: The document folder a previous pull wrote
+            format: The format the caller wants — "xml" or "markdown"
+            save_raw: Whether the caller wants the .raw/comments.json sidecar
+            tab: ID or title of the one tab the caller wants (default: all)
+        """
+        folder = Path(folder)
+        index_path = _index_path(folder)
+        if not index_path.exists():
+            return False
+        index = IndexXml.from_xml_string(index_path.read_text(encoding="utf-8"))
+        if index.id != document_id or index.format != format or not index.revision:
+            return False
+        if not _index_holds_tab(index, tab):
+            return False
+        if (
+            save_raw
+            and index.comments_modified
+            and not (folder / RAW_DIR / "comments.json").exists()
+        ):
+            return False
+        with self.tracer.span("pull.check_local"):
+            if not self._get_serde(format).is_pristine(folder):
+                return False
+
+        with self.tracer.span("pull.check_remote"):
+            revision_id, comments_changed = await asyncio.gather(
+                self._transport.get_revision_id(document_id),
+                self._transport.comments_changed_since(
+                    document_id, index.comments_modified
+                ),
+            )
+        return revision_id == index.revision and not comments_changed
+
+    async def _pull_into(
+        self,
+        document_id: str,
+        document_dir: Path,
+        *,
+        save_raw: bool,
+        format: str,
+        tab: str | None = None,
+    ) -> None:
+        """Fetch *document_id* (or one *tab*) and write it to *document_dir*."""
+        tracer = self.tracer
 
         # Fetch document and comments
-        document_data = await self._transport.get_document(document_id)
-        raw_comments = await self._transport.list_comments(document_id)
+        with tracer.span("pull.get_document", tab=tab):
+            if tab is None:
+                document_data = await self._transport.get_document(document_id)
+            else:
+                document_data = await self._transport.get_document_tab(document_id, tab)
+        with tracer.span("pull.list_comments"):
+            raw_comments = await self._transport.list_comments(document_id)
 
         # Parse into typed models
-        doc = Document.model_validate(document_data.raw)
-        file_comments = comments_from_raw(document_id, raw_comments)
-        bundle = DocumentWithComments(document=doc, comments=file_comments)
+        with tracer.span("pull.parse"):
+            doc = document_data.to_document()
+            file_comments = comments_from_raw(document_id, raw_comments)
+        tab_id = None
+        if tab is not None:
+            if not doc.tabs:
+                raise NotFoundError(f"Tab not found in {document_id}: {tab}")
+            # Record the ID even when the caller named the tab by title
+            props = doc.tabs[0].tab_properties
+            tab_id = props.tab_id if props else None
+        bundle = DocumentWithComments(
+            document=doc, comments=file_comments, tab=tab_id or tab
+        )
 
-        document_dir = output_path / document_id
         serde_impl = self._get_serde(format)
-        serde_impl.serialize(bundle, document_dir)
+        with tracer.span("pull.serialize", format=format):
+            serde_impl.serialize(bundle, document_dir)
 
         # Optional: save raw comments JSON for debugging
         if save_raw and raw_comments:
-            raw_dir = document_dir / RAW_DIR
-            raw_dir.mkdir(parents=True, exist_ok=True)
-            raw_comments_path = raw_dir / "comments.json"
-            raw_comments_path.write_text(
-                json.dumps({"comments": raw_comments}, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            _write_raw_comments(document_dir, raw_comments)
 
-    def diff(self, folder: str | Path) -> DiffResult:
+    def diff(
+        self,
+        folder: str | Path,
+        *,
+        tab_executor: TabExecutorMode = "serial",
+        max_workers: int | None = None,
+    ) -> DiffResult:
         """Compare current files against pristine and generate batch requests.
 
         This is local-only and does not make any API calls.
 
         Args:
             folder: Path to document folder (containing index.xml)
+            tab_executor: "thread" or "process" to diff independent tabs in
+                parallel on large multi-tab documents (default "serial")
+            max_workers: Pool size for the parallel modes
 
         Returns:
             DiffResult with document_id, batches, and comment_ops
         """
         folder = Path(folder)
+        tracer = self.tracer
         document_id = _read_document_id(folder)
 
-        # New layout: .extrasuite/index.xml; legacy: index.xml at root
-        index_path = folder / ".extrasuite" / "index.xml"
-        if not index_path.exists():
-            index_path = folder / "index.xml"
+        index_path = _index_path(folder)
         index = IndexXml.from_xml_string(index_path.read_text(encoding="utf-8"))
-        serde_impl = self._get_serde(index.format or "xml")
+        format = index.format or "xml"
+        serde_impl = self._get_serde(format)
 
-        result = serde_impl.deserialize(folder)
+        with tracer.span("diff.deserialize", format=format):
+            result = serde_impl.deserialize(folder, tracer=tracer)
 
         base = result.base
-        desired_dict = result.desired.document.model_dump(
-            by_alias=True, exclude_none=True
-        )
-        reindex_and_normalize_all_tabs(desired_dict)
-        desired_doc = Document.model_validate(desired_dict)
-        batches = _reconcile_documents(base.document, desired_doc)
-        comment_ops = diff_comments(base.comments, result.desired.comments)
+        desired_doc = result.desired.document
+        if not result.desired_reindexed:
+            with tracer.span("diff.reindex"):
+                desired_dict = desired_doc.model_dump(by_alias=True, exclude_none=True)
+                reindex_and_normalize_all_tabs(desired_dict)
+                desired_doc = Document.model_validate(desired_dict)
+        with tracer.span("diff.reconcile"):
+            batches = _reconcile_documents(
+                base.document,
+                desired_doc,
+                tab_executor=tab_executor,
+                max_workers=max_workers,
+                tracer=tracer,
+            )
+        with tracer.span("diff.comments"):
+            comment_ops = diff_comments(base.comments, result.desired.comments)
 
         return DiffResult(
             document_id=document_id,
             batches=batches,
             comment_ops=comment_ops,
             base_revision_id=base.document.revision_id,
+            base=base,
+            format=format,
+            tab=index.tab,
         )
 
-    async def push(self, folder: str | Path, *, force: bool = False) -> PushResult:
+    async def push(
+        self, folder: str | Path, *, force: bool = False, refresh: bool = False
+    ) -> PushResult:
         """Push local changes to Google Docs.
 
         Comment operations execute before document changes so that anchor
         positions (relative to the current live document) are not shifted
         by document mutations.
 
+        With ``refresh``, the folder is rewritten afterwards as if it had
+        just been pulled, so it can be edited and pushed again.  The pushed
+        batches are replayed on ``MockGoogleDocsAPI`` and the result is
+        checked against the live ``revisionId`` (one field-masked GET); the
+        document is only fetched again when the replay cannot be trusted.
+
         Args:
             folder: Path to document folder
             force: Reserved for future use
+            refresh: Refresh the folder's base and pristine after pushing
 
         Returns:
             PushResult with success status and details
         """
         _ = force
         folder = Path(folder)
-        result = self.diff(folder)
+        tracer = self.tracer
+        with tracer.span("push.diff"):
+            result = self.diff(folder)
 
         if not result.batches and not result.comment_ops.has_operations:
             return PushResult(
@@ -179,43 +329,24 @@ class DocsClient:
             )
 
         # --- 1. Comment operations (Drive API — before document changes) ---
-        replies_created = 0
-        comments_resolved = 0
-        edits_applied = 0
-        ops = result.comment_ops
-
-        for r in ops.new_replies:
-            await self._transport.create_reply(
-                result.document_id, r.comment_id, r.content
-            )
-            replies_created += 1
-
-        for s in ops.resolves:
-            await self._transport.create_reply(
-                result.document_id, s.comment_id, "", action="resolve"
-            )
-            comments_resolved += 1
-
-        for e in ops.edits:
-            await self._transport.edit_comment(
-                result.document_id, e.comment_id, e.content
-            )
-            edits_applied += 1
-
-        for d in ops.deletes:
-            await self._transport.delete_comment(result.document_id, d.comment_id)
+        with tracer.span("push.comments"):
+            (
+                replies_created,
+                comments_resolved,
+                edits_applied,
+            ) = await self._push_comments(result.document_id, result.comment_ops)
 
-        for re_ in ops.reply_edits:
-            await self._transport.edit_reply(
-                result.document_id, re_.comment_id, re_.reply_id, re_.content
+        # --- 2. Document batches (Docs API — reconcile output) ---
+        with tracer.span("push.execute", batches=len(result.batches)):
+            execution = await _execute_document_batches(
+                self._transport, result, tracer=tracer
             )
-            edits_applied += 1
+        changes_applied = sum(len(batch.requests or []) for batch in result.batches)
 
-        # --- 2. Document batches (Docs API — reconcile output) ---
-        changes_applied = await _execute_document_batches(
-            self._transport,
-            result,
-        )
+        refreshed = None
+        if refresh:
+            with tracer.span("push.refresh"):
+                refreshed = await self._refresh_folder(folder, result, execution)
 
         # Build result message
         parts: list[str] = []
@@ -229,6 +360,8 @@ class DocsClient:
             parts.append(f"{edits_applied} comment edits")
 
         message = "Applied " + ", ".join(parts) if parts else "No changes to apply"
+        if refreshed:
+            message += "; local files refreshed"
 
         return PushResult(
             success=True,
@@ -237,36 +370,186 @@ class DocsClient:
             message=message,
             replies_created=replies_created,
             comments_resolved=comments_resolved,
+            refreshed=refreshed,
         )
 
+    async def _refresh_folder(
+        self,
+        folder: Path,
+        result: DiffResult,
+        execution: BatchExecutionResult,
+    ) -> str:
+        """Rewrite *folder* to match the document after a push.
+
+        Returns "replayed" when the replay was verified against the live
+        revision, "fetched" when the document had to be pulled again.
+        """
+        tracer = self.tracer
+        document_id = result.document_id
+        document = await self._replayed_document(result, execution)
+
+        if document is None:
+            with tracer.span("push.refresh.fetch"):
+                await self._pull_into(
+                    document_id,
+                    folder,
+                    save_raw=(folder / RAW_DIR / "comments.json").exists(),
+                    format=result.format,
+                    tab=result.tab,
+                )
+            return "fetched"
+
+        assert result.base is not None
+        comments = result.base.comments
+        raw_comments = None
+        if result.comment_ops.has_operations:
+            with tracer.span("push.refresh.list_comments"):
+                raw_comments = await self._transport.list_comments(document_id)
+            comments = comments_from_raw(document_id, raw_comments)
+
+        bundle = DocumentWithComments(
+            document=document, comments=comments, tab=result.tab
+        )
+        with tracer.span("push.refresh.serialize", format=result.format):
+            self._get_serde(result.format).serialize(bundle, folder)
+        if raw_comments and (folder / RAW_DIR / "comments.json").exists():
+            _write_raw_comments(folder, raw_comments)
+        return "replayed"
+
+    async def _replayed_document(
+        self, result: DiffResult, execution: BatchExecutionResult
+    ) -> Document | None:
+        """Return the replayed post-push document, or None if it is not trusted."""
+        if result.base is None:
+            return None
+        base = result.base.document
+        if result.batches:
+            revision_id = execution.final_revision_id
+            with self.tracer.span("push.refresh.replay", batches=len(result.batches)):
+                try:
+                    document = replay_batches(
+                        base,
+                        result.batches,
+                        execution.responses,
+                        revision_id=revision_id,
+                    )
+                except ReplayDivergedError as e:
+                    logger.info("Push replay diverged, fetching instead: %s", e)
+                    return None
+        else:
+            revision_id = base.revision_id
+            document = base
+        if revision_id is None:
+            return None
+
+        # Someone else may have edited between our last batch and now
+        with self.tracer.span("push.refresh.verify"):
+            live_revision_id = await self._transport.get_revision_id(result.document_id)
+        if live_revision_id != revision_id:
+            logger.info(
+                "Document moved to revision %s after push (expected %s); fetching",
+                live_revision_id,
+                revision_id,
+            )
+            return None
+        return document
+
+    async def _push_comments(
+        self, document_id: str, ops: CommentOperations
+    ) -> tuple[int, int, int]:
+        """Apply comment operations; return (replies, resolves, edits) counts."""
+        replies_created = 0
+        comments_resolved = 0
+        edits_applied = 0
+
+        for r in ops.new_replies:
+            await self._transport.create_reply(document_id, r.comment_id, r.content)
+            replies_created += 1
+
+        for s in ops.resolves:
+            await self._transport.create_reply(
+                document_id, s.comment_id, "", action="resolve"
+            )
+            comments_resolved += 1
+
+        for e in ops.edits:
+            await self._transport.edit_comment(document_id, e.comment_id, e.content)
+            edits_applied += 1
+
+        for d in ops.deletes:
+            await self._transport.delete_comment(document_id, d.comment_id)
+
+        for re_ in ops.reply_edits:
+            await self._transport.edit_reply(
+                document_id, re_.comment_id, re_.reply_id, re_.content
+            )
+            edits_applied += 1
+
+        return replies_created, comments_resolved, edits_applied
+
 
 def _reconcile_documents(
     base: Document,
     desired: Document,
+    *,
+    tab_executor: TabExecutorMode = "serial",
+    max_workers: int | None = None,
+    tracer: Tracer = NULL_TRACER,
 ) -> list[BatchUpdateDocumentRequest]:
-    return reconcile_v3_batches(base, desired)
+    return reconcile_v3_batches(
+        base,
+        desired,
+        tab_executor=tab_executor,
+        max_workers=max_workers,
+        tracer=tracer,
+    )
 
 
 async def _execute_document_batches(
     transport: Transport,
     result: DiffResult,
-) -> int:
-    await execute_request_batches(
+    *,
+    tracer: Tracer = NULL_TRACER,
+) -> BatchExecutionResult:
+    return await execute_request_batches(
         transport,
         document_id=result.document_id,
         request_batches=result.batches,
         initial_revision_id=result.base_revision_id,
+        tracer=tracer,
     )
-    return sum(len(batch.requests or []) for batch in result.batches)
 
 
-def _read_document_id(folder: Path) -> str:
-    """Read the document ID from index.xml (.extrasuite/ or root)."""
-    # New layout: .extrasuite/index.xml
+def _write_raw_comments(document_dir: Path, raw_comments: list[dict[str, Any]]) -> None:
+    """Save the raw Drive comments JSON under .raw/ for debugging."""
+    raw_dir = document_dir / RAW_DIR
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    (raw_dir / "comments.json").write_text(
+        json.dumps({"comments": raw_comments}, indent=2, ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+
+def _index_path(folder: Path) -> Path:
+    """Return the folder's index.xml path (.extrasuite/ or root)."""
+    # New layout: .extrasuite/index.xml; legacy: index.xml at root
     index_path = folder / ".extrasuite" / "index.xml"
     if not index_path.exists():
-        # Legacy layout: index.xml at root
         index_path = folder / "index.xml"
+    return index_path
+
+
+def _index_holds_tab(index: IndexXml, tab: str | None) -> bool:
+    """Return True if the folder *index* describes was pulled for *tab*."""
+    if tab is None or index.tab is None:
+        return tab == index.tab
+    titles = {t.title for t in index.all_tabs_flat() if t.id == index.tab}
+    return tab == index.tab or tab in titles
+
+
+def _read_document_id(folder: Path) -> str:
+    """Read the document ID from index.xml (.extrasuite/ or root)."""
+    index_path = _index_path(folder)
     if not index_path.exists():
         return folder.name
     index = IndexXml.from_xml_string(index_path.read_text(encoding="utf-8"))
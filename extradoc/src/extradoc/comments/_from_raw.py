@@ -63,4 +63,22 @@ def from_raw(file_id: str, raw_comments: list[dict[str, Any]]) -> FileComments:
         FileComments with all comments (including deleted ones, for completeness)
     """
     comments = [_parse_comment(c) for c in raw_comments]
-    return FileComments(file_id=file_id, comments=comments)
+    return FileComments(
+        file_id=file_id,
+        comments=comments,
+        modified_time=modified_high_water_mark(raw_comments),
+    )
+
+
+def modified_high_water_mark(raw_comments: list[dict[str, Any]]) -> str | None:
+    """Return the latest modifiedTime (or createdTime) of any comment or reply.
+
+    Drive timestamps are RFC 3339 UTC strings of one fixed format, so they
+    compare correctly as strings.
+    """
+    times = [
+        item.get("modifiedTime") or item.get("createdTime") or ""
+        for comment in raw_comments
+        for item in (comment, *comment.get("replies", []))
+    ]
+    return max(times, default="") or None
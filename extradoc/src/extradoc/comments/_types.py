@@ -46,6 +46,8 @@ class FileComments:
 
     file_id: str
     comments: list[Comment] = field(default_factory=list)
+    # Latest Drive modifiedTime across comments and replies, when known
+    modified_time: str | None = None
 
     @property
     def active_comments(self) -> list[Comment]:
@@ -59,6 +61,8 @@ class DocumentWithComments:
 
     document: Document
     comments: FileComments
+    # Tab ID when only that tab was pulled; None for the whole document
+    tab: str | None = None
 
 
 # ---------------------------------------------------------------------------
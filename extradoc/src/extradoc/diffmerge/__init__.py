@@ -4,11 +4,16 @@ Public API
 ----------
 - ``diff(base, desired)`` → list of DiffOp describing what changed.
 - ``apply(base_dict, ops)`` → new document dict with ops applied to base.
+- ``apply_to_document(base, ops)`` → new ``Document``; only touched tabs are
+  dumped, patched, reindexed and re-validated.
 - ``DiffOp`` — union type of all diff operation dataclasses.
+- ``DiffStats`` — optional counters for fingerprint-skipped tabs/segments.
 """
 
 from extradoc.diffmerge.apply_ops import apply_ops_to_document as apply
+from extradoc.diffmerge.apply_ops import apply_ops_to_model as apply_to_document
 from extradoc.diffmerge.content_align import ContentAlignment
+from extradoc.diffmerge.diff import DiffStats, TabExecutorMode
 from extradoc.diffmerge.diff import diff_documents as diff
 from extradoc.diffmerge.errors import (
     CoordinateNotResolvedError,
@@ -69,6 +74,7 @@ __all__ = [
     "DeleteTableColumnOp",
     "DeleteTableRowOp",
     "DiffOp",
+    "DiffStats",
     "InsertFootnoteOp",
     "InsertInlineObjectOp",
     "InsertListOp",
@@ -79,6 +85,7 @@ __all__ = [
     "InsertTableRowOp",
     "ReconcileV3Error",
     "ReconcileV3InvariantError",
+    "TabExecutorMode",
     "UnsupportedReconcileV3Error",
     "UpdateBodyContentOp",
     "UpdateDocumentStyleOp",
@@ -92,5 +99,6 @@ __all__ = [
     "UpdateTableColumnPropertiesOp",
     "UpdateTableRowStyleOp",
     "apply",
+    "apply_to_document",
     "diff",
 ]
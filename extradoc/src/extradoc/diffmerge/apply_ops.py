@@ -7,6 +7,10 @@ This module supports the 3-way merge deserialize workflow:
     desired   = apply_ops_to_document(base, ops)
 
 The function works entirely on raw dicts (not Pydantic models).
+
+``apply_ops_to_model`` is the model-level entry point used by the serdes:
+only the tabs the ops touch are dumped, patched in place, reindexed and
+re-validated; untouched tabs are shared with the base ``Document``.
 """
 
 from __future__ import annotations
@@ -16,7 +20,7 @@ import copy
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from extradoc.api_types._generated import StructuralElement
+    from extradoc.api_types._generated import Document, StructuralElement
     from extradoc.diffmerge.content_align import ContentAlignment
     from extradoc.diffmerge.model import ReconcileOp
 
@@ -48,6 +52,81 @@ def apply_ops_to_document(
     dict
         Deep copy of base_doc with all ops applied.
     """
+    doc = copy.deepcopy(base_doc)
+    _apply_ops_in_place(doc, ops)
+    return doc
+
+
+def apply_ops_to_model(base: Document, ops: list[ReconcileOp]) -> Document:
+    """Apply ops to a base ``Document``, re-validating only the touched tabs.
+
+    Tabs that no op targets are shared with *base* (not copied), so the
+    result must be treated as immutable.  Touched and inserted tabs are
+    dumped, patched in place, then reindexed and normalized the way
+    ``reindex_and_normalize_all_tabs`` would, and validated one tab at a
+    time.  Untouched tabs keep their API-accurate indices.
+
+    Documents whose tabs lack unique IDs fall back to one whole-document
+    dump / apply / reindex / validate pass.
+    """
+    from extradoc.api_types._generated import Document, Tab
+    from extradoc.mock.reindex import (
+        reindex_and_normalize_all_tabs,
+        reindex_and_normalize_tab,
+    )
+
+    base_tabs = base.tabs or []
+    tab_ids = [t.tab_properties.tab_id if t.tab_properties else None for t in base_tabs]
+    if not base_tabs or None in tab_ids or len(set(tab_ids)) != len(tab_ids):
+        whole = base.model_dump(by_alias=True, exclude_none=True)
+        _apply_ops_in_place(whole, ops)
+        _drop_none_values(whole)
+        reindex_and_normalize_all_tabs(whole)
+        return Document.model_validate(whole)
+
+    touched = {getattr(op, "tab_id", None) for op in ops}
+    # Untouched tabs enter the working dict as id-only shells; ops find
+    # tabs by tabProperties.tabId, so a shell can still be deleted or
+    # have tabs inserted around it.
+    shells: dict[int, Tab] = {}
+    tab_dicts: list[dict[str, Any]] = []
+    for tab, tab_id in zip(base_tabs, tab_ids, strict=True):
+        if tab_id in touched:
+            tab_dicts.append(tab.model_dump(by_alias=True, exclude_none=True))
+        else:
+            shell: dict[str, Any] = {"tabProperties": {"tabId": tab_id}}
+            shells[id(shell)] = tab
+            tab_dicts.append(shell)
+
+    doc: dict[str, Any] = {"tabs": tab_dicts}
+    _apply_ops_in_place(doc, ops)
+
+    tabs: list[Tab] = []
+    for tab_dict in doc.get("tabs") or []:
+        kept = shells.get(id(tab_dict))
+        if kept is None:
+            # Match a validate + exclude_none dump: ops may leave None values
+            _drop_none_values(tab_dict)
+            reindex_and_normalize_tab(tab_dict)
+            kept = Tab.model_validate(tab_dict)
+        tabs.append(kept)
+    return base.model_copy(update={"tabs": tabs})
+
+
+def _drop_none_values(node: Any) -> None:
+    """Remove ``None``-valued keys from every dict in *node*, in place."""
+    if isinstance(node, dict):
+        for key in [k for k, v in node.items() if v is None]:
+            del node[key]
+        for value in node.values():
+            _drop_none_values(value)
+    elif isinstance(node, list):
+        for item in node:
+            _drop_none_values(item)
+
+
+def _apply_ops_in_place(doc: dict[str, Any], ops: list[ReconcileOp]) -> None:
+    """Apply *ops* to *doc*, mutating it."""
     # Import here to avoid circular imports at module load time
     from extradoc.diffmerge.model import (
         CreateFooterOp,
@@ -81,8 +160,6 @@ def apply_ops_to_document(
         UpdateTableRowStyleOp,
     )
 
-    doc = copy.deepcopy(base_doc)
-
     # Collect child_ops from UpdateBodyContentOp. These are table structural
     # ops meant for the lowerer (API request generation), not for in-memory
     # application. The UpdateBodyContentOp's alignment already incorporates
@@ -163,8 +240,6 @@ def apply_ops_to_document(
     if __debug__:
         _assert_indices_well_formed(doc)
 
-    return doc
-
 
 # ---------------------------------------------------------------------------
 # Tab ops
@@ -80,6 +80,29 @@ desired index) are resolved by dropping the lower-similarity table pair.
 After anchors are finalised, the sub-ranges (gaps) between consecutive
 anchors are re-DP'd to avoid any match that would straddle a pin.
 
+Anchor-and-band mode
+~~~~~~~~~~~~~~~~~~~~
+The full DP is O(m·n) in time and memory, which is minutes of work for a
+tab with thousands of paragraphs.  For large inputs (``ANCHORED_ALIGN_MIN_CELLS``)
+``align_content`` instead pins the longest monotonic chain of unique
+exact-text anchors (``_patience_anchors``, a patience-diff variant of the
+pre-pin pass) and aligns each gap between anchors separately: small gaps
+with the full DP, large gaps with a DP restricted to a diagonal band of
+half-width ``DP_BAND_WIDTH``.  When most paragraphs are unchanged almost
+every paragraph becomes an anchor and the total work is near-linear.
+
+Linear-space DP
+~~~~~~~~~~~~~~~
+Backtracking the full DP needs the whole ``(m+1)·(n+1)`` matrix.  Above
+``LINEAR_SPACE_DP_MIN_CELLS`` cells ``_dp_align`` switches to
+``_linear_space_dp_align``, a Hirschberg-style divide and conquer that keeps
+two rolling rows.  Instead of meeting a backward pass in the middle, each
+forward pass also carries, for every cell below the middle row, the column
+at which the backtrack from that cell would first reach the middle row.  The
+split point is therefore exactly where the full backtrack crosses, and the
+result — including the prefer-match-then-delete tie-breaks — is identical
+to the full DP for about twice the ``match_cost`` evaluations.
+
 Cost Model
 ----------
 Higher penalty → the algorithm prefers to match rather than delete+insert.
@@ -104,10 +127,13 @@ dissimilarity.  For tables, it uses ``table_similarity`` from table_diff.py.
 from __future__ import annotations
 
 import math
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from extradoc.api_types._generated import (
         Paragraph,
         StructuralElement,
@@ -148,6 +174,37 @@ footnote reference placeholders."""
 INFINITE_PENALTY: float = math.inf
 """Penalty applied to the terminal element so it is never deleted/inserted."""
 
+ANCHORED_ALIGN_MIN_CELLS: int = 1_000_000
+"""DP size (m·n of the terminal-stripped sequences) above which
+``align_content`` switches to anchor-and-band alignment by default.
+
+Below this size the exact full DP is fast enough, and the alignment is
+byte-for-byte what it has always been."""
+
+FULL_DP_MAX_CELLS: int = 40_000
+"""In anchor-and-band mode, gaps whose m·n is at or below this size are still
+aligned with the exact full DP; larger gaps use the banded DP."""
+
+LINEAR_SPACE_DP_MIN_CELLS: int = 250_000
+"""DP size (m·n) above which ``_dp_align`` runs the linear-space
+(Hirschberg-style) variant instead of materialising the full DP matrix.
+
+The full matrix plus its cached pair costs take roughly 60 bytes per cell as
+boxed Python floats; the linear-space variant trades that for about twice
+the ``match_cost`` evaluations."""
+
+LINEAR_SPACE_DP_LEAF_CELLS: int = 4_096
+"""Sub-problems at or below this many cells are solved with the full DP
+inside ``_linear_space_dp_align``."""
+
+DP_BAND_WIDTH: int = 64
+"""Half-width (in cells) of the diagonal band used by the banded DP.
+
+The band follows the straight line from the top-left to the bottom-right of
+the gap, so paragraphs that moved further than this many positions relative
+to their neighbours inside one gap are deleted and re-inserted rather than
+matched."""
+
 
 # ---------------------------------------------------------------------------
 # ContentNode: simplified view of a document content element
@@ -206,6 +263,58 @@ class ContentNode:
     is_terminal: bool = False
     original: StructuralElement | object = None
 
+    # Lazily computed similarity features (see the properties below).  They
+    # are derived from ``text`` / ``table_cell_texts``, which are never
+    # mutated after construction, so computing them once per node is safe.
+    _tokens: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _text_hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    _cell_tokens: tuple[frozenset[str], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cell_hashes: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def tokens(self) -> frozenset[str]:
+        """Lower-cased word set of ``text`` (cached)."""
+        if self._tokens is None:
+            self._tokens = _tokenize(self.text)
+        return self._tokens
+
+    @property
+    def text_len(self) -> int:
+        """Length of ``text`` in characters."""
+        return len(self.text)
+
+    @property
+    def text_hash(self) -> int:
+        """Hash of ``text`` (cached); equal texts have equal hashes."""
+        if self._text_hash is None:
+            self._text_hash = hash(self.text)
+        return self._text_hash
+
+    @property
+    def cell_tokens(self) -> tuple[frozenset[str], ...]:
+        """Per-cell word sets of ``table_cell_texts`` (cached)."""
+        if self._cell_tokens is None:
+            self._cell_tokens = tuple(_tokenize(t) for t in self.table_cell_texts)
+        return self._cell_tokens
+
+    @property
+    def cell_hashes(self) -> tuple[int, ...]:
+        """Per-cell hash vector of ``table_cell_texts`` (cached)."""
+        if self._cell_hashes is None:
+            self._cell_hashes = tuple(hash(t) for t in self.table_cell_texts)
+        return self._cell_hashes
+
+
+def _tokenize(text: str) -> frozenset[str]:
+    """Return the lower-cased word set used by ``text_similarity``."""
+    return frozenset(text.lower().split())
+
 
 # ---------------------------------------------------------------------------
 # Building ContentNode from raw Google Docs API JSON
@@ -439,13 +548,25 @@ def text_similarity(a: str, b: str) -> float:
         return 1.0
     if not a or not b:
         return 0.0
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
+    return _token_jaccard(_tokenize(a), _tokenize(b))
+
+
+def _token_jaccard(words_a: frozenset[str], words_b: frozenset[str]) -> float:
+    """Return the Jaccard similarity of two word sets."""
     intersection = len(words_a & words_b)
-    union = len(words_a | words_b)
+    union = len(words_a) + len(words_b) - intersection
     return intersection / union if union > 0 else 0.0
 
 
+def _node_text_similarity(a: ContentNode, b: ContentNode) -> float:
+    """``text_similarity(a.text, b.text)`` using the nodes' cached features."""
+    if a.text_hash == b.text_hash and a.text == b.text:
+        return 1.0
+    if not a.text or not b.text:
+        return 0.0
+    return _token_jaccard(a.tokens, b.tokens)
+
+
 def shared_affix_ratio(a: str, b: str) -> float:
     """Return (shared_prefix + shared_suffix) / max(len(a), len(b)).
 
@@ -500,16 +621,39 @@ def _table_sim(base: ContentNode, desired: ContentNode) -> float:
     if not base.table_cell_texts:
         return 1.0
 
-    # Build a pool of desired cell texts (allow each desired cell to be
-    # consumed at most once via greedy best-match).
-    remaining_desired = list(desired.table_cell_texts)
+    # Identical cell vectors: every base cell greedily consumes its own
+    # counterpart with similarity 1.0.
+    if (
+        base.cell_hashes == desired.cell_hashes
+        and base.table_cell_texts == desired.table_cell_texts
+    ):
+        return 1.0
+
+    # Build a pool of desired cells (allow each desired cell to be consumed
+    # at most once via greedy best-match).  Cells are compared with the same
+    # rules as ``text_similarity`` using the nodes' cached word sets.
+    remaining_desired = list(
+        zip(
+            desired.table_cell_texts,
+            desired.cell_hashes,
+            desired.cell_tokens,
+            strict=True,
+        )
+    )
     total_sim = 0.0
 
-    for b_text in base.table_cell_texts:
+    for b_text, b_hash, b_tokens in zip(
+        base.table_cell_texts, base.cell_hashes, base.cell_tokens, strict=True
+    ):
         best_sim = 0.0
         best_idx = -1
-        for idx, d_text in enumerate(remaining_desired):
-            sim = text_similarity(b_text, d_text)
+        for idx, (d_text, d_hash, d_tokens) in enumerate(remaining_desired):
+            if b_hash == d_hash and b_text == d_text:
+                sim = 1.0
+            elif not b_text or not d_text:
+                sim = 0.0
+            else:
+                sim = _token_jaccard(b_tokens, d_tokens)
             if sim > best_sim:
                 best_sim = sim
                 best_idx = idx
@@ -527,7 +671,7 @@ def _table_sim(base: ContentNode, desired: ContentNode) -> float:
 
 def _list_sim(base: ContentNode, desired: ContentNode) -> float:
     """Return item-text Jaccard similarity for two list nodes."""
-    return text_similarity(base.text, desired.text)
+    return _node_text_similarity(base, desired)
 
 
 # ---------------------------------------------------------------------------
@@ -549,7 +693,7 @@ def matchable(base: ContentNode, desired: ContentNode) -> bool:
     if base.kind != desired.kind:
         return False
     if base.kind == NodeKind.PARAGRAPH:
-        if text_similarity(base.text, desired.text) >= MIN_PARA_MATCH_SIMILARITY:
+        if _node_text_similarity(base, desired) >= MIN_PARA_MATCH_SIMILARITY:
             return True
         # Fallback: near-identical paragraphs (one-character edits in the
         # middle of a CamelCase word, appended trailing clauses, etc.) score
@@ -612,7 +756,7 @@ def edit_cost(base: ContentNode, desired: ContentNode) -> float:
     Only called when matchable(base, desired) is True.
     """
     if base.kind == NodeKind.PARAGRAPH:
-        sim = text_similarity(base.text, desired.text)
+        sim = _node_text_similarity(base, desired)
         # For near-identical paragraphs whose word-Jaccard is artificially
         # low (CamelCase edits, appended clauses), use the shared
         # prefix+suffix ratio as the similarity estimate instead. This
@@ -634,6 +778,39 @@ def edit_cost(base: ContentNode, desired: ContentNode) -> float:
     return 0.0
 
 
+def match_cost(base: ContentNode, desired: ContentNode) -> float:
+    """Return ``edit_cost(base, desired)`` if matchable, else ``INFINITE_PENALTY``.
+
+    Equivalent to calling ``matchable`` and then ``edit_cost``, but computes
+    the shared similarity score (token Jaccard, affix ratio, table or list
+    similarity) only once.  This is what the DP evaluates per cell.
+    """
+    if base.kind != desired.kind:
+        return INFINITE_PENALTY
+    if base.kind == NodeKind.PARAGRAPH:
+        sim = _node_text_similarity(base, desired)
+        affix_sim = shared_affix_ratio(base.text, desired.text)
+        if (
+            sim < MIN_PARA_MATCH_SIMILARITY
+            and affix_sim < MIN_PARA_NEAR_IDENTICAL_RATIO
+        ):
+            return INFINITE_PENALTY
+        if affix_sim > sim:
+            sim = affix_sim
+        return (1.0 - sim) * max(base.text_len, desired.text_len)
+    if base.kind == NodeKind.TABLE:
+        sim = _table_sim(base, desired)
+        if sim < MIN_TABLE_MATCH_SIMILARITY:
+            return INFINITE_PENALTY
+        return (1.0 - sim) * max(base.num_cells, 1)
+    if base.kind == NodeKind.LIST:
+        sim = _list_sim(base, desired)
+        if base.list_kind != desired.list_kind and sim <= MIN_LIST_MATCH_SIMILARITY:
+            return INFINITE_PENALTY
+        return (1.0 - sim) * max(base.text_len, desired.text_len)
+    return 0.0
+
+
 # ---------------------------------------------------------------------------
 # Output types
 # ---------------------------------------------------------------------------
@@ -690,14 +867,15 @@ _UNCREATABLE_KINDS: frozenset[str] = frozenset(
 )
 
 
-def _pre_pin_stable_anchors(
+def _stable_anchor_candidates(
     base: list[ContentNode],
     desired: list[ContentNode],
 ) -> list[tuple[int, int]]:
-    """Collect stable anchors to establish before running the DP.
+    """Collect candidate anchor pairs, sorted by ``(base_idx, desired_idx)``.
 
-    Returns a sorted, non-conflicting list of ``(base_idx, desired_idx)``
-    anchor pairs. Two sources are used:
+    Every base index and every desired index appears in at most one
+    candidate, but the candidates are not necessarily monotonic — a moved
+    paragraph produces a pair that crosses the others.  Two sources are used:
 
     1. **Exact-text matches** — paragraphs/lists whose text content appears
        exactly once in base AND exactly once in desired (unambiguous).
@@ -708,9 +886,6 @@ def _pre_pin_stable_anchors(
        positional order.  If a TOC exists in base but NOT in desired it is
        intentionally omitted from the anchor list (it will be handled as a
        forced carry-through by the caller, not a deletion).
-
-    The returned list is sorted by ``base_idx`` and is guaranteed to be
-    monotonic in ``desired_idx`` as well (no conflicts).
     """
     # -----------------------------------------------------------------------
     # Source 1: Exact-text matches (unambiguous — appears exactly once each
@@ -769,14 +944,27 @@ def _pre_pin_stable_anchors(
         for bi, di in zip(base_indices, desired_indices, strict=False):
             uncreatable_anchors.append((bi, di))
 
+    return sorted(set(exact_anchors + uncreatable_anchors), key=lambda p: (p[0], p[1]))
+
+
+def _pre_pin_stable_anchors(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+) -> list[tuple[int, int]]:
+    """Collect stable anchors to establish before running the DP.
+
+    Returns a sorted, non-conflicting list of ``(base_idx, desired_idx)``
+    anchor pairs drawn from ``_stable_anchor_candidates``.
+
+    The returned list is sorted by ``base_idx`` and is guaranteed to be
+    monotonic in ``desired_idx`` as well (no conflicts).
+    """
     # -----------------------------------------------------------------------
     # Merge and de-conflict: keep only anchors that form a strictly monotonic
     # sequence in both indices (no two anchors share a base_idx or desired_idx,
     # and sorted by base_idx is also sorted by desired_idx).
     # -----------------------------------------------------------------------
-    all_candidates = sorted(
-        set(exact_anchors + uncreatable_anchors), key=lambda p: (p[0], p[1])
-    )
+    all_candidates = _stable_anchor_candidates(base, desired)
 
     # Greedy monotonic-subsequence filter (patience-sort variant): keep the
     # longest prefix that is strictly increasing in both axes.
@@ -802,10 +990,56 @@ def _pre_pin_stable_anchors(
     return result
 
 
+def _patience_anchors(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+) -> list[tuple[int, int]]:
+    """Select the largest monotonic subset of the stable anchor candidates.
+
+    Patience-diff variant of ``_pre_pin_stable_anchors``: instead of greedily
+    keeping candidates in base order (where one paragraph moved from the top
+    to the bottom of the document blocks every anchor after it), this keeps
+    the longest subsequence that is strictly increasing in both indices.
+    Runs in O(k log k) for k candidates.
+
+    When the candidates are already monotonic both variants return the full
+    candidate list.
+    """
+    candidates = _stable_anchor_candidates(base, desired)
+    if not candidates:
+        return []
+
+    # Candidates are sorted by base_idx and have distinct desired indices, so
+    # the answer is the longest increasing subsequence of desired indices.
+    tail_desired: list[int] = []  # smallest tail desired_idx per LIS length
+    tail_pos: list[int] = []  # candidate position holding that tail
+    prev: list[int] = [-1] * len(candidates)
+    for pos, (_bi, di) in enumerate(candidates):
+        k = bisect_left(tail_desired, di)
+        if k > 0:
+            prev[pos] = tail_pos[k - 1]
+        if k == len(tail_desired):
+            tail_desired.append(di)
+            tail_pos.append(pos)
+        else:
+            tail_desired[k] = di
+            tail_pos[k] = pos
+
+    result: list[tuple[int, int]] = []
+    pos = tail_pos[-1]
+    while pos >= 0:
+        result.append(candidates[pos])
+        pos = prev[pos]
+    result.reverse()
+    return result
+
+
 def _apply_anchors_to_alignment(
     anchors: list[tuple[int, int]],
     base: list[ContentNode],
     desired: list[ContentNode],
+    gap_align: Callable[[list[ContentNode], list[ContentNode]], ContentAlignment]
+    | None = None,
 ) -> ContentAlignment:
     """Run the DP within each gap defined by the given anchors and merge.
 
@@ -818,7 +1052,10 @@ def _apply_anchors_to_alignment(
         match points.  Must be strictly increasing in both dimensions.
     base, desired:
         The prefix sequences (terminals already stripped by the caller).
+    gap_align:
+        Aligner used for each gap.  Defaults to the full DP (``_dp_align``).
     """
+    align_gap = gap_align or _dp_align
     m = len(base)
     n = len(desired)
 
@@ -852,7 +1089,7 @@ def _apply_anchors_to_alignment(
 
         sub_base = [base[i] for i in gap_base_indices]
         sub_desired = [desired[j] for j in gap_desired_indices]
-        sub_alignment = _dp_align(sub_base, sub_desired)
+        sub_alignment = align_gap(sub_base, sub_desired)
 
         for sub_m in sub_alignment.matches:
             final_matches.append(
@@ -886,6 +1123,8 @@ def _apply_anchors_to_alignment(
 def align_content(
     base: list[ContentNode],
     desired: list[ContentNode],
+    *,
+    anchored: bool | None = None,
 ) -> ContentAlignment:
     """Align two content sequences to minimise reconciliation cost.
 
@@ -895,6 +1134,13 @@ def align_content(
         Content nodes from the base (current) document.
     desired:
         Content nodes from the desired (target) document.
+    anchored:
+        Use anchor-and-band alignment: pin the longest monotonic chain of
+        unique exact-text anchors (patience diff), then align each gap with
+        the full DP when it is small (``FULL_DP_MAX_CELLS``) or with a
+        diagonal-band DP (``DP_BAND_WIDTH``) when it is large.  ``None``
+        (the default) enables it automatically when the DP would exceed
+        ``ANCHORED_ALIGN_MIN_CELLS`` cells.
 
     Returns
     -------
@@ -955,20 +1201,29 @@ def align_content(
     prefix_base = base[: m - 1]
     prefix_desired = desired[: n - 1]
 
+    if anchored is None:
+        anchored = len(prefix_base) * len(prefix_desired) > ANCHORED_ALIGN_MIN_CELLS
+    gap_align = _anchored_gap_align if anchored else _dp_align
+
     # Pre-pin stable anchors before the DP: exact-text matches and
     # API-uncreatable elements (TOC, OPAQUE, SectionBreak).
-    pre_pins = _pre_pin_stable_anchors(prefix_base, prefix_desired)
+    if anchored:
+        pre_pins = _patience_anchors(prefix_base, prefix_desired)
+    else:
+        pre_pins = _pre_pin_stable_anchors(prefix_base, prefix_desired)
 
     if pre_pins:
         prefix_alignment = _apply_anchors_to_alignment(
-            pre_pins, prefix_base, prefix_desired
+            pre_pins, prefix_base, prefix_desired, gap_align
         )
     else:
-        prefix_alignment = _dp_align(prefix_base, prefix_desired)
+        prefix_alignment = gap_align(prefix_base, prefix_desired)
 
     # Table-flank pinning: force the paragraphs immediately adjacent to each
     # matched table pair to be matched (see module docstring).
-    prefix_alignment = _pin_table_flanks(prefix_alignment, prefix_base, prefix_desired)
+    prefix_alignment = _pin_table_flanks(
+        prefix_alignment, prefix_base, prefix_desired, gap_align
+    )
 
     # Positional fallback: promote unmatched same-kind elements in 1:1 gaps
     prefix_alignment = _positional_fallback(
@@ -1021,6 +1276,8 @@ def _pin_table_flanks(
     alignment: ContentAlignment,
     base: list[ContentNode],
     desired: list[ContentNode],
+    gap_align: Callable[[list[ContentNode], list[ContentNode]], ContentAlignment]
+    | None = None,
 ) -> ContentAlignment:
     """Post-process a DP alignment to enforce the table-flanking invariant.
 
@@ -1190,6 +1447,10 @@ def _pin_table_flanks(
     existing_matches_by_base: dict[int, int] = {
         m.base_idx: m.desired_idx for m in alignment.matches
     }
+    existing_matches_by_desired: dict[int, int] = {
+        m.desired_idx: m.base_idx for m in alignment.matches
+    }
+    align_gap = gap_align or _dp_align
 
     # Build gap boundaries: (-1, -1), anchors..., (m_len, n_len)
     boundaries: list[tuple[int, int]] = [
@@ -1229,9 +1490,6 @@ def _pin_table_flanks(
         if not gap_needs_redp:
             # Also check from desired side: a desired in this gap matched to
             # a base outside this gap?
-            existing_matches_by_desired: dict[int, int] = {
-                m.desired_idx: m.base_idx for m in alignment.matches
-            }
             for gi_desired in gap_desired_indices:
                 existing_bi = existing_matches_by_desired.get(gi_desired)
                 if existing_bi is None:
@@ -1244,7 +1502,7 @@ def _pin_table_flanks(
             # Re-DP this gap.
             sub_base = [base[i] for i in gap_base_indices]
             sub_desired = [desired[j] for j in gap_desired_indices]
-            sub_alignment = _dp_align(sub_base, sub_desired)
+            sub_alignment = align_gap(sub_base, sub_desired)
             for sub_m in sub_alignment.matches:
                 final_matches.append(
                     ContentMatch(
@@ -1255,13 +1513,14 @@ def _pin_table_flanks(
         else:
             # Keep original gap matches that are fully inside this gap, and
             # whose endpoints are not pinned to anchors.
-            for m_orig in alignment.matches:
-                bi = m_orig.base_idx
-                di = m_orig.desired_idx
-                if bi in anchor_base_set or di in anchor_desired_set:
+            for bi in gap_base_indices:
+                kept_di = existing_matches_by_base.get(bi)
+                if kept_di is None:
                     continue
-                if b_lo < bi < b_hi and d_lo < di < d_hi:
-                    final_matches.append(ContentMatch(base_idx=bi, desired_idx=di))
+                if bi in anchor_base_set or kept_di in anchor_desired_set:
+                    continue
+                if d_lo < kept_di < d_hi:
+                    final_matches.append(ContentMatch(base_idx=bi, desired_idx=kept_di))
 
     final_matches.sort(key=lambda m: (m.base_idx, m.desired_idx))
     matched_base = {m.base_idx for m in final_matches}
@@ -1380,8 +1639,20 @@ def _dp_align(
     """Run the core DP alignment on two sequences (no terminal constraint here).
 
     Used internally by ``align_content`` on the prefix sequences (after
-    the terminal elements have been pre-matched).
+    the terminal elements have been pre-matched).  Inputs larger than
+    ``LINEAR_SPACE_DP_MIN_CELLS`` use the linear-space variant, which gives
+    the same alignment.
     """
+    if len(base) * len(desired) > LINEAR_SPACE_DP_MIN_CELLS:
+        return _linear_space_dp_align(base, desired)
+    return _full_dp_align(base, desired)
+
+
+def _full_dp_align(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+) -> ContentAlignment:
+    """Run the core DP with the full matrix kept for the backtrack."""
     m = len(base)
     n = len(desired)
 
@@ -1404,15 +1675,23 @@ def _dp_align(
             matches=[], base_deletes=deletes, desired_inserts=[], total_cost=cost
         )
 
+    # Penalties depend on one side only: compute them once per element.
+    del_pens = [delete_penalty(b) for b in base]
+    ins_pens = [insert_penalty(d) for d in desired]
+
+    # pair_costs[i][j] = match_cost(base[i], desired[j]) (INF when not matchable).
+    # Filled once during the DP fill and reused by the backtrack, so each
+    # pair's similarity is evaluated exactly once.
+    pair_costs: list[list[float]] = []
+
     # dp[i][j] = minimum cost to reconcile base[0..i-1] with desired[0..j-1]
-    # Use flat arrays for memory efficiency.
     # Shape: (m+1) x (n+1)
     dp: list[list[float]] = [[_INF] * (n + 1) for _ in range(m + 1)]
     dp[0][0] = 0.0
 
     # Fill first row: insert all desired[0..j-1]
     for j in range(1, n + 1):
-        pen = insert_penalty(desired[j - 1])
+        pen = ins_pens[j - 1]
         if dp[0][j - 1] == _INF or pen == _INF:
             dp[0][j] = _INF
         else:
@@ -1420,7 +1699,7 @@ def _dp_align(
 
     # Fill first column: delete all base[0..i-1]
     for i in range(1, m + 1):
-        pen = delete_penalty(base[i - 1])
+        pen = del_pens[i - 1]
         if dp[i - 1][0] == _INF or pen == _INF:
             dp[i][0] = _INF
         else:
@@ -1429,34 +1708,35 @@ def _dp_align(
     # Fill rest of the table
     for i in range(1, m + 1):
         b = base[i - 1]
+        del_pen = del_pens[i - 1]
+        prev_row = dp[i - 1]
+        row = dp[i]
+        cost_row = [match_cost(b, d) for d in desired]
+        pair_costs.append(cost_row)
         for j in range(1, n + 1):
-            d = desired[j - 1]
-
             best = _INF
 
             # Transition 1: Delete base[i-1]
-            del_pen = delete_penalty(b)
-            if dp[i - 1][j] != _INF and del_pen != _INF:
-                candidate = dp[i - 1][j] + del_pen
+            if prev_row[j] != _INF and del_pen != _INF:
+                candidate = prev_row[j] + del_pen
                 if candidate < best:
                     best = candidate
 
             # Transition 2: Insert desired[j-1]
-            ins_pen = insert_penalty(d)
-            if dp[i][j - 1] != _INF and ins_pen != _INF:
-                candidate = dp[i][j - 1] + ins_pen
+            ins_pen = ins_pens[j - 1]
+            if row[j - 1] != _INF and ins_pen != _INF:
+                candidate = row[j - 1] + ins_pen
                 if candidate < best:
                     best = candidate
 
             # Transition 3: Match base[i-1] with desired[j-1]
-            if matchable(b, d):
-                ec = edit_cost(b, d)
-                if dp[i - 1][j - 1] != _INF:
-                    candidate = dp[i - 1][j - 1] + ec
-                    if candidate < best:
-                        best = candidate
+            ec = cost_row[j - 1]
+            if ec != _INF and prev_row[j - 1] != _INF:
+                candidate = prev_row[j - 1] + ec
+                if candidate < best:
+                    best = candidate
 
-            dp[i][j] = best
+            row[j] = best
 
     # ------------------------------------------------------------------
     # Backtrack to recover the alignment
@@ -1476,41 +1756,33 @@ def _dp_align(
             base_deletes.append(i - 1)
             i -= 1
         else:
-            b = base[i - 1]
-            d = desired[j - 1]
-
             # Determine which transition was used at dp[i][j]
             current = dp[i][j]
 
             # Check match first (prefer match over delete/insert on tie)
-            matched = False
-            if matchable(b, d):
-                ec = edit_cost(b, d)
-                if (
-                    dp[i - 1][j - 1] != _INF
-                    and abs(dp[i - 1][j - 1] + ec - current) < 1e-9
-                ):
-                    matches.append(ContentMatch(base_idx=i - 1, desired_idx=j - 1))
-                    i -= 1
-                    j -= 1
-                    matched = True
-
-            if not matched:
-                # Check delete vs insert; prefer delete on tie
-                del_pen = delete_penalty(b)
-                used_delete = False
-                if (
-                    dp[i - 1][j] != _INF
-                    and del_pen != _INF
-                    and abs(dp[i - 1][j] + del_pen - current) < 1e-9
-                ):
-                    base_deletes.append(i - 1)
-                    i -= 1
-                    used_delete = True
+            ec = pair_costs[i - 1][j - 1]
+            if (
+                ec != _INF
+                and dp[i - 1][j - 1] != _INF
+                and abs(dp[i - 1][j - 1] + ec - current) < 1e-9
+            ):
+                matches.append(ContentMatch(base_idx=i - 1, desired_idx=j - 1))
+                i -= 1
+                j -= 1
+                continue
 
-                if not used_delete:
-                    desired_inserts.append(j - 1)
-                    j -= 1
+            # Check delete vs insert; prefer delete on tie
+            del_pen = del_pens[i - 1]
+            if (
+                dp[i - 1][j] != _INF
+                and del_pen != _INF
+                and abs(dp[i - 1][j] + del_pen - current) < 1e-9
+            ):
+                base_deletes.append(i - 1)
+                i -= 1
+            else:
+                desired_inserts.append(j - 1)
+                j -= 1
 
     matches.reverse()
     base_deletes.sort()
@@ -1524,6 +1796,292 @@ def _dp_align(
     )
 
 
+def _linear_space_dp_align(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+) -> ContentAlignment:
+    """Run the core DP in O(m + n) memory (no terminal constraint here).
+
+    Produces exactly the alignment of ``_full_dp_align``.  The backtrack of
+    the full DP walks from ``(m, n)`` to ``(0, 0)`` taking, at every cell, the
+    first optimal move in the order match, delete, insert.  Among all
+    optimal paths that is the lexicographically smallest one read from the
+    end, so both of its halves around any cell it visits are themselves the
+    backtracks of the two sub-problems on either side of that cell.
+
+    Each sub-problem runs one forward pass with rolling rows.  Below the
+    middle row the pass also tracks, per cell, the column at which the
+    backtrack from that cell first reaches the middle row (the backtrack's
+    choice at a cell only depends on the current and previous row).  The
+    value at ``(m, n)`` is the split column; the two halves are then solved
+    recursively until they are small enough for the full DP.
+    """
+    m = len(base)
+    n = len(desired)
+    if m == 0 or n == 0:
+        return _full_dp_align(base, desired)
+
+    del_pens = [delete_penalty(b) for b in base]
+    ins_pens = [insert_penalty(d) for d in desired]
+
+    matches: list[ContentMatch] = []
+    base_deletes: list[int] = []
+    desired_inserts: list[int] = []
+    total_cost = _INF
+
+    # Explicit stack of sub-problems (i0, i1, j0, j1); depth is O(log m).
+    stack = [(0, m, 0, n)]
+    while stack:
+        i0, i1, j0, j1 = stack.pop()
+        rows = i1 - i0
+        cols = j1 - j0
+        if rows <= 1 or rows * cols <= LINEAR_SPACE_DP_LEAF_CELLS:
+            leaf = _full_dp_align(base[i0:i1], desired[j0:j1])
+            matches.extend(
+                ContentMatch(base_idx=i0 + mt.base_idx, desired_idx=j0 + mt.desired_idx)
+                for mt in leaf.matches
+            )
+            base_deletes.extend(i0 + i for i in leaf.base_deletes)
+            desired_inserts.extend(j0 + j for j in leaf.desired_inserts)
+            if (i0, i1, j0, j1) == (0, m, 0, n):
+                total_cost = leaf.total_cost
+            continue
+
+        mid = rows // 2
+        cost, split = _linear_space_split(
+            base, desired, del_pens, ins_pens, i0, i1, j0, j1, mid
+        )
+        if (i0, i1, j0, j1) == (0, m, 0, n):
+            total_cost = cost
+        stack.append((i0, i0 + mid, j0, j0 + split))
+        stack.append((i0 + mid, i1, j0 + split, j1))
+
+    matches.sort(key=lambda mt: mt.base_idx)
+    base_deletes.sort()
+    desired_inserts.sort()
+
+    return ContentAlignment(
+        matches=matches,
+        base_deletes=base_deletes,
+        desired_inserts=desired_inserts,
+        total_cost=total_cost,
+    )
+
+
+def _linear_space_split(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+    del_pens: list[float],
+    ins_pens: list[float],
+    i0: int,
+    i1: int,
+    j0: int,
+    j1: int,
+    mid: int,
+) -> tuple[float, int]:
+    """Forward pass of one ``_linear_space_dp_align`` sub-problem.
+
+    Aligns ``base[i0:i1]`` with ``desired[j0:j1]`` using two rolling rows and
+    returns ``(cost, split)``: the optimal cost and the local column at which
+    the backtrack from the bottom-right corner first enters local row
+    ``mid`` (``0 < mid < i1 - i0``).  Transitions and backtrack tie-breaks
+    mirror ``_full_dp_align`` exactly.
+    """
+    cols = j1 - j0
+
+    prev: list[float] = [0.0] * (cols + 1)
+    for j in range(1, cols + 1):
+        pen = ins_pens[j0 + j - 1]
+        prev[j] = _INF if prev[j - 1] == _INF or pen == _INF else prev[j - 1] + pen
+
+    # prev_split[j]: column where the backtrack from (i - 1, j) reaches ``mid``.
+    prev_split: list[int] = list(range(cols + 1))
+
+    for i in range(1, i1 - i0 + 1):
+        b = base[i0 + i - 1]
+        del_pen = del_pens[i0 + i - 1]
+        track = i > mid
+        row: list[float] = [_INF] * (cols + 1)
+        if prev[0] != _INF and del_pen != _INF:
+            row[0] = prev[0] + del_pen
+        split: list[int] = [prev_split[0]] * (cols + 1) if track else prev_split
+
+        for j in range(1, cols + 1):
+            best = _INF
+
+            up = prev[j]
+            if up != _INF and del_pen != _INF:
+                candidate = up + del_pen
+                if candidate < best:
+                    best = candidate
+
+            left = row[j - 1]
+            ins_pen = ins_pens[j0 + j - 1]
+            if left != _INF and ins_pen != _INF:
+                candidate = left + ins_pen
+                if candidate < best:
+                    best = candidate
+
+            diag = prev[j - 1]
+            ec = match_cost(b, desired[j0 + j - 1])
+            if ec != _INF and diag != _INF:
+                candidate = diag + ec
+                if candidate < best:
+                    best = candidate
+
+            row[j] = best
+
+            if track:
+                # Same move the full backtrack would take out of (i, j).
+                if ec != _INF and diag != _INF and abs(diag + ec - best) < 1e-9:
+                    split[j] = prev_split[j - 1]
+                elif up != _INF and del_pen != _INF and abs(up + del_pen - best) < 1e-9:
+                    split[j] = prev_split[j]
+                else:
+                    split[j] = split[j - 1]
+
+        prev = row
+        prev_split = split
+
+    return prev[cols], prev_split[cols]
+
+
+def _anchored_gap_align(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+) -> ContentAlignment:
+    """Gap aligner for anchor-and-band mode.
+
+    Small gaps get the exact full DP; gaps larger than ``FULL_DP_MAX_CELLS``
+    get the banded DP so the cost stays proportional to ``(m + n) · band``.
+    """
+    if len(base) * len(desired) <= FULL_DP_MAX_CELLS:
+        return _dp_align(base, desired)
+    return _banded_dp_align(base, desired, DP_BAND_WIDTH)
+
+
+def _band_bounds(m: int, n: int, band: int) -> tuple[list[int], list[int]]:
+    """Return per-row ``[lo, hi]`` column bounds of the diagonal band.
+
+    Row ``i`` covers the diagonal from ``(0, 0)`` to ``(m, n)`` between rows
+    ``i`` and ``i + 1``, widened by ``band`` on each side, so consecutive rows
+    always overlap and ``(m, n)`` is reachable from ``(0, 0)``.
+    """
+    lo: list[int] = []
+    hi: list[int] = []
+    for i in range(m + 1):
+        lo.append(max(0, (i * n) // m - band))
+        hi.append(n if i == m else min(n, -(-(i + 1) * n // m) + band))
+    return lo, hi
+
+
+def _banded_dp_align(
+    base: list[ContentNode],
+    desired: list[ContentNode],
+    band: int,
+) -> ContentAlignment:
+    """Run the core DP restricted to a diagonal band (no terminal constraint).
+
+    Same transitions and backtrack tie-breaks as ``_dp_align`` (prefer match,
+    then delete), but only cells inside the band are evaluated; everything
+    outside is treated as unreachable.  When the band covers the whole
+    matrix the result is identical to ``_dp_align``.
+    """
+    m = len(base)
+    n = len(desired)
+    if m == 0 or n == 0:
+        return _dp_align(base, desired)
+
+    lo, hi = _band_bounds(m, n, band)
+
+    def _get(row: list[float], i: int, j: int) -> float:
+        if j < lo[i] or j > hi[i]:
+            return _INF
+        return row[j - lo[i]]
+
+    del_pens = [delete_penalty(b) for b in base]
+    ins_pens = [insert_penalty(d) for d in desired]
+
+    # rows[i][j - lo[i]] = dp[i][j] for lo[i] <= j <= hi[i]; costs holds the
+    # matching match_cost(base[i-1], desired[j-1]) for the backtrack.
+    rows: list[list[float]] = []
+    costs: list[list[float]] = []
+    for i in range(m + 1):
+        row = [_INF] * (hi[i] - lo[i] + 1)
+        cost_row = [_INF] * (hi[i] - lo[i] + 1)
+        prev_row = rows[i - 1] if i > 0 else None
+        b = base[i - 1] if i > 0 else None
+        del_pen = del_pens[i - 1] if i > 0 else _INF
+        for j in range(lo[i], hi[i] + 1):
+            if i == 0 and j == 0:
+                row[0] = 0.0
+                continue
+            best = _INF
+            if prev_row is not None:
+                up = _get(prev_row, i - 1, j)
+                if up != _INF and del_pen != _INF:
+                    best = up + del_pen
+            if j > lo[i]:
+                left = row[j - 1 - lo[i]]
+                ins_pen = ins_pens[j - 1]
+                if left != _INF and ins_pen != _INF and left + ins_pen < best:
+                    best = left + ins_pen
+            if prev_row is not None and b is not None and j > 0:
+                diag = _get(prev_row, i - 1, j - 1)
+                if diag != _INF:
+                    ec = match_cost(b, desired[j - 1])
+                    cost_row[j - lo[i]] = ec
+                    if ec != _INF and diag + ec < best:
+                        best = diag + ec
+            row[j - lo[i]] = best
+        rows.append(row)
+        costs.append(cost_row)
+
+    matches: list[ContentMatch] = []
+    base_deletes: list[int] = []
+    desired_inserts: list[int] = []
+
+    i, j = m, n
+    while i > 0 or j > 0:
+        if i == 0:
+            desired_inserts.append(j - 1)
+            j -= 1
+            continue
+        if j == 0:
+            base_deletes.append(i - 1)
+            i -= 1
+            continue
+        current = _get(rows[i], i, j)
+
+        diag = _get(rows[i - 1], i - 1, j - 1)
+        ec = _get(costs[i], i, j)
+        if diag != _INF and ec != _INF and abs(diag + ec - current) < 1e-9:
+            matches.append(ContentMatch(base_idx=i - 1, desired_idx=j - 1))
+            i -= 1
+            j -= 1
+            continue
+
+        up = _get(rows[i - 1], i - 1, j)
+        del_pen = del_pens[i - 1]
+        if up != _INF and del_pen != _INF and abs(up + del_pen - current) < 1e-9:
+            base_deletes.append(i - 1)
+            i -= 1
+        else:
+            desired_inserts.append(j - 1)
+            j -= 1
+
+    matches.reverse()
+    base_deletes.sort()
+    desired_inserts.sort()
+
+    return ContentAlignment(
+        matches=matches,
+        base_deletes=base_deletes,
+        desired_inserts=desired_inserts,
+        total_cost=rows[m][n - lo[m]],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Convenience: build sequences from raw Google Docs API JSON
 # ---------------------------------------------------------------------------
@@ -20,6 +20,11 @@ No live API calls.  All computation is pure in-memory over typed Pydantic models
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
 from extradoc.api_types._generated import (
     Body,
     Document,
@@ -53,6 +58,7 @@ from extradoc.diffmerge.content_align import (
     align_content,
     content_node_from_element,
 )
+from extradoc.diffmerge.fingerprint import TabFingerprint, tab_fingerprint
 from extradoc.diffmerge.model import (
     CreateFooterOp,
     CreateHeaderOp,
@@ -85,14 +91,67 @@ from extradoc.diffmerge.model import (
 from extradoc.diffmerge.table_diff import diff_tables as _diff_tables_structural
 from extradoc.diffmerge.table_diff import get_matched_rows
 
+logger = logging.getLogger(__name__)
+
+TabExecutorMode = Literal["serial", "thread", "process"]
+"""How ``diff_documents`` diffs matched tab pairs.
+
+- ``"serial"`` — one after another on the calling thread (default).
+- ``"thread"`` — on a ``ThreadPoolExecutor``.
+- ``"process"`` — on a ``ProcessPoolExecutor`` (tab pairs and ops are
+  pickled across the process boundary).
+"""
+
+PARALLEL_DIFF_MIN_ELEMENTS: int = 2_000
+"""Minimum number of body elements (base + desired, summed over the changed
+tab pairs) before a non-serial ``tab_executor`` actually uses a pool.
+Smaller documents are diffed serially because pool start-up and pickling
+would cost more than the diff itself."""
+
+
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class DiffStats:
+    """Counters describing how much diff work was skipped by fingerprints.
+
+    Pass an instance to ``diff_documents`` to have it filled in.
+
+    Attributes
+    ----------
+    tabs_compared:
+        Matched tab pairs considered.
+    tabs_skipped:
+        Matched tab pairs whose fingerprints were identical (no passes run).
+    segments_compared:
+        Header/footer/footnote/body segments considered inside changed tabs.
+    segments_skipped:
+        Segments whose fingerprints were identical (not aligned).
+    """
+
+    tabs_compared: int = 0
+    tabs_skipped: int = 0
+    segments_compared: int = 0
+    segments_skipped: int = 0
+
+    def add(self, other: DiffStats) -> None:
+        """Accumulate the counters of ``other`` into this instance."""
+        self.tabs_compared += other.tabs_compared
+        self.tabs_skipped += other.tabs_skipped
+        self.segments_compared += other.segments_compared
+        self.segments_skipped += other.segments_skipped
+
+
 def diff_documents(
     base: Document,
     desired: Document,
+    *,
+    stats: DiffStats | None = None,
+    tab_executor: TabExecutorMode = "serial",
+    max_workers: int | None = None,
 ) -> list[ReconcileOp]:
     """Return the full op list to transform base → desired.
 
@@ -102,12 +161,23 @@ def diff_documents(
         Current state of the document.
     desired:
         Target state of the document.
+    stats:
+        Optional ``DiffStats`` that receives tab/segment skip counts.
+    tab_executor:
+        Where to diff the matched tab pairs (see ``TabExecutorMode``).  Pools
+        are only used when at least two tabs changed and the changed tabs
+        hold ``PARALLEL_DIFF_MIN_ELEMENTS`` body elements or more.  The op
+        list is identical in every mode.
+    max_workers:
+        Pool size for ``"thread"`` / ``"process"`` (executor default if None).
 
     Returns
     -------
     list[ReconcileOp]
         Ordered list of ops covering every detected difference, top-down.
     """
+    if stats is None:
+        stats = DiffStats()
 
     ops: list[ReconcileOp] = []
 
@@ -119,9 +189,19 @@ def diff_documents(
     ops.extend(tab_ops)
 
     # Recurse into matched tab pairs
-    for base_tab, desired_tab in tab_pairs:
-        ops.extend(_diff_tab(base_tab, desired_tab))
-
+    if tab_executor == "serial":
+        for base_tab, desired_tab in tab_pairs:
+            ops.extend(_diff_tab(base_tab, desired_tab, stats))
+    else:
+        ops.extend(_diff_tabs_pooled(tab_pairs, stats, tab_executor, max_workers))
+
+    logger.debug(
+        "diff_documents: skipped %d/%d tabs and %d/%d segments by fingerprint",
+        stats.tabs_skipped,
+        stats.tabs_compared,
+        stats.segments_skipped,
+        stats.segments_compared,
+    )
     return ops
 
 
@@ -264,30 +344,159 @@ def _match_tabs(
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class _SegmentFingerprints:
+    """Base/desired segment fingerprints of one changed tab pair."""
+
+    base: TabFingerprint
+    desired: TabFingerprint
+    stats: DiffStats
+
+    def changed(
+        self,
+        base_key: str,
+        desired_key: str,
+        base_content: list[StructuralElement],
+        desired_content: list[StructuralElement],
+    ) -> bool:
+        """Return True if the two segments differ and must be aligned."""
+        b_fp = self.base.segments.get(base_key)
+        d_fp = self.desired.segments.get(desired_key)
+        if b_fp is None or d_fp is None:
+            # Segment missing on one side (dangling header ID etc.) — fall
+            # back to a direct comparison.
+            return base_content != desired_content
+        self.stats.segments_compared += 1
+        if b_fp == d_fp:
+            self.stats.segments_skipped += 1
+            return False
+        return True
+
+
 def _diff_tab(
     base_tab: Tab,
     desired_tab: Tab,
+    stats: DiffStats | None = None,
+    fingerprints: tuple[TabFingerprint, TabFingerprint] | None = None,
 ) -> list[ReconcileOp]:
-    """Diff all tree levels within a matched tab pair."""
+    """Diff all tree levels within a matched tab pair.
+
+    Tabs whose structural fingerprints match (or that are the very same
+    object, e.g. a reused pristine tab) are skipped without running any
+    pass; inside changed tabs, unchanged segments are skipped individually.
+    ``fingerprints`` may carry precomputed ``(base, desired)`` fingerprints.
+    """
+    if stats is None:
+        stats = DiffStats()
     tab_id = _tab_id(base_tab)
     base_dt = _doc_tab(base_tab)
     desired_dt = _doc_tab(desired_tab)
 
+    stats.tabs_compared += 1
+    if base_tab is desired_tab:
+        stats.tabs_skipped += 1
+        return []
+    if fingerprints is None:
+        fingerprints = (tab_fingerprint(base_dt), tab_fingerprint(desired_dt))
+    base_fp, desired_fp = fingerprints
+    if base_fp.digest == desired_fp.digest:
+        stats.tabs_skipped += 1
+        return []
+    segments = _SegmentFingerprints(base_fp, desired_fp, stats)
+
     ops: list[ReconcileOp] = []
 
     ops.extend(_diff_document_style(tab_id, base_dt, desired_dt))
     ops.extend(_diff_named_styles(tab_id, base_dt, desired_dt))
     ops.extend(_diff_lists(tab_id, base_dt, desired_dt))
     ops.extend(_diff_inline_objects(tab_id, base_dt, desired_dt))
-    ops.extend(_diff_headers(tab_id, base_dt, desired_dt))
-    ops.extend(_diff_footers(tab_id, base_dt, desired_dt))
-    ops.extend(_diff_footnotes(tab_id, base_dt, desired_dt))
+    ops.extend(_diff_headers(tab_id, base_dt, desired_dt, segments))
+    ops.extend(_diff_footers(tab_id, base_dt, desired_dt, segments))
+    ops.extend(_diff_footnotes(tab_id, base_dt, desired_dt, segments))
     ops.extend(_diff_named_ranges(tab_id, base_dt, desired_dt))
-    ops.extend(_diff_body(tab_id, base_dt, desired_dt))
+    ops.extend(_diff_body(tab_id, base_dt, desired_dt, segments))
 
     return ops
 
 
+_TabJob = tuple[Tab, Tab, tuple[TabFingerprint, TabFingerprint]]
+
+
+def _diff_tab_job(job: _TabJob) -> tuple[list[ReconcileOp], DiffStats]:
+    """Pool entry point: diff one changed tab pair with its own counters.
+
+    Module-level so that it can be pickled by ``ProcessPoolExecutor``.
+    """
+    base_tab, desired_tab, fingerprints = job
+    stats = DiffStats()
+    ops = _diff_tab(base_tab, desired_tab, stats, fingerprints)
+    return ops, stats
+
+
+def _body_size(tab: Tab) -> int:
+    body = _doc_tab(tab).body
+    return len(body.content or []) if body else 0
+
+
+def _diff_tabs_pooled(
+    tab_pairs: list[tuple[Tab, Tab]],
+    stats: DiffStats,
+    mode: TabExecutorMode,
+    max_workers: int | None,
+) -> list[ReconcileOp]:
+    """Diff matched tab pairs on a thread or process pool.
+
+    Fingerprints are computed up front so unchanged tabs never reach the
+    pool.  Results are merged in ``tab_pairs`` order, so the op list is
+    deterministic and identical to the serial path.
+    """
+    jobs: list[_TabJob] = []
+    for base_tab, desired_tab in tab_pairs:
+        if base_tab is desired_tab:
+            stats.tabs_compared += 1
+            stats.tabs_skipped += 1
+            continue
+        fingerprints = (
+            tab_fingerprint(_doc_tab(base_tab)),
+            tab_fingerprint(_doc_tab(desired_tab)),
+        )
+        if fingerprints[0].digest == fingerprints[1].digest:
+            stats.tabs_compared += 1
+            stats.tabs_skipped += 1
+            continue
+        jobs.append((base_tab, desired_tab, fingerprints))
+
+    work = sum(_body_size(b) + _body_size(d) for b, d, _ in jobs)
+    if len(jobs) < 2 or work < PARALLEL_DIFF_MIN_ELEMENTS:
+        results = [_diff_tab_job(job) for job in jobs]
+    else:
+        executor: Executor
+        if mode == "process":
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        with executor:
+            results = list(executor.map(_diff_tab_job, jobs))
+
+    ops: list[ReconcileOp] = []
+    for tab_ops, tab_stats in results:
+        ops.extend(tab_ops)
+        stats.add(tab_stats)
+    return ops
+
+
+def _segment_changed(
+    segments: _SegmentFingerprints | None,
+    base_key: str,
+    desired_key: str,
+    base_content: list[StructuralElement],
+    desired_content: list[StructuralElement],
+) -> bool:
+    if segments is None:
+        return base_content != desired_content
+    return segments.changed(base_key, desired_key, base_content, desired_content)
+
+
 # ---------------------------------------------------------------------------
 # 1. DocumentStyle
 # ---------------------------------------------------------------------------
@@ -490,6 +699,7 @@ def _diff_headers(
     tab_id: str,
     base_dt: DocumentTab,
     desired_dt: DocumentTab,
+    segments: _SegmentFingerprints | None = None,
 ) -> list[ReconcileOp]:
     base_headers: dict[str, Header] = base_dt.headers or {}
     desired_headers: dict[str, Header] = desired_dt.headers or {}
@@ -533,7 +743,9 @@ def _diff_headers(
             d_content_list: list[StructuralElement] = (
                 (d_header.content or []) if d_header else []
             )
-            if b_content != d_content_list:
+            if _segment_changed(
+                segments, f"header:{b_id}", f"header:{d_id}", b_content, d_content_list
+            ):
                 alignment = _align_content_sequence(b_content, d_content_list)
                 ops.append(
                     UpdateHeaderContentOp(
@@ -570,6 +782,7 @@ def _diff_footers(
     tab_id: str,
     base_dt: DocumentTab,
     desired_dt: DocumentTab,
+    segments: _SegmentFingerprints | None = None,
 ) -> list[ReconcileOp]:
     base_footers: dict[str, Footer] = base_dt.footers or {}
     desired_footers: dict[str, Footer] = desired_dt.footers or {}
@@ -610,7 +823,9 @@ def _diff_footers(
             d_content_list: list[StructuralElement] = (
                 (d_footer.content or []) if d_footer else []
             )
-            if b_content != d_content_list:
+            if _segment_changed(
+                segments, f"footer:{b_id}", f"footer:{d_id}", b_content, d_content_list
+            ):
                 alignment = _align_content_sequence(b_content, d_content_list)
                 ops.append(
                     UpdateFooterContentOp(
@@ -646,6 +861,7 @@ def _diff_footnotes(
     tab_id: str,
     base_dt: DocumentTab,
     desired_dt: DocumentTab,
+    segments: _SegmentFingerprints | None = None,
 ) -> list[ReconcileOp]:
     base_fn: dict[str, Footnote] = base_dt.footnotes or {}
     desired_fn: dict[str, Footnote] = desired_dt.footnotes or {}
@@ -677,7 +893,8 @@ def _diff_footnotes(
             )
         else:
             b_content = base_fn[fn_id].content or []
-            if b_content != d_content:
+            key = f"footnote:{fn_id}"
+            if _segment_changed(segments, key, key, b_content, d_content):
                 alignment = _align_content_sequence(b_content, d_content)
                 ops.append(
                     UpdateFootnoteContentOp(
@@ -935,6 +1152,7 @@ def _diff_body(
     tab_id: str,
     base_dt: DocumentTab,
     desired_dt: DocumentTab,
+    segments: _SegmentFingerprints | None = None,
 ) -> list[ReconcileOp]:
     base_body = base_dt.body
     desired_body = desired_dt.body
@@ -943,7 +1161,7 @@ def _diff_body(
         (desired_body.content or []) if desired_body else []
     )
 
-    if b_content == d_content:
+    if not _segment_changed(segments, "body", "body", b_content, d_content):
         return []
 
     desired_inline_objects: dict[str, InlineObject] = desired_dt.inline_objects or {}
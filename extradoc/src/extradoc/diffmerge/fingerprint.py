@@ -0,0 +1,108 @@
+"""Structural fingerprints for short-circuiting the tab diff.
+
+A fingerprint is a stable digest of exactly the parts of a ``DocumentTab``
+that the ``_diff_*`` passes in ``diff.py`` read.  When the base and desired
+fingerprints of a tab (or of one segment inside it) are equal, the passes
+would find nothing to do, so ``diff_documents`` skips them entirely.
+
+Segments
+--------
+Each content-bearing story gets its own digest, keyed by:
+
+- ``"body"``
+- ``"header:<headerId>"``
+- ``"footer:<footerId>"``
+- ``"footnote:<footnoteId>"``
+
+Segment digests cover the ``content`` list only and exclude
+``startIndex``/``endIndex``: indices are derived from the content (the
+client reindexes the desired document before diffing), so two segments
+with the same content hash identically regardless of where stale indices
+point.
+
+Everything else in the tab (document style, named styles, lists, inline
+objects, named ranges, …) is folded into one ``meta`` digest *including*
+indices, because named-range indices are semantic, not derived.
+
+Fingerprints are conservative: equal digests guarantee equal content, but
+unequal digests only mean "diff this" (e.g. the same headers inserted in a
+different dict order hash differently).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter
+
+from extradoc.api_types._generated import StructuralElement
+
+if TYPE_CHECKING:
+    from extradoc.api_types._generated import DocumentTab
+
+_CONTENT_ADAPTER: TypeAdapter[list[StructuralElement]] = TypeAdapter(
+    list[StructuralElement]
+)
+
+# Matches a serialized index field together with one adjacent comma, so the
+# remaining JSON stays canonical.  Inside JSON string values every quote is
+# escaped (``\"startIndex\"``), so user text can never match.
+_INDEX_FIELD_RE = re.compile(
+    rb',"(?:startIndex|endIndex)":-?\d+|"(?:startIndex|endIndex)":-?\d+,?'
+)
+
+# DocumentTab fields fingerprinted per segment rather than in ``meta``.
+_SEGMENT_FIELDS: frozenset[str] = frozenset({"body", "headers", "footers", "footnotes"})
+
+
+@dataclass
+class TabFingerprint:
+    """Digest of a whole tab plus per-segment digests.
+
+    Attributes
+    ----------
+    digest:
+        Digest over ``meta`` and every segment digest.
+    segments:
+        Segment key → digest of that segment's content (indices excluded).
+    """
+
+    digest: str
+    segments: dict[str, str] = field(default_factory=dict)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def content_fingerprint(content: list[StructuralElement]) -> str:
+    """Return the index-independent digest of a content list."""
+    raw = _CONTENT_ADAPTER.dump_json(content, by_alias=True, exclude_none=True)
+    return _digest(_INDEX_FIELD_RE.sub(b"", raw))
+
+
+def tab_fingerprint(doc_tab: DocumentTab) -> TabFingerprint:
+    """Fingerprint a ``DocumentTab`` and each of its content segments."""
+    segments: dict[str, str] = {}
+    if doc_tab.body is not None:
+        segments["body"] = content_fingerprint(doc_tab.body.content or [])
+    for header_id, header in (doc_tab.headers or {}).items():
+        segments[f"header:{header_id}"] = content_fingerprint(header.content or [])
+    for footer_id, footer in (doc_tab.footers or {}).items():
+        segments[f"footer:{footer_id}"] = content_fingerprint(footer.content or [])
+    for footnote_id, footnote in (doc_tab.footnotes or {}).items():
+        segments[f"footnote:{footnote_id}"] = content_fingerprint(
+            footnote.content or []
+        )
+
+    meta = doc_tab.model_dump_json(
+        by_alias=True, exclude_none=True, exclude=set(_SEGMENT_FIELDS)
+    )
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(meta.encode("utf-8"))
+    for key in sorted(segments):
+        hasher.update(f"\0{key}\0{segments[key]}".encode())
+    return TabFingerprint(digest=hasher.hexdigest(), segments=segments)
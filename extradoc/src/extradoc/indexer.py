@@ -6,6 +6,10 @@ utilities to calculate and verify indexes for document elements.
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+
 
 def utf16_len(text: str) -> int:
     """Calculate the length of a string in UTF-16 code units.
@@ -20,12 +24,60 @@ def utf16_len(text: str) -> int:
     Returns:
         Length in UTF-16 code units
     """
-    length = 0
-    for char in text:
-        code_point = ord(char)
-        if code_point > 0xFFFF:
-            # Surrogate pair needed
-            length += 2
-        else:
-            length += 1
-    return length
+    if text.isascii():
+        return len(text)
+    # Lone surrogates are one code unit each, like any other BMP char
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
+class Utf16Offsets:
+    """Code-point index → UTF-16 offset map for one string.
+
+    Pure-BMP strings (the common case) store nothing: offsets equal
+    code-point indices.  Only strings with surrogate pairs get an
+    ``array``-backed prefix sum of ``len(text) + 1`` entries.
+
+    Indexing with a code-point index ``i`` (``0 <= i <= len(text)``) gives
+    its UTF-16 offset; the last entry is the total UTF-16 length.
+    """
+
+    __slots__ = ("_prefix", "cp_len", "length")
+
+    def __init__(self, text: str) -> None:
+        self.cp_len = len(text)
+        self.length = utf16_len(text)
+        self._prefix: array[int] | None = None
+        if self.length != self.cp_len:
+            prefix = array("q", [0]) * (self.cp_len + 1)
+            pos = 0
+            for i, ch in enumerate(text):
+                pos += 2 if ord(ch) > 0xFFFF else 1
+                prefix[i + 1] = pos
+            self._prefix = prefix
+
+    def __len__(self) -> int:
+        return self.cp_len + 1
+
+    def __getitem__(self, cp_index: int) -> int:
+        if self._prefix is not None:
+            return self._prefix[cp_index]
+        if cp_index < 0:
+            cp_index += self.cp_len + 1
+        if not 0 <= cp_index <= self.cp_len:
+            raise IndexError("code-point index out of range")
+        return cp_index
+
+    def to_codepoint(self, utf16_units: int) -> int:
+        """Return the first code-point index at or after *utf16_units*.
+
+        Offsets past the end clamp to ``len(text)``.
+        """
+        if self._prefix is None:
+            return min(max(utf16_units, 0), self.cp_len)
+        return min(bisect_left(self._prefix, utf16_units), self.cp_len)
+
+
+@lru_cache(maxsize=4096)
+def utf16_offsets(text: str) -> Utf16Offsets:
+    """Return the (cached) UTF-16 offset map for *text*."""
+    return Utf16Offsets(text)
@@ -2,5 +2,6 @@
 
 from extradoc.mock.api import MockGoogleDocsAPI
 from extradoc.mock.exceptions import MockAPIError, ValidationError
+from extradoc.mock.server import MockDocsServer
 
-__all__ = ["MockAPIError", "MockGoogleDocsAPI", "ValidationError"]
+__all__ = ["MockAPIError", "MockDocsServer", "MockGoogleDocsAPI", "ValidationError"]
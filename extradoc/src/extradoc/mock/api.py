@@ -20,7 +20,9 @@ from extradoc.mock import (
     table_ops,
     text_ops,
 )
-from extradoc.mock.exceptions import ValidationError
+from extradoc.mock.dirty import dirty_regions, reindex_dirty_regions
+from extradoc.mock.exceptions import MockAPIError, ValidationError
+from extradoc.mock.journal import BatchJournal
 from extradoc.mock.reindex import reindex_and_normalize_all_tabs
 from extradoc.mock.validation import DocumentStructureTracker
 
@@ -35,7 +37,10 @@ class MockGoogleDocsAPI:
     - Proper UTF-16 index handling
 
     After each request, a centralized reindex + normalize pass fixes all
-    indices and consolidates text runs. Handlers only modify content.
+    indices and consolidates text runs. Handlers only modify content. The
+    pass is limited to the region the request addresses (see
+    ``extradoc.mock.dirty``), and so is the structure tracker update;
+    ``verify_reindex=True`` cross-checks both against a full pass.
 
     Public interface uses Pydantic types (Document, BatchUpdateDocumentRequest,
     BatchUpdateDocumentResponse). Internally the document is stored as a plain
@@ -44,7 +49,7 @@ class MockGoogleDocsAPI:
     for transport or test helpers.
     """
 
-    def __init__(self, doc: Document) -> None:
+    def __init__(self, doc: Document, *, verify_reindex: bool = False) -> None:
         initial = doc.model_dump(by_alias=True, exclude_none=True)
         self._document = copy.deepcopy(initial)
         self._revision_id = initial.get("revisionId", "mock_revision_1")
@@ -59,6 +64,12 @@ class MockGoogleDocsAPI:
         self._footer_types: set[str] = set()
         self._extract_header_footer_types()
 
+        # False until the whole document has been through reindex/normalize
+        # once; until then a failed batch must restore every tab in full and
+        # requests cannot be reindexed incrementally.
+        self._normalized = False
+        self._verify_reindex = verify_reindex
+
     def _extract_named_ranges(self) -> None:
         for tab in self._document.get("tabs", []):
             document_tab = tab.get("documentTab", {})
@@ -114,21 +125,35 @@ class MockGoogleDocsAPI:
 
         replies: list[dict[str, Any]] = []
 
-        backup_document = copy.deepcopy(self._document)
+        # Copy-on-write undo journal instead of a deepcopy of the document
+        journal = BatchJournal(self._document, full=not self._normalized)
         backup_revision = self._revision_id
+        backup_normalized = self._normalized
         backup_named_ranges = copy.deepcopy(self._named_ranges)
+        backup_header_types = set(self._header_types)
+        backup_footer_types = set(self._footer_types)
 
         try:
             for request in requests:
+                journal.record(request)
+                regions = (
+                    dirty_regions(self._document, request) if self._normalized else None
+                )
                 reply = self._process_request(request)
                 replies.append(reply)
 
-                # Reindex and normalize after each request
-                reindex_and_normalize_all_tabs(self._document)
-
-                # Rebuild structure tracker so subsequent requests
-                # validate against the updated document state
-                self._structure_tracker = DocumentStructureTracker(self._document)
+                # Reindex and normalize what the request touched, and update
+                # the structure tracker so subsequent requests validate
+                # against the updated document state
+                if regions is None:
+                    reindex_and_normalize_all_tabs(self._document)
+                    self._normalized = True
+                    self._structure_tracker = DocumentStructureTracker(self._document)
+                else:
+                    reindex_dirty_regions(regions)
+                    self._structure_tracker.update(regions)
+                    if self._verify_reindex:
+                        self._check_reindex(request)
 
             self._revision_counter += 1
             self._revision_id = f"mock_revision_{self._revision_counter}"
@@ -140,11 +165,29 @@ class MockGoogleDocsAPI:
             }
 
         except Exception:
-            self._document = backup_document
+            journal.rollback()
             self._revision_id = backup_revision
+            self._normalized = backup_normalized
             self._named_ranges = backup_named_ranges
+            self._header_types = backup_header_types
+            self._footer_types = backup_footer_types
+            self._structure_tracker = DocumentStructureTracker(self._document)
             raise
 
+    def _check_reindex(self, request: dict[str, Any]) -> None:
+        expected = copy.deepcopy(self._document)
+        reindex_and_normalize_all_tabs(expected)
+        if expected != self._document:
+            raise MockAPIError(
+                f"Incremental reindex diverged from the full pass after {request}",
+                status_code=500,
+            )
+        if DocumentStructureTracker(self._document) != self._structure_tracker:
+            raise MockAPIError(
+                f"Structure tracker diverged from a full scan after {request}",
+                status_code=500,
+            )
+
     def batch_update(
         self,
         batch: BatchUpdateDocumentRequest,
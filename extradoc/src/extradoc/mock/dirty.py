@@ -0,0 +1,257 @@
+"""Dirty-region tracking for the per-request reindex pass.
+
+Every request handler edits content at the locations the request names:
+``location`` / ``range`` / ``tableStartLocation`` / ``endOfSegmentLocation``
+and friends.  Elements of a segment before the first addressed element keep
+their content and their indices, and elements after the last one keep their
+content (only their indices shift).  ``dirty_regions`` works out, before the
+request runs, which (tab, segment, element span) each request can touch, so
+that ``reindex_dirty_regions`` can afterwards normalize only that span and
+reindex the segment from its first element onwards instead of walking every
+tab, header, footer and footnote.
+
+When the edit cannot be pinned to the segment the request names
+(``target_segment``), the whole tab is reindexed.
+
+Requests that create or drop segments or tabs, or that can edit arbitrary
+parts of the document (``FULL_REINDEX_REQUESTS``), return ``None``: the
+caller runs the full ``reindex_and_normalize_all_tabs`` pass instead.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any
+
+from extradoc.mock.reindex import (
+    reindex_and_normalize_segment,
+    reindex_and_normalize_tab,
+)
+
+# Requests whose effect is not limited to the locations they name.
+DOCUMENT_WIDE_REQUESTS = frozenset(
+    {
+        "replaceAllText",
+        "replaceNamedRangeContent",
+        "deleteNamedRange",
+        "replaceImage",
+        "deletePositionedObject",
+    }
+)
+
+# Requests that also add or remove whole segments or tabs.
+FULL_REINDEX_REQUESTS = DOCUMENT_WIDE_REQUESTS | {
+    "createHeader",
+    "createFooter",
+    "createFootnote",
+    "deleteHeader",
+    "deleteFooter",
+    "addDocumentTab",
+    "deleteTab",
+}
+
+# Requests whose handlers resolve the range against the body of the tab
+# whatever ``segmentId`` says, so a non-body segment ID does not name what
+# they edit.
+SEGMENT_BLIND_REQUESTS = frozenset(
+    {
+        "updateTextStyle",
+        "updateParagraphStyle",
+        "createParagraphBullets",
+        "deleteParagraphBullets",
+        "insertPageBreak",
+    }
+)
+
+SEGMENT_DICTS = ("headers", "footers", "footnotes")
+END = -1
+
+
+@dataclass(frozen=True)
+class TouchedLocation:
+    """A (tab, segment, index range) a request addresses.
+
+    ``tab_id`` / ``segment_id`` of ``None`` mean the first tab / the body.
+    ``start`` / ``end`` are ``None`` when the request names no index (the
+    segment as a whole is not touched, only tab metadata); ``END`` marks
+    an ``endOfSegmentLocation``.
+    """
+
+    tab_id: str | None
+    segment_id: str | None
+    start: int | None = None
+    end: int | None = None
+
+
+def touched_locations(request: dict[str, Any]) -> list[TouchedLocation]:
+    """Return every location a single raw request addresses."""
+    locations: list[TouchedLocation] = []
+    for request_type, body in request.items():
+        if request_type == "writeControl":
+            continue
+        _collect_locations(body, locations, key=request_type)
+    return locations
+
+
+def _collect_locations(value: Any, out: list[TouchedLocation], *, key: str) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _collect_locations(item, out, key=key)
+        return
+    if not isinstance(value, dict):
+        return
+    indices = [
+        v
+        for k in ("index", "startIndex", "endIndex")
+        if isinstance(v := value.get(k), int)
+    ]
+    tab_id = value.get("tabId")
+    segment_id = value.get("segmentId") or None
+    if key == "endOfSegmentLocation":
+        out.append(TouchedLocation(tab_id, segment_id, END, END))
+    elif indices:
+        out.append(TouchedLocation(tab_id, segment_id, min(indices), max(indices)))
+    elif isinstance(tab_id, str):
+        out.append(TouchedLocation(tab_id, None))
+    for k, v in value.items():
+        if isinstance(v, (dict, list)):
+            _collect_locations(v, out, key=k)
+
+
+def element_span(content: list[dict[str, Any]], start: int, end: int) -> range:
+    """Return the positions of the elements overlapping [start, end].
+
+    The span is widened by one neighbour on either side, since handlers
+    merge a paragraph into its predecessor or split it into its successor.
+    """
+    if start == END:
+        return range(max(len(content) - 2, 0), len(content))
+    # endIndex is monotonic; section breaks have no startIndex.
+    lo = bisect_right(content, start, key=_end_index) - 1
+    hi = bisect_right(content, end, key=_end_index) + 2
+    return range(max(lo, 0), min(hi, len(content)))
+
+
+def _end_index(element: dict[str, Any]) -> int:
+    return int(element.get("endIndex", 0))
+
+
+def find_tab(document: dict[str, Any], tab_id: str | None) -> dict[str, Any] | None:
+    """Resolve *tab_id* like ``navigation.get_tab``, returning None if absent."""
+    tabs = document.get("tabs") or []
+    if tab_id is None:
+        return tabs[0] if tabs else None
+    return next(
+        (t for t in tabs if t.get("tabProperties", {}).get("tabId") == tab_id),
+        None,
+    )
+
+
+def find_segment(tab: dict[str, Any], segment_id: str | None) -> dict[str, Any] | None:
+    """Resolve *segment_id* like ``navigation.get_segment``, or None."""
+    doc_tab = tab.get("documentTab", {})
+    if segment_id is None:
+        body: dict[str, Any] | None = doc_tab.get("body")
+        return body
+    for kind in SEGMENT_DICTS:
+        segments = doc_tab.get(kind, {})
+        if segment_id in segments:
+            segment: dict[str, Any] = segments[segment_id]
+            return segment
+    return None
+
+
+def target_segment(
+    tab: dict[str, Any], request: dict[str, Any], location: TouchedLocation
+) -> dict[str, Any] | None:
+    """Return the one segment *request* edits at *location*, or None.
+
+    None means the edit cannot be pinned to a single segment: either the
+    segment does not resolve, or the handler ignores a non-body
+    ``segmentId`` (``SEGMENT_BLIND_REQUESTS``).  Callers must then treat
+    the whole tab as touched.
+    """
+    if location.segment_id is not None and any(
+        k in SEGMENT_BLIND_REQUESTS for k in request
+    ):
+        return None
+    return find_segment(tab, location.segment_id)
+
+
+@dataclass
+class DirtyRegion:
+    """The part of one tab a request may change.
+
+    ``segment`` of ``None`` means the whole tab.  Otherwise ``first`` is the
+    position of the first element that may change and ``tail`` the number
+    of trailing elements the request leaves untouched.
+    """
+
+    tab: dict[str, Any]
+    segment: dict[str, Any] | None = None
+    segment_id: str | None = None
+    first: int = 0
+    tail: int = 0
+
+    @property
+    def is_body(self) -> bool:
+        return self.segment_id is None
+
+
+def dirty_regions(
+    document: dict[str, Any], request: dict[str, Any]
+) -> list[DirtyRegion] | None:
+    """Work out, before *request* runs, which regions it may change.
+
+    Returns ``None`` when the whole document has to be reindexed.
+    """
+    if any(k in FULL_REINDEX_REQUESTS for k in request):
+        return None
+    locations = touched_locations(request)
+    if not locations:
+        return None
+
+    regions: dict[int, DirtyRegion] = {}
+    whole_tabs: dict[int, DirtyRegion] = {}
+    for loc in locations:
+        tab = find_tab(document, loc.tab_id)
+        if tab is None:
+            # The handler rejects the request; reindexing is moot.
+            continue
+        segment = target_segment(tab, request, loc)
+        if loc.start is None or loc.end is None or segment is None:
+            whole_tabs.setdefault(id(tab), DirtyRegion(tab))
+            continue
+        content = segment.get("content", [])
+        span = element_span(content, loc.start, loc.end)
+        tail = len(content) - span.stop
+        region = regions.get(id(segment))
+        if region is None:
+            regions[id(segment)] = DirtyRegion(
+                tab, segment, loc.segment_id, span.start, tail
+            )
+        else:
+            region.first = min(region.first, span.start)
+            region.tail = min(region.tail, tail)
+
+    return list(whole_tabs.values()) + [
+        r for r in regions.values() if id(r.tab) not in whole_tabs
+    ]
+
+
+def reindex_dirty_regions(regions: list[DirtyRegion]) -> None:
+    """Normalize and reindex the regions returned by ``dirty_regions``."""
+    for region in regions:
+        lists = region.tab.get("documentTab", {}).get("lists", {})
+        if region.segment is None:
+            reindex_and_normalize_tab(region.tab)
+            continue
+        content = region.segment.get("content", [])
+        reindex_and_normalize_segment(
+            region.segment,
+            lists,
+            is_body=region.is_body,
+            first=min(region.first, len(content)),
+            stop=max(len(content) - region.tail, 0),
+        )
@@ -0,0 +1,216 @@
+"""Copy-on-write undo journal for MockGoogleDocsAPI batches.
+
+A batchUpdate is all-or-nothing: if any request fails, the document must be
+left exactly as it was before the batch.  Instead of deep-copying the whole
+document up front, ``BatchJournal`` saves only what a request can mutate,
+just before the request runs:
+
+- the top-level ``tabs`` list (shallow) and every non-tab document key;
+- per touched tab: ``tabProperties`` and every non-segment ``documentTab``
+  key (lists, styles, named ranges, …) plus shallow copies of the
+  ``headers`` / ``footers`` / ``footnotes`` dicts;
+- per touched segment: a shallow copy of its ``content`` list and deep
+  copies of the top-level structural elements around each index the
+  request addresses (one neighbour on either side).
+
+Which tabs, segments and indices a request touches is read from the
+request itself (``touched_locations``): every ``location`` / ``range`` /
+``tableStartLocation`` / ``endOfSegmentLocation``-like dict it contains.
+Requests that can affect arbitrary parts of the document
+(``DOCUMENT_WIDE_REQUESTS``) save every tab in full, and so does a request
+whose edit cannot be pinned to the segment it names (``target_segment``):
+an unresolved segment, or a handler that ignores ``segmentId``.
+
+A tab saved in full partway through a batch keeps the saves made before
+that point, moved onto the full copy, so that rollback first restores the
+copy and then undoes the earlier requests on it.
+
+On rollback the saved elements are put back into their content lists and
+the touched tabs are reindexed, which recomputes the derived fields
+(indices, nesting levels) that the per-request reindex rewrote in elements
+that were not saved.  This relies on reindex + normalize being idempotent
+on a document that has already been through it once, so the journal must
+save every tab in full for the first batch (``full=True``).
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any
+
+from extradoc.mock.dirty import (
+    DOCUMENT_WIDE_REQUESTS,
+    SEGMENT_DICTS,
+    TouchedLocation,
+    element_span,
+    find_tab,
+    target_segment,
+    touched_locations,
+)
+from extradoc.mock.reindex import reindex_and_normalize_tab
+
+
+@dataclass
+class _SegmentSave:
+    segment: dict[str, Any]
+    keys: dict[str, Any]
+    content: list[dict[str, Any]]
+    positions: dict[int, int]
+    had_content: bool
+    elements: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls, segment: dict[str, Any]) -> _SegmentSave:
+        content = list(segment.get("content", []))
+        return cls(
+            segment=segment,
+            keys={k: copy.deepcopy(v) for k, v in segment.items() if k != "content"},
+            content=content,
+            positions={id(el): i for i, el in enumerate(content)},
+            had_content="content" in segment,
+        )
+
+    def save_around(self, start: int, end: int) -> None:
+        """Save the live elements overlapping [start, end] plus one neighbour."""
+        live = self.segment.get("content", [])
+        for pos_live in element_span(live, start, end):
+            el = live[pos_live]
+            pos = self.positions.get(id(el))
+            if pos is not None and pos not in self.elements:
+                self.elements[pos] = copy.deepcopy(el)
+
+    def retarget(self, memo: dict[int, Any]) -> None:
+        """Point this save at the copies of its objects in a deepcopy *memo*."""
+        self.segment = memo.get(id(self.segment), self.segment)
+        self.content = [memo.get(id(el), el) for el in self.content]
+
+    def restore(self) -> None:
+        self.segment.clear()
+        self.segment.update(self.keys)
+        if self.had_content:
+            self.segment["content"] = [
+                self.elements.get(i, el) for i, el in enumerate(self.content)
+            ]
+
+
+@dataclass
+class _TabSave:
+    tab: dict[str, Any]
+    full: dict[str, Any] | None = None
+    shell: dict[str, Any] | None = None
+    segments: dict[int, _SegmentSave] = field(default_factory=dict)
+
+    def save_full(self) -> None:
+        if self.full is not None:
+            return
+        memo: dict[int, Any] = {}
+        self.full = copy.deepcopy(self.tab, memo)
+        # Earlier requests of the batch may already have edited the tab: keep
+        # their saves, moved onto the copy, to undo them after restoring it.
+        for save in self.segments.values():
+            save.retarget(memo)
+        doc_tab = self.shell.get("documentTab") if self.shell is not None else None
+        if doc_tab is not None:
+            for k, v in doc_tab.items():
+                if k == "body":
+                    doc_tab[k] = memo.get(id(v), v)
+                elif k in SEGMENT_DICTS:
+                    doc_tab[k] = {sid: memo.get(id(seg), seg) for sid, seg in v.items()}
+
+    def save_meta(self) -> None:
+        if self.full is not None or self.shell is not None:
+            return
+        shell = {k: copy.deepcopy(v) for k, v in self.tab.items() if k != "documentTab"}
+        doc_tab = self.tab.get("documentTab")
+        if doc_tab is not None:
+            saved_doc_tab: dict[str, Any] = {}
+            for k, v in doc_tab.items():
+                if k == "body":
+                    saved_doc_tab[k] = v
+                elif k in SEGMENT_DICTS:
+                    saved_doc_tab[k] = dict(v)
+                else:
+                    saved_doc_tab[k] = copy.deepcopy(v)
+            shell["documentTab"] = saved_doc_tab
+        self.shell = shell
+
+    def segment(self, segment: dict[str, Any]) -> _SegmentSave:
+        save = self.segments.get(id(segment))
+        if save is None:
+            save = _SegmentSave.capture(segment)
+            self.segments[id(segment)] = save
+        return save
+
+    def restore(self) -> None:
+        if self.full is not None:
+            self.tab.clear()
+            self.tab.update(self.full)
+            if not self.segments and self.shell is None:
+                return
+        for save in self.segments.values():
+            save.restore()
+        if self.shell is not None:
+            self.tab.clear()
+            self.tab.update(self.shell)
+        reindex_and_normalize_tab(self.tab)
+
+
+class BatchJournal:
+    """Undo journal for one batchUpdate on a raw document dict.
+
+    Call ``record(request)`` before running each request and ``rollback()``
+    if the batch fails.  ``full=True`` saves every tab in full up front.
+    """
+
+    def __init__(self, document: dict[str, Any], *, full: bool = False) -> None:
+        self._document = document
+        self._keys = {k: copy.deepcopy(v) for k, v in document.items() if k != "tabs"}
+        self._order = list(document)
+        tabs = document.get("tabs")
+        self._tabs: list[dict[str, Any]] | None = (
+            list(tabs) if tabs is not None else None
+        )
+        self._saves: dict[int, _TabSave] = {
+            id(tab): _TabSave(tab) for tab in self._tabs or []
+        }
+        if full:
+            for save in self._saves.values():
+                save.save_full()
+
+    def record(self, request: dict[str, Any]) -> None:
+        """Save whatever *request* may mutate, before it runs."""
+        if any(k in DOCUMENT_WIDE_REQUESTS for k in request):
+            for save in self._saves.values():
+                save.save_full()
+            return
+        locations = touched_locations(request) or [TouchedLocation(None, None)]
+        for loc in locations:
+            save = self._tab_save(loc.tab_id)
+            if save is None or save.full is not None:
+                continue
+            save.save_meta()
+            if loc.start is None or loc.end is None:
+                continue
+            segment = target_segment(save.tab, request, loc)
+            if segment is None:
+                save.save_full()
+                continue
+            save.segment(segment).save_around(loc.start, loc.end)
+
+    def _tab_save(self, tab_id: str | None) -> _TabSave | None:
+        """Resolve *tab_id* like ``navigation.get_tab`` against the live tabs."""
+        tab = find_tab(self._document, tab_id)
+        # Tabs created in this batch are simply dropped on rollback.
+        return self._saves.get(id(tab)) if tab is not None else None
+
+    def rollback(self) -> None:
+        """Restore the document to its state when the journal was created."""
+        for save in self._saves.values():
+            save.restore()
+        restored = dict(self._keys)
+        if self._tabs is not None:
+            restored["tabs"] = self._tabs
+        self._document.clear()
+        for key in self._order:
+            self._document[key] = restored[key]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from typing import Any
 
 from extradoc.mock.exceptions import ValidationError
@@ -105,6 +106,60 @@ def validate_range(tab: dict[str, Any], start_index: int, end_index: int) -> Non
             )
 
 
+def _end_index(element: dict[str, Any]) -> int:
+    return int(element.get("endIndex", 0))
+
+
+def first_element_ending_after(
+    elements: list[dict[str, Any]], index: int, *, inclusive: bool = False
+) -> int:
+    """Return the position of the first element whose endIndex is > *index*.
+
+    Segment content, table rows and table cells are laid out in index order,
+    so their endIndex values are sorted and the lookup is a bisect.  With
+    *inclusive*, elements ending exactly at *index* count as well.
+
+    Args:
+        elements: Structural elements, rows or cells in document order.
+        index: UTF-16 index to look up.
+        inclusive: If True, use endIndex >= index instead.
+
+    Returns:
+        Position in *elements* (``len(elements)`` if none qualifies).
+    """
+    if inclusive:
+        return bisect_left(elements, index, key=_end_index)
+    return bisect_right(elements, index, key=_end_index)
+
+
+def element_at_index(
+    content: list[dict[str, Any]], index: int
+) -> tuple[dict[str, Any], int] | None:
+    """Return the (element, position) whose [startIndex, endIndex) holds *index*."""
+    pos = first_element_ending_after(content, index)
+    if pos < len(content) and content[pos].get("startIndex", 0) <= index:
+        return content[pos], pos
+    return None
+
+
+def _overlapping(
+    elements: list[dict[str, Any]],
+    start_index: int,
+    end_index: int,
+    *,
+    inclusive: bool = False,
+) -> list[dict[str, Any]]:
+    """Return the elements with endIndex > start_index and startIndex < end_index."""
+    result: list[dict[str, Any]] = []
+    pos = first_element_ending_after(elements, start_index, inclusive=inclusive)
+    for i in range(pos, len(elements)):
+        element = elements[i]
+        if element.get("startIndex", 0) >= end_index:
+            break
+        result.append(element)
+    return result
+
+
 def _collect_paragraphs_in_range(
     content: list[dict[str, Any]],
     start_index: int,
@@ -114,20 +169,22 @@ def _collect_paragraphs_in_range(
     inclusive: bool = False,
 ) -> None:
     """Recursively collect paragraphs in range from content list (including inside tables)."""
-    for element in content:
-        el_start = element.get("startIndex", 0)
-        el_end = element.get("endIndex", 0)
-
+    for element in _overlapping(content, start_index, end_index, inclusive=inclusive):
         if "paragraph" in element:
-            if inclusive:
-                if el_end >= start_index and el_start < end_index:
-                    result.append(element["paragraph"])
-            else:
-                if el_end > start_index and el_start < end_index:
-                    result.append(element["paragraph"])
-        elif "table" in element and el_end > start_index and el_start < end_index:
-            for row in element["table"].get("tableRows", []):
-                for cell in row.get("tableCells", []):
+            result.append(element["paragraph"])
+        elif "table" in element and (
+            not inclusive or _end_index(element) > start_index
+        ):
+            rows = element["table"].get("tableRows", [])
+            if rows and "endIndex" in rows[0]:
+                rows = _overlapping(rows, start_index, end_index, inclusive=inclusive)
+            for row in rows:
+                cells = row.get("tableCells", [])
+                if cells and "endIndex" in cells[0]:
+                    cells = _overlapping(
+                        cells, start_index, end_index, inclusive=inclusive
+                    )
+                for cell in cells:
                     _collect_paragraphs_in_range(
                         cell.get("content", []),
                         start_index,
@@ -183,8 +240,9 @@ def find_table_at_index(
     Raises:
         ValidationError: If table not found.
     """
-    content = segment.get("content", [])
-    for i, element in enumerate(content):
+    found = element_at_index(segment.get("content", []), table_start_index)
+    if found is not None:
+        element, i = found
         if "table" in element and element.get("startIndex", 0) == table_start_index:
             return element, i
     raise ValidationError(f"Table not found at index {table_start_index}")
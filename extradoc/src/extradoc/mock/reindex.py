@@ -14,7 +14,9 @@ from typing import Any
 from extradoc.indexer import utf16_len
 
 
-def reindex_segment(segment: dict[str, Any], *, is_body: bool = True) -> None:
+def reindex_segment(
+    segment: dict[str, Any], *, is_body: bool = True, first: int = 0
+) -> None:
     """Walk all content in a segment and assign correct indices.
 
     For body segments:
@@ -28,18 +30,24 @@ def reindex_segment(segment: dict[str, Any], *, is_body: bool = True) -> None:
     Args:
         segment: A segment dict with a "content" key.
         is_body: True for body segments, False for headers/footers/footnotes.
+        first: Position of the first element to reindex. Elements before it
+            must already carry correct indices.
     """
     content = segment.get("content", [])
     if not content:
         return
 
-    # Determine starting index.
-    # Body with sectionBreak starts at 0; otherwise body content starts at 1.
-    # Non-body segments (headers/footers/footnotes) start at 0.
-    current_idx = (0 if "sectionBreak" in content[0] else 1) if is_body else 0
+    if first > 0:
+        current_idx = content[first - 1]["endIndex"]
+        is_first_element = False
+    else:
+        # Determine starting index.
+        # Body with sectionBreak starts at 0; otherwise body content starts at 1.
+        # Non-body segments (headers/footers/footnotes) start at 0.
+        current_idx = (0 if "sectionBreak" in content[0] else 1) if is_body else 0
+        is_first_element = True
 
-    is_first_element = True
-    for element in content:
+    for element in content[first:]:
         if "sectionBreak" in element:
             # Real API omits startIndex on sectionBreak (always first element)
             element.pop("startIndex", None)
@@ -397,39 +405,60 @@ def _update_nesting_levels_in_segment(
             _update_nesting_levels_in_table(element["table"], lists)
 
 
+def reindex_and_normalize_segment(
+    segment: dict[str, Any],
+    lists: dict[str, Any],
+    *,
+    is_body: bool,
+    first: int = 0,
+    stop: int | None = None,
+) -> None:
+    """Normalize ``content[first:stop]`` and reindex from ``first`` onwards.
+
+    Elements outside ``[first, stop)`` must already be normalized; elements
+    before ``first`` must also carry correct indices.
+
+    Args:
+        segment: A segment dict with a "content" key.
+        lists: The tab's list definitions, for bullet nesting levels.
+        is_body: True for body segments, False for headers/footers/footnotes.
+        first: Position of the first element that may have changed.
+        stop: Position after the last element that may have changed.
+    """
+    content = segment.get("content", [])
+    if first == 0 and stop is None:
+        window = segment
+    else:
+        window = {"content": content[first:stop]}
+    normalize_segment(window)
+    reindex_segment(segment, is_body=is_body, first=first)
+    _update_nesting_levels_in_segment(window, lists)
+
+
+def reindex_and_normalize_tab(tab: dict[str, Any]) -> None:
+    """Reindex and normalize every segment of one tab."""
+    doc_tab = tab.get("documentTab", {})
+    lists = doc_tab.get("lists", {})
+
+    # Body
+    body = doc_tab.get("body")
+    if body:
+        reindex_and_normalize_segment(body, lists, is_body=True)
+
+    # Headers, footers, footnotes
+    for kind in ("headers", "footers", "footnotes"):
+        for segment in doc_tab.get(kind, {}).values():
+            reindex_and_normalize_segment(segment, lists, is_body=False)
+
+
 def reindex_and_normalize_all_tabs(document: dict[str, Any]) -> None:
     """Reindex and normalize all segments across all tabs.
 
-    Called after each request in batch_update().
+    Called after a request in batch_update() that cannot be limited to a
+    dirty region (see ``extradoc.mock.dirty``).
 
     Args:
         document: The full document dict.
     """
     for tab in document.get("tabs", []):
-        doc_tab = tab.get("documentTab", {})
-        lists = doc_tab.get("lists", {})
-
-        # Body
-        body = doc_tab.get("body")
-        if body:
-            normalize_segment(body)
-            reindex_segment(body, is_body=True)
-            _update_nesting_levels_in_segment(body, lists)
-
-        # Headers
-        for header in doc_tab.get("headers", {}).values():
-            normalize_segment(header)
-            reindex_segment(header, is_body=False)
-            _update_nesting_levels_in_segment(header, lists)
-
-        # Footers
-        for footer in doc_tab.get("footers", {}).values():
-            normalize_segment(footer)
-            reindex_segment(footer, is_body=False)
-            _update_nesting_levels_in_segment(footer, lists)
-
-        # Footnotes
-        for footnote in doc_tab.get("footnotes", {}).values():
-            normalize_segment(footnote)
-            reindex_segment(footnote, is_body=False)
-            _update_nesting_levels_in_segment(footnote, lists)
+        reindex_and_normalize_tab(tab)
@@ -0,0 +1,209 @@
+"""Replay executed batches on MockGoogleDocsAPI to predict the pushed document.
+
+After a push, the live document is the base document with the pushed
+batches applied.  ``replay_batches`` rebuilds that state locally so the
+folder can be refreshed without another ``documents.get``:
+
+1. The batches run on a ``MockGoogleDocsAPI`` loaded with the base, with
+   placeholders resolved from the mock's own replies.
+2. Object IDs the mock minted (tabs, headers, footnotes, named ranges,
+   images) are mapped to the real IDs by walking the mock and real replies
+   side by side.
+3. The result is checked for anything the mock cannot predict: request
+   kinds it only validates, replies whose shape differs from the real ones,
+   and IDs the real API never reported (list IDs, heading IDs).
+
+Any of these raises ``ReplayDivergedError``; callers fall back to fetching
+the document.  The replay says nothing about concurrent edits — compare
+the live ``revisionId`` against the last ``writeControl`` for that.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from extradoc.api_types._generated import Document
+from extradoc.mock.api import MockGoogleDocsAPI
+from extradoc.mock.exceptions import MockAPIError
+from extradoc.reconcile_v3.executor import resolve_deferred_placeholders
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from extradoc.api_types._generated import BatchUpdateDocumentRequest
+
+# Request kinds the mock applies in full; the rest are validated only
+REPLAYABLE_REQUESTS = frozenset(
+    {
+        "insertText",
+        "deleteContentRange",
+        "updateTextStyle",
+        "updateParagraphStyle",
+        "createParagraphBullets",
+        "deleteParagraphBullets",
+        "insertTable",
+        "insertTableRow",
+        "insertTableColumn",
+        "deleteTableRow",
+        "deleteTableColumn",
+        "updateTableCellStyle",
+        "insertPageBreak",
+        "createHeader",
+        "createFooter",
+        "deleteHeader",
+        "deleteFooter",
+        "createFootnote",
+        "addDocumentTab",
+        "updateDocumentTabProperties",
+        "deleteTab",
+        "createNamedRange",
+        "deleteNamedRange",
+    }
+)
+
+# Maps keyed by object ID
+_ID_KEYED_MAPS = frozenset(
+    {"headers", "footers", "footnotes", "lists", "inlineObjects", "positionedObjects"}
+)
+# "...Id" fields that are not object IDs
+_NOT_OBJECT_IDS = frozenset({"documentId", "revisionId"})
+
+
+class ReplayDivergedError(MockAPIError):
+    """The mock replay cannot be trusted to match the live document."""
+
+
+def replay_batches(
+    base: Document,
+    batches: Sequence[BatchUpdateDocumentRequest],
+    responses: Sequence[dict[str, Any]],
+    *,
+    revision_id: str | None,
+) -> Document:
+    """Return *base* with *batches* applied, using the real *responses*' IDs.
+
+    *responses* are the live ``batchUpdate`` responses, one per batch;
+    *revision_id* becomes the result's ``revisionId``.
+
+    Raises:
+        ReplayDivergedError: The replay may not match the live document
+    """
+    if len(responses) != len(batches):
+        raise ReplayDivergedError(
+            f"{len(batches)} batch(es) but {len(responses)} response(s)"
+        )
+    for batch in batches:
+        for request in batch.requests or []:
+            kind = _request_kind(request.model_dump(by_alias=True, exclude_none=True))
+            if kind not in REPLAYABLE_REQUESTS:
+                raise ReplayDivergedError(f"The mock does not apply {kind} requests")
+
+    api = MockGoogleDocsAPI(base)
+    id_map: dict[str, str] = {}
+    mock_responses: list[dict[str, Any]] = []
+    try:
+        for batch, real in zip(batches, responses, strict=True):
+            resolved = resolve_deferred_placeholders(mock_responses, batch)
+            mock = api.batch_update(resolved).model_dump(
+                by_alias=True, exclude_none=True
+            )
+            mock_responses.append(mock)
+            _map_reply_ids(
+                mock.get("replies", []), real.get("replies", []), id_map, "replies"
+            )
+    except ReplayDivergedError:
+        raise
+    except (MockAPIError, ValueError, KeyError, IndexError, TypeError) as e:
+        raise ReplayDivergedError(f"Replay failed: {e}") from e
+
+    raw = _rename_ids(api._get_raw(), id_map)
+    known = set(_object_ids(base.model_dump(by_alias=True, exclude_none=True)))
+    known.update(id_map.values())
+    unknown = sorted(set(_object_ids(raw)) - known)
+    if unknown:
+        raise ReplayDivergedError(f"IDs the API did not report: {unknown[:5]}")
+    heading_ids = Counter(_field_values(raw, "headingId"))
+    duplicated = sorted(h for h, n in heading_ids.items() if n > 1)
+    if duplicated:
+        raise ReplayDivergedError(f"Duplicate heading IDs: {duplicated[:5]}")
+
+    raw["revisionId"] = revision_id
+    if revision_id is None:
+        del raw["revisionId"]
+    return Document.model_validate(raw)
+
+
+def _request_kind(request: dict[str, Any]) -> str:
+    kinds = [k for k in request if k != "writeControl"]
+    return kinds[0] if len(kinds) == 1 else ",".join(kinds)
+
+
+def _map_reply_ids(mock: Any, real: Any, id_map: dict[str, str], path: str) -> None:
+    """Walk *mock* and *real* replies together, recording mock→real IDs."""
+    if isinstance(mock, dict) and isinstance(real, dict):
+        if mock.keys() != real.keys():
+            raise ReplayDivergedError(
+                f"Reply shape differs at {path}: {sorted(mock)} != {sorted(real)}"
+            )
+        for key, value in mock.items():
+            sub = f"{path}.{key}"
+            if key.endswith("Id") and isinstance(value, str):
+                if not isinstance(real[key], str):
+                    raise ReplayDivergedError(f"Reply shape differs at {sub}")
+                id_map[value] = real[key]
+            else:
+                _map_reply_ids(value, real[key], id_map, sub)
+    elif isinstance(mock, list) and isinstance(real, list):
+        if len(mock) != len(real):
+            raise ReplayDivergedError(
+                f"Reply count differs at {path}: {len(mock)} != {len(real)}"
+            )
+        for i, (m, r) in enumerate(zip(mock, real, strict=True)):
+            _map_reply_ids(m, r, id_map, f"{path}[{i}]")
+    elif mock != real:
+        raise ReplayDivergedError(f"Reply differs at {path}: {mock!r} != {real!r}")
+
+
+def _rename_ids(obj: Any, id_map: dict[str, str]) -> Any:
+    """Replace mapped IDs wherever they appear, as values or as map keys."""
+    if not id_map:
+        return obj
+    if isinstance(obj, dict):
+        return {id_map.get(k, k): _rename_ids(v, id_map) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rename_ids(v, id_map) for v in obj]
+    if isinstance(obj, str):
+        return id_map.get(obj, obj)
+    return obj
+
+
+def _object_ids(obj: Any) -> Iterator[str]:
+    """Yield every object ID in a raw document: ``...Id`` fields and map keys."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in _ID_KEYED_MAPS and isinstance(value, dict):
+                yield from value
+            if (
+                key.endswith("Id")
+                and key not in _NOT_OBJECT_IDS
+                and isinstance(value, str)
+            ):
+                yield value
+            else:
+                yield from _object_ids(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _object_ids(value)
+
+
+def _field_values(obj: Any, field: str) -> Iterator[Any]:
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == field:
+                yield value
+            else:
+                yield from _field_values(value, field)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _field_values(value, field)
@@ -0,0 +1,390 @@
+"""Serve MockGoogleDocsAPI over HTTP as a local Docs / Drive stand-in.
+
+``MockDocsServer`` answers the endpoints ``GoogleDocsTransport`` calls:
+
+- ``GET  .../v1/documents/{id}`` (honouring ``includeTabsContent`` and a
+  ``fields`` mask)
+- ``POST .../v1/documents/{id}:batchUpdate``
+- ``GET/POST/PATCH/DELETE .../drive/v3/files/{id}/comments[/{cid}[/replies[/{rid}]]]``
+
+Each document is backed by its own ``MockGoogleDocsAPI``; comments live in
+a plain in-memory store.  The server can be used in-process through
+``server.transport()`` (an ``httpx.MockTransport``), or, since instances
+are ASGI apps, served over a real socket (``uvicorn.run(server)``) and
+reached by pointing ``GoogleDocsTransport(api_base=..., drive_api_base=...)``
+or the CLI's ``EXTRASUITE_DOCS_API_BASE`` / ``EXTRASUITE_DRIVE_API_BASE``
+at it.
+
+Latency, server errors and 429 throttling can be injected to load-test the
+pull / push pipelines offline::
+
+    server = MockDocsServer(latency=0.05, error_rate=0.01, throttle_rate=0.05)
+    server.add_document(doc_id, raw_json)
+    transport = GoogleDocsTransport(
+        "token",
+        api_base="http://mock/v1/documents",
+        drive_api_base="http://mock/drive/v3/files",
+        http_transport=server.transport(),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from extradoc.api_types._generated import Document
+from extradoc.mock.api import MockGoogleDocsAPI
+from extradoc.mock.exceptions import MockAPIError
+
+_DOCUMENT_PATH = re.compile(r"/v1/documents/(?P<doc>[^/:]+)(?P<batch>:batchUpdate)?$")
+_COMMENTS_PATH = re.compile(
+    r"/drive/v3/files/(?P<file>[^/]+)/comments"
+    r"(?:/(?P<comment>[^/]+)(?P<replies>/replies)?(?:/(?P<reply>[^/]+))?)?$"
+)
+
+# Google's canonical status strings for the error bodies we emit
+_STATUS_NAMES = {
+    400: "INVALID_ARGUMENT",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+}
+
+DEFAULT_PAGE_SIZE = 20
+
+
+class MockDocsServer:
+    """In-memory Docs / Drive comments server backed by MockGoogleDocsAPI.
+
+    Args:
+        latency: Seconds to wait before answering each request
+        jitter: Extra random delay, uniform in ``[0, jitter]`` seconds
+        error_rate: Fraction of requests answered with a 503
+        throttle_rate: Fraction of requests answered with a 429
+        retry_after: ``Retry-After`` seconds sent with injected 429s
+        seed: Seed for the fault-injection RNG, for reproducible runs
+        verify_reindex: Passed to each ``MockGoogleDocsAPI``
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int | None = None,
+        verify_reindex: bool = False,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._verify_reindex = verify_reindex
+
+        self.documents: dict[str, MockGoogleDocsAPI] = {}
+        self.comments: dict[str, list[dict[str, Any]]] = {}
+        # (method, route) of every request received, faults included
+        self.requests: list[tuple[str, str]] = []
+        self._next_id = 0
+
+    def add_document(
+        self,
+        document_id: str,
+        document: Document | dict[str, Any],
+        comments: list[dict[str, Any]] | None = None,
+    ) -> MockGoogleDocsAPI:
+        """Register a document (and optionally its Drive comments)."""
+        if isinstance(document, dict):
+            document = Document.model_validate(document)
+        api = MockGoogleDocsAPI(document, verify_reindex=self._verify_reindex)
+        self.documents[document_id] = api
+        self.comments[document_id] = [dict(c) for c in comments or []]
+        return api
+
+    def transport(self) -> httpx.MockTransport:
+        """Return an httpx transport that routes requests to this server."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a single Docs or Drive API request."""
+        path = request.url.path
+        self.requests.append((request.method, path))
+
+        delay = self.latency + (
+            self._random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.throttle_rate and self._random.random() < self.throttle_rate:
+            return _error(
+                429,
+                "Quota exceeded (injected)",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        if self.error_rate and self._random.random() < self.error_rate:
+            return _error(503, "The service is currently unavailable (injected)")
+
+        try:
+            if match := _DOCUMENT_PATH.search(path):
+                return self._handle_document(request, match)
+            if match := _COMMENTS_PATH.search(path):
+                return self._handle_comments(request, match)
+        except MockAPIError as e:
+            return _error(e.status_code, str(e))
+        return _error(404, f"No mock route for {request.method} {path}")
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """ASGI entry point, so the server can run under uvicorn & co."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        query = scope.get("query_string", b"").decode("latin-1")
+        url = f"http://mock{scope['path']}"
+        request = httpx.Request(
+            scope["method"],
+            f"{url}?{query}" if query else url,
+            headers=[
+                (k.decode("latin-1"), v.decode("latin-1")) for k, v in scope["headers"]
+            ],
+            content=body,
+        )
+        response = await self.handle(request)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (k.encode("latin-1"), v.encode("latin-1"))
+                    for k, v in response.headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+    # ------------------------------------------------------------------
+    # Docs API
+    # ------------------------------------------------------------------
+
+    def _handle_document(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        document_id = match["doc"]
+        api = self.documents.get(document_id)
+        if api is None:
+            return _error(404, f"Requested entity was not found: {document_id}")
+
+        if match["batch"]:
+            if request.method != "POST":
+                return _error(405, "batchUpdate only accepts POST")
+            body = json.loads(request.content or b"{}")
+            response = api._batch_update_raw(
+                body.get("requests", []), body.get("writeControl")
+            )
+            response["documentId"] = document_id
+            return httpx.Response(200, json=response)
+
+        if request.method != "GET":
+            return _error(405, "documents.get only accepts GET")
+        document = api._get_raw()
+        document["documentId"] = document_id
+        document.setdefault("title", "")
+        if request.url.params.get("includeTabsContent") != "true":
+            document = _first_tab_view(document)
+        if fields := request.url.params.get("fields"):
+            document = _apply_field_mask(document, _parse_field_mask(fields))
+        return httpx.Response(200, json=document)
+
+    # ------------------------------------------------------------------
+    # Drive comments API
+    # ------------------------------------------------------------------
+
+    def _handle_comments(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        comments = self.comments.get(match["file"])
+        if comments is None:
+            return _error(404, f"File not found: {match['file']}")
+        method = request.method
+        body: dict[str, Any] = json.loads(request.content) if request.content else {}
+
+        if match["comment"] is None:
+            if method == "GET":
+                return self._list_comments(request, comments)
+            return _error(405, f"{method} is not supported on comments")
+
+        comment = _find_live(comments, match["comment"])
+        if comment is None:
+            return _error(404, f"Comment not found: {match['comment']}")
+
+        if not match["replies"]:
+            if method == "PATCH":
+                comment.update(content=body.get("content", ""), modifiedTime=_now())
+                return httpx.Response(200, json=comment)
+            if method == "DELETE":
+                comment.update(deleted=True, modifiedTime=_now())
+                return httpx.Response(204)
+            return _error(405, f"{method} is not supported on a comment")
+
+        replies: list[dict[str, Any]] = comment.setdefault("replies", [])
+        if match["reply"] is None:
+            if method != "POST":
+                return _error(405, f"{method} is not supported on replies")
+            reply = {
+                "id": self._new_id("reply"),
+                "content": body.get("content", ""),
+                "author": {"displayName": "Mock User", "me": True},
+                "createdTime": _now(),
+                "modifiedTime": _now(),
+            }
+            if action := body.get("action"):
+                reply["action"] = action
+                comment["resolved"] = action == "resolve"
+            replies.append(reply)
+            comment["modifiedTime"] = reply["modifiedTime"]
+            return httpx.Response(200, json=reply)
+
+        existing = _find_live(replies, match["reply"])
+        if existing is None:
+            return _error(404, f"Reply not found: {match['reply']}")
+        if method == "PATCH":
+            existing.update(content=body.get("content", ""), modifiedTime=_now())
+            comment["modifiedTime"] = existing["modifiedTime"]
+            return httpx.Response(200, json=existing)
+        if method == "DELETE":
+            existing.update(deleted=True, modifiedTime=_now())
+            comment["modifiedTime"] = existing["modifiedTime"]
+            return httpx.Response(204)
+        return _error(405, f"{method} is not supported on a reply")
+
+    def _list_comments(
+        self, request: httpx.Request, comments: list[dict[str, Any]]
+    ) -> httpx.Response:
+        params = request.url.params
+        live = [
+            c
+            for c in comments
+            if (params.get("includeDeleted") == "true" or not c.get("deleted"))
+            and c.get("modifiedTime", "") >= params.get("startModifiedTime", "")
+        ]
+        page_size = int(params.get("pageSize", DEFAULT_PAGE_SIZE))
+        offset = int(params.get("pageToken", 0))
+        page: dict[str, Any] = {"comments": live[offset : offset + page_size]}
+        if offset + page_size < len(live):
+            page["nextPageToken"] = str(offset + page_size)
+        return httpx.Response(200, json=page)
+
+    def _new_id(self, prefix: str) -> str:
+        self._next_id += 1
+        return f"mock-{prefix}-{self._next_id}"
+
+
+def _find_live(items: list[dict[str, Any]], item_id: str) -> dict[str, Any] | None:
+    return next(
+        (i for i in items if i.get("id") == item_id and not i.get("deleted")), None
+    )
+
+
+def _first_tab_view(document: dict[str, Any]) -> dict[str, Any]:
+    """Return *document* as served without ``includeTabsContent``.
+
+    The first tab's content moves to the document-level fields and
+    ``tabs`` is left out.
+    """
+    tabs = document.pop("tabs", None) or [{}]
+    document.update(tabs[0].get("documentTab") or {})
+    return document
+
+
+def _parse_field_mask(fields: str) -> dict[str, Any]:
+    """Parse a partial-response mask (``a,b(c,d),e/f``) into a nested dict.
+
+    A leaf maps to an empty dict, meaning "the whole value".
+    """
+    tree: dict[str, Any] = {}
+    stack = [tree]
+    name = ""
+
+    def _add(name: str) -> dict[str, Any]:
+        node = stack[-1]
+        for part in name.strip().split("/"):
+            node = node.setdefault(part, {})
+        return node
+
+    for char in fields:
+        if char == "(":
+            stack.append(_add(name))
+            name = ""
+        elif char in ",)":
+            if name.strip():
+                _add(name)
+            name = ""
+            if char == ")":
+                stack.pop()
+        else:
+            name += char
+    if name.strip():
+        _add(name)
+    return tree
+
+
+def _apply_field_mask(value: Any, mask: dict[str, Any]) -> Any:
+    """Keep only the parts of *value* selected by a parsed field mask."""
+    if not mask or "*" in mask:
+        return value
+    if isinstance(value, list):
+        return [_apply_field_mask(v, mask) for v in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        k: _apply_field_mask(value[k], sub) for k, sub in mask.items() if k in value
+    }
+
+
+def _now() -> str:
+    now = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    return now.replace("+00:00", "Z")
+
+
+def _error(
+    status: int, message: str, *, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """Build a Google-style JSON error response."""
+    return httpx.Response(
+        status,
+        json={
+            "error": {
+                "code": status,
+                "message": message,
+                "status": _STATUS_NAMES.get(status, "UNKNOWN"),
+            }
+        },
+        headers=headers,
+    )
@@ -10,7 +10,12 @@ import copy
 from typing import Any
 
 from extradoc.mock.exceptions import ValidationError
-from extradoc.mock.navigation import get_segment, get_tab
+from extradoc.mock.navigation import (
+    element_at_index,
+    first_element_ending_after,
+    get_segment,
+    get_tab,
+)
 from extradoc.mock.utils import (
     calculate_utf16_offset,
     merge_explicit_keys,
@@ -146,14 +151,14 @@ def _insert_text_impl(
     if index >= max_index:
         raise ValidationError(f"Index {index} is beyond segment end {max_index - 1}")
 
-    for element in content:
-        if "table" in element:
-            table_start = element.get("startIndex", 0)
-            if index == table_start:
-                raise ValidationError(
-                    "Cannot insert text at table start index. "
-                    "Insert in the preceding paragraph instead."
-                )
+    found = element_at_index(content, index)
+    if found is not None and "table" in found[0]:
+        table_start = found[0].get("startIndex", 0)
+        if index == table_start:
+            raise ValidationError(
+                "Cannot insert text at table start index. "
+                "Insert in the preceding paragraph instead."
+            )
 
     if "\n" in text:
         _insert_text_with_newlines(segment, index, text)
@@ -178,9 +183,14 @@ def _insert_text_simple_in_content(
     index: int,
     text: str,
 ) -> bool:
-    for elem_idx, element in enumerate(content):
+    # Tables ending at index still qualify, hence inclusive
+    first = first_element_ending_after(content, index, inclusive=True)
+    for elem_idx in range(first, len(content)):
+        element = content[elem_idx]
         elem_start = element.get("startIndex", 0)
         elem_end = element.get("endIndex", 0)
+        if elem_start > index:
+            break
 
         if (
             elem_start <= index < elem_end
@@ -338,9 +348,13 @@ def _insert_text_with_newlines_in_content(
     index: int,
     text: str,
 ) -> bool:
-    for elem_idx, element in enumerate(content):
+    first = first_element_ending_after(content, index)
+    for elem_idx in range(first, len(content)):
+        element = content[elem_idx]
         elem_start = element.get("startIndex", 0)
         elem_end = element.get("endIndex", 0)
+        if elem_start > index:
+            break
 
         table = element.get("table")
         if table is not None and elem_start <= index < elem_end:
@@ -648,28 +662,25 @@ def _insert_page_break_impl(
         },
     }
 
-    for elem_idx, element in enumerate(content):
+    found = element_at_index(content, index)
+    if found is not None and "paragraph" in found[0]:
+        element, elem_idx = found
         elem_start = element.get("startIndex", 0)
-        elem_end = element.get("endIndex", 0)
-
-        if elem_start <= index < elem_end and "paragraph" in element:
-            if index == elem_start:
-                # Insert pagebreak paragraph before this paragraph (no split).
-                content.insert(elem_idx, copy.deepcopy(pagebreak_para))
-            else:
-                # Split paragraph at index: left part gets content before index
-                # (with a trailing \n ensured), right part gets content from
-                # index onwards (including the original trailing \n).
-                paragraph = element["paragraph"]
-                left_para, right_para = _split_paragraph_at(
-                    paragraph, index, elem_start
-                )
-                content[elem_idx : elem_idx + 1] = [
-                    {"startIndex": 0, "endIndex": 0, "paragraph": left_para},
-                    copy.deepcopy(pagebreak_para),
-                    {"startIndex": 0, "endIndex": 0, "paragraph": right_para},
-                ]
-            return
+        if index == elem_start:
+            # Insert pagebreak paragraph before this paragraph (no split).
+            content.insert(elem_idx, copy.deepcopy(pagebreak_para))
+        else:
+            # Split paragraph at index: left part gets content before index
+            # (with a trailing \n ensured), right part gets content from
+            # index onwards (including the original trailing \n).
+            paragraph = element["paragraph"]
+            left_para, right_para = _split_paragraph_at(paragraph, index, elem_start)
+            content[elem_idx : elem_idx + 1] = [
+                {"startIndex": 0, "endIndex": 0, "paragraph": left_para},
+                copy.deepcopy(pagebreak_para),
+                {"startIndex": 0, "endIndex": 0, "paragraph": right_para},
+            ]
+        return
 
     raise ValidationError(f"Could not find paragraph at index {index}")
 
@@ -987,9 +998,13 @@ def _delete_content_from_segment(
     Indices are set to 0 — reindex fixes them.
     """
     content = segment.get("content", [])
+    first = first_element_ending_after(content, start_index)
 
     # Check if range falls within a table cell — delegate to cell-level delete
-    for element in content:
+    for i in range(first, len(content)):
+        element = content[i]
+        if element.get("startIndex", 0) >= end_index:
+            break
         if "table" not in element:
             continue
         table_start = element.get("startIndex", 0)
@@ -1005,10 +1020,13 @@ def _delete_content_from_segment(
 
     # Find affected elements (paragraphs and fully-covered tables)
     affected_indices: list[int] = []
-    for i, element in enumerate(content):
+    for i in range(first, len(content)):
+        element = content[i]
         elem_start = element.get("startIndex", 0)
         elem_end = element.get("endIndex", 0)
-        if elem_start < end_index and elem_end > start_index:
+        if elem_start >= end_index:
+            break
+        if elem_end > start_index:
             if "paragraph" in element:
                 affected_indices.append(i)
             elif (
@@ -1041,7 +1059,13 @@ def _delete_content_from_segment(
     # Non-textRun elements (footnoteReference, inlineObjectElement, …) that fall
     # outside the delete range are preserved so they are not silently dropped.
     surviving_runs: list[
-        tuple[str | None, dict[str, Any] | None, dict[str, Any], bool, dict[str, Any] | None]
+        tuple[
+            str | None,
+            dict[str, Any] | None,
+            dict[str, Any],
+            bool,
+            dict[str, Any] | None,
+        ]
     ] = []
 
     for idx in affected_indices:
@@ -1057,7 +1081,9 @@ def _delete_content_from_segment(
                 run_end = pe.get("endIndex", 0)
                 # Preserve non-textRun elements that lie outside the delete range.
                 if run_end <= start_index or run_start >= end_index:
-                    surviving_runs.append((None, None, para_props, False, copy.deepcopy(pe)))
+                    surviving_runs.append(
+                        (None, None, para_props, False, copy.deepcopy(pe))
+                    )
                 continue
             run_start = pe.get("startIndex", 0)
             run_end = pe.get("endIndex", 0)
@@ -1086,7 +1112,13 @@ def _delete_content_from_segment(
     # The real API consolidates those, but keeps within-paragraph runs separate.
     # Non-textRun elements cannot be consolidated — pass them through as-is.
     consolidated: list[
-        tuple[str | None, dict[str, Any] | None, dict[str, Any], bool, dict[str, Any] | None]
+        tuple[
+            str | None,
+            dict[str, Any] | None,
+            dict[str, Any],
+            bool,
+            dict[str, Any] | None,
+        ]
     ] = []
     for run in surviving_runs:
         content_item, style_item, props, modified, raw_pe = run
@@ -1119,7 +1151,9 @@ def _delete_content_from_segment(
 
     # Re-split into paragraphs based on \n boundaries.
     # Group items: (str, style_dict) for textRun, (None, pe_dict) for non-textRun.
-    para_groups: list[tuple[list[tuple[str | None, dict[str, Any]]], dict[str, Any]]] = []
+    para_groups: list[
+        tuple[list[tuple[str | None, dict[str, Any]]], dict[str, Any]]
+    ] = []
     current_group: list[tuple[str | None, dict[str, Any]]] = []
     first_props_in_group: dict[str, Any] | None = None
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from extradoc.indexer import utf16_len
+from extradoc.indexer import utf16_len, utf16_offsets
 
 
 def calculate_utf16_offset(text: str, utf16_units: int) -> int:
@@ -18,19 +18,7 @@ def calculate_utf16_offset(text: str, utf16_units: int) -> int:
     Returns:
         String index (Python character position)
     """
-    if utf16_units == 0:
-        return 0
-
-    units_counted = 0
-    for i, char in enumerate(text):
-        if units_counted >= utf16_units:
-            return i
-        if ord(char) >= 0x10000:
-            units_counted += 2
-        else:
-            units_counted += 1
-
-    return len(text)
+    return utf16_offsets(text).to_codepoint(utf16_units)
 
 
 def strip_control_characters(text: str) -> str:
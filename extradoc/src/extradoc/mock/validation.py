@@ -2,21 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
+from extradoc.indexer import utf16_offsets
 from extradoc.mock.exceptions import ValidationError
 from extradoc.mock.navigation import get_segment
 
+if TYPE_CHECKING:
+    from extradoc.mock.dirty import DirtyRegion
 
+
+@dataclass
 class _SegmentStructure:
-    """Structural elements tracked within a single segment."""
+    """Structural elements tracked within a single segment.
+
+    Every list is sorted by start index, so lookups can bisect.
+    """
+
+    tables: list[tuple[int, int]] = field(default_factory=list)
+    table_cell_ranges: list[list[tuple[int, int]]] = field(default_factory=list)
+    table_of_contents: list[tuple[int, int]] = field(default_factory=list)
+    equations: list[tuple[int, int]] = field(default_factory=list)
+    section_breaks: list[int] = field(default_factory=list)
+
+    def truncate(self, cutoff: int) -> None:
+        """Drop every structure starting at or after *cutoff*."""
+        i = bisect_left(self.tables, cutoff, key=_start)
+        del self.tables[i:]
+        del self.table_cell_ranges[i:]
+        del self.table_of_contents[
+            bisect_left(self.table_of_contents, cutoff, key=_start) :
+        ]
+        del self.equations[bisect_left(self.equations, cutoff, key=_start) :]
+        del self.section_breaks[bisect_left(self.section_breaks, cutoff) :]
+
+
+def _start(interval: tuple[int, int]) -> int:
+    return interval[0]
 
-    def __init__(self) -> None:
-        self.tables: list[tuple[int, int]] = []
-        self.table_cell_ranges: list[list[tuple[int, int]]] = []
-        self.table_of_contents: list[tuple[int, int]] = []
-        self.equations: list[tuple[int, int]] = []
-        self.section_breaks: list[int] = []
+
+def _end(interval: tuple[int, int]) -> int:
+    return interval[1]
+
+
+def _overlapping(
+    intervals: list[tuple[int, int]], start_index: int, end_index: int
+) -> range:
+    """Positions of the sorted, disjoint *intervals* with end > start_index
+    and start <= end_index."""
+    return range(
+        bisect_right(intervals, start_index, key=_end),
+        bisect_right(intervals, end_index, key=_start),
+    )
 
 
 class DocumentStructureTracker:
@@ -27,21 +66,42 @@ class DocumentStructureTracker:
     validation of operations that might violate structural constraints.
 
     Structures are indexed per (tab_id, segment_id) so that index ranges
-    from different tabs/segments are never confused.
+    from different tabs/segments are never confused.  After a request,
+    ``update`` rescans only the dirty regions the request touched.
     """
 
     def __init__(self, document: dict[str, Any]) -> None:
-        # Legacy flat lists — kept for backward compat with any external callers
-        self.tables: list[tuple[int, int]] = []
-        self.table_cell_ranges: list[list[tuple[int, int]]] = []
-        self.table_of_contents: list[tuple[int, int]] = []
-        self.equations: list[tuple[int, int]] = []
-        self.section_breaks: list[int] = []
-
         # Per-(tab, segment) structures
         self._segments: dict[tuple[str | None, str | None], _SegmentStructure] = {}
         self._scan_document(document)
 
+    # Legacy flat lists — kept for backward compat with any external callers
+
+    @property
+    def tables(self) -> list[tuple[int, int]]:
+        return [t for seg in self._segments.values() for t in seg.tables]
+
+    @property
+    def table_cell_ranges(self) -> list[list[tuple[int, int]]]:
+        return [c for seg in self._segments.values() for c in seg.table_cell_ranges]
+
+    @property
+    def table_of_contents(self) -> list[tuple[int, int]]:
+        return [t for seg in self._segments.values() for t in seg.table_of_contents]
+
+    @property
+    def equations(self) -> list[tuple[int, int]]:
+        return [e for seg in self._segments.values() for e in seg.equations]
+
+    @property
+    def section_breaks(self) -> list[int]:
+        return [b for seg in self._segments.values() for b in seg.section_breaks]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DocumentStructureTracker):
+            return NotImplemented
+        return self._segments == other._segments
+
     def _get_or_create(
         self, tab_id: str | None, segment_id: str | None
     ) -> _SegmentStructure:
@@ -52,17 +112,40 @@ class DocumentStructureTracker:
 
     def _scan_document(self, document: dict[str, Any]) -> None:
         for tab in document.get("tabs", []):
-            tab_id = tab.get("tabProperties", {}).get("tabId")
-            document_tab = tab.get("documentTab", {})
-
-            # Body
-            body = document_tab.get("body", {})
-            self._scan_content(body.get("content", []), tab_id, None)
-
-            # Headers, footers, footnotes
-            for seg_type in ("headers", "footers", "footnotes"):
-                for seg_id, seg in document_tab.get(seg_type, {}).items():
-                    self._scan_content(seg.get("content", []), tab_id, seg_id)
+            self._scan_tab(tab)
+
+    def _scan_tab(self, tab: dict[str, Any]) -> None:
+        tab_id = tab.get("tabProperties", {}).get("tabId")
+        document_tab = tab.get("documentTab", {})
+
+        # Body
+        body = document_tab.get("body", {})
+        self._scan_content(body.get("content", []), tab_id, None)
+
+        # Headers, footers, footnotes
+        for seg_type in ("headers", "footers", "footnotes"):
+            for seg_id, seg in document_tab.get(seg_type, {}).items():
+                self._scan_content(seg.get("content", []), tab_id, seg_id)
+
+    def update(self, regions: list[DirtyRegion]) -> None:
+        """Rescan the regions a request changed, after they were reindexed.
+
+        Segments are updated in place so that the fallback order used by
+        ``_resolve_segment`` is unchanged.
+        """
+        for region in regions:
+            tab_id = region.tab.get("tabProperties", {}).get("tabId")
+            if region.segment is None:
+                for key, seg in self._segments.items():
+                    if key[0] == tab_id:
+                        seg.truncate(0)
+                self._scan_tab(region.tab)
+                continue
+            content = region.segment.get("content", [])
+            first = min(region.first, len(content))
+            cutoff = content[first - 1].get("endIndex", 0) if first > 0 else 0
+            self._get_or_create(tab_id, region.segment_id).truncate(cutoff)
+            self._scan_content(content[first:], tab_id, region.segment_id)
 
     def _scan_content(
         self,
@@ -77,7 +160,6 @@ class DocumentStructureTracker:
 
             if "table" in element:
                 seg.tables.append((start, end))
-                self.tables.append((start, end))
                 cell_ranges: list[tuple[int, int]] = []
                 for row in element["table"].get("tableRows", []):
                     for cell in row.get("tableCells", []):
@@ -87,15 +169,15 @@ class DocumentStructureTracker:
                             c_end = cell_content[-1].get("endIndex", 0)
                             cell_ranges.append((c_start, c_end))
                 seg.table_cell_ranges.append(cell_ranges)
-                self.table_cell_ranges.append(cell_ranges)
             elif "tableOfContents" in element:
                 seg.table_of_contents.append((start, end))
-                self.table_of_contents.append((start, end))
                 toc = element["tableOfContents"]
                 self._scan_content(toc.get("content", []), tab_id, segment_id)
             elif "sectionBreak" in element:
-                seg.section_breaks.append(start)
-                self.section_breaks.append(start)
+                # Section breaks carry no startIndex; one recorded at index 0
+                # can never block a deletion, so only explicit ones are kept.
+                if "startIndex" in element:
+                    seg.section_breaks.append(start)
             elif "paragraph" in element:
                 para = element["paragraph"]
                 for para_elem in para.get("elements", []):
@@ -103,7 +185,6 @@ class DocumentStructureTracker:
                         eq_start = para_elem.get("startIndex", 0)
                         eq_end = para_elem.get("endIndex", 0)
                         seg.equations.append((eq_start, eq_end))
-                        self.equations.append((eq_start, eq_end))
 
     def _resolve_segment(
         self, tab_id: str | None, segment_id: str | None
@@ -125,21 +206,24 @@ class DocumentStructureTracker:
         tab_id: str | None = None,
         segment_id: str | None = None,
     ) -> None:
-        """Validate that deletion doesn't violate structural rules."""
+        """Validate that deletion doesn't violate structural rules.
+
+        Only structures overlapping the range, or starting right at its end,
+        can be violated; they are found by bisecting the sorted intervals.
+        """
         seg = self._resolve_segment(tab_id, segment_id)
 
         # Validate tables
-        for i, (table_start, table_end) in enumerate(seg.tables):
+        for i in _overlapping(seg.tables, start_index, end_index):
+            table_start, table_end = seg.tables[i]
             if start_index > table_start and end_index < table_end:
                 # Range is inside the table — only valid if it falls entirely
                 # within a single cell's content range (not structural overhead)
                 cell_ranges = (
                     seg.table_cell_ranges[i] if i < len(seg.table_cell_ranges) else []
                 )
-                in_cell = any(
-                    c_start <= start_index and end_index <= c_end
-                    for c_start, c_end in cell_ranges
-                )
+                cell = bisect_right(cell_ranges, start_index, key=_start) - 1
+                in_cell = cell >= 0 and end_index <= cell_ranges[cell][1]
                 if in_cell:
                     continue
                 raise ValidationError(
@@ -161,7 +245,8 @@ class DocumentStructureTracker:
                 )
 
         # Validate TableOfContents
-        for toc_start, toc_end in seg.table_of_contents:
+        for i in _overlapping(seg.table_of_contents, start_index, end_index):
+            toc_start, toc_end = seg.table_of_contents[i]
             if self._is_partial_overlap(start_index, end_index, toc_start, toc_end):
                 raise ValidationError(
                     f"Cannot partially delete table of contents at indices {toc_start}-{toc_end}. "
@@ -176,7 +261,8 @@ class DocumentStructureTracker:
                 )
 
         # Validate Equations
-        for eq_start, eq_end in seg.equations:
+        for i in _overlapping(seg.equations, start_index, end_index):
+            eq_start, eq_end = seg.equations[i]
             if self._is_partial_overlap(start_index, end_index, eq_start, eq_end):
                 raise ValidationError(
                     f"Cannot partially delete equation at indices {eq_start}-{eq_end}. "
@@ -185,7 +271,9 @@ class DocumentStructureTracker:
                 )
 
         # Validate SectionBreaks
-        for sb_index in seg.section_breaks:
+        i = bisect_left(seg.section_breaks, end_index)
+        if i < len(seg.section_breaks):
+            sb_index = seg.section_breaks[i]
             if sb_index > 1 and start_index < sb_index == end_index:
                 raise ValidationError(
                     f"Cannot delete newline before section break without deleting the break. "
@@ -233,22 +321,25 @@ def _check_surrogate_pairs_in_element(
 def _validate_text_surrogate_pairs(
     text: str, elem_start: int, del_start: int, del_end: int
 ) -> None:
-    current_index = elem_start
-    for char in text:
-        char_code = ord(char)
-        if char_code >= 0x10000:
-            pair_start = current_index
-            pair_end = current_index + 2
-            if pair_start < del_start < pair_end or pair_start < del_end < pair_end:
-                raise ValidationError(
-                    f"Cannot delete one code unit of a surrogate pair. "
-                    f"Character '{char}' (U+{char_code:04X}) at index {pair_start} "
-                    f"spans indices {pair_start}-{pair_end}. Deletion range "
-                    f"{del_start}-{del_end} would split it."
-                )
-            current_index += 2
-        else:
-            current_index += 1
+    offsets = utf16_offsets(text)
+    if offsets.length == offsets.cp_len:
+        return  # No surrogate pairs to split
+    for index in (del_start, del_end):
+        units = index - elem_start
+        if not 0 < units < offsets.length:
+            continue
+        cp_index = offsets.to_codepoint(units)
+        if offsets[cp_index] == units:
+            continue
+        char = text[cp_index - 1]
+        pair_start = elem_start + offsets[cp_index - 1]
+        pair_end = pair_start + 2
+        raise ValidationError(
+            f"Cannot delete one code unit of a surrogate pair. "
+            f"Character '{char}' (U+{ord(char):04X}) at index {pair_start} "
+            f"spans indices {pair_start}-{pair_end}. Deletion range "
+            f"{del_start}-{del_end} would split it."
+        )
 
 
 def validate_no_table_cell_final_newline_deletion(
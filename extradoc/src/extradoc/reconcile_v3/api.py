@@ -19,19 +19,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from extradoc.api_types._generated import (
-    BatchUpdateDocumentRequest,
-    Document,
-    Request,
-)
-from extradoc.api_types._generated import (
-    List as DocList,
-)
 from extradoc.diffmerge import diff as diff_documents
 from extradoc.reconcile_v3.lower import lower_batches
+from extradoc.reconcile_v3.placeholders import LoweredBatch
+from extradoc.tracing import NULL_TRACER, Tracer
 
 if TYPE_CHECKING:
-    from extradoc.diffmerge import DiffOp
+    from extradoc.api_types._generated import (
+        BatchUpdateDocumentRequest,
+        Document,
+        Request,
+    )
+    from extradoc.api_types._generated import (
+        List as DocList,
+    )
+    from extradoc.diffmerge import DiffOp, TabExecutorMode
 
 
 def _extract_lists_by_tab(doc: Document) -> dict[str, dict[str, DocList]]:
@@ -101,6 +103,10 @@ def reconcile(
 def reconcile_batches(
     base: Document,
     desired: Document,
+    *,
+    tab_executor: TabExecutorMode = "serial",
+    max_workers: int | None = None,
+    tracer: Tracer = NULL_TRACER,
 ) -> list[BatchUpdateDocumentRequest]:
     """Top-down tree reconciler — multi-batch sequence.
 
@@ -110,6 +116,15 @@ def reconcile_batches(
         Current state of the document.
     desired:
         Target state of the document.
+    tab_executor:
+        ``"thread"`` or ``"process"`` to diff independent tabs in parallel
+        (see ``extradoc.diffmerge.diff.diff_documents``).  The output is the
+        same in every mode.
+    max_workers:
+        Pool size for the parallel modes.
+    tracer:
+        Receives ``reconcile.*`` spans and the ``reconcile.ops`` /
+        ``reconcile.batches`` / ``reconcile.requests`` counters.
 
     Returns
     -------
@@ -117,17 +132,25 @@ def reconcile_batches(
         Ordered list of request batches.  Each batch must be executed in order.
         Deferred-ID placeholders in later batches are resolved against prior
         batch responses via
-        ``extradoc.reconcile_v3.executor.resolve_deferred_placeholders``.
+        ``extradoc.reconcile_v3.executor.resolve_deferred_placeholders``;
+        each batch is a ``LoweredBatch`` recording which fields hold them.
     """
-    ops = diff_documents(base, desired)
+    with tracer.span("reconcile.diff_documents"):
+        ops = diff_documents(
+            base, desired, tab_executor=tab_executor, max_workers=max_workers
+        )
+    tracer.count("reconcile.ops", len(ops))
     desired_lists_by_tab = _extract_lists_by_tab(desired)
     base_lists_by_tab = _extract_lists_by_tab(base)
-    raw_batches = lower_batches(
-        ops,
-        desired_lists_by_tab=desired_lists_by_tab,
-        base_lists_by_tab=base_lists_by_tab,
-    )
-    return [BatchUpdateDocumentRequest(requests=batch) for batch in raw_batches]
+    with tracer.span("reconcile.lower_batches"):
+        raw_batches = lower_batches(
+            ops,
+            desired_lists_by_tab=desired_lists_by_tab,
+            base_lists_by_tab=base_lists_by_tab,
+        )
+    tracer.count("reconcile.batches", len(raw_batches))
+    tracer.count("reconcile.requests", sum(len(batch) for batch in raw_batches))
+    return [LoweredBatch.from_requests(batch) for batch in raw_batches]
 
 
 def diff(
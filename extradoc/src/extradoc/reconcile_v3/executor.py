@@ -5,7 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol
 
-from extradoc.api_types._generated import BatchUpdateDocumentRequest, WriteControl
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    DeferredID,
+    WriteControl,
+)
+from extradoc.reconcile_v3.placeholders import (
+    LoweredBatch,
+    find_placeholder_slots,
+    patch_placeholders,
+)
+from extradoc.tracing import NULL_TRACER, Tracer
+from extradoc.transport import encode_batch
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -29,64 +40,54 @@ def resolve_deferred_placeholders(
     prior_responses: Sequence[dict[str, Any]],
     batch: BatchUpdateDocumentRequest,
 ) -> BatchUpdateDocumentRequest:
-    """Resolve DeferredID-style placeholder dicts inside a typed batch request.
+    """Resolve the DeferredID placeholders inside a typed batch request.
 
-    Strategy: serialize the batch to a dict via model_dump, walk the dict to
-    resolve placeholder dicts (which is how DeferredID dataclasses serialize),
-    then validate back into a BatchUpdateDocumentRequest.
+    The batch's placeholder table (recorded at lowering time for
+    ``LoweredBatch``, found by walking the requests otherwise) says which
+    fields hold placeholders; only those are patched, on a copy.  A batch
+    without placeholders is returned as-is.
     """
-
-    def extract_path(data: Any, path: str) -> str:
-        current = data
-        for key in path.split("."):
-            if not isinstance(current, dict) or key not in current:
-                raise ValueError(
-                    f"Could not resolve deferred path {path!r} at key {key!r}"
-                )
-            current = current[key]
-        if not isinstance(current, str):
-            raise ValueError(f"Deferred path {path!r} did not resolve to a string")
-        return current
-
-    def is_deferred_id_dict(value: Any) -> bool:
-        return (
-            isinstance(value, dict)
-            and "placeholder" in value
-            and "batch_index" in value
-            and "request_index" in value
-            and "response_path" in value
+    slots = (
+        batch.placeholders
+        if isinstance(batch, LoweredBatch)
+        else find_placeholder_slots(batch.requests or [])
+    )
+    if not slots:
+        return batch
+    values = [_resolve_deferred_id(prior_responses, s.deferred_id) for s in slots]
+    return patch_placeholders(batch, slots, values)
+
+
+def _resolve_deferred_id(
+    prior_responses: Sequence[dict[str, Any]], deferred_id: DeferredID
+) -> str:
+    batch_index = deferred_id.batch_index
+    request_index = deferred_id.request_index
+    if not isinstance(batch_index, int) or not isinstance(request_index, int):
+        raise ValueError("Deferred placeholder batch/request indexes must be integers")
+    if batch_index >= len(prior_responses):
+        raise ValueError(
+            f"Deferred placeholder references batch {batch_index}, "
+            f"but only {len(prior_responses)} response(s) are available"
         )
+    replies = prior_responses[batch_index].get("replies", [])
+    if not isinstance(replies, list) or request_index >= len(replies):
+        raise ValueError(
+            f"Deferred placeholder references request {request_index}, "
+            f"but batch {batch_index} has {len(replies) if isinstance(replies, list) else 0} replies"
+        )
+    return _extract_path(replies[request_index], deferred_id.response_path)
 
-    def resolve(value: Any) -> Any:
-        if is_deferred_id_dict(value):
-            batch_index = value["batch_index"]
-            request_index = value["request_index"]
-            if not isinstance(batch_index, int) or not isinstance(request_index, int):
-                raise ValueError(
-                    "Deferred placeholder batch/request indexes must be integers"
-                )
-            if batch_index >= len(prior_responses):
-                raise ValueError(
-                    f"Deferred placeholder references batch {batch_index}, "
-                    f"but only {len(prior_responses)} response(s) are available"
-                )
-            replies = prior_responses[batch_index].get("replies", [])
-            if not isinstance(replies, list) or request_index >= len(replies):
-                raise ValueError(
-                    f"Deferred placeholder references request {request_index}, "
-                    f"but batch {batch_index} has {len(replies) if isinstance(replies, list) else 0} replies"
-                )
-            return extract_path(replies[request_index], value["response_path"])
-        if isinstance(value, dict):
-            return {key: resolve(item) for key, item in value.items()}
-        if isinstance(value, list):
-            return [resolve(item) for item in value]
-        return value
 
-    # Serialize to dict, resolve placeholders, validate back
-    raw = batch.model_dump(by_alias=True, mode="python")
-    resolved_raw = resolve(raw)
-    return BatchUpdateDocumentRequest.model_validate(resolved_raw)
+def _extract_path(data: Any, path: str) -> str:
+    current = data
+    for key in path.split("."):
+        if not isinstance(current, dict) or key not in current:
+            raise ValueError(f"Could not resolve deferred path {path!r} at key {key!r}")
+        current = current[key]
+    if not isinstance(current, str):
+        raise ValueError(f"Deferred path {path!r} did not resolve to a string")
+    return current
 
 
 async def execute_request_batches(
@@ -95,20 +96,37 @@ async def execute_request_batches(
     document_id: str,
     request_batches: Sequence[BatchUpdateDocumentRequest],
     initial_revision_id: str | None,
+    tracer: Tracer = NULL_TRACER,
 ) -> BatchExecutionResult:
-    """Execute request batches, carrying forward returned requiredRevisionId."""
+    """Execute request batches, carrying forward returned requiredRevisionId.
+
+    *tracer* gets one ``execute.batch`` span per batch and the
+    ``execute.batches`` / ``execute.requests`` / ``execute.bytes_sent``
+    counters.
+    """
     revision_id = initial_revision_id
     responses: list[dict[str, Any]] = []
-    for batch in request_batches:
-        resolved = resolve_deferred_placeholders(responses, batch)
-        if revision_id is not None:
-            resolved.write_control = WriteControl(
-                required_revision_id=revision_id,
-            )
-        response = await transport.batch_update(
-            document_id,
-            resolved,
-        )
+    for index, batch in enumerate(request_batches):
+        request_count = len(batch.requests or [])
+        with tracer.span("execute.batch", index=index, requests=request_count):
+            with tracer.span("execute.resolve_placeholders"):
+                resolved = resolve_deferred_placeholders(responses, batch)
+            if revision_id is not None:
+                # Copy: resolved may be the caller's own (placeholder-free) batch
+                resolved = resolved.model_copy(
+                    update={
+                        "write_control": WriteControl(required_revision_id=revision_id)
+                    }
+                )
+            if tracer.enabled:
+                tracer.count("execute.batches")
+                tracer.count("execute.requests", request_count)
+                tracer.count("execute.bytes_sent", len(encode_batch(resolved)))
+            with tracer.span("execute.batch_update"):
+                response = await transport.batch_update(
+                    document_id,
+                    resolved,
+                )
         responses.append(response)
         revision_id = _next_required_revision_id(response, revision_id)
     return BatchExecutionResult(
@@ -25,13 +25,16 @@ Deferred IDs
 When a header/footer is created in Batch 1, its ID is not yet known.  The
 ``updateSectionStyle`` request in Batch 2 that attaches the header uses a
 ``DeferredID`` placeholder that ``resolve_deferred_placeholders`` resolves
-after Batch 1 executes.
+after Batch 1 executes.  ``reconcile_batches`` records which request fields
+hold placeholders (see ``placeholders.py``) so the executor patches only
+those.
 """
 
 from __future__ import annotations
 
 import copy
 import difflib
+import re
 from itertools import groupby
 from typing import TYPE_CHECKING
 
@@ -128,7 +131,7 @@ from extradoc.diffmerge import (
     UpdateTableRowStyleOp,
 )
 from extradoc.diffmerge.model import DeleteNamedRangeOp, InsertNamedRangeOp
-from extradoc.indexer import utf16_len
+from extradoc.indexer import Utf16Offsets, utf16_len, utf16_offsets
 
 # Slot → API type string
 _HEADER_TYPE = {
@@ -2223,22 +2226,6 @@ def _runs_to_spans(
     return spans
 
 
-def _build_cp_to_utf16(text: str) -> list[int]:
-    """Build a mapping from code-point index to UTF-16 offset.
-
-    Returns a list of length ``len(text) + 1`` where entry ``i`` is the
-    UTF-16 offset corresponding to code-point index ``i``.  The final
-    entry gives the total UTF-16 length.
-    """
-    result: list[int] = []
-    utf16_pos = 0
-    for ch in text:
-        result.append(utf16_pos)
-        utf16_pos += 2 if ord(ch) > 0xFFFF else 1
-    result.append(utf16_pos)
-    return result
-
-
 def _styles_equal(s1: TextStyle, s2: TextStyle) -> bool:
     """Return True if two TextStyle models are effectively equal.
 
@@ -2249,6 +2236,130 @@ def _styles_equal(s1: TextStyle, s2: TextStyle) -> bool:
     )
 
 
+# Paragraph bodies whose combined length is at or below this are diffed with a
+# single character-level SequenceMatcher; longer ones get the word-level
+# pre-pass in _paragraph_opcodes.
+_CHAR_DIFF_MAX_CHARS = 400
+
+# Upper bound on len(a) * len(b) handed to any one SequenceMatcher call inside
+# _paragraph_opcodes (tokens for the word pass, characters per window).  Larger
+# inputs fall back to a coarser but still valid replace.
+_DIFF_MAX_CELLS = 1_000_000
+
+# Word, whitespace run, or a single other character (punctuation, opaque
+# placeholder).  Concatenating the tokens always reproduces the input.
+_DIFF_TOKEN_RE = re.compile(r"\w+|\s+|[^\w\s]")
+
+_Opcode = tuple[str, int, int, int, int]
+
+
+def _paragraph_opcodes(base: str, desired: str) -> list[_Opcode]:
+    """Return SequenceMatcher-style opcodes turning *base* into *desired*.
+
+    Short inputs go straight to a character-level ``SequenceMatcher`` (the
+    historical behaviour).  Longer inputs are first aligned on word and
+    whitespace tokens; characters are only diffed inside the token windows
+    that changed, so an edit to one word of a long clause costs time
+    proportional to that window rather than to the square of the clause.
+
+    Every ``SequenceMatcher`` call is capped at ``_DIFF_MAX_CELLS``: a token
+    pass over the cap degrades to trimming the common prefix/suffix, and a
+    window over the cap is replaced wholesale.  The opcodes always cover both
+    strings contiguously, so the caller's requests stay valid.
+    """
+    if len(base) + len(desired) <= _CHAR_DIFF_MAX_CHARS:
+        return list(
+            difflib.SequenceMatcher(None, base, desired, autojunk=False).get_opcodes()
+        )
+
+    base_tokens = _DIFF_TOKEN_RE.findall(base)
+    desired_tokens = _DIFF_TOKEN_RE.findall(desired)
+    if len(base_tokens) * len(desired_tokens) > _DIFF_MAX_CELLS:
+        return _affix_opcodes(base, desired)
+
+    base_offsets = _token_offsets(base_tokens)
+    desired_offsets = _token_offsets(desired_tokens)
+    token_matcher = difflib.SequenceMatcher(
+        None, base_tokens, desired_tokens, autojunk=False
+    )
+
+    opcodes: list[_Opcode] = []
+    for tag, ti1, ti2, tj1, tj2 in token_matcher.get_opcodes():
+        i1, i2 = base_offsets[ti1], base_offsets[ti2]
+        j1, j2 = desired_offsets[tj1], desired_offsets[tj2]
+        if tag != "replace":
+            opcodes.append((tag, i1, i2, j1, j2))
+        elif (i2 - i1) * (j2 - j1) > _DIFF_MAX_CELLS:
+            opcodes.append(("replace", i1, i2, j1, j2))
+        else:
+            window = difflib.SequenceMatcher(
+                None, base[i1:i2], desired[j1:j2], autojunk=False
+            )
+            opcodes.extend(
+                (wtag, i1 + wi1, i1 + wi2, j1 + wj1, j1 + wj2)
+                for wtag, wi1, wi2, wj1, wj2 in window.get_opcodes()
+            )
+    return _coalesce_opcodes(opcodes)
+
+
+def _token_offsets(tokens: list[str]) -> list[int]:
+    """Return the character offset of each token, plus the total length."""
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return offsets
+
+
+def _affix_opcodes(base: str, desired: str) -> list[_Opcode]:
+    """Opcodes that keep the common prefix/suffix and replace the middle."""
+    limit = min(len(base), len(desired))
+    prefix = 0
+    while prefix < limit and base[prefix] == desired[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and base[len(base) - 1 - suffix] == desired[len(desired) - 1 - suffix]
+    ):
+        suffix += 1
+    opcodes: list[_Opcode] = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    i2 = len(base) - suffix
+    j2 = len(desired) - suffix
+    if prefix < i2 or prefix < j2:
+        opcodes.append((_change_tag(i2 - prefix, j2 - prefix), prefix, i2, prefix, j2))
+    if suffix:
+        opcodes.append(("equal", i2, len(base), j2, len(desired)))
+    return opcodes
+
+
+def _change_tag(base_len: int, desired_len: int) -> str:
+    if base_len and desired_len:
+        return "replace"
+    return "delete" if base_len else "insert"
+
+
+def _coalesce_opcodes(opcodes: list[_Opcode]) -> list[_Opcode]:
+    """Merge adjacent opcodes so the output has SequenceMatcher's shape.
+
+    Window diffs can leave two ``equal`` chunks, or several change chunks,
+    back to back; each such run becomes one ``equal`` or one change opcode.
+    """
+    merged: list[_Opcode] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if i1 == i2 and j1 == j2:
+            continue
+        if merged and (merged[-1][0] == "equal") == (tag == "equal"):
+            prev_tag, pi1, _pi2, pj1, _pj2 = merged[-1]
+            if prev_tag != "equal":
+                tag = _change_tag(i2 - pi1, j2 - pj1)
+            merged[-1] = (tag, pi1, i2, pj1, j2)
+        else:
+            merged.append((tag, i1, i2, j1, j2))
+    return merged
+
+
 def _delete_ops_skipping_opaque(
     *,
     base_body: str,
@@ -2257,7 +2368,7 @@ def _delete_ops_skipping_opaque(
     story_offset: int,
     tab_id: _StrOrDeferred,
     segment_id: str | None,
-    cp_to_utf16: list[int] | None = None,
+    cp_to_utf16: Utf16Offsets | None = None,
 ) -> list[tuple[int, list[Request]]]:
     """Split a delete range around opaque placeholder characters.
 
@@ -2320,7 +2431,9 @@ def _diff_paragraph_runs(
     Algorithm:
     1. Extract text runs from base and desired paragraphs.
     2. Build a plain-text string (excluding the terminal \\n) for each.
-    3. Run a character-level diff (SequenceMatcher) to find equal/insert/delete chunks.
+    3. Diff the two strings (``_paragraph_opcodes``: character-level
+       SequenceMatcher, with a word-level pre-pass for long paragraphs) to
+       find equal/insert/delete/replace chunks.
     4. For each chunk:
        - 'equal': check if style changed → emit updateTextStyle if so.
        - 'delete': emit deleteContentRange.
@@ -2358,11 +2471,10 @@ def _diff_paragraph_runs(
     # SequenceMatcher indices (code-point-based) into UTF-16 offsets
     # required by the Google Docs API.  Characters outside the BMP
     # (emoji, mathematical bold, etc.) are 1 code point but 2 UTF-16 units.
-    base_cp_to_utf16 = _build_cp_to_utf16(base_body)
+    base_cp_to_utf16 = utf16_offsets(base_body)
 
     # Compute character-level diff
-    matcher = difflib.SequenceMatcher(None, base_body, desired_body, autojunk=False)
-    opcodes = matcher.get_opcodes()
+    opcodes = _paragraph_opcodes(base_body, desired_body)
 
     # Collect pending ops as (abs_start, abs_end, kind, extra)
     # kind ∈ {"delete", "insert", "update_style", "replace"}
@@ -2502,7 +2614,7 @@ def _style_update_ops_for_equal_span(
     story_offset: int,
     tab_id: str,
     segment_id: str | None,
-    cp_to_utf16: list[int] | None = None,
+    cp_to_utf16: Utf16Offsets | None = None,
 ) -> list[tuple[int, list[Request]]]:
     """For an 'equal' diff chunk, emit updateTextStyle where style changed.
 
@@ -2655,7 +2767,7 @@ def _insert_ops_for_span(
     story_offset: int,
     tab_id: str,
     segment_id: str | None,
-    base_cp_to_utf16: list[int] | None = None,
+    base_cp_to_utf16: Utf16Offsets | None = None,
     inherited_style: TextStyle | None = None,
 ) -> list[Request]:
     """Emit insertText + optional updateTextStyle for desired[desired_start:desired_end].
@@ -0,0 +1,119 @@
+"""Placeholder patch tables for lowered request batches.
+
+``lower_batches`` embeds ``DeferredID`` placeholders in later batches (IDs of
+headers, footers, tabs and footnotes that an earlier batch creates).  A
+``PlaceholderSlot`` records one field that holds such a placeholder; a
+batch's slots form its patch table.
+
+``reconcile_batches`` returns ``LoweredBatch`` objects, which carry the
+table built when the batch was lowered, so the executor patches exactly
+those fields (copying only the models on each slot's path) and passes
+placeholder-free batches through untouched.  Plain
+``BatchUpdateDocumentRequest`` objects get their table from
+``find_placeholder_slots`` at execution time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, PrivateAttr
+
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    DeferredID,
+    Request,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class PlaceholderSlot:
+    """One request field holding a ``DeferredID``.
+
+    ``path`` is the attribute path from the ``Request`` to the field, with
+    list positions as ints, e.g. ``("insert_text", "location", "tab_id")``.
+    """
+
+    request_index: int
+    path: tuple[str | int, ...]
+    deferred_id: DeferredID
+
+
+class LoweredBatch(BatchUpdateDocumentRequest):
+    """A ``BatchUpdateDocumentRequest`` that carries its placeholder table.
+
+    Serializes exactly like its base class; the table is private state.
+    """
+
+    _placeholders: tuple[PlaceholderSlot, ...] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_requests(cls, requests: list[Request]) -> LoweredBatch:
+        batch = cls(requests=requests)
+        batch._placeholders = find_placeholder_slots(requests)
+        return batch
+
+    @property
+    def placeholders(self) -> tuple[PlaceholderSlot, ...]:
+        """The batch's patch table (built on first use if not recorded)."""
+        if self._placeholders is None:
+            self._placeholders = find_placeholder_slots(self.requests or [])
+        return self._placeholders
+
+
+def find_placeholder_slots(
+    requests: Sequence[Request],
+) -> tuple[PlaceholderSlot, ...]:
+    """Return every field of *requests* that holds a ``DeferredID``."""
+    slots: list[PlaceholderSlot] = []
+    for request_index, request in enumerate(requests):
+        _walk(request, (), request_index, slots)
+    return tuple(slots)
+
+
+def _walk(
+    value: Any,
+    path: tuple[str | int, ...],
+    request_index: int,
+    out: list[PlaceholderSlot],
+) -> None:
+    if isinstance(value, DeferredID):
+        out.append(PlaceholderSlot(request_index, path, value))
+    elif isinstance(value, BaseModel):
+        for name, item in value.__dict__.items():
+            if item is not None:
+                _walk(item, (*path, name), request_index, out)
+    elif isinstance(value, list):
+        for position, item in enumerate(value):
+            _walk(item, (*path, position), request_index, out)
+
+
+def patch_placeholders(
+    batch: BatchUpdateDocumentRequest,
+    slots: Sequence[PlaceholderSlot],
+    values: Sequence[str],
+) -> BatchUpdateDocumentRequest:
+    """Return a copy of *batch* with each slot's field set to its value.
+
+    Only the models on each slot's path are copied; *batch* is unchanged.
+    """
+    requests = list(batch.requests or [])
+    for slot, value in zip(slots, values, strict=True):
+        requests[slot.request_index] = _replace(
+            requests[slot.request_index], slot.path, value
+        )
+    return batch.model_copy(update={"requests": requests})
+
+
+def _replace(node: Any, path: tuple[str | int, ...], value: str) -> Any:
+    head, rest = path[0], path[1:]
+    if isinstance(head, int):
+        items = list(node)
+        items[head] = _replace(items[head], rest, value) if rest else value
+        return items
+    new = _replace(getattr(node, head), rest, value) if rest else value
+    return node.model_copy(update={head: new})
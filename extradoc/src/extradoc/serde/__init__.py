@@ -3,7 +3,8 @@
 Protocol:
     class Serde:
         serialize(bundle, folder) -> None
-        deserialize(folder) -> DeserializeResult
+        deserialize(folder, *, tracer=NULL_TRACER) -> DeserializeResult
+        is_pristine(folder) -> bool
 
 Implementations:
     XmlSerde      -- extradoc.serde.xml.XmlSerde
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from extradoc.comments._types import DocumentWithComments
+    from extradoc.tracing import Tracer
 
 
 @dataclass
@@ -30,6 +32,9 @@ class DeserializeResult:
 
     base: DocumentWithComments
     desired: DocumentWithComments
+    # True when desired already carries reindexed, normalized tabs (the
+    # three-way merges do this), so DocsClient.diff skips its own pass.
+    desired_reindexed: bool = False
 
 
 @runtime_checkable
@@ -48,7 +53,7 @@ class Serde(Protocol):
         """
         ...
 
-    def deserialize(self, folder: Path) -> DeserializeResult:
+    def deserialize(self, folder: Path, *, tracer: Tracer = ...) -> DeserializeResult:
         """Read a folder and return both the base and desired documents.
 
         Base is reconstructed from internal state written by serialize.
@@ -56,12 +61,24 @@ class Serde(Protocol):
 
         Args:
             folder: Path to the document folder
+            tracer: Receives ``serde.*`` spans (default: disabled)
 
         Returns:
             DeserializeResult with base and desired DocumentWithComments
         """
         ...
 
+    def is_pristine(self, folder: Path) -> bool:
+        """Return True if the folder's files are exactly as serialize wrote them.
+
+        Args:
+            folder: Path to the document folder
+
+        Returns:
+            False if any content file was edited, added or removed
+        """
+        ...
+
 
 __all__ = [
     "DeserializeResult",
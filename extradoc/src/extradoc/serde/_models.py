@@ -59,6 +59,10 @@ class IndexXml:
     title: str
     revision: str | None = None
     format: str = "xml"  # "xml" or "markdown"
+    # Drive modifiedTime high-water mark of the comments at pull time
+    comments_modified: str | None = None
+    # Tab ID of a single-tab pull; None when every tab was pulled
+    tab: str | None = None
     tabs: list[IndexTab] = field(default_factory=list)
 
     def to_element(self) -> Element:
@@ -69,6 +73,10 @@ class IndexXml:
             root.set("revision", self.revision)
         if self.format != "xml":
             root.set("format", self.format)
+        if self.comments_modified:
+            root.set("commentsModified", self.comments_modified)
+        if self.tab:
+            root.set("tab", self.tab)
         for tab in self.tabs:
             _index_tab_to_element(tab, root)
         return root
@@ -86,6 +94,8 @@ class IndexXml:
             title=root.get("title", ""),
             revision=root.get("revision"),
             format=root.get("format", "xml"),
+            comments_modified=root.get("commentsModified"),
+            tab=root.get("tab"),
             tabs=tabs,
         )
 
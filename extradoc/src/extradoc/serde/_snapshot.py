@@ -0,0 +1,121 @@
+"""Parsed-pristine snapshots.
+
+Every diff/push needs the pristine document (the folder as it was at pull
+time).  Re-parsing it means extracting the pristine zip and running the
+full XML / markdown parser, even though the pristine never changes between
+pulls.  ``serialize`` therefore also stores the *parsed* pristine next to
+the zip as a compact snapshot, and ``deserialize`` loads that instead.
+
+Snapshot format: ``_MAGIC`` followed by zlib-compressed JSON holding the
+sha256 of the pristine zip, the snapshot format version, the extradoc
+version, the document (API JSON), the comments and serde-specific ``meta``
+(the markdown serde keeps its per-tab source hash manifest there).  A
+snapshot whose zip hash or versions do not match is stale; ``load_snapshot``
+returns ``None`` for stale, missing or unreadable snapshots and the caller
+re-parses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import zlib
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
+
+from extradoc.api_types._generated import Document
+from extradoc.comments._types import (
+    Comment,
+    DocumentWithComments,
+    FileComments,
+    Reply,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"EXTRADOC-PRISTINE\x00"
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class PristineSnapshot:
+    """A loaded snapshot: the parsed pristine plus serde-specific metadata."""
+
+    bundle: DocumentWithComments
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+def _extradoc_version() -> str:
+    try:
+        return version("extradoc")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def zip_digest(zip_path: Path) -> str:
+    """Return the sha256 hex digest of the pristine zip's bytes."""
+    return hashlib.sha256(zip_path.read_bytes()).hexdigest()
+
+
+def write_snapshot(
+    snapshot_path: Path,
+    zip_path: Path,
+    bundle: DocumentWithComments,
+    meta: dict[str, Any] | None = None,
+) -> None:
+    """Write *bundle* (the parsed pristine of *zip_path*) to *snapshot_path*."""
+    payload = {
+        "format": _FORMAT_VERSION,
+        "extradoc": _extradoc_version(),
+        "zip_sha256": zip_digest(zip_path),
+        "document": bundle.document.model_dump(by_alias=True, exclude_none=True),
+        "comments": asdict(bundle.comments),
+        "meta": meta or {},
+    }
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    snapshot_path.write_bytes(_MAGIC + zlib.compress(data.encode("utf-8")))
+
+
+def load_snapshot(snapshot_path: Path, zip_path: Path) -> PristineSnapshot | None:
+    """Return the snapshot if it is present and matches *zip_path*."""
+    if not snapshot_path.exists():
+        return None
+    try:
+        blob = snapshot_path.read_bytes()
+        if not blob.startswith(_MAGIC):
+            return None
+        payload = json.loads(zlib.decompress(blob[len(_MAGIC) :]))
+    except (OSError, zlib.error, ValueError) as exc:
+        logger.debug("Ignoring unreadable pristine snapshot %s: %s", snapshot_path, exc)
+        return None
+    if (
+        payload.get("format") != _FORMAT_VERSION
+        or payload.get("extradoc") != _extradoc_version()
+        or payload.get("zip_sha256") != zip_digest(zip_path)
+    ):
+        return None
+    bundle = DocumentWithComments(
+        document=Document.model_validate(payload["document"]),
+        comments=_comments_from_dict(payload["comments"]),
+    )
+    return PristineSnapshot(bundle=bundle, meta=payload.get("meta", {}))
+
+
+def _comments_from_dict(data: dict[str, Any]) -> FileComments:
+    return FileComments(
+        file_id=data["file_id"],
+        comments=[
+            Comment(
+                **{
+                    **c,
+                    "replies": [Reply(**r) for r in c.get("replies", [])],
+                }
+            )
+            for c in data.get("comments", [])
+        ],
+    )
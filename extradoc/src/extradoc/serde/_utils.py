@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import re
 import urllib.parse
-from typing import Any
+import zipfile
+import zlib
+from typing import TYPE_CHECKING, Any
 from xml.etree.ElementTree import Element, indent, tostring
 
 from extradoc.api_types._generated import (
@@ -14,6 +16,10 @@ from extradoc.api_types._generated import (
     TableCellBorder,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from pathlib import Path
+
 
 def sanitize_tab_name(name: str) -> str:
     """Sanitize a tab name for use as a folder name.
@@ -26,6 +32,40 @@ def sanitize_tab_name(name: str) -> str:
     return sanitized or "untitled"
 
 
+def files_match_zip(folder: Path, zip_path: Path, skip_dirs: Collection[str]) -> bool:
+    """Return True if the files in *folder* are exactly those in *zip_path*.
+
+    Top-level directories in *skip_dirs* are ignored on both sides.  Files are compared
+    by size and CRC-32 against the zip's directory, so nothing is
+    decompressed.  A root ``index.xml`` entry may be missing from the
+    folder: markdown pristines carry a copy of ``.extrasuite/index.xml``.
+    """
+    if not zip_path.exists():
+        return False
+    on_disk = {
+        path.relative_to(folder).as_posix(): path
+        for path in folder.rglob("*")
+        if path.is_file() and path.relative_to(folder).parts[0] not in skip_dirs
+    }
+    with zipfile.ZipFile(zip_path) as zf:
+        entries = {
+            i.filename: i
+            for i in zf.infolist()
+            if not i.is_dir() and i.filename.split("/", 1)[0] not in skip_dirs
+        }
+    if on_disk.keys() - entries.keys() or entries.keys() - on_disk.keys() - {
+        "index.xml"
+    }:
+        return False
+    for name, path in on_disk.items():
+        entry = entries[name]
+        if path.stat().st_size != entry.file_size:
+            return False
+        if zlib.crc32(path.read_bytes()) != entry.CRC:
+            return False
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Color conversions
 # ---------------------------------------------------------------------------
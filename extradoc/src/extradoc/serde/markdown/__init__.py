@@ -5,24 +5,34 @@ Provides MarkdownSerde, the markdown implementation of the Serde protocol.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 import tempfile
 import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from extradoc.api_types._generated import Document
+from extradoc.api_types._adapters import load_document
 from extradoc.comments._types import DocumentWithComments, FileComments
 from extradoc.comments._xml import from_xml as comments_from_xml
 from extradoc.comments._xml import to_xml as comments_to_xml
 from extradoc.serde import DeserializeResult
+from extradoc.tracing import NULL_TRACER, Tracer
 
 from .._index import build_index
 from .._models import IndexXml
-from .._utils import build_heading_maps, sanitize_tab_name
+from .._snapshot import PristineSnapshot, load_snapshot, write_snapshot
+from .._utils import build_heading_maps, files_match_zip, sanitize_tab_name
 from ._from_markdown import markdown_to_document
 from ._to_markdown import document_to_markdown
 
+if TYPE_CHECKING:
+    from extradoc.api_types._generated import Document, Tab
+
+# folder name -> (sha256 of the pristine tab source, parsed pristine Tab)
+_PristineTabs = dict[str, tuple[str, "Tab"]]
+
 _INTERNAL_DIR = ".extrasuite"
 _TABS_DIR = "tabs"
 _SKIP_DIRS = {_INTERNAL_DIR}
@@ -53,6 +63,8 @@ class MarkdownSerde:
         # Build index (same structure as XML, but format="markdown")
         index = build_index(doc)
         index.format = "markdown"
+        index.comments_modified = bundle.comments.modified_time
+        index.tab = bundle.tab
         tab_list = doc.tabs or []
         for i, idx_tab in enumerate(index.tabs):
             if i < len(tab_list):
@@ -134,8 +146,10 @@ class MarkdownSerde:
 
         # comments.xml at root — only written when there are active comments
         comments_path = folder / "comments.xml"
+        comments_xml: str | None = None
         if bundle.comments.active_comments:
-            comments_path.write_text(comments_to_xml(bundle.comments), encoding="utf-8")
+            comments_xml = comments_to_xml(bundle.comments)
+            comments_path.write_text(comments_xml, encoding="utf-8")
         elif comments_path.exists():
             comments_path.unlink()
 
@@ -150,37 +164,74 @@ class MarkdownSerde:
             encoding="utf-8",
         )
 
-        # .extrasuite/pristine.zip
+        # .extrasuite/pristine.zip + parsed snapshot of it
         _write_pristine_zip(folder)
+        _write_snapshot(folder, doc, comments_xml)
 
-    def deserialize(self, folder: Path) -> DeserializeResult:
+    def deserialize(
+        self, folder: Path, *, tracer: Tracer = NULL_TRACER
+    ) -> DeserializeResult:
         """Read the folder and return base + desired documents.
 
         Base is loaded from .extrasuite/document.json (or legacy .raw/).
         Desired is computed via 3-way merge: diff(pristine, current) applied to base.
+
+        Tab files whose bytes still match the pull-time manifest are not
+        re-parsed: the pristine tab model is reused, so the three-way merge
+        skips them too.
         """
-        base_bundle = self._load_base(folder)
+        with tracer.span("serde.load_pristine"):
+            pristine_bundle, snapshot = self._load_pristine_snapshot(folder)
+        with tracer.span("serde.load_base"):
+            base_bundle = self._load_base(folder, pristine_bundle.comments)
 
         _, heading_name_to_id = build_heading_maps(base_bundle.document)
+        pristine_tabs = _reusable_tabs(snapshot, heading_name_to_id)
 
-        pristine_bundle = self._load_pristine(folder)
-        mine_bundle = self._parse(folder, heading_name_to_id=heading_name_to_id)
+        with tracer.span("serde.parse"):
+            mine_bundle = self._parse(
+                folder,
+                heading_name_to_id=heading_name_to_id,
+                pristine_tabs=pristine_tabs,
+            )
+
+        with tracer.span("serde.three_way_merge"):
+            desired_bundle = _three_way_merge(pristine_bundle, mine_bundle, base_bundle)
 
-        desired_bundle = _three_way_merge(pristine_bundle, mine_bundle, base_bundle)
+        return DeserializeResult(
+            base=base_bundle, desired=desired_bundle, desired_reindexed=True
+        )
 
-        return DeserializeResult(base=base_bundle, desired=desired_bundle)
+    def is_pristine(self, folder: Path) -> bool:
+        """Return True if the content files match .extrasuite/pristine.zip.
+
+        The client's .raw/ sidecars are not content and are ignored.
+        """
+        zip_path, _ = _pristine_paths(folder)
+        skip_dirs = (
+            _SKIP_DIRS | {_LEGACY_RAW_DIR}
+            if _is_new_layout(folder)
+            else _LEGACY_SKIP_DIRS
+        )
+        return files_match_zip(folder, zip_path, skip_dirs)
+
+    def _load_base(
+        self, folder: Path, comments: FileComments | None = None
+    ) -> DocumentWithComments:
+        """Load the transport-accurate base from .extrasuite/document.json or legacy .raw/.
 
-    def _load_base(self, folder: Path) -> DocumentWithComments:
-        """Load the transport-accurate base from .extrasuite/document.json or legacy .raw/."""
+        Base comments are the pristine comments; pass them as *comments* when
+        the pristine is already loaded.
+        """
         new_layout = _is_new_layout(folder)
         if new_layout:
             raw_doc_path = folder / _INTERNAL_DIR / "document.json"
         else:
             raw_doc_path = folder / _LEGACY_RAW_DIR / "document.json"
-        raw_data = json.loads(raw_doc_path.read_text(encoding="utf-8"))
-        doc = Document.model_validate(raw_data)
-        pristine_bundle = self._load_pristine(folder)
-        return DocumentWithComments(document=doc, comments=pristine_bundle.comments)
+        doc = load_document(raw_doc_path.read_bytes())
+        if comments is None:
+            comments = self._load_pristine(folder).comments
+        return DocumentWithComments(document=doc, comments=comments)
 
     def _load_pristine(
         self,
@@ -188,12 +239,35 @@ class MarkdownSerde:
         *,
         heading_name_to_id: dict[str, tuple[str, str | None]] | None = None,
     ) -> DocumentWithComments:
-        """Extract and parse .extrasuite/pristine.zip or legacy .pristine/document.zip."""
-        new_layout = _is_new_layout(folder)
-        if new_layout:
-            pristine_zip = folder / _INTERNAL_DIR / "pristine.zip"
-        else:
-            pristine_zip = folder / _LEGACY_PRISTINE_DIR / "document.zip"
+        """Load the parsed .extrasuite/pristine.zip or legacy .pristine/document.zip.
+
+        Uses the snapshot written at pull time when it matches the zip;
+        otherwise (and whenever heading ids are remapped) re-parses the zip.
+        """
+        if heading_name_to_id is None:
+            return self._load_pristine_snapshot(folder)[0]
+        pristine_zip, _ = _pristine_paths(folder)
+        return self._parse_pristine_zip(
+            pristine_zip, heading_name_to_id=heading_name_to_id
+        )
+
+    def _load_pristine_snapshot(
+        self, folder: Path
+    ) -> tuple[DocumentWithComments, PristineSnapshot | None]:
+        """Load the pristine, plus the snapshot it came from if one was valid."""
+        pristine_zip, snapshot_path = _pristine_paths(folder)
+        snapshot = load_snapshot(snapshot_path, pristine_zip)
+        if snapshot is None:
+            return self._parse_pristine_zip(pristine_zip), None
+        return snapshot.bundle, snapshot
+
+    def _parse_pristine_zip(
+        self,
+        pristine_zip: Path,
+        *,
+        heading_name_to_id: dict[str, tuple[str, str | None]] | None = None,
+    ) -> DocumentWithComments:
+        """Extract and parse a pristine zip."""
         with tempfile.TemporaryDirectory() as tmp:
             with zipfile.ZipFile(pristine_zip, "r") as zf:
                 zf.extractall(tmp)
@@ -212,11 +286,30 @@ class MarkdownSerde:
         folder: Path,
         *,
         heading_name_to_id: dict[str, tuple[str, str | None]] | None = None,
+        pristine_tabs: _PristineTabs | None = None,
     ) -> DocumentWithComments:
-        """Read a markdown-format folder into a DocumentWithComments."""
+        """Read a markdown-format folder into a DocumentWithComments.
+
+        Tabs listed in *pristine_tabs* whose source is unchanged reuse the
+        pristine Tab instead of being parsed.
+        """
         index_xml_path = folder / _index_xml_path_in_folder(folder)
         index = IndexXml.from_xml_string(index_xml_path.read_text(encoding="utf-8"))
-        return _parse_markdown(folder, index, heading_name_to_id=heading_name_to_id)
+        return _parse_markdown(
+            folder,
+            index,
+            heading_name_to_id=heading_name_to_id,
+            pristine_tabs=pristine_tabs,
+        )
+
+
+def _pristine_paths(folder: Path) -> tuple[Path, Path]:
+    """Return (pristine zip, parsed snapshot) paths for the folder's layout."""
+    if _is_new_layout(folder):
+        internal_dir = folder / _INTERNAL_DIR
+        return internal_dir / "pristine.zip", internal_dir / "pristine.snapshot"
+    legacy_dir = folder / _LEGACY_PRISTINE_DIR
+    return legacy_dir / "document.zip", legacy_dir / "document.snapshot"
 
 
 def _index_xml_path_in_folder(folder: Path) -> Path:
@@ -227,13 +320,119 @@ def _index_xml_path_in_folder(folder: Path) -> Path:
     return Path("index.xml")
 
 
-def _parse_markdown(
-    folder: Path,
-    index: IndexXml,
-    *,
-    heading_name_to_id: dict[str, tuple[str, str | None]] | None = None,
-) -> DocumentWithComments:
-    """Internal: read a markdown-format folder into a DocumentWithComments."""
+def _source_digest(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _headings_digest(heading_name_to_id: dict[str, tuple[str, str | None]]) -> str:
+    data = json.dumps(sorted(heading_name_to_id.items()), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _write_snapshot(folder: Path, doc: Document, comments_xml: str | None) -> None:
+    """Snapshot the parse of the folder ``serialize`` just wrote.
+
+    The pristine zip holds exactly these files, so their parse is the
+    parsed pristine; no need to extract the zip.  The manifest is built
+    from the same sources without parsing them a second time.
+    """
+    zip_path, snapshot_path = _pristine_paths(folder)
+    index = IndexXml.from_xml_string(
+        (folder / _index_xml_path_in_folder(folder)).read_text(encoding="utf-8")
+    )
+    tab_content, tab_ids = _read_tab_sources(folder, index)
+    document = markdown_to_document(
+        tab_content,
+        document_id=index.id,
+        title=index.title,
+        revision_id=index.revision,
+        tab_ids=tab_ids,
+    )
+    comments = (
+        comments_from_xml(comments_xml)
+        if comments_xml is not None
+        else FileComments(file_id=index.id)
+    )
+    _, heading_name_to_id = build_heading_maps(doc)
+    write_snapshot(
+        snapshot_path,
+        zip_path,
+        DocumentWithComments(document=document, comments=comments),
+        meta={
+            "headings": _headings_digest(heading_name_to_id),
+            "tabs": _tab_manifest(tab_content, document, heading_name_to_id),
+        },
+    )
+
+
+# Targets of inline links and link reference definitions that start with "#"
+_ANCHOR_TARGET_RE = re.compile(r"\](?:\(|:)\s*<?#([^\s)>]*)")
+# Anchors that do not depend on the heading name map
+_ID_ANCHOR_PREFIXES = ("heading:", "bookmark:", "tab:", "heading-ref:")
+
+
+def _tab_manifest(
+    tab_content: dict[str, str],
+    pristine: Document,
+    heading_name_to_id: dict[str, tuple[str, str | None]],
+) -> dict[str, dict[str, Any]]:
+    """Map reusable tab files to the sha256 of their source and their tab id.
+
+    *pristine* is the parse of *tab_content* without heading links resolved;
+    ``deserialize`` parses the user's files with *heading_name_to_id*.  The
+    map only affects name-based heading links (``[...](#Heading)``), so a
+    tab whose source has none parses the same either way and is reusable.
+    Tabs with one are always re-parsed.  ``markdown_to_document`` emits one
+    tab per source, in ``_read_tab_sources`` order.
+    """
+    manifest: dict[str, dict[str, Any]] = {}
+    for (tab_folder, source), tab in zip(
+        tab_content.items(), pristine.tabs or [], strict=False
+    ):
+        if tab.tab_properties is None:
+            continue
+        if heading_name_to_id and any(
+            not target.startswith(_ID_ANCHOR_PREFIXES)
+            for target in _ANCHOR_TARGET_RE.findall(source)
+        ):
+            continue
+        manifest[tab_folder] = {
+            "sha256": _source_digest(source),
+            "tab_id": tab.tab_properties.tab_id,
+        }
+    return manifest
+
+
+def _reusable_tabs(
+    snapshot: PristineSnapshot | None,
+    heading_name_to_id: dict[str, tuple[str, str | None]],
+) -> _PristineTabs:
+    """Return the snapshot's reusable pristine tabs keyed by tab file.
+
+    Empty without a valid snapshot, or when the heading map no longer
+    matches the one the manifest was built with.
+    """
+    if snapshot is None or snapshot.meta.get("headings") != _headings_digest(
+        heading_name_to_id
+    ):
+        return {}
+    tabs_by_id = {
+        tab.tab_properties.tab_id: tab
+        for tab in snapshot.bundle.document.tabs or []
+        if tab.tab_properties and tab.tab_properties.tab_id
+    }
+    pristine_tabs: _PristineTabs = {}
+    for tab_folder, entry in snapshot.meta.get("tabs", {}).items():
+        tab = tabs_by_id.get(entry.get("tab_id"))
+        if tab is not None:
+            pristine_tabs[tab_folder] = (entry["sha256"], tab)
+    return pristine_tabs
+
+
+def _read_tab_sources(
+    folder: Path, index: IndexXml
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Return (folder name → markdown source, folder name → tab id)."""
     new_layout = _is_new_layout(folder)
     tabs_dir = folder / _TABS_DIR if new_layout else folder
 
@@ -258,6 +457,25 @@ def _parse_markdown(
             continue
         tab_content[stem] = md_path.read_text(encoding="utf-8")
 
+    return tab_content, tab_ids
+
+
+def _parse_markdown(
+    folder: Path,
+    index: IndexXml,
+    *,
+    heading_name_to_id: dict[str, tuple[str, str | None]] | None = None,
+    pristine_tabs: _PristineTabs | None = None,
+) -> DocumentWithComments:
+    """Internal: read a markdown-format folder into a DocumentWithComments."""
+    tab_content, tab_ids = _read_tab_sources(folder, index)
+
+    reuse_tabs: dict[str, Tab] = {}
+    for tab_folder, (digest, tab) in (pristine_tabs or {}).items():
+        source = tab_content.get(tab_folder)
+        if source is not None and _source_digest(source) == digest:
+            reuse_tabs[tab_folder] = tab
+
     document = markdown_to_document(
         tab_content,
         document_id=index.id,
@@ -265,6 +483,7 @@ def _parse_markdown(
         revision_id=index.revision,
         tab_ids=tab_ids,
         heading_name_to_id=heading_name_to_id,
+        reuse_tabs=reuse_tabs,
     )
 
     comments_path = folder / "comments.xml"
@@ -311,20 +530,22 @@ def _three_way_merge(
     mine: DocumentWithComments,
     base: DocumentWithComments,
 ) -> DocumentWithComments:
-    """Compute desired = apply_ops(base, diff(ancestor, mine))."""
-    from extradoc.diffmerge import apply as apply_ops_to_document
-    from extradoc.diffmerge import diff as reconcile_diff
+    """Compute desired = apply_ops(base, diff(ancestor, mine)), reindexed.
 
-    base_dict = base.document.model_dump(by_alias=True, exclude_none=True)
+    Untouched desired tabs are the base's own models, so inline objects are
+    merged in copy-on-write fashion.
+    """
+    from extradoc.diffmerge import apply_to_document
+    from extradoc.diffmerge import diff as reconcile_diff
 
     ops = reconcile_diff(ancestor.document, mine.document)
-    desired_dict = apply_ops_to_document(base_dict, ops)
-
-    desired_document = base.document.__class__.model_validate(desired_dict)
+    desired_document = apply_to_document(base.document, ops)
 
     # Merge inline_objects from mine into desired.
-    for d_tab, m_tab in zip(
-        desired_document.tabs or [], mine.document.tabs or [], strict=False
+    tabs = list(desired_document.tabs or [])
+    changed = False
+    for i, (d_tab, m_tab) in enumerate(
+        zip(tabs, mine.document.tabs or [], strict=False)
     ):
         m_dt = m_tab.document_tab
         d_dt = d_tab.document_tab
@@ -336,11 +557,20 @@ def _three_way_merge(
                         ioe = pe.inline_object_element
                         if ioe and ioe.inline_object_id:
                             referenced_ids.add(ioe.inline_object_id)
-            merged = dict(d_dt.inline_objects or {})
-            for obj_id, obj in m_dt.inline_objects.items():
-                if obj_id in referenced_ids and obj_id not in merged:
-                    merged[obj_id] = obj
-            d_dt.inline_objects = merged
+            existing = d_dt.inline_objects or {}
+            missing = {
+                obj_id: obj
+                for obj_id, obj in m_dt.inline_objects.items()
+                if obj_id in referenced_ids and obj_id not in existing
+            }
+            if missing:
+                document_tab = d_dt.model_copy(
+                    update={"inline_objects": {**existing, **missing}}
+                )
+                tabs[i] = d_tab.model_copy(update={"document_tab": document_tab})
+                changed = True
+    if changed:
+        desired_document = desired_document.model_copy(update={"tabs": tabs})
 
     return DocumentWithComments(document=desired_document, comments=mine.comments)
 
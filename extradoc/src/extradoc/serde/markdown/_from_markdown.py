@@ -212,6 +212,7 @@ def markdown_to_document(
     revision_id: str | None = None,
     tab_ids: dict[str, str] | None = None,
     heading_name_to_id: dict[str, tuple[str, str | None]] | None = None,
+    reuse_tabs: dict[str, Tab] | None = None,
 ) -> Document:
     """Convert per-tab markdown content to a Document.
 
@@ -222,6 +223,9 @@ def markdown_to_document(
         tab_ids: Optional dict[folder_name → tab_id] for using real API tab IDs
         heading_name_to_id: Optional map from heading name → heading_id for
             resolving name-based heading links (e.g. ``[text](#Overview)``).
+        reuse_tabs: Optional dict[folder_name → Tab] of already-parsed tabs
+            whose source is known to be unchanged.  Such a tab is used as-is
+            instead of re-parsing, provided its tab id still matches.
 
     Returns:
         Document without indices. Call reindex_document() if needed.
@@ -242,6 +246,15 @@ def markdown_to_document(
             tab_id = (tab_ids or {}).get(folder, f"t.{folder}")
         tab_title = fm["title"] if fm.get("title") else folder.replace("_", " ")
 
+        reused = (reuse_tabs or {}).get(folder)
+        if (
+            reused is not None
+            and reused.tab_properties is not None
+            and reused.tab_properties.tab_id == tab_id
+        ):
+            doc.tabs.append(reused)
+            continue
+
         tab = _parse_tab(
             content, tab_title, folder, tab_id=tab_id, heading_name_to_id=h_map
         )
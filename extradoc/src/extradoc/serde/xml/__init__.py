@@ -9,17 +9,19 @@ import json
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
-from extradoc.api_types._generated import Document
+from extradoc.api_types._adapters import load_document
 from extradoc.comments._inject import inject_comment_refs, strip_comment_refs
 from extradoc.comments._types import DocumentWithComments, FileComments
 from extradoc.comments._xml import from_xml as comments_from_xml
 from extradoc.comments._xml import to_xml as comments_to_xml
 from extradoc.serde import DeserializeResult
+from extradoc.tracing import NULL_TRACER, Tracer
 
 from .._index import build_index
 from .._models import IndexXml, TabFiles, TabXml
+from .._snapshot import load_snapshot, write_snapshot
 from .._styles import StylesXml
 from .._tab_extras import (
     DocStyleXml,
@@ -28,14 +30,19 @@ from .._tab_extras import (
     NamedStylesXml,
     PositionedObjectsXml,
 )
+from .._utils import files_match_zip
 from ._from_xml import tabs_to_document
 from ._to_xml import document_to_xml
 
+if TYPE_CHECKING:
+    from extradoc.api_types._generated import Document
+
 # Minimal styles.xml used when a new tab folder has no styles.xml yet.
 _MINIMAL_STYLES_XML = '<?xml version="1.0" encoding="UTF-8"?>\n<styles />'
 
 _PRISTINE_DIR = ".pristine"
 _PRISTINE_ZIP = "document.zip"
+_PRISTINE_SNAPSHOT = "document.snapshot"
 _RAW_DIR = ".raw"
 _SKIP_DIRS = {_PRISTINE_DIR, _RAW_DIR}
 
@@ -48,10 +55,12 @@ class XmlSerde:
     def serialize(self, bundle: DocumentWithComments, folder: Path) -> None:
         """Write DocumentWithComments to XML folder structure.
 
-        Writes content files, .pristine/document.zip, and
-        .raw/document.json for round-trip fidelity.
+        Writes content files, .pristine/document.zip (plus a parsed
+        snapshot of it), and .raw/document.json for round-trip fidelity.
         """
         index, tabs = from_document(bundle.document)
+        index.comments_modified = bundle.comments.modified_time
+        index.tab = bundle.tab
 
         folder.mkdir(parents=True, exist_ok=True)
 
@@ -101,39 +110,73 @@ class XmlSerde:
             encoding="utf-8",
         )
 
-        # Write .pristine/document.zip
+        # Write .pristine/document.zip + parsed snapshot of it
         _write_pristine_zip(folder)
+        pristine_dir = folder / _PRISTINE_DIR
+        write_snapshot(
+            pristine_dir / _PRISTINE_SNAPSHOT,
+            pristine_dir / _PRISTINE_ZIP,
+            self._parse_pristine_zip(pristine_dir / _PRISTINE_ZIP),
+        )
 
-    def deserialize(self, folder: Path) -> DeserializeResult:
+    def deserialize(
+        self, folder: Path, *, tracer: Tracer = NULL_TRACER
+    ) -> DeserializeResult:
         """Read the folder and return base + desired documents.
 
         Base is loaded from .raw/document.json (written by serialize).
         Desired is computed via 3-way merge: diff(pristine, current) applied to base.
         """
-        base_bundle = self._load_base(folder)
-        pristine_bundle = self._load_pristine(folder)
+        with tracer.span("serde.load_pristine"):
+            pristine_bundle = self._load_pristine(folder)
+        with tracer.span("serde.load_base"):
+            base_bundle = self._load_base(folder, pristine_bundle.comments)
 
         # Parse current (mine) folder
-        mine_bundle = self._parse(folder)
+        with tracer.span("serde.parse"):
+            mine_bundle = self._parse(folder)
 
         # 3-way merge
-        desired_bundle = _three_way_merge(pristine_bundle, mine_bundle, base_bundle)
+        with tracer.span("serde.three_way_merge"):
+            desired_bundle = _three_way_merge(pristine_bundle, mine_bundle, base_bundle)
 
         # Comment ops are handled by the caller (DocsClient.diff)
-        return DeserializeResult(base=base_bundle, desired=desired_bundle)
+        return DeserializeResult(
+            base=base_bundle, desired=desired_bundle, desired_reindexed=True
+        )
+
+    def is_pristine(self, folder: Path) -> bool:
+        """Return True if the content files match .pristine/document.zip."""
+        return files_match_zip(
+            folder, folder / _PRISTINE_DIR / _PRISTINE_ZIP, _SKIP_DIRS
+        )
 
-    def _load_base(self, folder: Path) -> DocumentWithComments:
+    def _load_base(
+        self, folder: Path, comments: FileComments | None = None
+    ) -> DocumentWithComments:
         """Load the transport-accurate base from .raw/document.json."""
         raw_doc_path = folder / _RAW_DIR / "document.json"
-        raw_data = json.loads(raw_doc_path.read_text(encoding="utf-8"))
-        doc = Document.model_validate(raw_data)
+        doc = load_document(raw_doc_path.read_bytes())
         # Use pristine comments as base comments
-        pristine_bundle = self._load_pristine(folder)
-        return DocumentWithComments(document=doc, comments=pristine_bundle.comments)
+        if comments is None:
+            comments = self._load_pristine(folder).comments
+        return DocumentWithComments(document=doc, comments=comments)
 
     def _load_pristine(self, folder: Path) -> DocumentWithComments:
-        """Extract and parse .pristine/document.zip."""
-        pristine_zip = folder / _PRISTINE_DIR / _PRISTINE_ZIP
+        """Load the parsed .pristine/document.zip.
+
+        Uses the snapshot written at pull time when it matches the zip,
+        otherwise re-parses the zip.
+        """
+        pristine_dir = folder / _PRISTINE_DIR
+        pristine_zip = pristine_dir / _PRISTINE_ZIP
+        snapshot = load_snapshot(pristine_dir / _PRISTINE_SNAPSHOT, pristine_zip)
+        if snapshot is not None:
+            return snapshot.bundle
+        return self._parse_pristine_zip(pristine_zip)
+
+    def _parse_pristine_zip(self, pristine_zip: Path) -> DocumentWithComments:
+        """Extract and parse a pristine zip."""
         with tempfile.TemporaryDirectory() as tmp:
             with zipfile.ZipFile(pristine_zip, "r") as zf:
                 zf.extractall(tmp)
@@ -249,15 +292,12 @@ def _three_way_merge(
     mine: DocumentWithComments,
     base: DocumentWithComments,
 ) -> DocumentWithComments:
-    """Compute desired = apply_ops(base, diff(ancestor, mine))."""
-    from extradoc.diffmerge import apply as apply_ops_to_document
+    """Compute desired = apply_ops(base, diff(ancestor, mine)), reindexed."""
+    from extradoc.diffmerge import apply_to_document
     from extradoc.diffmerge import diff as reconcile_diff
 
-    base_dict = base.document.model_dump(by_alias=True, exclude_none=True)
-
     ops = reconcile_diff(ancestor.document, mine.document)
-    desired_dict = apply_ops_to_document(base_dict, ops)
-    desired_document = base.document.__class__.model_validate(desired_dict)
+    desired_document = apply_to_document(base.document, ops)
 
     return DocumentWithComments(document=desired_document, comments=mine.comments)
 
@@ -0,0 +1,140 @@
+"""Opt-in timing spans and counters for pull / diff / push.
+
+``DocsClient``, ``reconcile_v3.api.reconcile_batches``,
+``reconcile_v3.executor.execute_request_batches`` and the serdes accept a
+``tracer``.  The default is ``NULL_TRACER``, whose ``span()`` returns a shared
+no-op context manager and whose ``count()`` does nothing, so instrumentation
+costs one method call per phase when disabled.  Anything more expensive to
+measure (e.g. request body size) is only computed when ``tracer.enabled``.
+
+Use ``RecordingTracer`` to collect a trace::
+
+    tracer = RecordingTracer()
+    client = DocsClient(transport, tracer=tracer)
+    await client.push(folder)
+    tracer.write_json("trace.json")
+
+Subclass ``Tracer`` to forward spans elsewhere (logging, OpenTelemetry, …).
+
+Span names
+----------
+``pull.*``, ``diff.*``, ``push.*`` (``DocsClient``), ``serde.*`` (load base,
+load pristine, parse, three-way merge), ``reconcile.*`` (diff_documents,
+lower_batches) and ``execute.*`` (one ``execute.batch`` per batchUpdate with
+``resolve_placeholders`` and ``batch_update`` children).
+
+Counters
+--------
+``reconcile.ops``, ``reconcile.batches``, ``reconcile.requests``,
+``execute.batches``, ``execute.requests``, ``execute.bytes_sent``.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Tracer:
+    """Instrumentation surface; this base class records nothing."""
+
+    enabled: ClassVar[bool] = False
+
+    def span(self, name: str, **attrs: Any) -> AbstractContextManager[None]:  # noqa: ARG002
+        """Return a context manager timing the phase *name*."""
+        return _NULL_SPAN
+
+    def count(self, name: str, value: float = 1) -> None:
+        """Add *value* to the counter *name*."""
+
+
+NULL_TRACER = Tracer()
+"""Shared disabled tracer used when no tracer is given."""
+
+
+@dataclass
+class SpanRecord:
+    """One finished (or still open) span."""
+
+    name: str
+    start_s: float
+    depth: int
+    parent: int | None
+    attrs: dict[str, Any] = field(default_factory=dict)
+    duration_s: float | None = None
+
+
+class RecordingTracer(Tracer):
+    """Tracer that keeps every span and counter in memory.
+
+    Spans are stored in start order; ``parent`` is the index of the
+    enclosing span and ``start_s`` is relative to the tracer's creation.
+    Not safe for concurrent spans from several threads.
+    """
+
+    enabled: ClassVar[bool] = True
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._stack: list[int] = []
+        self.spans: list[SpanRecord] = []
+        self.counters: dict[str, float] = {}
+
+    @contextmanager
+    def _span(self, name: str, attrs: dict[str, Any]) -> Iterator[None]:
+        record = SpanRecord(
+            name=name,
+            start_s=self._clock() - self._origin,
+            depth=len(self._stack),
+            parent=self._stack[-1] if self._stack else None,
+            attrs=attrs,
+        )
+        self.spans.append(record)
+        self._stack.append(len(self.spans) - 1)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            record.duration_s = self._clock() - self._origin - record.start_s
+
+    def span(self, name: str, **attrs: Any) -> AbstractContextManager[None]:
+        return self._span(name, attrs)
+
+    def count(self, name: str, value: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the trace as a JSON-serializable dict."""
+        return {
+            "spans": [
+                {
+                    "name": s.name,
+                    "start_s": round(s.start_s, 6),
+                    "duration_s": (
+                        None if s.duration_s is None else round(s.duration_s, 6)
+                    ),
+                    "depth": s.depth,
+                    "parent": s.parent,
+                    **({"attrs": s.attrs} if s.attrs else {}),
+                }
+                for s in self.spans
+            ],
+            "counters": dict(self.counters),
+        }
+
+    def write_json(self, path: str | Path) -> None:
+        """Write ``to_dict()`` to *path* as indented JSON."""
+        Path(path).write_text(
+            json.dumps(self.to_dict(), indent=2, default=str) + "\n",
+            encoding="utf-8",
+        )
@@ -10,19 +10,32 @@ from __future__ import annotations
 import json
 import ssl
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
+from extradoc.api_types._adapters import load_document, type_adapter
 from extradoc.api_types._generated import (
-    BatchUpdateDocumentRequest,  # noqa: TC001 - used at runtime in batch_update()
+    BatchUpdateDocumentRequest,
+    Document,
 )
+from extradoc.comments._from_raw import modified_high_water_mark
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
 import certifi
 import httpx
 
+_json_loads: Callable[[bytes], Any]
+try:  # Optional speedup: pip install "extradoc[speedups]"
+    from orjson import loads as _orjson_loads
+
+    _json_loads = _orjson_loads
+except ImportError:
+    _json_loads = json.loads
+
 # API constants
 API_BASE = "https://docs.googleapis.com/v1/documents"
 DRIVE_API_BASE = "https://www.googleapis.com/drive/v3/files"
@@ -36,6 +49,19 @@ _COMMENTS_FIELDS = (
     "nextPageToken"
 )
 
+# DocumentTab fields; without includeTabsContent the API returns the first
+# tab's content in the same-named legacy Document fields
+_DOCUMENT_TAB_FIELDS = (
+    "body,headers,footers,footnotes,documentStyle,suggestedDocumentStyleChanges,"
+    "namedStyles,suggestedNamedStylesChanges,lists,namedRanges,inlineObjects,"
+    "positionedObjects"
+)
+# Levels of the tab tree (top-level tabs and two levels of child tabs)
+_TAB_TREE_DEPTH = 3
+# Request extension marking a POST as safe to retry; matches
+# extrasuite.client.retry.IDEMPOTENT_EXTENSION
+_IDEMPOTENT_EXTENSION = "extrasuite.idempotent"
+
 
 class TransportError(Exception):
     """Base exception for transport errors."""
@@ -77,6 +103,89 @@ class DocumentData:
     document_id: str
     title: str
     raw: dict[str, Any]  # Full API response
+    # Undecoded response body, when the transport received one over HTTP
+    content: bytes | None = field(default=None, repr=False, compare=False)
+
+    def to_document(self) -> Document:
+        """Validate the response into a typed ``Document``.
+
+        Parses the response bytes directly when available, which is faster
+        than validating the already-decoded ``raw`` dict.
+        """
+        if self.content is not None:
+            return load_document(self.content)
+        return type_adapter(Document).validate_python(self.raw)
+
+
+def encode_batch(batch: BatchUpdateDocumentRequest) -> bytes:
+    """Serialize a batchUpdate body straight to JSON bytes.
+
+    Equivalent to ``json.dumps(batch.model_dump(by_alias=True,
+    exclude_none=True))`` without building the intermediate dict tree.
+    """
+    return batch.__pydantic_serializer__.to_json(
+        batch, by_alias=True, exclude_none=True
+    )
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body (with orjson when it is installed)."""
+    return _json_loads(content)
+
+
+def single_tab_document(raw: dict[str, Any], tab: str) -> dict[str, Any]:
+    """Cut a ``documents.get`` response down to one tab.
+
+    The tab whose ID — or, failing that, title — is *tab* becomes the only
+    top-level tab, without its child tabs.  Of the document-level fields
+    only ``documentId``, ``title`` and ``revisionId`` are kept.
+
+    Raises:
+        NotFoundError: The document has no such tab
+    """
+    selected = _find_tab(raw.get("tabs") or [], tab)
+    if selected is None:
+        raise NotFoundError(f"Tab not found: {tab}")
+    result: dict[str, Any] = {
+        k: raw[k] for k in ("documentId", "title", "revisionId") if k in raw
+    }
+    result["tabs"] = [{k: v for k, v in selected[1].items() if k != "childTabs"}]
+    return result
+
+
+def _find_tab(
+    tabs: list[dict[str, Any]], tab: str
+) -> tuple[int, dict[str, Any]] | None:
+    """Return (nesting level, tab) for the tab with ID or else title *tab*."""
+    flat: list[tuple[int, dict[str, Any]]] = []
+    pending = [(0, t) for t in reversed(tabs)]
+    while pending:
+        level, t = pending.pop()
+        flat.append((level, t))
+        pending.extend((level + 1, c) for c in reversed(t.get("childTabs") or []))
+    for key in ("tabId", "title"):
+        for level, t in flat:
+            if (t.get("tabProperties") or {}).get(key) == tab:
+                return level, t
+    return None
+
+
+def _tabs_mask(content_level: int | None) -> str:
+    """Return a ``tabs(...)`` fields mask covering the whole tab tree.
+
+    Only tabs at *content_level* (0 is top-level) include their content;
+    with None, no tab does.
+    """
+
+    def _tab_fields(level: int) -> str:
+        fields = ["tabProperties"]
+        if level == content_level:
+            fields.append("documentTab")
+        if level + 1 < _TAB_TREE_DEPTH:
+            fields.append(f"childTabs({_tab_fields(level + 1)})")
+        return ",".join(fields)
+
+    return f"tabs({_tab_fields(0)})"
 
 
 class Transport(ABC):
@@ -98,6 +207,64 @@ class Transport(ABC):
         """
         ...
 
+    async def get_revision_id(self, document_id: str) -> str | None:
+        """Fetch only the document's current revisionId.
+
+        The default fetches the whole document; transports that can ask
+        the API for a single field override this.
+
+        Args:
+            document_id: The document identifier
+
+        Returns:
+            The revisionId, or None if the source does not report one
+        """
+        document_data = await self.get_document(document_id)
+        revision_id = document_data.raw.get("revisionId")
+        return revision_id if isinstance(revision_id, str) else None
+
+    async def get_document_tab(self, document_id: str, tab: str) -> DocumentData:
+        """Fetch one tab of a document (see ``single_tab_document``).
+
+        The default fetches the whole document and drops the other tabs;
+        transports that can narrow the request override this.
+
+        Args:
+            document_id: The document identifier
+            tab: The tab's ID or title
+
+        Returns:
+            DocumentData whose only tab is the selected one
+
+        Raises:
+            NotFoundError: The document has no such tab
+        """
+        document_data = await self.get_document(document_id)
+        return DocumentData(
+            document_id=document_data.document_id,
+            title=document_data.title,
+            raw=single_tab_document(document_data.raw, tab),
+        )
+
+    async def comments_changed_since(
+        self, file_id: str, modified_time: str | None
+    ) -> bool:
+        """Check whether any comment was added, edited or deleted since a pull.
+
+        The default lists every comment; transports that can filter on the
+        server override this.
+
+        Args:
+            file_id: The file identifier
+            modified_time: The comments' modifiedTime high-water mark at
+                the last pull (None if there were no comments)
+
+        Returns:
+            True if some comment or reply changed after *modified_time*
+        """
+        latest = modified_high_water_mark(await self.list_comments(file_id))
+        return (latest or "") > (modified_time or "")
+
     @abstractmethod
     async def batch_update(
         self,
@@ -120,6 +287,9 @@ class Transport(ABC):
     async def list_comments(self, file_id: str) -> list[dict[str, Any]]:
         """Fetch all comments on a file via Drive API v3.
 
+        Deleted comments are included (flagged ``deleted``) so that their
+        deletion time counts towards the modifiedTime high-water mark.
+
         Args:
             file_id: The file identifier
 
@@ -219,32 +389,101 @@ class GoogleDocsTransport(Transport):
         self,
         access_token: str,
         timeout: int = DEFAULT_TIMEOUT,
+        *,
+        api_base: str = API_BASE,
+        drive_api_base: str = DRIVE_API_BASE,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the transport.
 
         Args:
             access_token: OAuth2 access token with documents.readonly scope
             timeout: Request timeout in seconds
+            api_base: Docs API documents endpoint, e.g. a local
+                ``extradoc.mock.server`` for load tests
+            drive_api_base: Drive API files endpoint
+            http_transport: Optional httpx transport (e.g. an
+                ``httpx.MockTransport``) to send requests through
+            http_client: Optional shared ``httpx.AsyncClient`` (e.g. one
+                pooled client for every transport in a process).  The
+                transport sends its auth headers per request and leaves
+                closing a shared client to its owner.
         """
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            verify=ssl_context,
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
+        self._api_base = api_base.rstrip("/")
+        self._drive_api_base = drive_api_base.rstrip("/")
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        }
+        self._owns_client = http_client is None
+        if http_client is None:
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            http_client = httpx.AsyncClient(
+                timeout=timeout, verify=ssl_context, transport=http_transport
+            )
+        self._client = http_client
 
     async def get_document(self, document_id: str) -> DocumentData:
         """Fetch document data from Google Docs API."""
-        url = f"{API_BASE}/{document_id}?includeTabsContent=true"
-        response = await self._request(url)
+        url = f"{self._api_base}/{document_id}?includeTabsContent=true"
+        content = await self._get_content(url)
+        response: dict[str, Any] = decode_json(content)
 
         return DocumentData(
             document_id=response.get("documentId", document_id),
             title=response.get("title", ""),
             raw=response,
+            content=content,
+        )
+
+    async def get_revision_id(self, document_id: str) -> str | None:
+        """Fetch the revisionId alone, with a ``fields`` mask."""
+        response = await self._request(
+            f"{self._api_base}/{document_id}?fields=revisionId"
+        )
+        revision_id = response.get("revisionId")
+        return revision_id if isinstance(revision_id, str) else None
+
+    async def get_document_tab(self, document_id: str, tab: str) -> DocumentData:
+        """Fetch one tab with ``fields`` masks instead of the whole document.
+
+        A first request fetches the tab tree without content to locate the
+        tab.  A mask cannot select one element of ``tabs``, so the content
+        request narrows as far as the API allows: the first tab comes from
+        the legacy document-level fields (no ``includeTabsContent``); any
+        other tab is fetched along with the tabs at its nesting level only.
+        """
+        url = f"{self._api_base}/{document_id}"
+        outline = await self._request(
+            f"{url}?includeTabsContent=true"
+            f"&fields=documentId,title,revisionId,{_tabs_mask(None)}"
+        )
+        tabs = outline.get("tabs") or []
+        found = _find_tab(tabs, tab)
+        if found is None:
+            raise NotFoundError(f"Tab not found in {document_id}: {tab}")
+        level, selected = found
+        tab_id = selected["tabProperties"]["tabId"]
+
+        if selected is tabs[0]:
+            document_tab = await self._request(
+                f"{url}?fields=revisionId,{_DOCUMENT_TAB_FIELDS}"
+            )
+            response = dict(outline)
+            if "revisionId" in document_tab:
+                response["revisionId"] = document_tab.pop("revisionId")
+            response["tabs"] = [{**selected, "documentTab": document_tab}]
+        else:
+            response = await self._request(
+                f"{url}?includeTabsContent=true"
+                f"&fields=documentId,title,revisionId,{_tabs_mask(level)}"
+            )
+
+        return DocumentData(
+            document_id=response.get("documentId", document_id),
+            title=response.get("title", ""),
+            raw=single_tab_document(response, tab_id),
         )
 
     async def batch_update(
@@ -252,23 +491,51 @@ class GoogleDocsTransport(Transport):
         document_id: str,
         batch: BatchUpdateDocumentRequest,
     ) -> dict[str, Any]:
-        """Apply batchUpdate requests to Google Docs API."""
-        url = f"{API_BASE}/{document_id}:batchUpdate"
-        body = batch.model_dump(by_alias=True, exclude_none=True)
-        return await self._post_request(url, body)
+        """Apply batchUpdate requests to Google Docs API.
+
+        A batch pinned to a revision (``writeControl.requiredRevisionId``)
+        fails on replay instead of applying twice, so it is marked
+        idempotent for the HTTP client's retry layer.
+        """
+        url = f"{self._api_base}/{document_id}:batchUpdate"
+        write_control = batch.write_control
+        idempotent = bool(write_control and write_control.required_revision_id)
+        return await self._post_request(
+            url,
+            encode_batch(batch),
+            extensions={_IDEMPOTENT_EXTENSION: True} if idempotent else None,
+        )
 
     async def list_comments(self, file_id: str) -> list[dict[str, Any]]:
         """Fetch all comments via Drive API v3 with pagination."""
+        return await self._list_comment_pages(
+            f"{self._drive_api_base}/{file_id}/comments"
+            f"?fields={_COMMENTS_FIELDS}&includeDeleted=true&pageSize=100"
+        )
+
+    async def comments_changed_since(
+        self, file_id: str, modified_time: str | None
+    ) -> bool:
+        """Ask Drive only for comments modified since *modified_time*."""
+        url = f"{self._drive_api_base}/{file_id}/comments?"
+        if modified_time is None:
+            # No comments at the last pull: is there a live one now?
+            response = await self._request(url + "fields=comments(id)&pageSize=1")
+            return bool(response.get("comments"))
+        comments = await self._list_comment_pages(
+            url + "fields=comments(modifiedTime),nextPageToken"
+            "&includeDeleted=true&pageSize=100"
+            f"&startModifiedTime={quote(modified_time)}"
+        )
+        # startModifiedTime is inclusive
+        return any(c.get("modifiedTime", "") > modified_time for c in comments)
+
+    async def _list_comment_pages(self, url: str) -> list[dict[str, Any]]:
         all_comments: list[dict[str, Any]] = []
         page_token: str | None = None
         while True:
-            url = (
-                f"{DRIVE_API_BASE}/{file_id}/comments"
-                f"?fields={_COMMENTS_FIELDS}&pageSize=100"
-            )
-            if page_token:
-                url += f"&pageToken={page_token}"
-            response = await self._request(url)
+            page_url = f"{url}&pageToken={page_token}" if page_token else url
+            response = await self._request(page_url)
             all_comments.extend(response.get("comments", []))
             page_token = response.get("nextPageToken")
             if not page_token:
@@ -284,7 +551,7 @@ class GoogleDocsTransport(Transport):
     ) -> dict[str, Any]:
         """Create a reply on an existing comment via Drive API v3."""
         url = (
-            f"{DRIVE_API_BASE}/{file_id}/comments/{comment_id}/replies"
+            f"{self._drive_api_base}/{file_id}/comments/{comment_id}/replies"
             f"?fields=id,content,author,createdTime,action"
         )
         body: dict[str, Any] = {"content": content}
@@ -296,13 +563,15 @@ class GoogleDocsTransport(Transport):
         self, file_id: str, comment_id: str, content: str
     ) -> dict[str, Any]:
         """Edit a comment via Drive API v3 PATCH."""
-        url = f"{DRIVE_API_BASE}/{file_id}/comments/{comment_id}?fields=id,content"
+        url = (
+            f"{self._drive_api_base}/{file_id}/comments/{comment_id}?fields=id,content"
+        )
         body: dict[str, Any] = {"content": content}
         return await self._patch_request(url, body)
 
     async def delete_comment(self, file_id: str, comment_id: str) -> None:
         """Delete a comment via Drive API v3 DELETE."""
-        url = f"{DRIVE_API_BASE}/{file_id}/comments/{comment_id}"
+        url = f"{self._drive_api_base}/{file_id}/comments/{comment_id}"
         await self._delete_request(url)
 
     async def edit_reply(
@@ -310,36 +579,61 @@ class GoogleDocsTransport(Transport):
     ) -> dict[str, Any]:
         """Edit a reply via Drive API v3 PATCH."""
         url = (
-            f"{DRIVE_API_BASE}/{file_id}/comments/{comment_id}/replies/{reply_id}"
-            f"?fields=id,content"
+            f"{self._drive_api_base}/{file_id}/comments/{comment_id}"
+            f"/replies/{reply_id}?fields=id,content"
         )
         body: dict[str, Any] = {"content": content}
         return await self._patch_request(url, body)
 
     async def delete_reply(self, file_id: str, comment_id: str, reply_id: str) -> None:
         """Delete a reply via Drive API v3 DELETE."""
-        url = f"{DRIVE_API_BASE}/{file_id}/comments/{comment_id}/replies/{reply_id}"
+        url = (
+            f"{self._drive_api_base}/{file_id}/comments/{comment_id}/replies/{reply_id}"
+        )
         await self._delete_request(url)
 
     async def _request(self, url: str) -> dict[str, Any]:
         """Make an authenticated GET request."""
+        result: dict[str, Any] = decode_json(await self._get_content(url))
+        return result
+
+    async def _get_content(self, url: str) -> bytes:
+        """Make an authenticated GET request and return the raw body."""
         try:
-            response = await self._client.get(url)
+            response = await self._client.get(url, headers=self._headers)
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
-            return result
+            return response.content
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e)
             raise  # unreachable, but makes type checker happy
         except httpx.RequestError as e:
             raise TransportError(f"Network error: {e}") from e
 
-    async def _post_request(self, url: str, body: dict[str, Any]) -> dict[str, Any]:
-        """Make an authenticated POST request."""
+    async def _post_request(
+        self,
+        url: str,
+        body: dict[str, Any] | bytes,
+        *,
+        extensions: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make an authenticated POST request.
+
+        *body* is either a JSON-able dict or pre-encoded JSON bytes.
+        """
         try:
-            response = await self._client.post(url, json=body)
+            if isinstance(body, bytes):
+                response = await self._client.post(
+                    url,
+                    content=body,
+                    headers={**self._headers, "Content-Type": "application/json"},
+                    extensions=extensions,
+                )
+            else:
+                response = await self._client.post(
+                    url, json=body, headers=self._headers, extensions=extensions
+                )
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = decode_json(response.content)
             return result
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e)
@@ -350,9 +644,9 @@ class GoogleDocsTransport(Transport):
     async def _patch_request(self, url: str, body: dict[str, Any]) -> dict[str, Any]:
         """Make an authenticated PATCH request."""
         try:
-            response = await self._client.patch(url, json=body)
+            response = await self._client.patch(url, json=body, headers=self._headers)
             response.raise_for_status()
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = decode_json(response.content)
             return result
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e)
@@ -363,7 +657,7 @@ class GoogleDocsTransport(Transport):
     async def _delete_request(self, url: str) -> None:
         """Make an authenticated DELETE request."""
         try:
-            response = await self._client.delete(url)
+            response = await self._client.delete(url, headers=self._headers)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             self._handle_http_error(e)
@@ -388,8 +682,9 @@ class GoogleDocsTransport(Transport):
         raise APIError(f"API error ({status}): {body}", status_code=status) from e
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was passed in shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
 
 class LocalFileTransport(Transport):
@@ -411,12 +706,14 @@ class LocalFileTransport(Transport):
     async def get_document(self, document_id: str) -> DocumentData:
         """Read document data from local file."""
         path = self._golden_dir / f"{document_id}.json"
-        response = json.loads(path.read_text(encoding="utf-8"))
+        content = path.read_bytes()
+        response: dict[str, Any] = decode_json(content)
 
         return DocumentData(
             document_id=response.get("documentId", document_id),
             title=response.get("title", ""),
             raw=response,
+            content=content,
         )
 
     async def batch_update(
@@ -0,0 +1,267 @@
+"""Tests for anchor-and-band content alignment.
+
+Anchor-and-band mode pins the longest monotonic chain of unique exact-text
+anchors (patience diff), then aligns each gap with the full DP when it is
+small or with a diagonal-band DP when it is large.  It must produce the same
+``ContentAlignment`` as the classic full DP on the golden corpus and scale
+near-linearly when most paragraphs are unchanged: only the gaps between
+anchors reach the DP.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from extradoc.api_types._generated import Document, StructuralElement
+from extradoc.diffmerge import content_align, diff
+from extradoc.diffmerge.content_align import (
+    ContentNode,
+    _banded_dp_align,
+    _dp_align,
+    _patience_anchors,
+    _pre_pin_stable_anchors,
+    align_content,
+    content_node_from_element,
+)
+from tests.diffmerge.helpers import make_para_el, make_table_el, make_terminal_para
+
+GOLDEN_DIR = Path(__file__).parent.parent / "golden"
+
+
+# ---------------------------------------------------------------------------
+# Utilities
+# ---------------------------------------------------------------------------
+
+
+def _nodes(elements: list[StructuralElement]) -> list[ContentNode]:
+    nodes = [content_node_from_element(el) for el in elements]
+    if nodes:
+        nodes[-1].is_terminal = True
+    return nodes
+
+
+def _all_tabs(tabs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for tab in tabs:
+        out.append(tab)
+        out.extend(_all_tabs(tab.get("childTabs", [])))
+    return out
+
+
+def _mutate_golden(d: dict[str, Any]) -> None:
+    """Delete, edit and insert a scattering of body paragraphs in every tab."""
+    for tab in _all_tabs(d.get("tabs", [])):
+        content = tab["documentTab"]["body"]["content"]
+        for idx in range(len(content) - 2, 0, -1):
+            para = content[idx].get("paragraph")
+            if para is None:
+                continue
+            if idx % 7 == 0:
+                del content[idx]
+            elif idx % 11 == 0:
+                para["elements"] = [
+                    {"textRun": {"content": f"Rewritten paragraph {idx}.\n"}}
+                ]
+            elif idx % 13 == 0:
+                content.insert(
+                    idx,
+                    {
+                        "paragraph": {
+                            "elements": [{"textRun": {"content": f"Inserted {idx}.\n"}}]
+                        }
+                    },
+                )
+
+
+def _golden_pairs() -> list[tuple[str, Document, Document]]:
+    pairs: list[tuple[str, Document, Document]] = []
+    for path in sorted(GOLDEN_DIR.glob("*.json")):
+        if path.stem.endswith("_desired"):
+            continue
+        raw = json.loads(path.read_text())
+        base = Document.model_validate(raw)
+        desired_path = path.with_name(f"{path.stem}_desired.json")
+        if desired_path.exists():
+            desired = Document.model_validate(json.loads(desired_path.read_text()))
+            pairs.append((f"{path.stem}:desired", base, desired))
+        mutated = json.loads(path.read_text())
+        _mutate_golden(mutated)
+        pairs.append((f"{path.stem}:mutated", base, Document.model_validate(mutated)))
+    return pairs
+
+
+_GOLDEN_PAIRS = _golden_pairs()
+
+
+def _body_content(doc: Document) -> list[list[StructuralElement]]:
+    out: list[list[StructuralElement]] = []
+
+    def _walk(tabs: list[Any]) -> None:
+        for tab in tabs:
+            body = tab.document_tab.body if tab.document_tab else None
+            if body and body.content:
+                out.append(list(body.content))
+            _walk(tab.child_tabs or [])
+
+    _walk(doc.tabs or [])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Golden equivalence
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("base", "desired"),
+    [(b, d) for _, b, d in _GOLDEN_PAIRS],
+    ids=[name for name, _, _ in _GOLDEN_PAIRS],
+)
+def test_anchored_alignment_matches_full_dp_on_golden(
+    base: Document, desired: Document
+) -> None:
+    for b_content, d_content in zip(
+        _body_content(base), _body_content(desired), strict=False
+    ):
+        full = align_content(_nodes(b_content), _nodes(d_content), anchored=False)
+        anchored = align_content(_nodes(b_content), _nodes(d_content), anchored=True)
+        assert anchored == full
+
+
+@pytest.mark.parametrize(
+    ("base", "desired"),
+    [(b, d) for _, b, d in _GOLDEN_PAIRS],
+    ids=[name for name, _, _ in _GOLDEN_PAIRS],
+)
+def test_anchored_diff_ops_match_on_golden(
+    base: Document, desired: Document, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = diff(base, desired)
+    monkeypatch.setattr(content_align, "ANCHORED_ALIGN_MIN_CELLS", 0)
+    assert diff(base, desired) == expected
+
+
+# ---------------------------------------------------------------------------
+# Banded DP
+# ---------------------------------------------------------------------------
+
+
+def _random_paras(rng: random.Random, count: int) -> list[StructuralElement]:
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+    return [
+        make_para_el(" ".join(rng.choice(words) for _ in range(4)) + "\n")
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_banded_dp_equals_full_dp_when_band_covers_matrix(seed: int) -> None:
+    rng = random.Random(seed)
+    base = _nodes(_random_paras(rng, 30))
+    desired = _nodes(_random_paras(rng, 24))
+    assert _banded_dp_align(base, desired, band=64) == _dp_align(base, desired)
+
+
+def test_banded_dp_reaches_corner_for_lopsided_gaps() -> None:
+    base = _nodes([make_para_el(f"Only paragraph {i}\n") for i in range(2)])
+    desired = _nodes([make_para_el(f"Only paragraph {i}\n") for i in range(200)])
+    alignment = _banded_dp_align(base, desired, band=1)
+    matched = {(m.base_idx, m.desired_idx) for m in alignment.matches}
+    assert len(matched) + len(alignment.base_deletes) == len(base)
+    assert len(matched) + len(alignment.desired_inserts) == len(desired)
+
+
+# ---------------------------------------------------------------------------
+# Patience anchors
+# ---------------------------------------------------------------------------
+
+
+def test_patience_anchors_survive_moved_paragraph() -> None:
+    """A paragraph moved from the top to the bottom must not block the
+    anchors for every paragraph after it."""
+    texts = [f"Unique paragraph number {i}\n" for i in range(10)]
+    base = _nodes([make_para_el(t) for t in texts])
+    desired = _nodes([make_para_el(t) for t in [*texts[1:], texts[0]]])
+
+    greedy = _pre_pin_stable_anchors(base, desired)
+    patience = _patience_anchors(base, desired)
+
+    assert greedy == [(0, 9)]
+    assert patience == [(i, i - 1) for i in range(1, 10)]
+
+
+def test_patience_anchors_equal_greedy_when_monotonic() -> None:
+    base = _nodes(
+        [
+            make_para_el("Stable intro\n"),
+            make_table_el([["a", "b"]]),
+            make_para_el("Stable outro\n"),
+            make_terminal_para(),
+        ]
+    )
+    desired = _nodes(
+        [
+            make_para_el("Stable intro\n"),
+            make_para_el("Inserted\n"),
+            make_table_el([["a", "c"]]),
+            make_para_el("Stable outro\n"),
+            make_terminal_para(),
+        ]
+    )
+    assert _patience_anchors(base, desired) == _pre_pin_stable_anchors(base, desired)
+
+
+# ---------------------------------------------------------------------------
+# Scaling
+# ---------------------------------------------------------------------------
+
+
+def test_anchored_alignment_scales_on_mostly_unchanged_document(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    count = 3000
+    base_els = [make_para_el(f"Policy clause {i} text body\n") for i in range(count)]
+    desired_els = list(base_els)
+    origins: list[int | None] = list(range(count))
+    for i in range(10, count, 300):
+        desired_els[i] = make_para_el(f"Policy clause {i} text body amended\n")
+    del desired_els[1500], origins[1500]
+    desired_els.insert(2000, make_para_el("A freshly inserted clause\n"))
+    origins.insert(2000, None)
+    base_els.append(make_terminal_para())
+    desired_els.append(make_terminal_para())
+    origins.append(count)
+
+    base = _nodes(base_els)
+    desired = _nodes(desired_els)
+
+    # Record the size of every DP sub-problem the gaps are handed to.
+    gap_cells: list[int] = []
+    for name in ("_dp_align", "_banded_dp_align"):
+        original = getattr(content_align, name)
+
+        def _spy(b: Any, d: Any, *args: Any, _original: Any = original) -> Any:
+            gap_cells.append(len(b) * len(d))
+            return _original(b, d, *args)
+
+        monkeypatch.setattr(content_align, name, _spy)
+
+    alignment = align_content(base, desired)
+
+    # Anchored mode kicks in on its own, and the anchors leave only the
+    # edited paragraphs to the DP: a handful of tiny gaps, not a
+    # count x count matrix.
+    assert count * count > content_align.ANCHORED_ALIGN_MIN_CELLS
+    assert gap_cells
+    assert max(gap_cells) <= 4
+    assert sum(gap_cells) < count
+    assert alignment.base_deletes == [1500]
+    assert alignment.desired_inserts == [2000]
+    assert sorted((m.base_idx, m.desired_idx) for m in alignment.matches) == [
+        (origin, j) for j, origin in enumerate(origins) if origin is not None
+    ]
@@ -0,0 +1,90 @@
+"""Tests for ``apply_to_document``, the model-level three-way merge step."""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+from extradoc.api_types._generated import Document
+from extradoc.diffmerge import apply, apply_to_document, diff
+from extradoc.mock.reindex import reindex_and_normalize_all_tabs
+from tests.diffmerge.helpers import make_document, make_para_el, make_tab
+
+GOLDEN_DIR = Path(__file__).parent.parent / "golden"
+MULTITAB_GOLDEN_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+def _dump(model: Any) -> dict[str, Any]:
+    result: dict[str, Any] = model.model_dump(by_alias=True, exclude_none=True)
+    return result
+
+
+def _dict_pipeline(base: Document, ops: list[Any]) -> Document:
+    """The dump → apply → validate → dump → reindex → validate round trip."""
+    merged = Document.model_validate(apply(_dump(base), ops))
+    desired = _dump(merged)
+    reindex_and_normalize_all_tabs(desired)
+    return Document.model_validate(desired)
+
+
+def test_only_touched_tabs_are_rebuilt() -> None:
+    raw = json.loads((GOLDEN_DIR / f"{MULTITAB_GOLDEN_ID}.json").read_text())
+    base = Document.model_validate(raw)
+    edited = copy.deepcopy(raw)
+    content = edited["tabs"][0]["documentTab"]["body"]["content"]
+    content[3]["paragraph"]["elements"] = [
+        {"textRun": {"content": "Edited paragraph.\n", "textStyle": {}}}
+    ]
+    ops = diff(base, Document.model_validate(edited))
+    before = _dump(base)
+
+    merged = apply_to_document(base, ops)
+
+    assert _dump(base) == before
+    base_tabs = base.tabs or []
+    merged_tabs = merged.tabs or []
+    assert merged_tabs[0] is not base_tabs[0]
+    assert all(m is b for m, b in zip(merged_tabs[1:], base_tabs[1:], strict=True))
+    assert _dump(merged_tabs[0]) == _dump((_dict_pipeline(base, ops).tabs or [])[0])
+    assert "Edited paragraph." in json.dumps(_dump(merged_tabs[0]))
+
+
+def _tab_ids(document: Document) -> list[str | None]:
+    return [
+        t.tab_properties.tab_id if t.tab_properties else None
+        for t in document.tabs or []
+    ]
+
+
+def test_tab_insert_and_delete_around_untouched_tabs() -> None:
+    t1, t2, t3 = make_tab("t1", "A", 0), make_tab("t2", "B", 1), make_tab("t3", "C", 2)
+    base = make_document(tabs=[t1, t2])
+    new_tab = make_tab("t9", "New", 1, body_content=[make_para_el("Hello\n")])
+    desired = make_document(tabs=[t1, new_tab, t2])
+
+    merged = apply_to_document(base, diff(base, desired))
+
+    assert _tab_ids(merged) == ["t1", "t9", "t2"]
+    tabs = merged.tabs or []
+    assert tabs[0] is t1
+    assert tabs[2] is t2
+    inserted = tabs[1].document_tab
+    assert inserted is not None and inserted.body is not None
+    assert [el.end_index for el in inserted.body.content or []] == [7]
+
+    base = make_document(tabs=[t1, t2, t3])
+    merged = apply_to_document(base, diff(base, make_document(tabs=[t1, t3])))
+    assert _tab_ids(merged) == ["t1", "t3"]
+    assert (merged.tabs or [])[1] is t3
+
+
+def test_documents_without_tab_ids_use_whole_document_pass() -> None:
+    base = make_document(tabs=[make_tab("t1")])
+    (base.tabs or [])[0].tab_properties = None
+    desired = make_document(tabs=[make_tab("t1", body_content=[make_para_el("x\n")])])
+    (desired.tabs or [])[0].tab_properties = None
+    ops = diff(base, desired)
+
+    assert _dump(apply_to_document(base, ops)) == _dump(_dict_pipeline(base, ops))
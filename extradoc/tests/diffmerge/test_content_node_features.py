@@ -0,0 +1,109 @@
+"""Tests for the cached ContentNode similarity features and ``match_cost``.
+
+The DP evaluates ``match_cost`` once per cell using features cached on each
+``ContentNode``.  These must give exactly the same answers as the plain
+string-level ``text_similarity`` / ``matchable`` / ``edit_cost`` functions,
+so that alignments are unchanged.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+import pytest
+
+from extradoc.diffmerge.content_align import (
+    ContentNode,
+    NodeKind,
+    _node_text_similarity,
+    _table_sim,
+    edit_cost,
+    match_cost,
+    matchable,
+    text_similarity,
+)
+
+_WORDS = ["Alpha", "beta", "gamma", "delta", "FOOTNOTE_REF", "x", ""]
+
+
+def _random_text(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 5)))
+
+
+def _random_node(rng: random.Random) -> ContentNode:
+    kind = rng.choice(
+        [NodeKind.PARAGRAPH, NodeKind.LIST, NodeKind.TABLE, NodeKind.PAGE_BREAK]
+    )
+    if kind == NodeKind.TABLE:
+        cells = [_random_text(rng) for _ in range(rng.randint(0, 4))]
+        return ContentNode(kind=kind, num_cells=len(cells), table_cell_texts=cells)
+    if kind == NodeKind.LIST:
+        return ContentNode(
+            kind=kind,
+            text=_random_text(rng),
+            list_kind=rng.choice(["BULLETED", "NUMBERED"]),
+        )
+    return ContentNode(kind=kind, text=_random_text(rng))
+
+
+def _reference_table_sim(base: ContentNode, desired: ContentNode) -> float:
+    """The original string-level greedy table similarity."""
+    if not base.table_cell_texts:
+        return 1.0
+    remaining = list(desired.table_cell_texts)
+    total = 0.0
+    for b_text in base.table_cell_texts:
+        best_sim, best_idx = 0.0, -1
+        for idx, d_text in enumerate(remaining):
+            sim = text_similarity(b_text, d_text)
+            if sim > best_sim:
+                best_sim, best_idx = sim, idx
+        total += best_sim
+        if best_idx >= 0:
+            remaining.pop(best_idx)
+    return total / len(base.table_cell_texts)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_match_cost_equals_matchable_then_edit_cost(seed: int) -> None:
+    rng = random.Random(seed)
+    nodes = [_random_node(rng) for _ in range(40)]
+    for base, desired in itertools.product(nodes, repeat=2):
+        expected = edit_cost(base, desired) if matchable(base, desired) else math.inf
+        assert match_cost(base, desired) == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_cached_similarity_equals_string_similarity(seed: int) -> None:
+    rng = random.Random(seed)
+    nodes = [_random_node(rng) for _ in range(40)]
+    for base, desired in itertools.product(nodes, repeat=2):
+        assert _node_text_similarity(base, desired) == text_similarity(
+            base.text, desired.text
+        )
+        if base.kind == desired.kind == NodeKind.TABLE:
+            assert _table_sim(base, desired) == _reference_table_sim(base, desired)
+
+
+def test_features_are_computed_once() -> None:
+    node = ContentNode(
+        kind=NodeKind.TABLE,
+        num_cells=2,
+        table_cell_texts=["Hello World", "hello"],
+        text="Some Text here",
+    )
+    assert node.tokens == frozenset({"some", "text", "here"})
+    assert node.tokens is node.tokens
+    assert node.cell_tokens == (frozenset({"hello", "world"}), frozenset({"hello"}))
+    assert node.cell_tokens is node.cell_tokens
+    assert node.cell_hashes == (hash("Hello World"), hash("hello"))
+    assert node.text_len == len("Some Text here")
+
+
+def test_cached_features_do_not_affect_equality() -> None:
+    a = ContentNode(kind=NodeKind.PARAGRAPH, text="same words")
+    b = ContentNode(kind=NodeKind.PARAGRAPH, text="same words")
+    _ = a.tokens, a.text_hash
+    assert a == b
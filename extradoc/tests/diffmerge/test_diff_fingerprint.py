@@ -0,0 +1,163 @@
+"""Tests for the per-tab / per-segment fingerprint short-circuit in diff.
+
+Unchanged tabs and segments are skipped by ``diff_documents``.  The op list
+must be identical to what the unskipped diff produces, and the skip counts
+must be reported through ``DiffStats``.
+"""
+
+from __future__ import annotations
+
+import copy
+import importlib
+import itertools
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from extradoc.api_types._generated import Document, NamedRange, NamedRanges, Range
+from extradoc.diffmerge import DiffStats, diff
+from extradoc.diffmerge.fingerprint import (
+    TabFingerprint,
+    content_fingerprint,
+    tab_fingerprint,
+)
+from tests.diffmerge.helpers import (
+    make_document,
+    make_footer,
+    make_footnote,
+    make_header,
+    make_indexed_para,
+    make_indexed_terminal,
+    make_para_el,
+    make_tab,
+    make_terminal_para,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+# ``extradoc.diffmerge.diff`` is shadowed by the ``diff`` function re-export.
+diff_module = importlib.import_module("extradoc.diffmerge.diff")
+
+GOLDEN_DIR = Path(__file__).parent.parent / "golden"
+MULTITAB_GOLDEN_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+def _diff_without_fingerprints(
+    base: Document, desired: Document, monkeypatch: pytest.MonkeyPatch
+) -> list[Any]:
+    """Run the diff with every fingerprint unique, i.e. nothing skipped."""
+    counter = itertools.count()
+
+    def _never_equal(_doc_tab: object) -> TabFingerprint:
+        return TabFingerprint(digest=str(next(counter)))
+
+    with monkeypatch.context() as m:
+        m.setattr(diff_module, "tab_fingerprint", _never_equal)
+        return diff(base, desired)
+
+
+def _multitab_edit_one() -> tuple[Document, Document]:
+    raw = json.loads((GOLDEN_DIR / f"{MULTITAB_GOLDEN_ID}.json").read_text())
+    base = Document.model_validate(raw)
+    edited = copy.deepcopy(raw)
+    content = edited["tabs"][0]["documentTab"]["body"]["content"]
+    content[3]["paragraph"]["elements"] = [
+        {"textRun": {"content": "Edited paragraph.\n", "textStyle": {}}}
+    ]
+    return base, Document.model_validate(edited)
+
+
+def test_identical_document_skips_every_tab() -> None:
+    raw = json.loads((GOLDEN_DIR / f"{MULTITAB_GOLDEN_ID}.json").read_text())
+    stats = DiffStats()
+    assert (
+        diff(Document.model_validate(raw), Document.model_validate(raw), stats=stats)
+        == []
+    )
+    assert stats.tabs_compared == stats.tabs_skipped > 0
+
+
+def test_unchanged_tabs_skipped_and_ops_identical(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base, desired = _multitab_edit_one()
+    stats = DiffStats()
+    ops = diff(base, desired, stats=stats)
+
+    assert ops
+    assert stats.tabs_skipped == stats.tabs_compared - 1
+    assert ops == _diff_without_fingerprints(base, desired, monkeypatch)
+
+
+def test_unchanged_segments_skipped_inside_changed_tab(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    doc_style = {"defaultHeaderId": "h1", "defaultFooterId": "f1"}
+
+    def _doc(body_text: str) -> Document:
+        return make_document(
+            tabs=[
+                make_tab(
+                    "t1",
+                    body_content=[make_para_el(body_text), make_terminal_para()],
+                    headers={"h1": make_header("h1")},
+                    footers={"f1": make_footer("f1")},
+                    footnotes={"fn1": make_footnote("fn1")},
+                    document_style=doc_style,
+                )
+            ]
+        )
+
+    base = _doc("Original body text\n")
+    desired = _doc("Changed body text\n")
+
+    stats = DiffStats()
+    ops = diff(base, desired, stats=stats)
+
+    assert stats.tabs_skipped == 0
+    # header, footer and footnote skipped; body diffed
+    assert stats.segments_compared == 4
+    assert stats.segments_skipped == 3
+    assert ops == _diff_without_fingerprints(base, desired, monkeypatch)
+
+
+def test_content_fingerprint_ignores_indices() -> None:
+    indexed = [make_indexed_para("Hello\n", 1), make_indexed_terminal(7)]
+    shifted = [make_indexed_para("Hello\n", 40), make_indexed_terminal(46)]
+    unindexed = [make_para_el("Hello\n"), make_terminal_para()]
+    assert content_fingerprint(indexed) == content_fingerprint(shifted)
+    assert content_fingerprint(indexed) == content_fingerprint(unindexed)
+    assert content_fingerprint(indexed) != content_fingerprint(
+        [make_para_el("Hello!\n"), make_terminal_para()]
+    )
+
+
+def test_content_fingerprint_not_fooled_by_index_like_text() -> None:
+    plain = [make_para_el("x\n")]
+    tricky = [make_para_el('x"startIndex":5\n')]
+    assert content_fingerprint(plain) != content_fingerprint(tricky)
+
+
+def test_named_range_indices_are_part_of_tab_fingerprint() -> None:
+    def _tab_with_range(start: int) -> Any:
+        tab = make_tab("t1")
+        assert tab.document_tab is not None
+        tab.document_tab.named_ranges = {
+            "r": NamedRanges(
+                name="r",
+                named_ranges=[
+                    NamedRange(
+                        name="r",
+                        named_range_id="nr1",
+                        ranges=[Range(start_index=start, end_index=start + 2)],
+                    )
+                ],
+            )
+        }
+        return tab.document_tab
+
+    assert (
+        tab_fingerprint(_tab_with_range(1)).digest
+        != tab_fingerprint(_tab_with_range(3)).digest
+    )
@@ -0,0 +1,119 @@
+"""Tests for the linear-space (Hirschberg-style) content alignment DP.
+
+``_linear_space_dp_align`` must return exactly the ``ContentAlignment`` of
+the full-matrix DP — including its prefer-match-then-delete tie-breaks —
+while keeping only rolling rows in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from extradoc.api_types._generated import Document, StructuralElement
+from extradoc.diffmerge import content_align, diff
+from extradoc.diffmerge.content_align import (
+    ContentAlignment,
+    ContentNode,
+    _dp_align,
+    _full_dp_align,
+    _linear_space_dp_align,
+    content_node_from_element,
+)
+from tests.diffmerge.helpers import make_para_el, make_table_el
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+GOLDEN_DIR = Path(__file__).parent.parent / "golden"
+
+
+def _nodes(elements: list[StructuralElement]) -> list[ContentNode]:
+    return [content_node_from_element(el) for el in elements]
+
+
+def _tie_heavy_elements(rng: random.Random, count: int) -> list[StructuralElement]:
+    """Paragraphs and tables drawn from a tiny vocabulary, so equal-cost
+    alternatives (and therefore tie-breaks) are everywhere."""
+    words = ["alpha", "beta", "gamma", "delta"]
+    out: list[StructuralElement] = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            out.append(make_table_el([[rng.choice(words), rng.choice(words)]]))
+        else:
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+            out.append(make_para_el(text + "\n"))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_linear_space_equals_full_dp(
+    seed: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(content_align, "LINEAR_SPACE_DP_LEAF_CELLS", 4)
+    rng = random.Random(seed)
+    base = _nodes(_tie_heavy_elements(rng, rng.randint(0, 60)))
+    desired = _nodes(_tie_heavy_elements(rng, rng.randint(0, 60)))
+    assert _linear_space_dp_align(base, desired) == _full_dp_align(base, desired)
+
+
+def test_linear_space_equals_full_dp_on_repeated_paragraphs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(content_align, "LINEAR_SPACE_DP_LEAF_CELLS", 1)
+    base = _nodes([make_para_el("same\n") for _ in range(17)])
+    desired = _nodes([make_para_el("same\n") for _ in range(11)])
+    assert _linear_space_dp_align(base, desired) == _full_dp_align(base, desired)
+
+
+def test_dp_align_switches_above_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def _spy(base: list[ContentNode], desired: list[ContentNode]) -> ContentAlignment:
+        calls.append(len(base) * len(desired))
+        return _full_dp_align(base, desired)
+
+    monkeypatch.setattr(content_align, "_linear_space_dp_align", _spy)
+    monkeypatch.setattr(content_align, "LINEAR_SPACE_DP_MIN_CELLS", 20)
+    nodes = _nodes([make_para_el(f"p{i}\n") for i in range(5)])
+    _dp_align(nodes[:4], nodes[:5])
+    _dp_align(nodes[:5], nodes[:5])
+    assert calls == [25]
+
+
+def test_linear_space_uses_less_memory() -> None:
+    rng = random.Random(0)
+    base = _nodes(_tie_heavy_elements(rng, 300))
+    desired = _nodes(_tie_heavy_elements(rng, 300))
+
+    def _peak(fn: Callable[..., ContentAlignment]) -> int:
+        tracemalloc.start()
+        try:
+            fn(base, desired)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert _peak(_linear_space_dp_align) * 4 < _peak(_full_dp_align)
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(GOLDEN_DIR.glob("*_desired.json")),
+    ids=lambda p: p.stem,
+)
+def test_linear_space_diff_ops_match_on_golden(
+    path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base_path = path.with_name(path.name.replace("_desired", ""))
+    base = Document.model_validate(json.loads(base_path.read_text()))
+    desired = Document.model_validate(json.loads(path.read_text()))
+    expected = diff(base, desired)
+    monkeypatch.setattr(content_align, "LINEAR_SPACE_DP_MIN_CELLS", 0)
+    monkeypatch.setattr(content_align, "LINEAR_SPACE_DP_LEAF_CELLS", 16)
+    assert diff(base, desired) == expected
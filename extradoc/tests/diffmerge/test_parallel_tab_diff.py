@@ -0,0 +1,108 @@
+"""Tests for pooled (thread / process) tab diffing in ``diff_documents``.
+
+Parallel modes must produce exactly the serial op list, in the same order,
+with the same ``DiffStats``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+from extradoc import DocsClient
+from extradoc.api_types._generated import Document
+from extradoc.diffmerge import DiffStats, diff
+from extradoc.reconcile_v3.api import reconcile_batches
+from extradoc.transport import LocalFileTransport
+
+# ``extradoc.diffmerge.diff`` is shadowed by the ``diff`` function re-export.
+diff_module = importlib.import_module("extradoc.diffmerge.diff")
+
+GOLDEN_DIR = Path(__file__).parent.parent / "golden"
+MULTITAB_GOLDEN_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+def _multitab_edit_every_tab() -> tuple[Document, Document]:
+    raw = json.loads((GOLDEN_DIR / f"{MULTITAB_GOLDEN_ID}.json").read_text())
+    edited = copy.deepcopy(raw)
+    for i, tab in enumerate(edited["tabs"]):
+        content = tab["documentTab"]["body"]["content"]
+        for el in content[1:]:
+            if "paragraph" in el:
+                el["paragraph"]["elements"] = [
+                    {"textRun": {"content": f"Edited tab {i}.\n", "textStyle": {}}}
+                ]
+                break
+    return Document.model_validate(raw), Document.model_validate(edited)
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_pooled_diff_matches_serial(
+    mode: diff_module.TabExecutorMode, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base, desired = _multitab_edit_every_tab()
+    serial_stats = DiffStats()
+    serial = diff(base, desired, stats=serial_stats)
+    assert len(desired.tabs or []) > 1
+    assert serial
+
+    monkeypatch.setattr(diff_module, "PARALLEL_DIFF_MIN_ELEMENTS", 0)
+    pooled_stats = DiffStats()
+    pooled = diff(base, desired, stats=pooled_stats, tab_executor=mode, max_workers=2)
+
+    assert pooled == serial
+    assert pooled_stats == serial_stats
+
+
+def test_small_documents_stay_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    base, desired = _multitab_edit_every_tab()
+
+    def _no_pool(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("pool should not be created below the threshold")
+
+    monkeypatch.setattr(diff_module, "ThreadPoolExecutor", _no_pool)
+    monkeypatch.setattr(diff_module, "ProcessPoolExecutor", _no_pool)
+    assert diff(base, desired, tab_executor="process") == diff(base, desired)
+
+
+def test_reconcile_batches_accepts_tab_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base, desired = _multitab_edit_every_tab()
+    monkeypatch.setattr(diff_module, "PARALLEL_DIFF_MIN_ELEMENTS", 0)
+    assert reconcile_batches(base, desired, tab_executor="thread") == (
+        reconcile_batches(base, desired)
+    )
+
+
+def test_client_diff_passes_pool_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = DocsClient(LocalFileTransport(GOLDEN_DIR))
+    asyncio.run(client.pull(MULTITAB_GOLDEN_ID, tmp_path, format="markdown"))
+    folder = tmp_path / MULTITAB_GOLDEN_ID
+    # Two edited tabs are enough to reach the pool
+    for tab_file in sorted((folder / "tabs").glob("*.md"))[:2]:
+        tab_file.write_text(
+            tab_file.read_text(encoding="utf-8") + "\nEdited.\n", encoding="utf-8"
+        )
+    serial = client.diff(folder).batches
+
+    sizes: list[int | None] = []
+    thread_pool = diff_module.ThreadPoolExecutor
+
+    def _pool(max_workers: int | None = None) -> object:
+        sizes.append(max_workers)
+        return thread_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(diff_module, "PARALLEL_DIFF_MIN_ELEMENTS", 0)
+    monkeypatch.setattr(diff_module, "ThreadPoolExecutor", _pool)
+    pooled = client.diff(folder, tab_executor="thread", max_workers=3).batches
+
+    assert sizes == [3]
+    assert pooled == serial
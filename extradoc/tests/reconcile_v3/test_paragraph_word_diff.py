@@ -0,0 +1,157 @@
+"""Tests for the word-level pre-pass in paragraph text diffing.
+
+Long paragraphs are aligned on word/whitespace tokens first and diffed at
+the character level only inside changed token windows.  The opcodes must
+still transform base into desired exactly, and the lowered requests must
+stay minimal for small edits to long paragraphs.
+"""
+
+from __future__ import annotations
+
+import difflib
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from extradoc.diffmerge import diff
+from extradoc.reconcile_v3 import lower
+from extradoc.reconcile_v3.lower import _paragraph_opcodes, lower_ops
+from tests.reconcile_v3.helpers import (
+    make_indexed_doc,
+    make_indexed_para,
+    make_indexed_terminal,
+    make_para_el,
+    make_terminal_para,
+)
+
+if TYPE_CHECKING:
+    from extradoc.api_types._generated import Request
+
+_CLAUSE = (
+    "The Supplier shall indemnify, defend and hold harmless the Customer "
+    "from and against any and all losses, damages, liabilities, costs and "
+    "expenses (including reasonable legal fees) arising out of or in "
+    "connection with any breach of this Agreement by the Supplier. "
+)
+
+
+def _long_text(rng: random.Random, words: int) -> str:
+    """Non-repetitive prose-like text (repeated clauses make any diff
+    ambiguous, so the minimality assertions would be meaningless)."""
+    vocab = _CLAUSE.split() + [f"term{i}" for i in range(200)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+def _apply_opcodes(
+    base: str, desired: str, opcodes: list[tuple[str, int, int, int, int]]
+) -> str:
+    out: list[str] = []
+    cursor_i = cursor_j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (cursor_i, cursor_j), "opcodes must be contiguous"
+        if tag == "equal":
+            assert base[i1:i2] == desired[j1:j2]
+        out.append(desired[j1:j2])
+        cursor_i, cursor_j = i2, j2
+    assert (cursor_i, cursor_j) == (len(base), len(desired))
+    return "".join(out)
+
+
+def _apply_requests(text: str, requests: list[Request], offset: int = 1) -> str:
+    """Apply text-level requests to a body string that starts at *offset*."""
+    for req in requests:
+        if req.delete_content_range is not None:
+            rng = req.delete_content_range.range
+            assert rng is not None
+            start = (rng.start_index or 0) - offset
+            end = (rng.end_index or 0) - offset
+            text = text[:start] + text[end:]
+        elif req.insert_text is not None:
+            loc = req.insert_text.location
+            assert loc is not None
+            pos = (loc.index or 0) - offset
+            text = text[:pos] + (req.insert_text.text or "") + text[pos:]
+    return text
+
+
+def _edit_words(rng: random.Random, text: str, edits: int) -> str:
+    words = text.split(" ")
+    for _ in range(edits):
+        idx = rng.randrange(len(words))
+        choice = rng.random()
+        if choice < 0.3:
+            words[idx] = words[idx][::-1]
+        elif choice < 0.6:
+            words.insert(idx, "newly-added")
+        else:
+            del words[idx]
+    return " ".join(words)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_opcodes_reconstruct_desired(seed: int) -> None:
+    rng = random.Random(seed)
+    base = _long_text(rng, 300)
+    desired = _edit_words(rng, base, 12)
+    opcodes = _paragraph_opcodes(base, desired)
+    assert _apply_opcodes(base, desired, opcodes) == desired
+
+
+def test_short_paragraphs_keep_character_diff() -> None:
+    base, desired = "hello world", "hello there world"
+    assert _paragraph_opcodes(base, desired) == (
+        difflib.SequenceMatcher(None, base, desired, autojunk=False).get_opcodes()
+    )
+
+
+def test_single_word_edit_in_long_clause_matches_character_diff() -> None:
+    base = _CLAUSE * 6
+    desired = base.replace("indemnify", "indemnifies", 1)
+    changes = [op for op in _paragraph_opcodes(base, desired) if op[0] != "equal"]
+    char_changes = [
+        op
+        for op in difflib.SequenceMatcher(
+            None, base, desired, autojunk=False
+        ).get_opcodes()
+        if op[0] != "equal"
+    ]
+    assert changes == char_changes == [("replace", 27, 28, 27, 30)]
+
+
+@pytest.mark.parametrize("cap", [1, 50])
+def test_work_cap_still_reconstructs_desired(
+    cap: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(lower, "_DIFF_MAX_CELLS", cap)
+    rng = random.Random(cap)
+    base = _long_text(rng, 150)
+    desired = _edit_words(rng, base, 8)
+    opcodes = _paragraph_opcodes(base, desired)
+    assert _apply_opcodes(base, desired, opcodes) == desired
+
+
+def test_long_paragraph_requests_apply_to_desired() -> None:
+    rng = random.Random(7)
+    base_text = _long_text(rng, 200) + "\n"
+    desired_text = _edit_words(rng, base_text.rstrip("\n"), 6) + "\n"
+    base = make_indexed_doc(
+        body_content=[
+            make_indexed_para(base_text, 1),
+            make_indexed_terminal(1 + len(base_text)),
+        ]
+    )
+    desired = make_indexed_doc(
+        body_content=[make_para_el(desired_text), make_terminal_para()]
+    )
+
+    requests = lower_ops(diff(base, desired))
+
+    assert _apply_requests(base_text, requests) == desired_text
+    deleted = sum(
+        (r.delete_content_range.range.end_index or 0)
+        - (r.delete_content_range.range.start_index or 0)
+        for r in requests
+        if r.delete_content_range is not None and r.delete_content_range.range
+    )
+    assert deleted < 100
@@ -0,0 +1,66 @@
+"""Tests for the placeholder patch tables recorded on lowered batches."""
+
+from __future__ import annotations
+
+from extradoc.api_types._generated import BatchUpdateDocumentRequest
+from extradoc.reconcile_v3.api import reconcile_batches
+from extradoc.reconcile_v3.executor import resolve_deferred_placeholders
+from extradoc.reconcile_v3.placeholders import LoweredBatch
+from tests.reconcile_v3.helpers import (
+    make_document,
+    make_para_el,
+    make_tab,
+    make_terminal_para,
+)
+
+
+def _new_tab_batches() -> list[BatchUpdateDocumentRequest]:
+    base = make_document(tabs=[make_tab("t1", "Tab 1", 0)])
+    desired = make_document(
+        tabs=[
+            make_tab("t1", "Tab 1", 0),
+            make_tab(
+                "t2",
+                "Tab 2",
+                1,
+                body_content=[make_para_el("Hello\n"), make_terminal_para()],
+            ),
+        ]
+    )
+    return reconcile_batches(base, desired)
+
+
+def test_lowered_batches_record_placeholder_fields() -> None:
+    create, content = _new_tab_batches()
+
+    assert isinstance(create, LoweredBatch)
+    assert isinstance(content, LoweredBatch)
+    assert create.placeholders == ()
+    assert content.placeholders
+    for slot in content.placeholders:
+        assert slot.path[-1] == "tab_id"
+        assert slot.deferred_id.response_path == "addDocumentTab.tabProperties.tabId"
+
+
+def test_resolve_patches_only_recorded_fields() -> None:
+    create, content = _new_tab_batches()
+    responses = [
+        {"replies": [{"addDocumentTab": {"tabProperties": {"tabId": "t2-real"}}}]}
+    ]
+
+    assert resolve_deferred_placeholders([], create) is create
+
+    resolved = resolve_deferred_placeholders(responses, content)
+    insert = next(r.insert_text for r in resolved.requests or [] if r.insert_text)
+    assert insert.location is not None
+    assert insert.location.tab_id == "t2-real"
+    # The lowered batch itself still holds its placeholders
+    original = next(r.insert_text for r in content.requests or [] if r.insert_text)
+    assert original.location is not None
+    assert original.location.tab_id != "t2-real"
+
+    # A plain batch (no recorded table) resolves to the same request body
+    plain = BatchUpdateDocumentRequest(requests=content.requests)
+    assert resolve_deferred_placeholders(responses, plain).model_dump(
+        by_alias=True, exclude_none=True
+    ) == resolved.model_dump(by_alias=True, exclude_none=True)
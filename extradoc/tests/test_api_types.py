@@ -0,0 +1,62 @@
+"""Tests for the deferred-build API models and their shared adapters."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from extradoc.api_types import load_document, type_adapter
+from extradoc.api_types._generated import Document, Request
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+_FIRST_USE_SCRIPT = """
+import json
+from extradoc.api_types._generated import Document, Paragraph, Request, Tab
+
+before = [Document.__pydantic_complete__, Tab.__pydantic_complete__]
+Document.model_validate({"documentId": "d", "tabs": [{"tabProperties": {"tabId": "t"}}]})
+after = [
+    Document.__pydantic_complete__,
+    Tab.__pydantic_complete__,
+    Paragraph.__pydantic_complete__,
+    Request.__pydantic_complete__,
+]
+print(json.dumps({"before": before, "after": after}))
+"""
+
+
+def test_models_build_on_first_use_dependencies_first() -> None:
+    # A fresh interpreter: models built by other tests would hide the effect
+    out = subprocess.run(
+        [sys.executable, "-c", _FIRST_USE_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    state = json.loads(out.stdout)
+
+    assert state["before"] == [False, False]
+    # Document's nested models were built with it; unrelated ones were not
+    assert state["after"] == [True, True, True, False]
+
+
+def test_type_adapter_is_cached_and_shares_the_model_validator() -> None:
+    adapter = type_adapter(Request)
+    request = adapter.validate_python({"insertText": {"text": "x"}})
+
+    assert type_adapter(Request) is adapter
+    assert request.insert_text is not None
+    assert adapter.validator is Request.__pydantic_validator__
+
+
+def test_load_document_matches_model_validate() -> None:
+    path = GOLDEN_DIR / "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ.json"
+    content = path.read_bytes()
+
+    document = load_document(content)
+
+    assert document == Document.model_validate(json.loads(content))
+    assert load_document(content.decode("utf-8")) == document
@@ -0,0 +1,172 @@
+"""Tests for skipping pulls of folders that are already up to date."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from extradoc import DocsClient, GoogleDocsTransport
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    InsertTextRequest,
+    Location,
+    Request,
+)
+from extradoc.comments._from_raw import modified_high_water_mark
+from extradoc.mock.server import MockDocsServer
+from extradoc.serde._models import IndexXml
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from extradoc.transport import DocumentData
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+class _CountingTransport(GoogleDocsTransport):
+    """Counts full document fetches."""
+
+    def __init__(self, server: MockDocsServer) -> None:
+        super().__init__(
+            "token",
+            api_base="http://mock/v1/documents",
+            drive_api_base="http://mock/drive/v3/files/",
+            http_transport=server.transport(),
+        )
+        self.full_fetches = 0
+
+    async def get_document(self, document_id: str) -> DocumentData:
+        self.full_fetches += 1
+        return await super().get_document(document_id)
+
+
+def _server() -> MockDocsServer:
+    server = MockDocsServer(seed=0)
+    raw = json.loads((GOLDEN_DIR / f"{DOCUMENT_ID}.json").read_text())
+    comments = [
+        {
+            "id": "c1",
+            "content": "Comment",
+            "modifiedTime": "2024-01-01T00:00:00.000Z",
+            "replies": [],
+        }
+    ]
+    server.add_document(DOCUMENT_ID, raw, comments)
+    return server
+
+
+def _pulls(
+    tmp_path: Path,
+    change: Callable[[_CountingTransport, Path], Awaitable[None]],
+    *,
+    format: str = "markdown",
+) -> list[tuple[bool, int]]:
+    """Pull, pull again, apply *change*, pull twice more.
+
+    Returns (wrote the folder, full document fetches) for each pull.
+    """
+    server = _server()
+    transport = _CountingTransport(server)
+    client = DocsClient(transport)
+    results: list[tuple[bool, int]] = []
+
+    async def _pull() -> None:
+        transport.full_fetches = 0
+        wrote = await client.pull(DOCUMENT_ID, tmp_path, format=format)
+        results.append((wrote, transport.full_fetches))
+
+    async def _run() -> None:
+        try:
+            await _pull()
+            await _pull()
+            await change(transport, tmp_path / DOCUMENT_ID)
+            await _pull()
+            await _pull()
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
+    return results
+
+
+async def _reply(transport: _CountingTransport, _folder: Path) -> None:
+    await transport.create_reply(DOCUMENT_ID, "c1", "Done", action="resolve")
+
+
+async def _delete_comment(transport: _CountingTransport, _folder: Path) -> None:
+    await transport.delete_comment(DOCUMENT_ID, "c1")
+
+
+async def _edit_document(transport: _CountingTransport, _folder: Path) -> None:
+    insert = InsertTextRequest(text="Hi", location=Location(index=1))
+    batch = BatchUpdateDocumentRequest(requests=[Request(insert_text=insert)])
+    await transport.batch_update(DOCUMENT_ID, batch)
+
+
+async def _edit_local_file(_transport: _CountingTransport, folder: Path) -> None:
+    tab_file = next(p for p in sorted(folder.rglob("*.md")) if p.name != "index.md")
+    tab_file.write_text(tab_file.read_text(encoding="utf-8") + "\nLocal edit.\n")
+
+
+@pytest.mark.parametrize(
+    "change", [_reply, _delete_comment, _edit_document, _edit_local_file]
+)
+def test_pull_skips_until_something_changes(
+    tmp_path: Path, change: Callable[[_CountingTransport, Path], Awaitable[None]]
+) -> None:
+    assert _pulls(tmp_path, change) == [(True, 1), (False, 0), (True, 1), (False, 0)]
+
+
+def test_pull_skip_works_for_xml_folders(tmp_path: Path) -> None:
+    results = _pulls(tmp_path, _edit_document, format="xml")
+
+    assert results == [(True, 1), (False, 0), (True, 1), (False, 0)]
+
+
+def test_pull_rewrites_for_another_format_or_when_forced(tmp_path: Path) -> None:
+    server = _server()
+    transport = _CountingTransport(server)
+    client = DocsClient(transport)
+
+    async def _run() -> list[bool]:
+        try:
+            return [
+                await client.pull(DOCUMENT_ID, tmp_path, format="markdown"),
+                await client.pull(DOCUMENT_ID, tmp_path, format="markdown", force=True),
+                await client.pull(DOCUMENT_ID, tmp_path, format="xml"),
+            ]
+        finally:
+            await transport.close()
+
+    assert asyncio.run(_run()) == [True, True, True]
+
+
+def test_pull_records_comment_high_water_mark(tmp_path: Path) -> None:
+    results = _pulls(tmp_path, _reply)
+    index = IndexXml.from_xml_string(
+        (tmp_path / DOCUMENT_ID / ".extrasuite" / "index.xml").read_text()
+    )
+
+    assert results[2] == (True, 1)
+    assert index.comments_modified is not None
+    assert index.comments_modified > "2024-01-01T00:00:00.000Z"
+    assert IndexXml.from_xml_string(index.to_xml_string()) == index
+
+
+def test_modified_high_water_mark_covers_replies() -> None:
+    raw = [
+        {
+            "modifiedTime": "2024-01-02T00:00:00.000Z",
+            "replies": [{"modifiedTime": "2024-03-01T00:00:00.000Z"}],
+        },
+        {"createdTime": "2024-02-01T00:00:00.000Z"},
+    ]
+
+    assert modified_high_water_mark(raw) == "2024-03-01T00:00:00.000Z"
+    assert modified_high_water_mark([]) is None
@@ -1,6 +1,6 @@
 """Tests for the Google Docs index utilities."""
 
-from extradoc.indexer import utf16_len
+from extradoc.indexer import utf16_len, utf16_offsets
 
 
 class TestUtf16Len:
@@ -49,3 +49,44 @@ class TestUtf16Len:
         # Japanese + emoji
         assert utf16_len("こんにちは") == 5  # All BMP
         assert utf16_len("こんにちは😀") == 7  # 5 + 2
+
+
+def _reference_offsets(text: str) -> list[int]:
+    offsets = [0]
+    for ch in text:
+        offsets.append(offsets[-1] + (2 if ord(ch) > 0xFFFF else 1))
+    return offsets
+
+
+class TestUtf16Offsets:
+    """Tests for the cached code-point → UTF-16 offset map."""
+
+    def test_bmp_text_is_identity(self) -> None:
+        """Pure-BMP text needs no prefix array."""
+        offsets = utf16_offsets("I\u2019m here")
+        assert len(offsets) == 9
+        assert [offsets[i] for i in range(9)] == list(range(9))
+        assert offsets[-1] == offsets.length == 8
+        assert offsets.to_codepoint(5) == 5
+        assert offsets.to_codepoint(50) == 8
+
+    def test_surrogate_pairs(self) -> None:
+        """Offsets after an emoji move by two code units."""
+        text = "a\U0001f600b\U0001f44dc\ud800"
+        offsets = utf16_offsets(text)
+        expected = _reference_offsets(text)
+        assert [offsets[i] for i in range(len(text) + 1)] == expected
+        assert offsets.length == utf16_len(text) == expected[-1]
+
+    def test_to_codepoint_rounds_up_inside_a_pair(self) -> None:
+        """A UTF-16 offset inside a surrogate pair maps past the pair."""
+        offsets = utf16_offsets("\U0001f600a")
+        assert offsets.to_codepoint(0) == 0
+        assert offsets.to_codepoint(1) == 1
+        assert offsets.to_codepoint(2) == 1
+        assert offsets.to_codepoint(3) == 2
+        assert offsets.to_codepoint(9) == 2
+
+    def test_cached_per_string(self) -> None:
+        """The same string returns the same map."""
+        assert utf16_offsets("x\U0001f600") is utf16_offsets("x\U0001f600")
@@ -0,0 +1,226 @@
+"""Tests for the undo journal behind MockGoogleDocsAPI batch rollback."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from extradoc.api_types._generated import Document
+from extradoc.mock import MockAPIError, MockGoogleDocsAPI, ValidationError
+from extradoc.mock.journal import TouchedLocation, touched_locations
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "18WZe578kHC0DP4Q1c-hhs15VWUJlFYNMvSwtzk-Wgbo"
+
+_BAD_REQUEST = {"insertText": {"location": {"index": 10**9}, "text": "x"}}
+
+
+def _mock() -> MockGoogleDocsAPI:
+    raw = json.loads((GOLDEN_DIR / f"{DOCUMENT_ID}.json").read_text())
+    return MockGoogleDocsAPI(Document.model_validate(raw))
+
+
+def _snapshot(mock: MockGoogleDocsAPI) -> dict[str, Any]:
+    return {
+        "document": copy.deepcopy(mock._document),
+        "named_ranges": copy.deepcopy(mock._named_ranges),
+        "header_types": set(mock._header_types),
+        "revision": mock._revision_id,
+    }
+
+
+def _assert_rolls_back(mock: MockGoogleDocsAPI, requests: list[dict[str, Any]]) -> None:
+    before = _snapshot(mock)
+    with pytest.raises(ValidationError):
+        mock._batch_update_raw([*requests, _BAD_REQUEST])
+    assert _snapshot(mock) == before
+
+
+def _tab_id(mock: MockGoogleDocsAPI) -> str:
+    return mock._document["tabs"][0]["tabProperties"]["tabId"]
+
+
+def test_touched_locations_reads_locations_and_ranges() -> None:
+    locations = touched_locations(
+        {
+            "updateTextStyle": {
+                "range": {"startIndex": 5, "endIndex": 9, "tabId": "t.1"},
+                "textStyle": {"bold": True},
+                "fields": "bold",
+            }
+        }
+    )
+    assert locations == [TouchedLocation("t.1", None, 5, 9)]
+
+    locations = touched_locations(
+        {"insertText": {"endOfSegmentLocation": {"segmentId": "kix.h"}, "text": "x"}}
+    )
+    assert locations == [TouchedLocation(None, "kix.h", -1, -1)]
+
+
+def test_failed_first_batch_restores_document() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    _assert_rolls_back(
+        mock,
+        [{"insertText": {"location": {"index": 1, "tabId": tab_id}, "text": "Hi\n"}}],
+    )
+
+
+def test_failed_batch_after_commit_restores_touched_elements() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    mock._batch_update_raw(
+        [{"insertText": {"location": {"index": 1, "tabId": tab_id}, "text": "A"}}]
+    )
+    _assert_rolls_back(
+        mock,
+        [
+            {
+                "insertTable": {
+                    "rows": 2,
+                    "columns": 2,
+                    "location": {"index": 17298, "tabId": tab_id},
+                }
+            },
+            {
+                "updateParagraphStyle": {
+                    "range": {"startIndex": 6688, "endIndex": 6690, "tabId": tab_id},
+                    "paragraphStyle": {"namedStyleType": "HEADING_1"},
+                    "fields": "namedStyleType",
+                }
+            },
+            {
+                "deleteContentRange": {
+                    "range": {"startIndex": 20, "endIndex": 60, "tabId": tab_id}
+                }
+            },
+            {
+                "createParagraphBullets": {
+                    "range": {"startIndex": 100, "endIndex": 140, "tabId": tab_id},
+                    "bulletPreset": "BULLET_DISC_CIRCLE_SQUARE",
+                }
+            },
+        ],
+    )
+
+
+def test_failed_batch_drops_created_tabs_segments_and_named_ranges() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    mock._batch_update_raw(
+        [{"insertText": {"location": {"index": 1, "tabId": tab_id}, "text": "A"}}]
+    )
+    _assert_rolls_back(
+        mock,
+        [
+            {"addDocumentTab": {"tabProperties": {"title": "New"}}},
+            {"createHeader": {"type": "DEFAULT"}},
+            {"createFootnote": {"location": {"index": 30, "tabId": tab_id}}},
+            {
+                "createNamedRange": {
+                    "name": "x",
+                    "range": {"startIndex": 40, "endIndex": 50, "tabId": tab_id},
+                }
+            },
+        ],
+    )
+
+
+def test_failed_document_wide_request_restores_all_tabs() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    mock._batch_update_raw(
+        [{"insertText": {"location": {"index": 1, "tabId": tab_id}, "text": "A"}}]
+    )
+    _assert_rolls_back(
+        mock,
+        [
+            {
+                "replaceAllText": {
+                    "containsText": {"text": "the", "matchCase": False},
+                    "replaceText": "THE",
+                }
+            }
+        ],
+    )
+
+
+def _random_request(
+    rng: random.Random, mock: MockGoogleDocsAPI, tab_id: str
+) -> dict[str, Any]:
+    doc_tab = mock._document["tabs"][0]["documentTab"]
+    body_end = doc_tab["body"]["content"][-1]["endIndex"]
+    segment_ids = [*doc_tab.get("footnotes", {}), *doc_tab.get("footers", {})]
+    # Style requests name a non-body segment but edit the body anyway.
+    segment_id = rng.choice([None, *segment_ids])
+    start = rng.randrange(1, body_end - 50)
+    span = {"startIndex": start, "endIndex": start + rng.randrange(1, 40)}
+    styled = {**span, "tabId": tab_id}
+    if segment_id is not None:
+        styled["segmentId"] = segment_id
+    choices: list[dict[str, Any]] = [
+        {"insertText": {"location": {"index": start, "tabId": tab_id}, "text": "a\nb"}},
+        {
+            "insertText": {
+                "endOfSegmentLocation": {
+                    "tabId": tab_id,
+                    "segmentId": rng.choice(segment_ids),
+                },
+                "text": "x",
+            }
+        },
+        {"deleteContentRange": {"range": {**span, "tabId": tab_id}}},
+        {
+            "updateParagraphStyle": {
+                "range": styled,
+                "paragraphStyle": {"namedStyleType": "HEADING_1"},
+                "fields": "namedStyleType",
+            }
+        },
+        {
+            "updateTextStyle": {
+                "range": styled,
+                "textStyle": {"bold": True},
+                "fields": "bold",
+            }
+        },
+        {
+            "createParagraphBullets": {
+                "range": styled,
+                "bulletPreset": "BULLET_DISC_CIRCLE_SQUARE",
+            }
+        },
+        {"deleteParagraphBullets": {"range": styled}},
+        {
+            "replaceAllText": {
+                "containsText": {"text": "the", "matchCase": False},
+                "replaceText": "THE",
+            }
+        },
+    ]
+    return rng.choice(choices)
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_failed_random_batches_restore_document(seed: int) -> None:
+    rng = random.Random(seed)
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    mock._batch_update_raw(
+        [{"insertText": {"location": {"index": 1, "tabId": tab_id}, "text": "A"}}]
+    )
+    for _ in range(3):
+        requests = [
+            _random_request(rng, mock, tab_id) for _ in range(rng.randrange(1, 5))
+        ]
+        before = copy.deepcopy(mock._document)
+        # Any request may fail on its own; the batch must still roll back.
+        with pytest.raises(MockAPIError):
+            mock._batch_update_raw([*requests, _BAD_REQUEST])
+        assert mock._document == before, requests
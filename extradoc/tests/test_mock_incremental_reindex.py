@@ -0,0 +1,146 @@
+"""Tests for the dirty-region reindex pass in MockGoogleDocsAPI."""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+from extradoc.api_types._generated import Document
+from extradoc.mock import MockGoogleDocsAPI
+from extradoc.mock.dirty import dirty_regions
+from extradoc.mock.reindex import (
+    reindex_and_normalize_all_tabs,
+    reindex_and_normalize_tab,
+)
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "18WZe578kHC0DP4Q1c-hhs15VWUJlFYNMvSwtzk-Wgbo"
+
+
+def _mock() -> MockGoogleDocsAPI:
+    raw = json.loads((GOLDEN_DIR / f"{DOCUMENT_ID}.json").read_text())
+    mock = MockGoogleDocsAPI(Document.model_validate(raw), verify_reindex=True)
+    tab_id = mock._document["tabs"][0]["tabProperties"]["tabId"]
+    mock._batch_update_raw(
+        [{"insertText": {"location": {"index": 1, "tabId": tab_id}, "text": "A"}}]
+    )
+    return mock
+
+
+def _tab_id(mock: MockGoogleDocsAPI) -> str:
+    return mock._document["tabs"][0]["tabProperties"]["tabId"]
+
+
+def test_dirty_region_covers_addressed_elements_only() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    body = mock._document["tabs"][0]["documentTab"]["body"]
+    regions = dirty_regions(
+        mock._document,
+        {"insertText": {"location": {"index": 6688, "tabId": tab_id}, "text": "x"}},
+    )
+
+    assert regions is not None
+    [region] = regions
+    assert region.segment is body
+    content = body["content"]
+    assert 0 < region.first < len(content) - region.tail < len(content)
+    assert content[region.first]["endIndex"] <= 6688
+    assert content[len(content) - region.tail - 1]["endIndex"] > 6688
+
+
+def test_segment_creating_requests_fall_back_to_full_pass() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    assert dirty_regions(mock._document, {"createHeader": {"type": "DEFAULT"}}) is None
+    assert (
+        dirty_regions(
+            mock._document,
+            {"createFootnote": {"location": {"index": 30, "tabId": tab_id}}},
+        )
+        is None
+    )
+
+
+def test_incremental_pass_matches_full_pass() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    requests: list[dict[str, Any]] = [
+        {"insertText": {"location": {"index": 6688, "tabId": tab_id}, "text": "a\nb"}},
+        {
+            "insertTable": {
+                "rows": 2,
+                "columns": 2,
+                "location": {"index": 17298, "tabId": tab_id},
+            }
+        },
+        {
+            "deleteContentRange": {
+                "range": {"startIndex": 20, "endIndex": 400, "tabId": tab_id}
+            }
+        },
+        {
+            "updateTextStyle": {
+                "range": {"startIndex": 1000, "endIndex": 1200, "tabId": tab_id},
+                "textStyle": {"bold": True},
+                "fields": "bold",
+            }
+        },
+        {
+            "createParagraphBullets": {
+                "range": {"startIndex": 100, "endIndex": 140, "tabId": tab_id},
+                "bulletPreset": "NUMBERED_DECIMAL_ALPHA_ROMAN",
+            }
+        },
+        {"insertPageBreak": {"location": {"index": 50, "tabId": tab_id}}},
+    ]
+
+    # verify_reindex=True raises MockAPIError on any divergence
+    mock._batch_update_raw(requests)
+
+    expected = copy.deepcopy(mock._document)
+    reindex_and_normalize_all_tabs(expected)
+    assert mock._document == expected
+
+
+def test_segment_blind_requests_reindex_the_whole_tab() -> None:
+    mock = _mock()
+    tab_id = _tab_id(mock)
+    footnote = {"tabId": tab_id, "segmentId": "kix.fn23"}
+    range_ = {"startIndex": 70, "endIndex": 200, **footnote}
+    requests: list[dict[str, Any]] = [
+        # These handlers edit the body whatever segmentId says.
+        {
+            "updateParagraphStyle": {
+                "range": range_,
+                "paragraphStyle": {"namedStyleType": "HEADING_1"},
+                "fields": "namedStyleType",
+            }
+        },
+        {
+            "updateTextStyle": {
+                "range": range_,
+                "textStyle": {"bold": True},
+                "fields": "bold",
+            }
+        },
+        {
+            "createParagraphBullets": {
+                "range": range_,
+                "bulletPreset": "NUMBERED_DECIMAL_ALPHA_ROMAN",
+            }
+        },
+        {"insertPageBreak": {"endOfSegmentLocation": footnote}},
+    ]
+
+    [region] = dirty_regions(mock._document, requests[0]) or []
+    assert region.segment is None
+
+    mock._verify_reindex = False
+    for request in requests:
+        mock._batch_update_raw([request])
+        expected = copy.deepcopy(mock._document)
+        reindex_and_normalize_tab(expected["tabs"][0])
+        assert mock._document == expected, request
@@ -0,0 +1,105 @@
+"""Tests for the bisect-based element lookups in extradoc.mock.navigation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from extradoc.mock import ValidationError
+from extradoc.mock.navigation import (
+    element_at_index,
+    find_table_at_index,
+    first_element_ending_after,
+    get_paragraphs_in_range,
+)
+from extradoc.mock.reindex import reindex_and_normalize_all_tabs
+
+
+def _para(text: str) -> dict[str, Any]:
+    return {"paragraph": {"elements": [{"textRun": {"content": text}}]}}
+
+
+def _table(rows: int, columns: int) -> dict[str, Any]:
+    return {
+        "table": {
+            "tableRows": [
+                {
+                    "tableCells": [
+                        {"content": [_para(f"r{r}c{c}\n")]} for c in range(columns)
+                    ]
+                }
+                for r in range(rows)
+            ]
+        }
+    }
+
+
+def _tab() -> dict[str, Any]:
+    content = [{"sectionBreak": {}}]
+    content += [_para(f"Para {i}\n") for i in range(10)]
+    content += [_table(3, 2)]
+    content += [_para(f"After {i}\n") for i in range(10)]
+    document = {
+        "tabs": [
+            {
+                "tabProperties": {"tabId": "t.0"},
+                "documentTab": {"body": {"content": content}},
+            }
+        ]
+    }
+    reindex_and_normalize_all_tabs(document)
+    tab: dict[str, Any] = document["tabs"][0]
+    return tab
+
+
+def _texts(paragraphs: list[dict[str, Any]]) -> list[str]:
+    return [p["elements"][0]["textRun"]["content"].strip() for p in paragraphs]
+
+
+def test_element_lookup_bisects_content() -> None:
+    content = _tab()["documentTab"]["body"]["content"]
+    para = content[3]
+
+    assert element_at_index(content, para["startIndex"]) == (para, 3)
+    assert element_at_index(content, para["endIndex"] - 1) == (para, 3)
+    assert first_element_ending_after(content, para["endIndex"]) == 4
+    assert first_element_ending_after(content, para["endIndex"], inclusive=True) == 3
+    assert element_at_index(content, content[-1]["endIndex"]) is None
+
+
+def test_paragraphs_in_range_descend_into_overlapping_cells() -> None:
+    tab = _tab()
+    content = tab["documentTab"]["body"]["content"]
+    table = content[11]
+    cell = table["table"]["tableRows"][1]["tableCells"][1]["content"][0]
+
+    assert _texts(
+        get_paragraphs_in_range(tab, cell["startIndex"], cell["endIndex"])
+    ) == ["r1c1"]
+    assert _texts(
+        get_paragraphs_in_range(tab, content[10]["startIndex"], table["startIndex"] + 10)
+    ) == ["Para 9", "r0c0", "r0c1"]
+    assert _texts(
+        get_paragraphs_in_range(
+            tab, content[12]["startIndex"], content[13]["startIndex"], inclusive=True
+        )
+    ) == ["After 0"]
+    # Inclusive ranges also pick up the paragraph ending at start_index
+    assert _texts(
+        get_paragraphs_in_range(
+            tab,
+            content[13]["startIndex"],
+            content[13]["startIndex"] + 1,
+            inclusive=True,
+        )
+    ) == ["After 0", "After 1"]
+
+
+def test_find_table_at_index() -> None:
+    segment = _tab()["documentTab"]["body"]
+    table = segment["content"][11]
+
+    assert find_table_at_index(segment, table["startIndex"]) == (table, 11)
+    with pytest.raises(ValidationError, match="Table not found"):
+        find_table_at_index(segment, table["startIndex"] + 1)
@@ -0,0 +1,181 @@
+"""Tests for MockDocsServer, the HTTP stand-in for the Docs / Drive APIs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from extradoc import APIError, DocsClient, GoogleDocsTransport, NotFoundError
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    InsertTextRequest,
+    Location,
+    Request,
+)
+from extradoc.mock.server import MockDocsServer
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+def _server(**kwargs: float) -> MockDocsServer:
+    server = MockDocsServer(seed=0, **kwargs)
+    raw = json.loads((GOLDEN_DIR / f"{DOCUMENT_ID}.json").read_text())
+    comments = [
+        {"id": f"c{i}", "content": f"Comment {i}", "replies": []} for i in range(5)
+    ]
+    server.add_document(DOCUMENT_ID, raw, comments)
+    return server
+
+
+def _transport(
+    server: MockDocsServer, http_transport: httpx.AsyncBaseTransport | None = None
+) -> GoogleDocsTransport:
+    return GoogleDocsTransport(
+        "token",
+        api_base="http://mock/v1/documents",
+        drive_api_base="http://mock/drive/v3/files/",
+        http_transport=http_transport or server.transport(),
+    )
+
+
+def test_pull_through_mock_server(tmp_path: Path) -> None:
+    server = _server()
+
+    async def _run() -> None:
+        transport = _transport(server)
+        try:
+            await DocsClient(transport).pull(DOCUMENT_ID, tmp_path)
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
+
+    assert (tmp_path / DOCUMENT_ID).is_dir()
+    assert server.requests[0] == ("GET", f"/v1/documents/{DOCUMENT_ID}")
+    assert server.requests[1] == ("GET", f"/drive/v3/files/{DOCUMENT_ID}/comments")
+
+
+def test_batch_update_and_comments_round_trip() -> None:
+    server = _server()
+    batch = BatchUpdateDocumentRequest(
+        requests=[
+            Request(
+                insert_text=InsertTextRequest(text="Hi", location=Location(index=1))
+            )
+        ]
+    )
+
+    async def _run() -> None:
+        transport = _transport(server)
+        try:
+            before = await transport.get_document(DOCUMENT_ID)
+            response = await transport.batch_update(DOCUMENT_ID, batch)
+            after = await transport.get_document(DOCUMENT_ID)
+            assert response["documentId"] == DOCUMENT_ID
+            assert after.raw["revisionId"] != before.raw["revisionId"]
+
+            # pageSize=100 from the transport still walks every page
+            server.comments[DOCUMENT_ID] *= 30
+            assert len(await transport.list_comments(DOCUMENT_ID)) == 150
+            server.comments[DOCUMENT_ID] = server.comments[DOCUMENT_ID][:5]
+
+            await transport.create_reply(DOCUMENT_ID, "c1", "Done", action="resolve")
+            await transport.edit_comment(DOCUMENT_ID, "c2", "Edited")
+            await transport.delete_comment(DOCUMENT_ID, "c3")
+            comments = {c["id"]: c for c in await transport.list_comments(DOCUMENT_ID)}
+            assert comments["c1"]["resolved"] is True
+            assert comments["c1"]["replies"][0]["action"] == "resolve"
+            assert comments["c2"]["content"] == "Edited"
+            assert comments["c3"]["deleted"] is True
+
+            with pytest.raises(NotFoundError):
+                await transport.delete_comment(DOCUMENT_ID, "c3")
+            with pytest.raises(NotFoundError):
+                await transport.get_document("missing")
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
+
+
+def test_rejected_batch_maps_to_api_error() -> None:
+    server = _server()
+    batch = BatchUpdateDocumentRequest(
+        requests=[
+            Request(
+                insert_text=InsertTextRequest(text="x", location=Location(index=10**9))
+            )
+        ]
+    )
+
+    async def _run() -> None:
+        transport = _transport(server)
+        try:
+            with pytest.raises(APIError) as excinfo:
+                await transport.batch_update(DOCUMENT_ID, batch)
+            assert excinfo.value.status_code == 400
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
+
+
+def test_injected_throttling_and_errors() -> None:
+    server = _server(throttle_rate=1.0)
+
+    async def _run() -> None:
+        transport = _transport(server)
+        try:
+            with pytest.raises(APIError) as excinfo:
+                await transport.get_document(DOCUMENT_ID)
+            assert excinfo.value.status_code == 429
+
+            server.throttle_rate, server.error_rate = 0.0, 1.0
+            with pytest.raises(APIError) as excinfo:
+                await transport.get_document(DOCUMENT_ID)
+            assert excinfo.value.status_code == 503
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
+
+
+def test_server_is_an_asgi_app() -> None:
+    server = _server()
+
+    async def _run() -> None:
+        transport = _transport(server, httpx.ASGITransport(app=server))
+        try:
+            document = await transport.get_document(DOCUMENT_ID)
+            assert document.document_id == DOCUMENT_ID
+            assert await transport.list_comments(DOCUMENT_ID)
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
+
+
+def test_document_get_honours_field_masks() -> None:
+    server = _server()
+
+    async def _run() -> None:
+        transport = _transport(server)
+        try:
+            revision_id = await transport.get_revision_id(DOCUMENT_ID)
+            assert revision_id == server.documents[DOCUMENT_ID]._revision_id
+            masked = await transport._request(
+                f"http://mock/v1/documents/{DOCUMENT_ID}"
+                "?includeTabsContent=true&fields=title,tabs(tabProperties/tabId)"
+            )
+            assert set(masked) == {"title", "tabs"}
+            assert all(set(t) == {"tabProperties"} for t in masked["tabs"])
+            assert all(set(t["tabProperties"]) == {"tabId"} for t in masked["tabs"])
+        finally:
+            await transport.close()
+
+    asyncio.run(_run())
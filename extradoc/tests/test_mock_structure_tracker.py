@@ -0,0 +1,76 @@
+"""Tests for the incrementally maintained DocumentStructureTracker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from extradoc.mock import ValidationError
+from extradoc.mock.dirty import dirty_regions, reindex_dirty_regions
+from extradoc.mock.reindex import reindex_and_normalize_all_tabs
+from extradoc.mock.table_ops import handle_insert_table
+from extradoc.mock.validation import DocumentStructureTracker
+
+
+def _para(text: str) -> dict[str, Any]:
+    return {"paragraph": {"elements": [{"textRun": {"content": text}}]}}
+
+
+def _document() -> dict[str, Any]:
+    content = [{"sectionBreak": {}}] + [_para(f"Paragraph {i}\n") for i in range(20)]
+    document = {
+        "tabs": [
+            {
+                "tabProperties": {"tabId": "t.0"},
+                "documentTab": {"body": {"content": content}},
+            }
+        ]
+    }
+    reindex_and_normalize_all_tabs(document)
+    return document
+
+
+def _insert_table(
+    document: dict[str, Any], tracker: DocumentStructureTracker, index: int
+) -> dict[str, Any]:
+    request = {"rows": 2, "columns": 2, "location": {"index": index, "tabId": "t.0"}}
+    regions = dirty_regions(document, {"insertTable": request})
+    assert regions is not None
+    handle_insert_table(document, request, tracker)
+    reindex_dirty_regions(regions)
+    tracker.update(regions)
+    body = document["tabs"][0]["documentTab"]["body"]["content"]
+    table: dict[str, Any] = next(el for el in body if "table" in el)
+    return table
+
+
+def test_update_matches_full_scan() -> None:
+    document = _document()
+    tracker = DocumentStructureTracker(document)
+
+    _insert_table(document, tracker, 40)
+
+    assert tracker == DocumentStructureTracker(document)
+    assert len(tracker.tables) == 1
+
+
+def test_validate_delete_range_against_tracked_table() -> None:
+    document = _document()
+    tracker = DocumentStructureTracker(document)
+    table = _insert_table(document, tracker, 40)
+    start, end = table["startIndex"], table["endIndex"]
+    cell = table["table"]["tableRows"][0]["tableCells"][0]["content"][0]
+
+    # Whole table, text outside it, and text inside a cell are fine
+    tracker.validate_delete_range(start, end, "t.0")
+    tracker.validate_delete_range(1, 5, "t.0")
+    tracker.validate_delete_range(end + 1, end + 4, "t.0")
+    tracker.validate_delete_range(cell["startIndex"], cell["startIndex"], "t.0")
+
+    with pytest.raises(ValidationError, match="partially delete table"):
+        tracker.validate_delete_range(start - 3, start + 2, "t.0")
+    with pytest.raises(ValidationError, match="newline before table"):
+        tracker.validate_delete_range(start - 1, start, "t.0")
+    with pytest.raises(ValidationError, match="structural"):
+        tracker.validate_delete_range(start + 1, start + 3, "t.0")
@@ -0,0 +1,177 @@
+"""Tests for refreshing the local folder after a push (``push(refresh=True)``)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from extradoc import DocsClient, GoogleDocsTransport
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    CreateNamedRangeRequest,
+    Document,
+    InsertTextRequest,
+    Location,
+    Range,
+    Request,
+)
+from extradoc.mock.replay import ReplayDivergedError, replay_batches
+from extradoc.mock.server import MockDocsServer
+
+if TYPE_CHECKING:
+    from extradoc.transport import DocumentData
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+class _CountingTransport(GoogleDocsTransport):
+    """Counts full document fetches; optionally reports a foreign revision."""
+
+    def __init__(self, server: MockDocsServer, *, stale: bool = False) -> None:
+        super().__init__(
+            "token",
+            api_base="http://mock/v1/documents",
+            drive_api_base="http://mock/drive/v3/files/",
+            http_transport=server.transport(),
+        )
+        self.full_fetches = 0
+        self._stale = stale
+
+    async def get_document(self, document_id: str) -> DocumentData:
+        self.full_fetches += 1
+        return await super().get_document(document_id)
+
+    async def get_revision_id(self, document_id: str) -> str | None:
+        revision_id = await super().get_revision_id(document_id)
+        return f"{revision_id}-edited-elsewhere" if self._stale else revision_id
+
+
+def _golden() -> Document:
+    return Document.model_validate(
+        json.loads((GOLDEN_DIR / f"{DOCUMENT_ID}.json").read_text())
+    )
+
+
+def _push_edit(
+    tmp_path: Path, text: str, *, stale: bool = False
+) -> tuple[str | None, int, MockDocsServer, Path]:
+    """Pull, append *text* to the first tab, push with refresh.
+
+    Returns (refreshed, full fetches during push, server, folder).
+    """
+    server = MockDocsServer(seed=0)
+    server.add_document(DOCUMENT_ID, _golden())
+    transport = _CountingTransport(server, stale=stale)
+    client = DocsClient(transport)
+    folder = tmp_path / DOCUMENT_ID
+
+    async def _run() -> tuple[str | None, int]:
+        try:
+            await client.pull(DOCUMENT_ID, tmp_path, format="markdown")
+            tab_file = next(
+                p for p in sorted(folder.rglob("*.md")) if p.name != "index.md"
+            )
+            tab_file.write_text(
+                tab_file.read_text(encoding="utf-8") + text, encoding="utf-8"
+            )
+            transport.full_fetches = 0
+            result = await client.push(folder, refresh=True)
+            return result.refreshed, transport.full_fetches
+        finally:
+            await transport.close()
+
+    refreshed, fetches = asyncio.run(_run())
+    return refreshed, fetches, server, folder
+
+
+def _local_base(folder: Path) -> dict[str, object]:
+    raw = json.loads((folder / ".extrasuite" / "document.json").read_text())
+    return Document.model_validate(raw).model_dump(by_alias=True, exclude_none=True)
+
+
+def _live(server: MockDocsServer) -> dict[str, object]:
+    raw = server.documents[DOCUMENT_ID]._get_raw()
+    raw["documentId"] = DOCUMENT_ID
+    return Document.model_validate(raw).model_dump(by_alias=True, exclude_none=True)
+
+
+def test_refresh_replays_push_without_fetching(tmp_path: Path) -> None:
+    refreshed, fetches, server, folder = _push_edit(
+        tmp_path, "\nA **bold** new paragraph.\n"
+    )
+
+    assert refreshed == "replayed"
+    assert fetches == 0
+    assert _local_base(folder) == _live(server)
+    # The refreshed folder is a clean base for the next push
+    assert DocsClient(GoogleDocsTransport("token")).diff(folder).batches == []
+
+
+def test_refresh_fetches_when_replay_mints_unreported_ids(tmp_path: Path) -> None:
+    # New headings and lists get IDs the batchUpdate replies never report
+    refreshed, fetches, server, folder = _push_edit(
+        tmp_path, "\n## New heading\n\n- item\n"
+    )
+
+    assert refreshed == "fetched"
+    assert fetches == 1
+    assert _local_base(folder) == _live(server)
+
+
+def test_refresh_fetches_when_document_moved_on(tmp_path: Path) -> None:
+    refreshed, fetches, _, _ = _push_edit(tmp_path, "\nMore text.\n", stale=True)
+
+    assert refreshed == "fetched"
+    assert fetches == 1
+
+
+def test_replay_maps_mock_ids_to_reported_ids() -> None:
+    base = _golden()
+    batch = BatchUpdateDocumentRequest(
+        requests=[
+            Request(
+                create_named_range=CreateNamedRangeRequest(
+                    name="intro", range=Range(start_index=1, end_index=2)
+                )
+            )
+        ]
+    )
+    response = {"replies": [{"createNamedRange": {"namedRangeId": "kix.real"}}]}
+
+    document = replay_batches(base, [batch], [response], revision_id="rev-2")
+
+    assert document.revision_id == "rev-2"
+    tab = (document.tabs or [])[0].document_tab
+    assert tab is not None
+    ranges = (tab.named_ranges or {})["intro"].named_ranges or []
+    assert [r.named_range_id for r in ranges] == ["kix.real"]
+
+
+def test_replay_rejects_diverging_replies_and_unreplayable_requests() -> None:
+    base = _golden()
+    insert = BatchUpdateDocumentRequest(
+        requests=[
+            Request(insert_text=InsertTextRequest(text="x", location=Location(index=1)))
+        ]
+    )
+
+    with pytest.raises(ReplayDivergedError, match="Reply shape differs"):
+        replay_batches(
+            base, [insert], [{"replies": [{"insertText": {}}]}], revision_id="r"
+        )
+    with pytest.raises(ReplayDivergedError, match="does not apply replaceAllText"):
+        replay_batches(
+            base,
+            [
+                BatchUpdateDocumentRequest.model_validate(
+                    {"requests": [{"replaceAllText": {"containsText": {"text": "a"}}}]}
+                )
+            ],
+            [{"replies": [{}]}],
+            revision_id="r",
+        )
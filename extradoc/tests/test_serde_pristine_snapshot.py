@@ -0,0 +1,336 @@
+"""Tests for the parsed-pristine snapshot and markdown tab reuse."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from extradoc import DocsClient, GoogleDocsTransport
+from extradoc.api_types._generated import Document
+from extradoc.comments._types import (
+    Comment,
+    DocumentWithComments,
+    FileComments,
+    Reply,
+)
+from extradoc.mock.server import MockDocsServer
+from extradoc.serde._utils import build_heading_maps
+from extradoc.serde.markdown import MarkdownSerde, _from_markdown, _reusable_tabs
+from extradoc.serde.xml import XmlSerde
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+GOLDEN_IDS = [
+    "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ",
+    "1YicNYwId9u4okuK4uNfWdTEuKyS1QWb1RcnZl9eVyTc",
+]
+# Single tab containing a name-based heading link ("[...](#Heading)").
+HEADING_LINK_GOLDEN_ID = "1YKyqqH8wZa3kSnoBEdlwAumI94gRivSsZB1qvc9y4CA"
+
+SERDES = {
+    "markdown": (
+        MarkdownSerde,
+        Path(".extrasuite/pristine.zip"),
+        Path(".extrasuite/pristine.snapshot"),
+    ),
+    "xml": (
+        XmlSerde,
+        Path(".pristine/document.zip"),
+        Path(".pristine/document.snapshot"),
+    ),
+}
+
+
+def _bundle(document_id: str) -> DocumentWithComments:
+    raw = json.loads((GOLDEN_DIR / f"{document_id}.json").read_text())
+    comments = FileComments(
+        file_id=document_id,
+        comments=[
+            Comment(
+                id="c1",
+                author="a@example.com",
+                created_time="2025-01-01T00:00:00Z",
+                content="Check this",
+                anchor="kix.abc",
+                resolved=False,
+                deleted=False,
+                replies=[
+                    Reply(
+                        id="r1",
+                        author="b@example.com",
+                        created_time="2025-01-02T00:00:00Z",
+                        content="Done",
+                        action="resolve",
+                    )
+                ],
+                quoted_text="this",
+            )
+        ],
+    )
+    return DocumentWithComments(
+        document=Document.model_validate(raw), comments=comments
+    )
+
+
+def _serialized(
+    fmt: str, document_id: str, tmp_path: Path
+) -> tuple[MarkdownSerde | XmlSerde, Path]:
+    serde_cls, _, _ = SERDES[fmt]
+    serde = serde_cls()
+    folder = tmp_path / document_id
+    serde.serialize(_bundle(document_id), folder)
+    return serde, folder
+
+
+def _forbid_parse(monkeypatch: pytest.MonkeyPatch, serde_cls: type) -> None:
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("pristine zip was re-parsed")
+
+    monkeypatch.setattr(serde_cls, "_parse_pristine_zip", _fail)
+
+
+@pytest.mark.parametrize("document_id", GOLDEN_IDS)
+@pytest.mark.parametrize("fmt", sorted(SERDES))
+def test_snapshot_matches_parsed_zip(
+    fmt: str, document_id: str, tmp_path: Path
+) -> None:
+    serde, folder = _serialized(fmt, document_id, tmp_path)
+    _, zip_rel, snapshot_rel = SERDES[fmt]
+    assert (folder / snapshot_rel).exists()
+
+    parsed = serde._parse_pristine_zip(folder / zip_rel)
+    loaded = serde._load_pristine(folder)
+    assert loaded.document == parsed.document
+    assert loaded.comments == parsed.comments
+
+
+@pytest.mark.parametrize("fmt", sorted(SERDES))
+def test_deserialize_uses_snapshot(
+    fmt: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    serde, folder = _serialized(fmt, GOLDEN_IDS[0], tmp_path)
+    expected = serde.deserialize(folder)
+
+    _forbid_parse(monkeypatch, SERDES[fmt][0])
+    result = serde.deserialize(folder)
+    assert result.desired.document == expected.desired.document
+    assert result.base.comments == expected.base.comments
+
+
+@pytest.mark.parametrize("fmt", sorted(SERDES))
+def test_stale_snapshot_falls_back_to_parsing(fmt: str, tmp_path: Path) -> None:
+    serde, folder = _serialized(fmt, GOLDEN_IDS[0], tmp_path)
+    _, zip_rel, _ = SERDES[fmt]
+    zip_path = folder / zip_rel
+
+    # Rewrite the zip with a changed title; the snapshot no longer matches.
+    with zipfile.ZipFile(zip_path) as zf:
+        members = {name: zf.read(name) for name in zf.namelist()}
+    index_name = "index.xml"
+    members[index_name] = members[index_name].replace(b'title="', b'title="Renamed ')
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+    loaded = serde._load_pristine(folder)
+    assert loaded.document.title is not None
+    assert loaded.document.title.startswith("Renamed ")
+
+
+@pytest.mark.parametrize("fmt", sorted(SERDES))
+def test_missing_or_corrupt_snapshot_falls_back(fmt: str, tmp_path: Path) -> None:
+    serde, folder = _serialized(fmt, GOLDEN_IDS[0], tmp_path)
+    _, zip_rel, snapshot_rel = SERDES[fmt]
+    expected = serde._parse_pristine_zip(folder / zip_rel)
+
+    (folder / snapshot_rel).write_bytes(b"not a snapshot")
+    assert serde._load_pristine(folder).document == expected.document
+
+    (folder / snapshot_rel).unlink()
+    assert serde._load_pristine(folder).document == expected.document
+
+
+def test_snapshot_not_included_in_pristine_zip(tmp_path: Path) -> None:
+    for fmt, (_, zip_rel, snapshot_rel) in SERDES.items():
+        _, folder = _serialized(fmt, GOLDEN_IDS[0], tmp_path / fmt)
+        with zipfile.ZipFile(folder / zip_rel) as zf:
+            assert snapshot_rel.name not in {Path(n).name for n in zf.namelist()}
+
+
+# ---------------------------------------------------------------------------
+# Markdown: unchanged tab files reuse the pristine tab
+# ---------------------------------------------------------------------------
+
+
+def _count_tab_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed: list[str] = []
+    original = _from_markdown._parse_tab
+
+    def _spy(source: str, tab_title: str, folder: str, **kwargs: Any) -> Any:
+        parsed.append(folder)
+        return original(source, tab_title, folder, **kwargs)
+
+    monkeypatch.setattr(_from_markdown, "_parse_tab", _spy)
+    return parsed
+
+
+def _edit_first_tab(folder: Path) -> str:
+    tab_file = sorted((folder / "tabs").glob("*.md"))[0]
+    tab_file.write_text(
+        tab_file.read_text(encoding="utf-8") + "\nOne more paragraph.\n",
+        encoding="utf-8",
+    )
+    return tab_file.stem
+
+
+def test_markdown_reparses_only_edited_tabs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    serde, folder = _serialized("markdown", GOLDEN_IDS[0], tmp_path)
+    edited = _edit_first_tab(folder)
+    # Without a snapshot there is no manifest: every tab is parsed.
+    snapshot_path = folder / SERDES["markdown"][2]
+    snapshot = snapshot_path.read_bytes()
+    snapshot_path.unlink()
+    expected = serde.deserialize(folder)
+    snapshot_path.write_bytes(snapshot)
+
+    parsed = _count_tab_parses(monkeypatch)
+    result = serde.deserialize(folder)
+
+    assert parsed == [edited]
+    assert result.desired.document == expected.desired.document
+
+
+def test_markdown_unchanged_folder_parses_no_tabs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    serde, folder = _serialized("markdown", GOLDEN_IDS[0], tmp_path)
+    parsed = _count_tab_parses(monkeypatch)
+    result = serde.deserialize(folder)
+
+    assert parsed == []
+    assert result.desired.document == result.base.document
+
+
+def test_markdown_reuse_requires_matching_tab_id(tmp_path: Path) -> None:
+    serde, folder = _serialized("markdown", GOLDEN_IDS[0], tmp_path)
+    _, snapshot = serde._load_pristine_snapshot(folder)
+    _, heading_name_to_id = build_heading_maps(serde._load_base(folder).document)
+    pristine_tabs = _reusable_tabs(snapshot, heading_name_to_id)
+    assert pristine_tabs
+    tab_folder, (digest, tab) = next(iter(pristine_tabs.items()))
+    assert tab.tab_properties is not None
+    moved = tab.model_copy(
+        update={
+            "tab_properties": tab.tab_properties.model_copy(
+                update={"tab_id": "t.elsewhere"}
+            )
+        }
+    )
+
+    mine = serde._parse(
+        folder,
+        heading_name_to_id=heading_name_to_id,
+        pristine_tabs={tab_folder: (digest, moved)},
+    )
+    assert all(t is not moved for t in mine.document.tabs or [])
+
+
+def test_markdown_tab_with_resolvable_heading_link_is_reparsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Name-based heading links resolve differently in the pristine parse."""
+    serde, folder = _serialized("markdown", HEADING_LINK_GOLDEN_ID, tmp_path)
+    _, snapshot = serde._load_pristine_snapshot(folder)
+    assert snapshot is not None
+    manifest = snapshot.meta["tabs"]
+    linked = [
+        p.stem
+        for p in sorted((folder / "tabs").glob("*.md"))
+        if "](#" in p.read_text(encoding="utf-8")
+    ]
+    assert linked
+    assert not set(linked) & set(manifest)
+
+    parsed = _count_tab_parses(monkeypatch)
+    serde.deserialize(folder)
+    assert parsed == linked
+
+
+@pytest.mark.parametrize(
+    "document_id", [*GOLDEN_IDS, HEADING_LINK_GOLDEN_ID], ids=lambda d: d[:8]
+)
+def test_markdown_manifest_tabs_parse_to_the_pristine_tab(
+    document_id: str, tmp_path: Path
+) -> None:
+    serde, folder = _serialized("markdown", document_id, tmp_path)
+    _, snapshot = serde._load_pristine_snapshot(folder)
+    assert snapshot is not None
+    _, heading_name_to_id = build_heading_maps(serde._load_base(folder).document)
+    mine = serde._parse(folder, heading_name_to_id=heading_name_to_id)
+    mine_by_id = {
+        t.tab_properties.tab_id: t for t in mine.document.tabs or [] if t.tab_properties
+    }
+
+    reusable = _reusable_tabs(snapshot, heading_name_to_id)
+    assert reusable or document_id == HEADING_LINK_GOLDEN_ID
+    for _, tab in reusable.values():
+        assert tab.tab_properties is not None
+        assert mine_by_id[tab.tab_properties.tab_id] == tab
+
+
+def test_markdown_serialize_parses_each_tab_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _forbid_parse(monkeypatch, MarkdownSerde)
+    parsed = _count_tab_parses(monkeypatch)
+    serde, folder = _serialized("markdown", GOLDEN_IDS[0], tmp_path)
+
+    assert sorted(parsed) == sorted(p.stem for p in (folder / "tabs").glob("*.md"))
+    assert serde._load_pristine_snapshot(folder)[1] is not None
+
+
+def test_markdown_deserialize_writes_no_snapshot(tmp_path: Path) -> None:
+    serde, folder = _serialized("markdown", GOLDEN_IDS[0], tmp_path)
+    snapshot_path = folder / SERDES["markdown"][2]
+    snapshot_path.unlink()
+
+    serde.deserialize(folder)
+    assert not snapshot_path.exists()
+
+
+def test_markdown_push_does_not_parse_the_pristine_zip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    document_id = GOLDEN_IDS[0]
+    server = MockDocsServer(seed=0)
+    server.add_document(
+        document_id, json.loads((GOLDEN_DIR / f"{document_id}.json").read_text())
+    )
+    transport = GoogleDocsTransport(
+        "token",
+        api_base="http://mock/v1/documents",
+        drive_api_base="http://mock/drive/v3/files/",
+        http_transport=server.transport(),
+    )
+    client = DocsClient(transport)
+    folder = tmp_path / document_id
+
+    async def _run() -> int:
+        try:
+            await client.pull(document_id, tmp_path, format="markdown")
+            edited = _edit_first_tab(folder)
+            _forbid_parse(monkeypatch, MarkdownSerde)
+            parsed = _count_tab_parses(monkeypatch)
+            result = await client.push(folder)
+            assert parsed == [edited]
+            return result.changes_applied
+        finally:
+            await transport.close()
+
+    assert asyncio.run(_run()) > 0
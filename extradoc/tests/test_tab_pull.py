@@ -0,0 +1,185 @@
+"""Tests for single-tab pulls (``pull(tab=...)``) and the partial folders they write."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from extradoc import DocsClient, GoogleDocsTransport
+from extradoc.api_types._generated import Document
+from extradoc.mock.server import MockDocsServer
+from extradoc.serde._models import IndexXml
+from extradoc.transport import DocumentData, LocalFileTransport, NotFoundError
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+class _RecordingTransport(GoogleDocsTransport):
+    """Records the Docs API URLs it GETs."""
+
+    def __init__(self, server: MockDocsServer) -> None:
+        super().__init__(
+            "token",
+            api_base="http://mock/v1/documents",
+            drive_api_base="http://mock/drive/v3/files/",
+            http_transport=server.transport(),
+        )
+        self.urls: list[str] = []
+
+    async def _get_content(self, url: str) -> bytes:
+        if "/v1/documents/" in url:
+            self.urls.append(url)
+        return await super()._get_content(url)
+
+
+def _golden_raw() -> dict[str, Any]:
+    return json.loads((GOLDEN_DIR / f"{DOCUMENT_ID}.json").read_text())
+
+
+def _nested_raw() -> dict[str, Any]:
+    """The golden document with its third tab nested under the second."""
+    raw = _golden_raw()
+    child = raw["tabs"].pop()
+    child["tabProperties"].update(
+        parentTabId=raw["tabs"][1]["tabProperties"]["tabId"], index=0, nestingLevel=1
+    )
+    raw["tabs"][1]["childTabs"] = [child]
+    return raw
+
+
+def _fetch_tab(raw: dict[str, Any], tab: str) -> tuple[dict[str, Any], list[str]]:
+    server = MockDocsServer(seed=0)
+    server.add_document(DOCUMENT_ID, raw)
+    transport = _RecordingTransport(server)
+
+    async def _run() -> dict[str, Any]:
+        try:
+            return (await transport.get_document_tab(DOCUMENT_ID, tab)).raw
+        finally:
+            await transport.close()
+
+    return asyncio.run(_run()), transport.urls
+
+
+def _tab(raw: dict[str, Any]) -> dict[str, Any]:
+    document = Document.model_validate(raw).model_dump(by_alias=True, exclude_none=True)
+    tab: dict[str, Any] = document["tabs"][0]
+    tab.pop("childTabs", None)
+    return tab
+
+
+@pytest.mark.parametrize(
+    ("tab", "index", "content_mask"),
+    [
+        ("t.0", 0, "fields=revisionId,body,"),
+        ("Version 3", 2, "tabs(tabProperties,documentTab,childTabs("),
+    ],
+)
+def test_get_document_tab_fetches_one_tab_with_field_masks(
+    tab: str, index: int, content_mask: str
+) -> None:
+    raw = _golden_raw()
+
+    fetched, urls = _fetch_tab(raw, tab)
+
+    assert len(urls) == 2
+    assert "documentTab" not in urls[0]
+    assert content_mask in urls[1]
+    assert [k for k in fetched if k != "tabs"] == ["documentId", "title", "revisionId"]
+    assert _tab(fetched) == _tab({"tabs": [raw["tabs"][index]]})
+
+
+def test_get_document_tab_fetches_only_the_child_tab_level() -> None:
+    raw = _nested_raw()
+
+    fetched, urls = _fetch_tab(raw, "Version 3")
+
+    assert "tabs(tabProperties,childTabs(tabProperties,documentTab," in urls[1]
+    assert _tab(fetched) == _tab({"tabs": raw["tabs"][1]["childTabs"]})
+    # A parent tab comes without its children
+    parent, _ = _fetch_tab(raw, "Version 2")
+    assert "childTabs" not in parent["tabs"][0]
+
+
+def test_get_document_tab_default_matches_the_google_transport() -> None:
+    async def _local() -> dict[str, Any]:
+        transport = LocalFileTransport(GOLDEN_DIR)
+        return (await transport.get_document_tab(DOCUMENT_ID, "Version 2")).raw
+
+    fetched, _ = _fetch_tab(_golden_raw(), "Version 2")
+
+    assert _tab(asyncio.run(_local())) == _tab(fetched)
+    with pytest.raises(NotFoundError, match="No such tab"):
+        _fetch_tab(_golden_raw(), "No such tab")
+
+
+class _TablessTransport(LocalFileTransport):
+    """Answers tab fetches with a document that has no tabs."""
+
+    async def get_document_tab(
+        self,
+        document_id: str,
+        tab: str,  # noqa: ARG002
+    ) -> DocumentData:
+        document_data = await self.get_document(document_id)
+        raw = {k: v for k, v in document_data.raw.items() if k != "tabs"}
+        return DocumentData(document_data.document_id, document_data.title, raw)
+
+
+@pytest.mark.parametrize("tabless", [False, True])
+def test_tab_pull_of_a_missing_tab_raises_not_found(
+    tmp_path: Path, tabless: bool
+) -> None:
+    transport_cls = _TablessTransport if tabless else LocalFileTransport
+    client = DocsClient(transport_cls(GOLDEN_DIR))
+
+    with pytest.raises(NotFoundError, match="nonexistent"):
+        asyncio.run(client.pull(DOCUMENT_ID, tmp_path, tab="nonexistent"))
+    assert not (tmp_path / DOCUMENT_ID).exists()
+
+
+def test_tab_pull_diff_and_push_leave_other_tabs_alone(tmp_path: Path) -> None:
+    server = MockDocsServer(seed=0)
+    server.add_document(DOCUMENT_ID, _golden_raw())
+    before = copy.deepcopy(server.documents[DOCUMENT_ID]._get_raw()["tabs"])
+    transport = _RecordingTransport(server)
+    client = DocsClient(transport)
+    folder = tmp_path / DOCUMENT_ID
+
+    async def _run() -> tuple[bool, bool, str | None]:
+        try:
+            await client.pull(DOCUMENT_ID, tmp_path, format="markdown", tab="Version 2")
+            tab_file = folder / "tabs" / "Version_2.md"
+            tab_file.write_text(
+                tab_file.read_text(encoding="utf-8") + "\nPartial edit.\n",
+                encoding="utf-8",
+            )
+            result = await client.push(folder, refresh=True)
+            by_title = await client.is_up_to_date(
+                DOCUMENT_ID, folder, format="markdown", tab="Version 2"
+            )
+            whole = await client.is_up_to_date(DOCUMENT_ID, folder, format="markdown")
+            return by_title, whole, result.refreshed
+        finally:
+            await transport.close()
+
+    up_to_date, whole_up_to_date, refreshed = asyncio.run(_run())
+    index = IndexXml.from_xml_string((folder / ".extrasuite" / "index.xml").read_text())
+    after = server.documents[DOCUMENT_ID]._get_raw()["tabs"]
+
+    assert index.tab == "t.onxbcvnykaov"
+    assert [t.title for t in index.tabs] == ["Version 2"]
+    assert sorted(p.name for p in (folder / "tabs").iterdir()) == ["Version_2.md"]
+    assert [after[0], after[2]] == [before[0], before[2]]
+    assert after[1] != before[1]
+    assert "Partial edit." in json.dumps(after[1])
+    assert refreshed == "replayed"
+    assert DocsClient(GoogleDocsTransport("token")).diff(folder).batches == []
+    assert up_to_date
+    assert not whole_up_to_date
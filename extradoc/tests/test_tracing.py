@@ -0,0 +1,145 @@
+"""Tests for the opt-in pull / diff / push tracing in ``extradoc.tracing``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from extradoc import DocsClient, LocalFileTransport, RecordingTracer
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    InsertTextRequest,
+    Location,
+    Request,
+)
+from extradoc.reconcile_v3.executor import execute_request_batches
+from extradoc.tracing import NULL_TRACER, Tracer
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DOCUMENT_ID = "14nMj7vggV3XR3WQtYcgrABRABjKk-fqw0UQUCP25rhQ"
+
+
+class _RecordingTransport(LocalFileTransport):
+    """LocalFileTransport that remembers each batchUpdate it receives."""
+
+    def __init__(self, golden_dir: Path) -> None:
+        super().__init__(golden_dir)
+        self.batches: list[BatchUpdateDocumentRequest] = []
+
+    async def batch_update(
+        self, document_id: str, batch: BatchUpdateDocumentRequest
+    ) -> dict[str, Any]:
+        self.batches.append(batch)
+        return await super().batch_update(document_id, batch)
+
+
+def _insert(text: str) -> Request:
+    return Request(insert_text=InsertTextRequest(text=text, location=Location(index=1)))
+
+
+def _names(tracer: RecordingTracer) -> list[str]:
+    return [s.name for s in tracer.spans]
+
+
+def test_null_tracer_records_nothing() -> None:
+    assert not NULL_TRACER.enabled
+    first = NULL_TRACER.span("a", x=1)
+    assert first is NULL_TRACER.span("b")
+    with first, first:
+        NULL_TRACER.count("c", 5)
+    assert not hasattr(NULL_TRACER, "spans")
+
+
+def test_recording_tracer_nests_spans_and_sums_counters() -> None:
+    ticks = iter(range(100))
+    tracer = RecordingTracer(clock=lambda: float(next(ticks)))
+
+    with tracer.span("outer", kind="test"):
+        with tracer.span("inner"):
+            tracer.count("n")
+        tracer.count("n", 2)
+
+    outer, inner = tracer.spans
+    assert (outer.depth, outer.parent) == (0, None)
+    assert (inner.depth, inner.parent) == (1, 0)
+    assert inner.duration_s == 1.0
+    assert outer.duration_s == 3.0
+    assert tracer.counters == {"n": 3}
+    payload = tracer.to_dict()
+    assert payload["spans"][0]["attrs"] == {"kind": "test"}
+    assert "attrs" not in payload["spans"][1]
+
+
+def test_execute_request_batches_reports_batches_and_bytes() -> None:
+    tracer = RecordingTracer()
+    transport = _RecordingTransport(GOLDEN_DIR)
+    batches = [
+        BatchUpdateDocumentRequest(requests=[_insert("a"), _insert("b")]),
+        BatchUpdateDocumentRequest(requests=[_insert("c")]),
+    ]
+
+    asyncio.run(
+        execute_request_batches(
+            transport,
+            document_id=DOCUMENT_ID,
+            request_batches=batches,
+            initial_revision_id="rev",
+            tracer=tracer,
+        )
+    )
+
+    assert _names(tracer).count("execute.batch") == 2
+    assert _names(tracer).count("execute.batch_update") == 2
+    assert tracer.counters["execute.batches"] == 2
+    assert tracer.counters["execute.requests"] == 3
+    assert tracer.counters["execute.bytes_sent"] == sum(
+        len(b.model_dump_json(by_alias=True, exclude_none=True))
+        for b in transport.batches
+    )
+
+
+def test_pull_diff_push_spans(tmp_path: Path) -> None:
+    tracer = RecordingTracer()
+    transport = _RecordingTransport(GOLDEN_DIR)
+    client = DocsClient(transport, tracer=tracer)
+
+    asyncio.run(client.pull(DOCUMENT_ID, tmp_path, format="markdown"))
+    folder = tmp_path / DOCUMENT_ID
+    tab_file = next(p for p in sorted(folder.rglob("*.md")) if p.name != "index.md")
+    tab_file.write_text(
+        tab_file.read_text(encoding="utf-8") + "\nA traced paragraph.\n",
+        encoding="utf-8",
+    )
+    result = asyncio.run(client.push(folder))
+
+    assert result.changes_applied > 0
+    names = _names(tracer)
+    for name in (
+        "pull.get_document",
+        "pull.serialize",
+        "push.diff",
+        "diff.deserialize",
+        "serde.parse",
+        "reconcile.diff_documents",
+        "reconcile.lower_batches",
+        "push.execute",
+        "execute.batch_update",
+    ):
+        assert name in names, name
+    deserialize = next(s for s in tracer.spans if s.name == "diff.deserialize")
+    assert deserialize.parent is not None
+    assert tracer.spans[deserialize.parent].name == "push.diff"
+    assert tracer.counters["reconcile.requests"] == result.changes_applied
+    assert tracer.counters["execute.requests"] == result.changes_applied
+
+    trace_path = tmp_path / "trace.json"
+    tracer.write_json(trace_path)
+    assert json.loads(trace_path.read_text())["counters"] == tracer.counters
+
+
+def test_docs_client_defaults_to_null_tracer() -> None:
+    assert DocsClient(LocalFileTransport(GOLDEN_DIR)).tracer is NULL_TRACER
+    assert DocsClient.__new__(DocsClient).tracer is NULL_TRACER
+    assert isinstance(NULL_TRACER, Tracer)
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
+import httpx
 import pytest
 
+from extradoc.api_types._generated import (
+    BatchUpdateDocumentRequest,
+    InsertTextRequest,
+    Location,
+    Request,
+)
 from extradoc.transport import (
     APIError,
     AuthenticationError,
     DocumentData,
+    GoogleDocsTransport,
     NotFoundError,
     TransportError,
+    encode_batch,
 )
 
 
@@ -41,3 +53,56 @@ def test_document_data_is_frozen() -> None:
     # Should raise error when trying to modify (FrozenInstanceError)
     with pytest.raises(AttributeError):
         data.document_id = "modified"  # type: ignore[misc]
+
+
+def test_encode_batch_matches_model_dump() -> None:
+    """encode_batch produces the same JSON as dumping the model to a dict."""
+    batch = BatchUpdateDocumentRequest(
+        requests=[
+            Request(
+                insert_text=InsertTextRequest(
+                    text="caf\u00e9 \U0001f600", location=Location(index=1)
+                )
+            )
+        ]
+    )
+    body = encode_batch(batch)
+    assert isinstance(body, bytes)
+    assert json.loads(body) == batch.model_dump(by_alias=True, exclude_none=True)
+
+
+def test_batch_update_sends_encoded_body_and_keeps_response_bytes() -> None:
+    """batchUpdate posts raw JSON bytes; get_document keeps the raw body."""
+    document = {"documentId": "doc1", "title": "T", "revisionId": "r1"}
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"replies": [{}]})
+        return httpx.Response(200, json=document)
+
+    batch = BatchUpdateDocumentRequest(
+        requests=[
+            Request(insert_text=InsertTextRequest(text="x", location=Location(index=1)))
+        ]
+    )
+
+    async def _run() -> DocumentData:
+        transport = GoogleDocsTransport(
+            "token", http_transport=httpx.MockTransport(handler)
+        )
+        try:
+            assert await transport.batch_update("doc1", batch) == {"replies": [{}]}
+            return await transport.get_document("doc1")
+        finally:
+            await transport.close()
+
+    data = asyncio.run(_run())
+
+    post = seen[0]
+    assert post.headers["Content-Type"] == "application/json"
+    assert post.content == encode_batch(batch)
+    assert data.raw == document
+    assert data.content is not None
+    assert data.to_document().revision_id == "r1"
@@ -77,18 +77,20 @@ class GoogleFormsTransport(FormTransport):
 
     BASE_URL = "https://forms.googleapis.com/v1/forms"
 
-    def __init__(self, access_token: str) -> None:
+    def __init__(self, access_token: str, *, http_client: httpx.AsyncClient | None = None) -> None:
         """Initialize the transport with an access token.
 
         Args:
             access_token: OAuth2 access token for Google Forms API.
+            http_client: Optional shared HTTP client. Auth headers are sent
+                per request, and a shared client is left open on close().
         """
         self._access_token = access_token
-        self._client = httpx.AsyncClient(
-            headers={"Authorization": f"Bearer {access_token}"},
-            verify=certifi.where(),
-            timeout=30.0,
-        )
+        self._headers = {"Authorization": f"Bearer {access_token}"}
+        self._owns_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(verify=certifi.where(), timeout=30.0)
+        self._client = http_client
 
     def _check_response(self, response: httpx.Response, form_id: str) -> None:
         """Check HTTP response and raise appropriate exceptions.
@@ -125,7 +127,7 @@ class GoogleFormsTransport(FormTransport):
 
     async def get_form(self, form_id: str) -> dict[str, Any]:
         """GET /v1/forms/{formId}"""
-        response = await self._client.get(f"{self.BASE_URL}/{form_id}")
+        response = await self._client.get(f"{self.BASE_URL}/{form_id}", headers=self._headers)
         self._check_response(response, form_id)
         return response.json()  # type: ignore[no-any-return]
 
@@ -143,6 +145,7 @@ class GoogleFormsTransport(FormTransport):
         response = await self._client.get(
             f"{self.BASE_URL}/{form_id}/responses",
             params=params,
+            headers=self._headers,
         )
         self._check_response(response, form_id)
         return response.json()  # type: ignore[no-any-return]
@@ -161,13 +164,15 @@ class GoogleFormsTransport(FormTransport):
         response = await self._client.post(
             f"{self.BASE_URL}/{form_id}:batchUpdate",
             json=body,
+            headers=self._headers,
         )
         self._check_response(response, form_id)
         return response.json()  # type: ignore[no-any-return]
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was passed in shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
 
 class LocalFileTransport(FormTransport):
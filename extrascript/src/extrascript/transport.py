@@ -213,24 +213,28 @@ class GoogleAppsScriptTransport(Transport):
         self,
         access_token: str,
         timeout: int = DEFAULT_TIMEOUT,
+        *,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the transport.
 
         Args:
             access_token: OAuth2 access token with script.projects scope.
             timeout: Request timeout in seconds.
+            http_client: Optional shared ``httpx.AsyncClient``. Auth headers
+                are sent per request; a shared client is not closed here.
         """
         self._access_token = access_token
         self._timeout = timeout
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            verify=ssl_context,
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        }
+        self._owns_client = http_client is None
+        if http_client is None:
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            http_client = httpx.AsyncClient(timeout=timeout, verify=ssl_context)
+        self._client = http_client
 
     async def get_project(self, script_id: str) -> ProjectMetadata:
         """Fetch project metadata from Apps Script API."""
@@ -284,14 +288,15 @@ class GoogleAppsScriptTransport(Transport):
         await self._post(url, body)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was passed in shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
     # --- HTTP helpers ---
 
     async def _get(self, url: str) -> dict[str, Any]:
         try:
-            resp = await self._client.get(url)
+            resp = await self._client.get(url, headers=self._headers)
             resp.raise_for_status()
             result: dict[str, Any] = resp.json()
             return result
@@ -302,7 +307,7 @@ class GoogleAppsScriptTransport(Transport):
 
     async def _post(self, url: str, body: dict[str, Any]) -> dict[str, Any]:
         try:
-            resp = await self._client.post(url, json=body)
+            resp = await self._client.post(url, json=body, headers=self._headers)
             resp.raise_for_status()
             result: dict[str, Any] = resp.json()
             return result
@@ -313,7 +318,7 @@ class GoogleAppsScriptTransport(Transport):
 
     async def _put(self, url: str, body: dict[str, Any]) -> dict[str, Any]:
         try:
-            resp = await self._client.put(url, json=body)
+            resp = await self._client.put(url, json=body, headers=self._headers)
             resp.raise_for_status()
             result: dict[str, Any] = resp.json()
             return result
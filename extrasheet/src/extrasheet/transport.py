@@ -194,24 +194,28 @@ class GoogleSheetsTransport(Transport):
         self,
         access_token: str,
         timeout: int = DEFAULT_TIMEOUT,
+        *,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the transport.
 
         Args:
             access_token: OAuth2 access token with sheets.readonly scope
             timeout: Request timeout in seconds
+            http_client: Optional shared ``httpx.AsyncClient``; auth headers
+                are sent per request and a shared client is not closed here
         """
         self._access_token = access_token
         self._timeout = timeout
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            verify=ssl_context,
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        }
+        self._owns_client = http_client is None
+        if http_client is None:
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            http_client = httpx.AsyncClient(timeout=timeout, verify=ssl_context)
+        self._client = http_client
 
     async def get_metadata(self, spreadsheet_id: str) -> SpreadsheetMetadata:
         """Fetch spreadsheet metadata from Google Sheets API."""
@@ -324,7 +328,7 @@ class GoogleSheetsTransport(Transport):
     async def _request(self, url: str) -> dict[str, Any]:
         """Make an authenticated GET request."""
         try:
-            response = await self._client.get(url)
+            response = await self._client.get(url, headers=self._headers)
             response.raise_for_status()
             result: dict[str, Any] = response.json()
             return result
@@ -337,7 +341,7 @@ class GoogleSheetsTransport(Transport):
     async def _post_request(self, url: str, body: dict[str, Any]) -> dict[str, Any]:
         """Make an authenticated POST request."""
         try:
-            response = await self._client.post(url, json=body)
+            response = await self._client.post(url, json=body, headers=self._headers)
             response.raise_for_status()
             result: dict[str, Any] = response.json()
             return result
@@ -364,8 +368,9 @@ class GoogleSheetsTransport(Transport):
         raise APIError(f"API error ({status}): {body}", status_code=status) from e
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was passed in shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
 
 class LocalFileTransport(Transport):
@@ -107,24 +107,28 @@ class GoogleSlidesTransport(Transport):
         self,
         access_token: str,
         timeout: int = DEFAULT_TIMEOUT,
+        *,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the transport.
 
         Args:
             access_token: OAuth2 access token with presentations scope
             timeout: Request timeout in seconds
+            http_client: Optional shared ``httpx.AsyncClient``; auth headers
+                are sent per request and a shared client is not closed here
         """
         self._access_token = access_token
         self._timeout = timeout
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            verify=ssl_context,
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        }
+        self._owns_client = http_client is None
+        if http_client is None:
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            http_client = httpx.AsyncClient(timeout=timeout, verify=ssl_context)
+        self._client = http_client
 
     async def get_presentation(self, presentation_id: str) -> PresentationData:
         """Fetch presentation data from Google Slides API."""
@@ -144,7 +148,7 @@ class GoogleSlidesTransport(Transport):
         body = {"requests": requests}
 
         try:
-            response = await self._client.post(url, json=body)
+            response = await self._client.post(url, json=body, headers=self._headers)
             response.raise_for_status()
             result: dict[str, Any] = response.json()
             return result
@@ -156,7 +160,7 @@ class GoogleSlidesTransport(Transport):
     async def _request(self, url: str) -> dict[str, Any]:
         """Make an authenticated GET request."""
         try:
-            response = await self._client.get(url)
+            response = await self._client.get(url, headers=self._headers)
             response.raise_for_status()
             result: dict[str, Any] = response.json()
             return result
@@ -182,8 +186,9 @@ class GoogleSlidesTransport(Transport):
         return APIError(f"API error ({status}): {body}", status_code=status)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was passed in shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
 
 class LocalFileTransport(Transport):